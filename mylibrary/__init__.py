@@ -7,5 +7,138 @@ from __future__ import absolute_import
 # This is extracted automatically by the top-level setup.py.
 __version__ = '0.1.5'
 
-# add any imports here, if you wish to bring things into the library's top-level namespace when the library is imported.
+# To bring things into the library's top-level namespace, add them to the lazy tables below
+# rather than importing them here: "import mylibrary" should stay cheap. See __getattr__().
 
+import _thread
+import importlib
+import importlib.machinery
+import os
+import sys
+
+#########################################################
+# Lazy loading
+#########################################################
+
+# Names in the top-level namespace that are loaded on first access, by __getattr__() (PEP 562).
+#
+# Importing the compiled modules imports NumPy, which alone costs more than 100 ms;
+# a process that only needs, say, dostuff should not pay for it.
+#
+_submodules = ("fallback", "parallel", "profiling")
+
+# Top-level name -> the module it comes from.
+#
+# The hot-path counters: off by default; set MYLIBRARY_STATS=1, or call enable_stats().
+#
+_lazy_attributes = { "stats":         "counters",
+                     "reset_stats":   "counters",
+                     "enable_stats":  "counters",
+                     "stats_enabled": "counters" }
+
+#########################################################
+# Backend selection
+#########################################################
+
+# The modules that have both a compiled (Cython) implementation and a NumPy one in mylibrary.fallback.
+#
+# We use the compiled modules if they are there; otherwise the NumPy backend, so that mylibrary
+# also works where the extension modules could not be built. MYLIBRARY_BACKEND=compiled|numpy
+# pins the choice (an unavailable compiled backend is then an ImportError, not a silent slowdown).
+#
+# At import, the choice is made without importing anything: if the compiled modules are not all there,
+# it is the NumPy backend. Otherwise it is settled by the first module reached through the mylibrary
+# namespace (mylibrary.compute, "from mylibrary import compute"): if that fails to load, it is
+# the NumPy backend for all modules. backend() settles it by loading all of them. Either way,
+# the choice is final, so that the modules in use all come from one backend; once the compiled
+# backend is settled, a compiled module that fails to load is an ImportError.
+#
+# The NumPy modules are installed in sys.modules under their public names, so that
+# "import mylibrary.compute" and "from mylibrary import compute" give the same module either way.
+#
+backends = ("compiled", "numpy")
+_backend_modules = ("counters", "compute", "dostuff", "predicates")
+
+_requested = os.environ.get("MYLIBRARY_BACKEND", "").strip().lower()
+if _requested not in ("",) + backends:
+    raise ValueError( "MYLIBRARY_BACKEND must be one of %s, got '%s'" % (", ".join(backends), _requested) )
+
+# Install the NumPy backend. Each module is created lazily (importlib.util.LazyLoader):
+# it, and NumPy, are actually imported only when one of its attributes is first used.
+#
+def _use_fallback():
+    import importlib.util  # only here: it imports contextlib and more, a good part of the cost of "import mylibrary"
+    for name in _backend_modules:
+        sys.modules.pop( "mylibrary." + name, None )  # do not leave a half-imported compiled backend behind
+        spec = importlib.util.find_spec( "mylibrary.fallback." + name )
+        spec.loader = importlib.util.LazyLoader(spec.loader)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[spec.name] = sys.modules["mylibrary." + name] = module
+        spec.loader.exec_module(module)
+        globals()[name] = module
+    for name in _lazy_attributes:  # may have been taken from the compiled modules
+        globals().pop( name, None )
+    return "numpy"
+
+def _compiled_present():
+    return all( importlib.machinery.PathFinder.find_spec("mylibrary." + name, __path__) is not None for name in _backend_modules )
+
+if _requested == "numpy"  or  (_requested == ""  and  not _compiled_present()):
+    _backend = _use_fallback()
+elif _requested == "compiled"  and  not _compiled_present():
+    raise ImportError( "MYLIBRARY_BACKEND=compiled, but the extension modules of mylibrary are not built" )
+else:
+    _backend = "compiled"  # until _settle_backend() finds otherwise
+
+_settled      = _backend == "numpy"
+_backend_lock = _thread.RLock()  # _thread, not threading: it is built in, so it costs nothing to import
+
+# Settle the backend, if not done yet, by loading the given modules of it.
+#
+# If a compiled module fails to load, switch to the NumPy backend, unless the compiled backend
+# is pinned, or some compiled module was already imported directly ("import mylibrary.counters");
+# switching then would leave that one behind, so the ImportError is raised instead.
+#
+def _settle_backend( names ):
+    global _backend, _settled
+    with _backend_lock:
+        if _settled:
+            return
+        handed_out = any( "mylibrary." + name in sys.modules for name in _backend_modules )
+        try:
+            for name in names:
+                importlib.import_module( "mylibrary." + name )  # also sets it as an attribute of this module
+        except ImportError:
+            if _requested == "compiled"  or  handed_out:
+                raise
+            _backend = _use_fallback()
+        _settled = True
+
+def backend():
+    """Return the name of the backend in use: "compiled" (the Cython extension modules) or "numpy" (mylibrary.fallback).
+
+The backend is chosen when mylibrary is first imported, and settled when its modules are first
+used; set the environment variable MYLIBRARY_BACKEND to "compiled" or "numpy" before that to pin it.
+To tell for sure, this loads the modules of the backend, which a failing compiled module can still
+switch to "numpy" if no compiled module is in use yet. Once settled, the backend does not change.
+"""
+    _settle_backend(_backend_modules)
+    return _backend
+
+
+# Load the names of the lazy tables, and the modules of the backend, on first access.
+#
+def __getattr__( name ):
+    if name in _backend_modules:
+        _settle_backend( (name,) )
+        return importlib.import_module( "mylibrary." + name )
+    if name in _submodules:
+        return importlib.import_module( "mylibrary." + name )
+    if name in _lazy_attributes:
+        value = getattr( __getattr__(_lazy_attributes[name]), name )
+        globals()[name] = value
+        return value
+    raise AttributeError( "module '%s' has no attribute '%s'" % (__name__, name) )
+
+def __dir__():
+    return sorted( set(globals()) | set(_backend_modules) | set(_submodules) | set(_lazy_attributes) )
@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+#
+"""Argument checking for mylibrary.compute: input arrays, and output arrays of elementwise operations.
+
+This is plain Python (only the kernels differ), so both backends share it; see mylibrary.backend().
+The checks run once per call, before any kernel; both backends thus accept the same arguments,
+and raise the same errors. Use mylibrary.compute, not this module.
+"""
+
+from __future__ import division, print_function, absolute_import
+
+import array
+
+import numpy as np
+
+
+# Floating-point types the kernels are specialized for. Exported as mylibrary.compute.supported_dtypes.
+#
+supported_dtypes = (np.float32, np.float64)
+
+# Buffer formats of untyped bytes (bytes, bytearray, mmap, Arrow-style buffers, ...).
+#
+# Such buffers carry no element type, so their contents are reinterpreted as the dtype given by the caller.
+#
+_raw_formats = frozenset(("B", "b", "c"))
+
+def is_raw_buffer( x ):
+    """Return whether x is an untyped byte buffer (not an np.ndarray)."""
+    if isinstance(x, np.ndarray):
+        return False
+    try:
+        return memoryview(x).format in _raw_formats
+    except TypeError:  # no buffer protocol
+        return False
+
+def check_input( x, name="x", dtype=None ):
+    """Check that x is an array of a supported dtype, converting it (without copying) to np.ndarray.
+
+dtype is the element type of an untyped byte buffer (default float64); if given, typed input must also match it.
+"""
+    if is_raw_buffer(x):
+        x = np.frombuffer(x, dtype=(np.float64 if dtype is None else dtype))
+    else:
+        x = np.asarray(x)  # zero-copy for anything that supports the buffer protocol
+        if dtype is not None  and  x.dtype != dtype:
+            raise ValueError( "%s has dtype '%s', expected '%s'" % (name, x.dtype, np.dtype(dtype)) )
+    if x.dtype not in supported_dtypes:
+        raise ValueError( "%s has unsupported dtype '%s'; expected one of %s" % (name, x.dtype, [np.dtype(t).name for t in supported_dtypes]) )
+    return x
+
+def empty_like_container( x_orig, x ):
+    """Allocate an uninitialized container for a result like x (an np.ndarray view of x_orig), of the same type as x_orig.
+
+np.ndarray gives np.ndarray, array.array gives array.array, untyped byte buffers give bytearray,
+and anything else gives a memoryview.
+"""
+    if isinstance(x_orig, np.ndarray):
+        return np.empty_like(x_orig)
+    if isinstance(x_orig, array.array):
+        return array.array( x_orig.typecode, bytes(x.nbytes) )
+    if is_raw_buffer(x_orig):
+        return bytearray(x.nbytes)
+    return memoryview( np.empty_like(x) )
+
+def prepare_elementwise( x, out, inplace, dtype=None, like=False ):
+    """Check the input array of an elementwise operation, and allocate or check the output array.
+
+Return (x, out, out_orig), where x and out are np.ndarrays (views; no data is copied),
+and out_orig is what to return to the caller.
+
+If like is True, a newly allocated output is of the same container type as x (see empty_like_container()).
+"""
+    if inplace:
+        if out is not None:
+            raise ValueError( "cannot use both out and inplace=True" )
+        out = x
+
+    x_orig = x
+    x = check_input(x, dtype=dtype)
+
+    # np.empty() is a pretty good mechanism for dynamic allocation of arrays,
+    # as long as memory allocation can be done in Python parts of the code (no "nogil").
+    #
+    # If you absolutely need to dynamically allocate memory in nogil code,
+    # then "from libc.stdlib cimport malloc, free", and be ready for pain.
+    #
+    if out is None  and  not like:
+        out_orig = out = np.empty_like(x)  # same memory layout as x, when x is contiguous
+    elif out is None:
+        out_orig = out = empty_like_container(x_orig, x)
+        out = np.frombuffer(out, dtype=x.dtype) if is_raw_buffer(out) else np.asarray(out)
+    else:
+        out_orig = out
+        if is_raw_buffer(out):  # no dtype or shape of its own; use those of x
+            out = np.frombuffer(out, dtype=x.dtype)
+            if out.size == x.size:
+                out = out.reshape(x.shape)  # contiguous, so never copies
+        else:
+            out = np.asarray(out)
+        if out.dtype != x.dtype:
+            raise ValueError( "out has dtype '%s', expected '%s'" % (out.dtype, x.dtype) )
+        if out.shape != x.shape:
+            raise ValueError( "out has shape %s, expected %s" % (out.shape, x.shape) )
+        if not out.flags.writeable:
+            raise ValueError( "out is read-only" )
+
+        # Elementwise, writing out[j] only after reading x[j], so exact aliasing (in-place) is fine;
+        # any other overlap could read already-overwritten elements. This check is conservative.
+        #
+        if not (out.ctypes.data == x.ctypes.data  and  out.strides == x.strides)  and  np.may_share_memory(x, out):
+            raise ValueError( "out partially overlaps x; use either out=x or a separate array" )
+
+    return x, out, out_orig
@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+#
+# Cython-level declarations shared by mylibrary.compute and its kernel modules.
+#
+# The kernels of mylibrary.compute (see _kernels.pxi) are compiled several times, once per
+# instruction set variant, as the modules mylibrary._kernels_<variant>. Each module exports
+# a KernelTable of pointers to its kernels, in a capsule called "kernels"; at import time,
+# mylibrary.compute picks the best variant the CPU supports, and calls the kernels through
+# its table.
+#
+# There is no module mylibrary._kernels; this file only declares types.
+
+from __future__ import absolute_import
+
+# Name of the capsules holding a KernelTable.
+#
+cdef extern from *:
+    """
+    #define MYLIBRARY_KERNELS_CAPSULE "mylibrary._kernels.KernelTable"
+    """
+    const char* KERNELS_CAPSULE "MYLIBRARY_KERNELS_CAPSULE"
+
+# Reductions of f(x); see _reduce().
+#
+cdef enum:
+    _REDUCE_BLOCK     = 128  # base case of pairwise summation
+    _REDUCE_MAXCHUNKS = 64   # runs into which a large input is split (for threads); O(1) temporary memory
+
+cdef enum _Reduction:
+    _REDUCE_SUM
+    _REDUCE_DOT
+    _REDUCE_MIN
+    _REDUCE_MAX
+
+# Fused elementwise pipelines; see _pipeline().
+#
+cdef enum:
+    _PIPELINE_BLOCK   = 512  # elements; 4 kB for double
+    _PIPELINE_MAXOPS  = 32
+
+cdef enum _OpCode:
+    _OP_SCALE
+    _OP_OFFSET
+    _OP_SQRT
+    _OP_CLIP
+    _OP_ABS
+    _OP_SQUARE
+
+cdef struct _Op:
+    _OpCode code
+    double a
+    double b
+
+# One pointer per kernel and dtype. The signatures are those of the fused kernels in _kernels.pxi.
+#
+cdef struct KernelTable:
+    void (*sqrt_contig_float)( const float* x, float* out, Py_ssize_t n, int num_threads ) noexcept nogil
+    void (*sqrt_contig_double)( const double* x, double* out, Py_ssize_t n, int num_threads ) noexcept nogil
+
+    void (*sqrt_strided_float)( const float* x, Py_ssize_t xs0, Py_ssize_t xs1,
+                                float* out, Py_ssize_t os0, Py_ssize_t os1,
+                                Py_ssize_t m, Py_ssize_t n, int num_threads ) noexcept nogil
+    void (*sqrt_strided_double)( const double* x, Py_ssize_t xs0, Py_ssize_t xs1,
+                                 double* out, Py_ssize_t os0, Py_ssize_t os1,
+                                 Py_ssize_t m, Py_ssize_t n, int num_threads ) noexcept nogil
+
+    double (*pairwise_sum_float)( const float* x, Py_ssize_t xs0, Py_ssize_t xs1,
+                                  const float* y, Py_ssize_t ys0, Py_ssize_t ys1,
+                                  Py_ssize_t ncols, Py_ssize_t k0, Py_ssize_t count ) noexcept nogil
+    double (*pairwise_sum_double)( const double* x, Py_ssize_t xs0, Py_ssize_t xs1,
+                                   const double* y, Py_ssize_t ys0, Py_ssize_t ys1,
+                                   Py_ssize_t ncols, Py_ssize_t k0, Py_ssize_t count ) noexcept nogil
+
+    double (*extremum_float)( bint is_max, const float* x, Py_ssize_t xs0, Py_ssize_t xs1,
+                              Py_ssize_t ncols, Py_ssize_t k0, Py_ssize_t count ) noexcept nogil
+    double (*extremum_double)( bint is_max, const double* x, Py_ssize_t xs0, Py_ssize_t xs1,
+                               Py_ssize_t ncols, Py_ssize_t k0, Py_ssize_t count ) noexcept nogil
+
+    double (*reduce_float)( _Reduction op, const float* x, Py_ssize_t xs0, Py_ssize_t xs1,
+                            const float* y, Py_ssize_t ys0, Py_ssize_t ys1,
+                            Py_ssize_t m, Py_ssize_t n, bint chunked, int num_threads ) noexcept nogil
+    double (*reduce_double)( _Reduction op, const double* x, Py_ssize_t xs0, Py_ssize_t xs1,
+                             const double* y, Py_ssize_t ys0, Py_ssize_t ys1,
+                             Py_ssize_t m, Py_ssize_t n, bint chunked, int num_threads ) noexcept nogil
+
+    double (*combine)( _Reduction op, const double* partials, Py_ssize_t n ) noexcept nogil
+
+    void (*pipeline_float)( const _Op* ops, int nops, const float* x, Py_ssize_t xs0, Py_ssize_t xs1,
+                            float* out, Py_ssize_t os0, Py_ssize_t os1,
+                            Py_ssize_t m, Py_ssize_t n, int num_threads ) noexcept nogil
+    void (*pipeline_double)( const _Op* ops, int nops, const double* x, Py_ssize_t xs0, Py_ssize_t xs1,
+                             double* out, Py_ssize_t os0, Py_ssize_t os1,
+                             Py_ssize_t m, Py_ssize_t n, int num_threads ) noexcept nogil
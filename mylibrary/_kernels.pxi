@@ -0,0 +1,318 @@
+# -*- coding: utf-8 -*-
+#
+# The C-level kernels of mylibrary.compute.
+#
+# This file is included (textually) by each of the modules mylibrary._kernels_<variant>,
+# which setup.py compiles with different instruction set flags; see _kernels.pxd.
+# Edit the kernels here, not in the variant modules.
+
+cimport cython
+
+from libc.math cimport sqrt as c_sqrt, sqrtf as c_sqrtf
+
+from cython.parallel cimport prange
+
+from cpython.pycapsule cimport PyCapsule_New
+
+from mylibrary._kernels cimport *
+
+# Floating-point types the kernels are specialized for.
+#
+ctypedef fused real:
+    float
+    double
+
+
+#########################################################
+# Kernels
+#########################################################
+
+# These work on raw pointers, with strides counted in elements (not bytes), and never touch Python objects.
+#
+# num_threads follows the convention of f(): 1 = serial, 0 = OpenMP default, n > 1 = exactly n threads.
+# The caller is responsible for the serial cutoff.
+#
+# Otherwise, prange() splits the loop across an OpenMP thread team. Each iteration is independent,
+# so a static schedule is the right choice.
+#
+# (If the module is compiled without OpenMP, prange() silently degrades to a serial loop,
+#  so the result is the same either way.)
+
+# Called once per element; not worth a profiler entry or line trace (in the "profile" build of setup.py).
+#
+@cython.profile(False)
+@cython.linetrace(False)
+cdef inline real _sqrt( real v ) noexcept nogil:
+    if real is float:
+        return c_sqrtf(v)  # avoid a round trip through double
+    else:
+        return c_sqrt(v)
+
+# Contiguous 1-D kernel. This is the one the C compiler can vectorize.
+#
+cdef void _sqrt_contig( const real* x, real* out, Py_ssize_t n, int num_threads ) noexcept nogil:
+    cdef Py_ssize_t j
+    if num_threads == 1:
+        for j in range(n):
+            out[j] = _sqrt(x[j])
+    elif num_threads == 0:
+        for j in prange(n, schedule="static"):
+            out[j] = _sqrt(x[j])
+    else:
+        for j in prange(n, schedule="static", num_threads=num_threads):
+            out[j] = _sqrt(x[j])
+
+# Strided 2-D kernel, parallelized over rows.
+#
+# Any rank-1 or rank-2 view of an array can be described this way, so this covers
+# slices such as  x[::2]  and  x[:, 3:7]  as well as Fortran-ordered data.
+#
+cdef void _sqrt_strided( const real* x, Py_ssize_t xs0, Py_ssize_t xs1,
+                         real* out, Py_ssize_t os0, Py_ssize_t os1,
+                         Py_ssize_t m, Py_ssize_t n, int num_threads ) noexcept nogil:
+    cdef Py_ssize_t i, j
+    if num_threads == 1:
+        for i in range(m):
+            for j in range(n):
+                out[i*os0 + j*os1] = _sqrt(x[i*xs0 + j*xs1])
+    elif num_threads == 0:
+        for i in prange(m, schedule="static"):
+            for j in range(n):
+                out[i*os0 + j*os1] = _sqrt(x[i*xs0 + j*xs1])
+    else:
+        for i in prange(m, schedule="static", num_threads=num_threads):
+            for j in range(n):
+                out[i*os0 + j*os1] = _sqrt(x[i*xs0 + j*xs1])
+
+
+# Reductions of f(x) that stream over x once, without materializing f(x).
+#
+# Sums use pairwise summation (like NumPy's sum()), accumulating in double also for float32 input:
+# the rounding error grows as O(log n) instead of O(n), at essentially no extra cost.
+#
+# The input is a rank-2 strided array of m rows and n columns, reduced over all m*n elements.
+# A run of elements is addressed by its flat (row-major) index k0 and length count, so that
+# the summation tree does not depend on the memory layout.
+#
+# Sum of f(x) (times y, if y is not NULL) over a run of the flattened array.
+#
+cdef double _pairwise_sum( const real* x, Py_ssize_t xs0, Py_ssize_t xs1,
+                           const real* y, Py_ssize_t ys0, Py_ssize_t ys1,
+                           Py_ssize_t ncols, Py_ssize_t k0, Py_ssize_t count ) noexcept nogil:
+    cdef Py_ssize_t half
+    if count > _REDUCE_BLOCK:
+        half = count // 2
+        return ( _pairwise_sum(x, xs0, xs1, y, ys0, ys1, ncols, k0,        half)
+               + _pairwise_sum(x, xs0, xs1, y, ys0, ys1, ncols, k0 + half, count - half) )
+
+    # Base case: plain loop, one row segment at a time (a block may straddle rows).
+    cdef Py_ssize_t i = k0 // ncols, j = k0 - i*ncols
+    cdef Py_ssize_t t, seg
+    cdef const real* px
+    cdef const real* py
+    cdef double s = 0.0
+    while count > 0:
+        seg = min(count, ncols - j)
+        px  = x + i*xs0 + j*xs1
+        if y == NULL:
+            for t in range(seg):
+                s += _sqrt(px[t*xs1])
+        else:
+            py = y + i*ys0 + j*ys1
+            for t in range(seg):
+                s += <double>_sqrt(px[t*xs1]) * py[t*ys1]
+        count -= seg
+        i += 1
+        j  = 0
+    return s
+
+# Maximum (or minimum) of f(x) over a run of the flattened array. NaNs propagate, like in np.max().
+#
+cdef double _extremum( bint is_max, const real* x, Py_ssize_t xs0, Py_ssize_t xs1,
+                       Py_ssize_t ncols, Py_ssize_t k0, Py_ssize_t count ) noexcept nogil:
+    cdef Py_ssize_t i = k0 // ncols, j = k0 - i*ncols
+    cdef Py_ssize_t t, seg
+    cdef const real* px
+    cdef double v
+    cdef double result = _sqrt(x[i*xs0 + j*xs1])
+    while count > 0:
+        seg = min(count, ncols - j)
+        px  = x + i*xs0 + j*xs1
+        for t in range(seg):
+            v = _sqrt(px[t*xs1])
+            if v != v:  # NaN
+                return v
+            if (is_max and v > result)  or  (not is_max and v < result):
+                result = v
+        count -= seg
+        i += 1
+        j  = 0
+    return result
+
+# Reduce all m*n elements. The input must be nonempty.
+#
+# Large inputs are split into a fixed number of runs (independent of num_threads, so that the result
+# is too), which are reduced in parallel, and then combined.
+#
+cdef double _reduce( _Reduction op, const real* x, Py_ssize_t xs0, Py_ssize_t xs1,
+                     const real* y, Py_ssize_t ys0, Py_ssize_t ys1,
+                     Py_ssize_t m, Py_ssize_t n, bint chunked, int num_threads ) noexcept nogil:
+    cdef Py_ssize_t total = m * n
+    cdef Py_ssize_t nchunks = min(<Py_ssize_t>_REDUCE_MAXCHUNKS, total) if chunked else 1
+    cdef Py_ssize_t base = total // nchunks, extra = total % nchunks
+    cdef Py_ssize_t c, k0, count
+    cdef double partials[_REDUCE_MAXCHUNKS]
+
+    if num_threads == 1:
+        for c in range(nchunks):
+            k0    = c*base + min(c, extra)
+            count = base + (1 if c < extra else 0)
+            partials[c] = _reduce_run(op, x, xs0, xs1, y, ys0, ys1, n, k0, count)
+    elif num_threads == 0:
+        for c in prange(nchunks, schedule="static"):
+            k0    = c*base + min(c, extra)
+            count = base + (1 if c < extra else 0)
+            partials[c] = _reduce_run(op, x, xs0, xs1, y, ys0, ys1, n, k0, count)
+    else:
+        for c in prange(nchunks, schedule="static", num_threads=num_threads):
+            k0    = c*base + min(c, extra)
+            count = base + (1 if c < extra else 0)
+            partials[c] = _reduce_run(op, x, xs0, xs1, y, ys0, ys1, n, k0, count)
+
+    return _combine(op, partials, nchunks)
+
+cdef inline double _reduce_run( _Reduction op, const real* x, Py_ssize_t xs0, Py_ssize_t xs1,
+                                const real* y, Py_ssize_t ys0, Py_ssize_t ys1,
+                                Py_ssize_t ncols, Py_ssize_t k0, Py_ssize_t count ) noexcept nogil:
+    if op == _REDUCE_SUM:
+        return _pairwise_sum(x, xs0, xs1, <const real*>NULL, 0, 0, ncols, k0, count)
+    elif op == _REDUCE_DOT:
+        return _pairwise_sum(x, xs0, xs1, y, ys0, ys1, ncols, k0, count)
+    else:
+        return _extremum(op == _REDUCE_MAX, x, xs0, xs1, ncols, k0, count)
+
+# Combine partial results of the runs.
+#
+cdef double _combine( _Reduction op, const double* partials, Py_ssize_t n ) noexcept nogil:
+    cdef Py_ssize_t c
+    cdef double result = partials[0]
+    for c in range(1, n):
+        if op == _REDUCE_SUM  or  op == _REDUCE_DOT:
+            result += partials[c]
+        elif result != result:  # NaN propagates
+            break
+        elif ( partials[c] != partials[c]
+               or (op == _REDUCE_MAX and partials[c] > result)
+               or (op == _REDUCE_MIN and partials[c] < result) ):
+            result = partials[c]
+    return result
+
+
+# Fused elementwise pipelines: see class Pipeline.
+#
+# A pipeline is a short program of elementwise operations. Rather than taking one pass over memory
+# per operation, we run the whole program on one block of elements at a time. A block is small enough
+# to stay in L1 cache, so main memory is read once (x) and written once (out), whatever the number of
+# operations. Each operation is a precompiled loop over the block, so the interpretation overhead is
+# one dispatch per operation per block, not per element.
+#
+# Apply one operation to a run of n elements, from src to dst (which may be the same).
+#
+cdef void _apply_op( const _Op* op, const real* src, Py_ssize_t ss, real* dst, Py_ssize_t ds, Py_ssize_t n ) noexcept nogil:
+    if ss == 1  and  ds == 1:
+        _apply_op_impl(op, src, 1, dst, 1, n)  # constant strides, so that the C compiler can vectorize the inlined copy
+    else:
+        _apply_op_impl(op, src, ss, dst, ds, n)
+
+cdef inline void _apply_op_impl( const _Op* op, const real* src, Py_ssize_t ss, real* dst, Py_ssize_t ds, Py_ssize_t n ) noexcept nogil:
+    cdef Py_ssize_t t
+    cdef real a = <real>op.a, b = <real>op.b, v
+    if op.code == _OP_SCALE:
+        for t in range(n):
+            dst[t*ds] = src[t*ss] * a
+    elif op.code == _OP_OFFSET:
+        for t in range(n):
+            dst[t*ds] = src[t*ss] + b
+    elif op.code == _OP_SQRT:
+        for t in range(n):
+            dst[t*ds] = _sqrt(src[t*ss])
+    elif op.code == _OP_CLIP:
+        for t in range(n):
+            v = src[t*ss]
+            dst[t*ds] = a if v < a else (b if v > b else v)  # NaN passes through, like np.clip()
+    elif op.code == _OP_ABS:
+        for t in range(n):
+            v = src[t*ss]
+            dst[t*ds] = -v if v < 0 else v
+    elif op.code == _OP_SQUARE:
+        for t in range(n):
+            v = src[t*ss]
+            dst[t*ds] = v * v
+
+# Run the whole program on a run of elements within one row. The first operation reads x,
+# the rest work in place on out (which is in cache by then).
+#
+cdef void _run_ops( const _Op* ops, int nops, const real* x, Py_ssize_t xs, real* out, Py_ssize_t os, Py_ssize_t n ) noexcept nogil:
+    cdef Py_ssize_t t
+    cdef int k
+    if nops == 0:  # identity
+        for t in range(n):
+            out[t*os] = x[t*xs]
+        return
+    _apply_op(&ops[0], x, xs, out, os, n)
+    for k in range(1, nops):
+        _apply_op(&ops[k], out, os, out, os, n)
+
+# Run the program on block number blk of the flattened (row-major) rank-2 array of m rows, n columns.
+#
+cdef void _pipeline_block( const _Op* ops, int nops, const real* x, Py_ssize_t xs0, Py_ssize_t xs1,
+                           real* out, Py_ssize_t os0, Py_ssize_t os1,
+                           Py_ssize_t m, Py_ssize_t n, Py_ssize_t blk ) noexcept nogil:
+    cdef Py_ssize_t k0 = blk * _PIPELINE_BLOCK
+    cdef Py_ssize_t count = min(<Py_ssize_t>_PIPELINE_BLOCK, m*n - k0)
+    cdef Py_ssize_t i = k0 // n, j = k0 - i*n
+    cdef Py_ssize_t seg
+    while count > 0:  # a block may straddle rows
+        seg = min(count, n - j)
+        _run_ops(ops, nops, x + i*xs0 + j*xs1, xs1, out + i*os0 + j*os1, os1, seg)
+        count -= seg
+        i += 1
+        j  = 0
+
+cdef void _pipeline( const _Op* ops, int nops, const real* x, Py_ssize_t xs0, Py_ssize_t xs1,
+                     real* out, Py_ssize_t os0, Py_ssize_t os1,
+                     Py_ssize_t m, Py_ssize_t n, int num_threads ) noexcept nogil:
+    cdef Py_ssize_t nblocks = (m*n + _PIPELINE_BLOCK - 1) // _PIPELINE_BLOCK
+    cdef Py_ssize_t blk
+    if num_threads == 1:
+        for blk in range(nblocks):
+            _pipeline_block(ops, nops, x, xs0, xs1, out, os0, os1, m, n, blk)
+    elif num_threads == 0:
+        for blk in prange(nblocks, schedule="static"):
+            _pipeline_block(ops, nops, x, xs0, xs1, out, os0, os1, m, n, blk)
+    else:
+        for blk in prange(nblocks, schedule="static", num_threads=num_threads):
+            _pipeline_block(ops, nops, x, xs0, xs1, out, os0, os1, m, n, blk)
+
+
+#########################################################
+# Export
+#########################################################
+
+cdef KernelTable _table
+_table.sqrt_contig_float   = _sqrt_contig[float]
+_table.sqrt_contig_double  = _sqrt_contig[double]
+_table.sqrt_strided_float  = _sqrt_strided[float]
+_table.sqrt_strided_double = _sqrt_strided[double]
+_table.pairwise_sum_float  = _pairwise_sum[float]
+_table.pairwise_sum_double = _pairwise_sum[double]
+_table.extremum_float      = _extremum[float]
+_table.extremum_double     = _extremum[double]
+_table.reduce_float        = _reduce[float]
+_table.reduce_double       = _reduce[double]
+_table.combine             = _combine
+_table.pipeline_float      = _pipeline[float]
+_table.pipeline_double     = _pipeline[double]
+
+# The table is static, so it lives as long as the module.
+kernels = PyCapsule_New(&_table, KERNELS_CAPSULE, NULL)
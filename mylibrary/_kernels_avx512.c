@@ -0,0 +1,10452 @@
+/* Generated by Cython 3.3.0 */
+
+/* BEGIN: Cython Metadata
+{
+    "distutils": {
+        "depends": [],
+        "extra_compile_args": [
+            "-fopenmp",
+            "-O2",
+            "-fno-math-errno",
+            "-ftree-vectorize",
+            "-mavx512f",
+            "-mavx512dq",
+            "-mavx512vl",
+            "-mavx2",
+            "-mfma",
+            "-mprefer-vector-width=512"
+        ],
+        "extra_link_args": [
+            "-fopenmp"
+        ],
+        "include_dirs": [
+            "."
+        ],
+        "libraries": [
+            "m"
+        ],
+        "name": "mylibrary._kernels_avx512",
+        "sources": [
+            "mylibrary/_kernels_avx512.pyx"
+        ]
+    },
+    "module_name": "mylibrary._kernels_avx512"
+}
+END: Cython Metadata */
+
+#ifndef PY_SSIZE_T_CLEAN
+#define PY_SSIZE_T_CLEAN
+#endif /* PY_SSIZE_T_CLEAN */
+/* InitLimitedAPI */
+#if defined(Py_LIMITED_API)
+  #if !defined(CYTHON_LIMITED_API)
+  #define CYTHON_LIMITED_API 1
+  #endif
+#elif defined(CYTHON_LIMITED_API)
+  #ifdef _MSC_VER
+  #pragma message ("Limited API usage is enabled with 'CYTHON_LIMITED_API' but 'Py_LIMITED_API' does not define a Python target version. Consider setting 'Py_LIMITED_API' instead.")
+  #else
+  #warning Limited API usage is enabled with 'CYTHON_LIMITED_API' but 'Py_LIMITED_API' does not define a Python target version. Consider setting 'Py_LIMITED_API' instead.
+  #endif
+#endif
+
+#include "Python.h"
+#ifndef Py_PYTHON_H
+    #error Python headers needed to compile C extensions, please install development version of Python.
+#elif PY_VERSION_HEX < 0x03090000
+    #error Cython requires Python 3.9+.
+#elif defined(Py_LIMITED_API) && (Py_LIMITED_API & 0xFFFF0000) > (PY_VERSION_HEX & 0xFFFF0000)
+    #error 'Py_LIMITED_API' can only select past Python X.Y versions, not future ones.
+#else
+#define __PYX_ABI_VERSION "3_3_0"
+#define CYTHON_HEX_VERSION 0x030300F0
+#define CYTHON_FUTURE_DIVISION 1
+/* CModulePreamble */
+#include <stddef.h>
+#ifndef offsetof
+  #define offsetof(type, member) ( (size_t) & ((type*)0) -> member )
+#endif
+#if !defined(_WIN32) && !defined(WIN32) && !defined(MS_WINDOWS)
+  #ifndef __stdcall
+    #define __stdcall
+  #endif
+  #ifndef __cdecl
+    #define __cdecl
+  #endif
+  #ifndef __fastcall
+    #define __fastcall
+  #endif
+#endif
+#ifdef __has_builtin
+  #define __Pyx_has_cbuiltin(name) __has_builtin(name)
+#else
+  #define __Pyx_has_cbuiltin(name) (0)
+#endif
+#ifndef DL_IMPORT
+  #define DL_IMPORT(t) t
+#endif
+#ifndef DL_EXPORT
+  #define DL_EXPORT(t) t
+#endif
+#define __PYX_COMMA ,
+#ifndef PY_LONG_LONG
+  #define PY_LONG_LONG LONG_LONG
+#endif
+#ifndef Py_HUGE_VAL
+  #define Py_HUGE_VAL HUGE_VAL
+#endif
+#define __PYX_LIMITED_VERSION_HEX PY_VERSION_HEX
+#if defined(CYTHON_LIMITED_API)
+  #ifdef Py_LIMITED_API
+    #undef __PYX_LIMITED_VERSION_HEX
+    #define __PYX_LIMITED_VERSION_HEX Py_LIMITED_API
+    #if Py_LIMITED_API < 0x03090000
+      #error "Cython 3.3 requires the Python Limited API version to be 3.9 or greater."
+    #endif
+  #endif
+  #if defined(GRAALVM_PYTHON) || defined(PYPY_VERSION)
+    #ifdef _MSC_VER
+      #pragma message ("Py_LIMITED_API is defined on PyPy or GraalPy. This takes precedence over Cython's specialized\
+        code for PyPy and GraalPy and is unlikely to work.")
+    #else
+      #warning "Py_LIMITED_API is defined on PyPy or GraalPy. This takes precedence over Cython's specialized\
+        code for PyPy and GraalPy and is unlikely to work."
+    #endif
+  #endif
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_LIMITED_API 1
+  #define CYTHON_COMPILING_IN_GRAAL 0
+  #define CYTHON_COMPILING_IN_CPYTHON_FREETHREADING 0
+  #undef CYTHON_USE_TYPE_SLOTS
+  #define CYTHON_USE_TYPE_SLOTS 0
+  #undef CYTHON_USE_TYPE_SPECS
+  #define CYTHON_USE_TYPE_SPECS 1
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_INTERNALS
+  #define CYTHON_USE_UNICODE_INTERNALS 0
+  #ifndef CYTHON_USE_UNICODE_WRITER
+    #define CYTHON_USE_UNICODE_WRITER 0
+  #endif
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS
+    #define CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS 0
+  #endif
+  #undef CYTHON_ASSUME_SAFE_MACROS
+  #define CYTHON_ASSUME_SAFE_MACROS 0
+  #undef CYTHON_ASSUME_SAFE_SIZE
+  #define CYTHON_ASSUME_SAFE_SIZE 0
+  #undef CYTHON_UNPACK_METHODS
+  #define CYTHON_UNPACK_METHODS 0
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_GIL
+  #define CYTHON_FAST_GIL 0
+  #undef CYTHON_VECTORCALL
+  #define CYTHON_VECTORCALL (__PYX_LIMITED_VERSION_HEX >= 0x030C0000)
+  #ifndef CYTHON_VECTORCALL_TPNEW
+    #define CYTHON_VECTORCALL_TPNEW (CYTHON_VECTORCALL && __PYX_LIMITED_VERSION_HEX >= 0x030E0000)
+  #endif
+  #ifndef CYTHON_PEP487_INIT_SUBCLASS
+    #define CYTHON_PEP487_INIT_SUBCLASS 1
+  #endif
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #ifndef CYTHON_USE_MODULE_STATE
+    #define CYTHON_USE_MODULE_STATE 0
+  #endif
+  #undef CYTHON_USE_SYS_MONITORING
+  #define CYTHON_USE_SYS_MONITORING 0
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE (__PYX_LIMITED_VERSION_HEX >= 0x030F0000 && PY_VERSION_HEX > 0x030F00A8)
+  #endif
+  #ifndef CYTHON_USE_AM_SEND
+    #define CYTHON_USE_AM_SEND (__PYX_LIMITED_VERSION_HEX >= 0x030A0000)
+  #endif
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+  #ifndef CYTHON_USE_OWN_PREP_RERAISE_STAR
+    #define CYTHON_USE_OWN_PREP_RERAISE_STAR 1
+  #endif
+  #ifndef CYTHON_USE_FREELISTS
+  #define CYTHON_USE_FREELISTS 1
+  #endif
+  #undef CYTHON_IMMORTAL_CONSTANTS
+  #define CYTHON_IMMORTAL_CONSTANTS 0
+  #if __PYX_LIMITED_VERSION_HEX < 0x030E0000
+  #undef CYTHON_OPAQUE_OBJECTS
+  #define CYTHON_OPAQUE_OBJECTS 0
+  #elif !defined(CYTHON_OPAQUE_OBJECTS)
+  #define CYTHON_OPAQUE_OBJECTS (__PYX_LIMITED_VERSION_HEX >= 0x030F0000)
+  #endif
+#elif defined(GRAALVM_PYTHON)
+  /* For very preliminary testing purposes. Most variables are set the same as PyPy.
+     The existence of this section does not imply that anything works or is even tested */
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_LIMITED_API 0
+  #define CYTHON_COMPILING_IN_GRAAL 1
+  #define CYTHON_COMPILING_IN_CPYTHON_FREETHREADING 0
+  #ifndef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 0
+  #endif
+  #undef CYTHON_USE_TYPE_SPECS
+  #define CYTHON_USE_TYPE_SPECS 0
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_INTERNALS
+  #define CYTHON_USE_UNICODE_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #undef CYTHON_AVOID_BORROWED_REFS
+  #define CYTHON_AVOID_BORROWED_REFS 1
+  #undef CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS
+  #define CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS 0
+  #undef CYTHON_ASSUME_SAFE_MACROS
+  #define CYTHON_ASSUME_SAFE_MACROS 0
+  #undef CYTHON_ASSUME_SAFE_SIZE
+  #define CYTHON_ASSUME_SAFE_SIZE 0
+  #undef CYTHON_UNPACK_METHODS
+  #define CYTHON_UNPACK_METHODS 0
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_GIL
+  #define CYTHON_FAST_GIL 0
+  #ifndef CYTHON_VECTORCALL
+    #define CYTHON_VECTORCALL 1
+  #endif
+  #if CYTHON_USE_TYPE_SPECS && PY_VERSION_HEX < 0x030E0000
+    #undef CYTHON_VECTORCALL_TPNEW
+    #define CYTHON_VECTORCALL_TPNEW 0
+  #elif !defined(CYTHON_VECTORCALL_TPNEW)
+    #define CYTHON_VECTORCALL_TPNEW CYTHON_VECTORCALL
+  #endif
+  #ifndef CYTHON_PEP487_INIT_SUBCLASS
+    #define CYTHON_PEP487_INIT_SUBCLASS 1
+  #endif
+  #undef CYTHON_PEP489_MULTI_PHASE_INIT
+  #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #undef CYTHON_USE_MODULE_STATE
+  #define CYTHON_USE_MODULE_STATE 0
+  #undef CYTHON_USE_SYS_MONITORING
+  #define CYTHON_USE_SYS_MONITORING 0
+  #undef CYTHON_USE_TP_FINALIZE
+  #define CYTHON_USE_TP_FINALIZE 0
+  #undef CYTHON_USE_AM_SEND
+  #define CYTHON_USE_AM_SEND 0
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 1
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+  #ifndef CYTHON_USE_OWN_PREP_RERAISE_STAR
+    #define CYTHON_USE_OWN_PREP_RERAISE_STAR 1
+  #endif
+  #undef CYTHON_USE_FREELISTS
+  #define CYTHON_USE_FREELISTS 0
+  #undef CYTHON_IMMORTAL_CONSTANTS
+  #define CYTHON_IMMORTAL_CONSTANTS 0
+  #undef CYTHON_OPAQUE_OBJECTS
+  #define CYTHON_OPAQUE_OBJECTS 0
+#elif defined(PYPY_VERSION)
+  #define CYTHON_COMPILING_IN_PYPY 1
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_LIMITED_API 0
+  #define CYTHON_COMPILING_IN_GRAAL 0
+  #define CYTHON_COMPILING_IN_CPYTHON_FREETHREADING 0
+  #undef CYTHON_USE_TYPE_SLOTS
+  #define CYTHON_USE_TYPE_SLOTS 1
+  #ifndef CYTHON_USE_TYPE_SPECS
+    #define CYTHON_USE_TYPE_SPECS 0
+  #endif
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_INTERNALS
+  #define CYTHON_USE_UNICODE_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #undef CYTHON_AVOID_BORROWED_REFS
+  #define CYTHON_AVOID_BORROWED_REFS 1
+  #undef CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS
+  #define CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS 1
+  #undef CYTHON_ASSUME_SAFE_MACROS
+  #define CYTHON_ASSUME_SAFE_MACROS 0
+  #ifndef CYTHON_ASSUME_SAFE_SIZE
+    #define CYTHON_ASSUME_SAFE_SIZE 1
+  #endif
+  #undef CYTHON_UNPACK_METHODS
+  #define CYTHON_UNPACK_METHODS 0
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_GIL
+  #define CYTHON_FAST_GIL 0
+  #ifndef CYTHON_VECTORCALL
+    #define CYTHON_VECTORCALL 1
+  #endif
+  #if CYTHON_USE_TYPE_SPECS && PY_VERSION_HEX < 0x030E0000
+    #undef CYTHON_VECTORCALL_TPNEW
+    #define CYTHON_VECTORCALL_TPNEW 0
+  #elif !defined(CYTHON_VECTORCALL_TPNEW)
+    #define CYTHON_VECTORCALL_TPNEW (PYPY_VERSION_NUM >= 0x07030800 && CYTHON_VECTORCALL)
+  #endif
+  #ifndef CYTHON_PEP487_INIT_SUBCLASS
+    #define CYTHON_PEP487_INIT_SUBCLASS 1
+  #endif
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #undef CYTHON_USE_MODULE_STATE
+  #define CYTHON_USE_MODULE_STATE 0
+  #undef CYTHON_USE_SYS_MONITORING
+  #define CYTHON_USE_SYS_MONITORING 0
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE (PYPY_VERSION_NUM >= 0x07030C00)
+  #endif
+  #undef CYTHON_USE_AM_SEND
+  #define CYTHON_USE_AM_SEND 0
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC (PYPY_VERSION_NUM >= 0x07031100)
+  #endif
+  #ifndef CYTHON_USE_OWN_PREP_RERAISE_STAR
+    #define CYTHON_USE_OWN_PREP_RERAISE_STAR 1
+  #endif
+  #undef CYTHON_USE_FREELISTS
+  #define CYTHON_USE_FREELISTS 0
+  #undef CYTHON_IMMORTAL_CONSTANTS
+  #define CYTHON_IMMORTAL_CONSTANTS 0
+  #undef CYTHON_OPAQUE_OBJECTS
+  #define CYTHON_OPAQUE_OBJECTS 0
+#else
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_CPYTHON 1
+  #define CYTHON_COMPILING_IN_LIMITED_API 0
+  #define CYTHON_COMPILING_IN_GRAAL 0
+  #ifdef Py_GIL_DISABLED
+    #define CYTHON_COMPILING_IN_CPYTHON_FREETHREADING 1
+  #else
+    #define CYTHON_COMPILING_IN_CPYTHON_FREETHREADING 0
+  #endif
+  #if PY_VERSION_HEX < 0x030A0000
+    #undef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #elif !defined(CYTHON_USE_TYPE_SLOTS)
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #ifndef CYTHON_USE_TYPE_SPECS
+    #define CYTHON_USE_TYPE_SPECS 0
+  #endif
+  #ifndef CYTHON_USE_PYTYPE_LOOKUP
+    #define CYTHON_USE_PYTYPE_LOOKUP 1
+  #endif
+  #ifndef CYTHON_USE_PYLONG_INTERNALS
+    #define CYTHON_USE_PYLONG_INTERNALS 1
+  #endif
+  #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    #undef CYTHON_USE_PYLIST_INTERNALS
+    #define CYTHON_USE_PYLIST_INTERNALS 0
+  #elif !defined(CYTHON_USE_PYLIST_INTERNALS)
+    #define CYTHON_USE_PYLIST_INTERNALS 1
+  #endif
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING || PY_VERSION_HEX >= 0x030B00A2
+    #undef CYTHON_USE_UNICODE_WRITER
+    #define CYTHON_USE_UNICODE_WRITER 0
+  #elif !defined(CYTHON_USE_UNICODE_WRITER)
+    #define CYTHON_USE_UNICODE_WRITER 1
+  #endif
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    #undef CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS
+    #define CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS 1
+  #elif !defined(CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS)
+    #define CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_SIZE
+    #define CYTHON_ASSUME_SAFE_SIZE 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #ifndef CYTHON_FAST_THREAD_STATE
+    #define CYTHON_FAST_THREAD_STATE 1
+  #endif
+  #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    #undef CYTHON_FAST_GIL
+    #define CYTHON_FAST_GIL 0
+  #elif !defined(CYTHON_FAST_GIL)
+    #define CYTHON_FAST_GIL (PY_VERSION_HEX < 0x030C00A6)
+  #endif
+  #ifndef CYTHON_VECTORCALL
+    #define CYTHON_VECTORCALL 1
+  #endif
+  #if CYTHON_USE_TYPE_SPECS && PY_VERSION_HEX < 0x030E0000
+    #undef CYTHON_VECTORCALL_TPNEW
+    #define CYTHON_VECTORCALL_TPNEW 0
+  #elif !defined(CYTHON_VECTORCALL_TPNEW)
+    #define CYTHON_VECTORCALL_TPNEW CYTHON_VECTORCALL
+  #endif
+  #ifndef CYTHON_PEP487_INIT_SUBCLASS
+    #define CYTHON_PEP487_INIT_SUBCLASS 1
+  #endif
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #ifndef CYTHON_USE_MODULE_STATE
+    #define CYTHON_USE_MODULE_STATE 0
+  #endif
+  #ifndef CYTHON_USE_SYS_MONITORING
+    #define CYTHON_USE_SYS_MONITORING (PY_VERSION_HEX >= 0x030d00B1)
+  #endif
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE 1
+  #endif
+  #ifndef CYTHON_USE_AM_SEND
+    #define CYTHON_USE_AM_SEND 1
+  #endif
+  #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    #undef CYTHON_USE_DICT_VERSIONS
+    #define CYTHON_USE_DICT_VERSIONS 0
+  #elif !defined(CYTHON_USE_DICT_VERSIONS)
+    #define CYTHON_USE_DICT_VERSIONS  (PY_VERSION_HEX < 0x030C00A5 && !CYTHON_USE_MODULE_STATE)
+  #endif
+  #ifndef CYTHON_USE_EXC_INFO_STACK
+    #define CYTHON_USE_EXC_INFO_STACK 1
+  #endif
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 1
+  #endif
+  #ifndef CYTHON_USE_OWN_PREP_RERAISE_STAR
+    #define CYTHON_USE_OWN_PREP_RERAISE_STAR (PY_VERSION_HEX < 0x030C00B2)
+  #endif
+  #ifndef CYTHON_USE_FREELISTS
+    #define CYTHON_USE_FREELISTS (!CYTHON_COMPILING_IN_CPYTHON_FREETHREADING)
+  #endif
+  #if defined(CYTHON_IMMORTAL_CONSTANTS) && PY_VERSION_HEX < 0x030C0000
+    #undef CYTHON_IMMORTAL_CONSTANTS
+    #define CYTHON_IMMORTAL_CONSTANTS 0  // definitely won't work
+  #elif !defined(CYTHON_IMMORTAL_CONSTANTS)
+    #define CYTHON_IMMORTAL_CONSTANTS (PY_VERSION_HEX >= 0x030C0000 && !CYTHON_USE_MODULE_STATE && CYTHON_COMPILING_IN_CPYTHON_FREETHREADING)
+  #endif
+  #ifndef CYTHON_OPAQUE_OBJECTS
+    #define CYTHON_OPAQUE_OBJECTS 0
+  #endif
+#endif
+#if CYTHON_USE_PYLONG_INTERNALS
+  #undef SHIFT
+  #undef BASE
+  #undef MASK
+  #ifdef SIZEOF_VOID_P
+    enum { __pyx_check_sizeof_voidp = 1 / (int)(SIZEOF_VOID_P == sizeof(void*)) };
+  #endif
+#endif
+#ifndef __has_attribute
+  #define __has_attribute(x) 0
+#endif
+#ifndef __has_cpp_attribute
+  #define __has_cpp_attribute(x) 0
+#endif
+#ifndef CYTHON_RESTRICT
+  #if defined(__GNUC__)
+    #define CYTHON_RESTRICT __restrict__
+  #elif defined(_MSC_VER) && _MSC_VER >= 1400
+    #define CYTHON_RESTRICT __restrict
+  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define CYTHON_RESTRICT restrict
+  #else
+    #define CYTHON_RESTRICT
+  #endif
+#endif
+#ifndef CYTHON_UNUSED
+  #if defined(__cplusplus)
+    /* for clang __has_cpp_attribute(maybe_unused) is true even before C++17
+     * but leads to warnings with -pedantic, since it is a C++17 feature */
+    #if ((defined(_MSVC_LANG) && _MSVC_LANG >= 201703L) || __cplusplus >= 201703L)
+      #if __has_cpp_attribute(maybe_unused)
+        #define CYTHON_UNUSED [[maybe_unused]]
+      #endif
+    #endif
+  #elif defined(__STDC_VERSION__) && __STDC_VERSION__ >= 202311L
+    #define CYTHON_UNUSED [[maybe_unused]]
+  #endif
+#endif
+#ifndef CYTHON_UNUSED
+# if defined(__GNUC__)
+#   if !(defined(__cplusplus)) || (__GNUC__ > 3 || (__GNUC__ == 3 && __GNUC_MINOR__ >= 4))
+#     define CYTHON_UNUSED __attribute__ ((__unused__))
+#   else
+#     define CYTHON_UNUSED
+#   endif
+# elif defined(__ICC) || (defined(__INTEL_COMPILER) && !defined(_MSC_VER))
+#   define CYTHON_UNUSED __attribute__ ((__unused__))
+# else
+#   define CYTHON_UNUSED
+# endif
+#endif
+#ifndef CYTHON_UNUSED_VAR
+#  if defined(__cplusplus)
+     template<class T> void CYTHON_UNUSED_VAR( const T& ) { }
+#  else
+#    define CYTHON_UNUSED_VAR(x) (void)(x)
+#  endif
+#endif
+#ifndef CYTHON_MAYBE_UNUSED_VAR
+  #define CYTHON_MAYBE_UNUSED_VAR(x) CYTHON_UNUSED_VAR(x)
+#endif
+#ifndef CYTHON_NCP_UNUSED
+# if CYTHON_COMPILING_IN_CPYTHON && !CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+#  define CYTHON_NCP_UNUSED
+# else
+#  define CYTHON_NCP_UNUSED CYTHON_UNUSED
+# endif
+#endif
+#ifndef CYTHON_USE_CPP_STD_MOVE
+  #if defined(__cplusplus) && (\
+    __cplusplus >= 201103L || (defined(_MSC_VER) && _MSC_VER >= 1600))
+    #define CYTHON_USE_CPP_STD_MOVE 1
+  #else
+    #define CYTHON_USE_CPP_STD_MOVE 0
+  #endif
+#endif
+#define __Pyx_void_to_None(void_result) ((void)(void_result), Py_INCREF(Py_None), Py_None)
+#include <stdint.h>
+typedef uintptr_t  __pyx_uintptr_t;
+#ifndef CYTHON_FALLTHROUGH
+  #if defined(__cplusplus)
+    /* for clang __has_cpp_attribute(fallthrough) is true even before C++17
+     * but leads to warnings with -pedantic, since it is a C++17 feature */
+    #if ((defined(_MSVC_LANG) && _MSVC_LANG >= 201703L) || __cplusplus >= 201703L)
+      #if __has_cpp_attribute(fallthrough)
+        #define CYTHON_FALLTHROUGH [[fallthrough]]
+      #endif
+    #endif
+    #ifndef CYTHON_FALLTHROUGH
+      #if __has_cpp_attribute(clang::fallthrough)
+        #define CYTHON_FALLTHROUGH [[clang::fallthrough]]
+      #elif __has_cpp_attribute(gnu::fallthrough)
+        #define CYTHON_FALLTHROUGH [[gnu::fallthrough]]
+      #endif
+    #endif
+  #endif
+  #ifndef CYTHON_FALLTHROUGH
+    #if __has_attribute(fallthrough)
+      #define CYTHON_FALLTHROUGH __attribute__((fallthrough))
+    #else
+      #define CYTHON_FALLTHROUGH
+    #endif
+  #endif
+  #if defined(__clang__) && defined(__apple_build_version__)
+    #if __apple_build_version__ < 7000000
+      #undef  CYTHON_FALLTHROUGH
+      #define CYTHON_FALLTHROUGH
+    #endif
+  #endif
+#endif
+#ifdef Py_UNREACHABLE
+  #define __Pyx_UNREACHABLE() Py_UNREACHABLE()
+#elif __Pyx_has_cbuiltin(__builtin_unreachable)
+  #define __Pyx_UNREACHABLE() __builtin_unreachable()
+#elif defined(__clang__) || defined(__INTEL_COMPILER) || (defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 5)))
+  #define __Pyx_UNREACHABLE() __builtin_unreachable()
+#elif defined(_MSC_VER)
+  #define __Pyx_UNREACHABLE() __assume(0)
+#else
+  #define __Pyx_UNREACHABLE() Py_FatalError("Unreachable C code path reached")
+#endif
+#ifndef Py_UNREACHABLE
+  #define Py_UNREACHABLE() __Pyx_UNREACHABLE()
+#endif
+#ifdef __cplusplus
+  template <typename T>
+  struct __PYX_IS_UNSIGNED_IMPL {static const bool value = T(0) < T(-1);};
+  #define __PYX_IS_UNSIGNED(type) (__PYX_IS_UNSIGNED_IMPL<type>::value)
+#else
+  #define __PYX_IS_UNSIGNED(type) (((type)-1) > 0)
+#endif
+#if CYTHON_COMPILING_IN_PYPY == 1
+  #define __PYX_NEED_TP_PRINT_SLOT  (PY_VERSION_HEX < 0x030A0000)
+#else
+  #define __PYX_NEED_TP_PRINT_SLOT  0
+#endif
+#define __PYX_REINTERPRET_FUNCION(func_pointer, other_pointer) ((func_pointer)(void(*)(void))(other_pointer))
+#if __PYX_LIMITED_VERSION_HEX < 0x030C0000
+#define __Pyx_PyErr_FetchException(petype, peval, petb) PyErr_Fetch(petype, peval, petb)
+#define __Pyx_PyErr_RestoreException(etype, eval, etb) PyErr_Restore(etype, eval, etb)
+#else
+#define __Pyx_PyErr_FetchException(petype, peval, petb) *(petype)=NULL; *(peval)=PyErr_GetRaisedException(); *(petb)=NULL
+#define __Pyx_PyErr_RestoreException(etype, eval, etb) PyErr_SetRaisedException(eval)
+#endif
+
+/* CInitCode */
+#ifndef CYTHON_INLINE
+  #if defined(__clang__)
+    #define CYTHON_INLINE __inline__ __attribute__ ((__unused__))
+  #elif defined(__GNUC__)
+    #define CYTHON_INLINE __inline__
+  #elif defined(_MSC_VER)
+    #define CYTHON_INLINE __inline
+  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define CYTHON_INLINE inline
+  #else
+    #define CYTHON_INLINE
+  #endif
+#endif
+
+/* PythonCompatibility */
+#define __PYX_BUILD_PY_SSIZE_T "n"
+#define CYTHON_FORMAT_SSIZE_T "z"
+#define __Pyx_BUILTIN_MODULE_NAME "builtins"
+#define __Pyx_DefaultClassType PyType_Type
+#if CYTHON_COMPILING_IN_LIMITED_API
+    #ifndef CO_OPTIMIZED
+    static int CO_OPTIMIZED;
+    #endif
+    #ifndef CO_NEWLOCALS
+    static int CO_NEWLOCALS;
+    #endif
+    #ifndef CO_VARARGS
+    static int CO_VARARGS;
+    #endif
+    #ifndef CO_VARKEYWORDS
+    static int CO_VARKEYWORDS;
+    #endif
+    #ifndef CO_ASYNC_GENERATOR
+    static int CO_ASYNC_GENERATOR;
+    #endif
+    #ifndef CO_GENERATOR
+    static int CO_GENERATOR;
+    #endif
+    #ifndef CO_COROUTINE
+    static int CO_COROUTINE;
+    #endif
+#else
+    #ifndef CO_COROUTINE
+      #define CO_COROUTINE 0x80
+    #endif
+    #ifndef CO_ASYNC_GENERATOR
+      #define CO_ASYNC_GENERATOR 0x200
+    #endif
+#endif
+static int __Pyx_init_co_variables(void);
+#if PY_VERSION_HEX >= 0x030A00B1 || defined(Py_Is)
+  #define __Pyx_Py_Is(x, y)  Py_Is(x, y)
+#else
+  #define __Pyx_Py_Is(x, y) ((x) == (y))
+#endif
+#if PY_VERSION_HEX >= 0x030A00B1 || defined(Py_IsNone)
+  #define __Pyx_Py_IsNone(ob) Py_IsNone(ob)
+#else
+  #define __Pyx_Py_IsNone(ob) __Pyx_Py_Is((ob), Py_None)
+#endif
+#if PY_VERSION_HEX >= 0x030A00B1 || defined(Py_IsTrue)
+  #define __Pyx_Py_IsTrue(ob) Py_IsTrue(ob)
+#else
+  #define __Pyx_Py_IsTrue(ob) __Pyx_Py_Is((ob), Py_True)
+#endif
+#if PY_VERSION_HEX >= 0x030A00B1 || defined(Py_IsFalse)
+  #define __Pyx_Py_IsFalse(ob) Py_IsFalse(ob)
+#else
+  #define __Pyx_Py_IsFalse(ob) __Pyx_Py_Is((ob), Py_False)
+#endif
+#define __Pyx_NoneAsNull(obj)  (__Pyx_Py_IsNone(obj) ? NULL : (obj))
+#if CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyObject_GC_IsFinalized(o) _PyGC_FINALIZED(o)
+#else
+  #define __Pyx_PyObject_GC_IsFinalized(o) PyObject_GC_IsFinalized(o)
+#endif
+#if CYTHON_COMPILING_IN_LIMITED_API
+static unsigned long __Pyx_Runtime_TPFLAGS_SEQUENCE;
+static unsigned long __Pyx_Runtime_TPFLAGS_MAPPING;
+#else
+#define __Pyx_Runtime_TPFLAGS_SEQUENCE Py_TPFLAGS_SEQUENCE
+#define __Pyx_Runtime_TPFLAGS_MAPPING Py_TPFLAGS_MAPPING
+#endif
+static int __Pyx_init_tpflags_variables(void);
+#ifndef Py_TPFLAGS_HAVE_FINALIZE
+  #define Py_TPFLAGS_HAVE_FINALIZE 0
+#endif
+#ifndef Py_TPFLAGS_SEQUENCE
+  #define Py_TPFLAGS_SEQUENCE (CYTHON_COMPILING_IN_LIMITED_API ? 0 : 1 << 5)
+#endif
+#ifndef Py_TPFLAGS_MAPPING
+  #define Py_TPFLAGS_MAPPING (CYTHON_COMPILING_IN_LIMITED_API ? 0 : 1 << 6)
+#endif
+#ifndef Py_TPFLAGS_IMMUTABLETYPE
+  #define Py_TPFLAGS_IMMUTABLETYPE (1UL << 8)
+#endif
+#ifndef Py_TPFLAGS_DISALLOW_INSTANTIATION
+  #define Py_TPFLAGS_DISALLOW_INSTANTIATION (1UL << 7)
+#endif
+#ifndef METH_STACKLESS
+  #define METH_STACKLESS 0
+#endif
+#if !defined(METH_FASTCALL) || CYTHON_COMPILING_IN_PYPY
+  #ifndef METH_FASTCALL
+     #define METH_FASTCALL 0x80
+  #endif
+  typedef PyObject *(*__Pyx_PyCFunctionFast) (PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+  typedef PyObject *(*__Pyx_PyCFunctionFastWithKeywords) (PyObject *self, PyObject *const *args,
+                                                          Py_ssize_t nargs, PyObject *kwnames);
+#else
+  #if PY_VERSION_HEX >= 0x030d00A4
+  #  define __Pyx_PyCFunctionFast PyCFunctionFast
+  #  define __Pyx_PyCFunctionFastWithKeywords PyCFunctionFastWithKeywords
+  #else
+  #  define __Pyx_PyCFunctionFast _PyCFunctionFast
+  #  define __Pyx_PyCFunctionFastWithKeywords _PyCFunctionFastWithKeywords
+  #endif
+#endif
+#if CYTHON_VECTORCALL
+  #define __Pyx_METH_FASTCALL METH_FASTCALL
+  #define __Pyx_PyCFunction_FastCall __Pyx_PyCFunctionFast
+  #define __Pyx_PyCFunction_FastCallWithKeywords __Pyx_PyCFunctionFastWithKeywords
+#else
+  #define __Pyx_METH_FASTCALL METH_VARARGS
+  #define __Pyx_PyCFunction_FastCall PyCFunction
+  #define __Pyx_PyCFunction_FastCallWithKeywords PyCFunctionWithKeywords
+#endif
+#if CYTHON_VECTORCALL
+  #define __pyx_vectorcallfunc vectorcallfunc
+  #define __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET  PY_VECTORCALL_ARGUMENTS_OFFSET
+  #define __Pyx_PyVectorcall_NARGS(n)  PyVectorcall_NARGS((size_t)(n))
+#else
+  #define __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET  0
+  #define __Pyx_PyVectorcall_NARGS(n)  ((Py_ssize_t)(n))
+#endif
+#define __Pyx_PyCFunction_CheckExact(func) PyCFunction_CheckExact(func)
+#define __Pyx_CyOrPyCFunction_Check(func)  PyCFunction_Check(func)
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_CyOrPyCFunction_GET_FUNCTION(func)  (((PyCFunctionObject*)(func))->m_ml->ml_meth)
+#elif !CYTHON_COMPILING_IN_LIMITED_API
+#define __Pyx_CyOrPyCFunction_GET_FUNCTION(func)  PyCFunction_GET_FUNCTION(func)
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_CyOrPyCFunction_GET_FLAGS(func)  (((PyCFunctionObject*)(func))->m_ml->ml_flags)
+static CYTHON_INLINE PyObject* __Pyx_CyOrPyCFunction_GET_SELF(PyObject *func) {
+    return (__Pyx_CyOrPyCFunction_GET_FLAGS(func) & METH_STATIC) ? NULL : ((PyCFunctionObject*)func)->m_self;
+}
+#endif
+static CYTHON_INLINE int __Pyx__IsSameCFunction(PyObject *func, void (*cfunc)(void)) {
+#if CYTHON_COMPILING_IN_LIMITED_API
+    return PyCFunction_Check(func) && PyCFunction_GetFunction(func) == (PyCFunction) cfunc;
+#else
+    return PyCFunction_Check(func) && PyCFunction_GET_FUNCTION(func) == (PyCFunction) cfunc;
+#endif
+}
+#define __Pyx_IsSameCFunction(func, cfunc)   __Pyx__IsSameCFunction(func, cfunc)
+#if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030A0000
+  #define __Pyx_PyType_FromModuleAndSpec(m, s, b)  ((void)m, PyType_FromSpecWithBases(s, b))
+#else
+  #define __Pyx_PyType_FromModuleAndSpec(m, s, b)  PyType_FromModuleAndSpec(m, s, b)
+#endif
+#if CYTHON_COMPILING_IN_PYPY
+  typedef PyObject *(*__Pyx_PyCMethod)(PyObject *, PyTypeObject *, PyObject *const *, size_t, PyObject *);
+#else
+  #define __Pyx_PyCMethod  PyCMethod
+#endif
+#ifndef METH_METHOD
+  #define METH_METHOD 0x200
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyObject_Malloc)
+  #define PyObject_Malloc(s)   PyMem_Malloc(s)
+  #define PyObject_Free(p)     PyMem_Free(p)
+  #define PyObject_Realloc(p)  PyMem_Realloc(p)
+#endif
+#if CYTHON_COMPILING_IN_LIMITED_API
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno)
+#elif CYTHON_COMPILING_IN_GRAAL && defined(GRAALPY_VERSION_NUM) && GRAALPY_VERSION_NUM > 0x19000000
+  #define __Pyx_PyCode_HasFreeVars(co)  (PyCode_GetNumFree(co) > 0)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno) GraalPyFrame_SetLineNumber((frame), (lineno))
+#elif CYTHON_COMPILING_IN_GRAAL
+  #define __Pyx_PyCode_HasFreeVars(co)  (PyCode_GetNumFree(co) > 0)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno) _PyFrame_SetLineNumber((frame), (lineno))
+#else
+  #define __Pyx_PyCode_HasFreeVars(co)  (PyCode_GetNumFree(co) > 0)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno)  (frame)->f_lineno = (lineno)
+#endif
+#if CYTHON_COMPILING_IN_LIMITED_API
+  #define __Pyx_PyThreadState_Current PyThreadState_Get()
+#elif !CYTHON_FAST_THREAD_STATE
+  #define __Pyx_PyThreadState_Current PyThreadState_GET()
+#elif PY_VERSION_HEX >= 0x030d00A1
+  #define __Pyx_PyThreadState_Current PyThreadState_GetUnchecked()
+#else
+  #define __Pyx_PyThreadState_Current _PyThreadState_UncheckedGet()
+#endif
+#if CYTHON_OPAQUE_OBJECTS && CYTHON_COMPILING_IN_LIMITED_API
+    #define __PYX_SHARED_SIZEOF(T) -((int)sizeof(T))
+    #define __PYX_SHARED_RELATIVE_OFFSET Py_RELATIVE_OFFSET
+    #define CYTHON_OPAQUE_SHARED_TYPES 1
+#else
+    #define __PYX_SHARED_SIZEOF(T) sizeof(T)
+    #define __PYX_SHARED_RELATIVE_OFFSET 0
+    #define CYTHON_OPAQUE_SHARED_TYPES 0
+#endif
+#if CYTHON_USE_MODULE_STATE
+static CYTHON_INLINE void *__Pyx__PyModule_GetState(PyObject *op)
+{
+    void *result;
+    result = PyModule_GetState(op);
+    if (!result)
+        Py_FatalError("Couldn't find the module state");
+    return result;
+}
+#define __Pyx_PyModule_GetState(o) (__pyx_mstatetype *)__Pyx__PyModule_GetState(o)
+#else
+#define __Pyx_PyModule_GetState(op) ((void)op,__pyx_mstate_global)
+#endif
+#define __Pyx_PyObject_GetSlot(obj, name, func_ctype)  __Pyx_PyType_GetSlot(Py_TYPE((PyObject *) obj), name, func_ctype)
+#define __Pyx_PyObject_TryGetSlot(obj, name, func_ctype) __Pyx_PyType_TryGetSlot(Py_TYPE(obj), name, func_ctype)
+#define __Pyx_PyObject_GetSubSlot(obj, sub, name, func_ctype) __Pyx_PyType_GetSubSlot(Py_TYPE(obj), sub, name, func_ctype)
+#define __Pyx_PyObject_TryGetSubSlot(obj, sub, name, func_ctype) __Pyx_PyType_TryGetSubSlot(Py_TYPE(obj), sub, name, func_ctype)
+#if CYTHON_USE_TYPE_SLOTS
+  #define __Pyx_PyType_GetSlot(type, name, func_ctype)  ((type)->name)
+  #define __Pyx_PyType_TryGetSlot(type, name, func_ctype) __Pyx_PyType_GetSlot(type, name, func_ctype)
+  #define __Pyx_PyType_GetSubSlot(type, sub, name, func_ctype) (((type)->sub) ? ((type)->sub->name) : NULL)
+  #define __Pyx_PyType_TryGetSubSlot(type, sub, name, func_ctype) __Pyx_PyType_GetSubSlot(type, sub, name, func_ctype)
+#else
+  #define __Pyx_PyType_GetSlot(type, name, func_ctype)  ((func_ctype) PyType_GetSlot((type), Py_##name))
+  #define __Pyx_PyType_TryGetSlot(type, name, func_ctype)\
+    ((__PYX_LIMITED_VERSION_HEX >= 0x030A0000 ||\
+     (PyType_GetFlags(type) & Py_TPFLAGS_HEAPTYPE) || __Pyx_get_runtime_version() >= 0x030A0000) ?\
+     __Pyx_PyType_GetSlot(type, name, func_ctype) : NULL)
+  #define __Pyx_PyType_GetSubSlot(obj, sub, name, func_ctype) __Pyx_PyType_GetSlot(obj, name, func_ctype)
+  #define __Pyx_PyType_TryGetSubSlot(obj, sub, name, func_ctype) __Pyx_PyType_TryGetSlot(obj, name, func_ctype)
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON || defined(_PyDict_NewPresized)
+#define __Pyx_PyDict_NewPresized(n)  ((n <= 8) ? PyDict_New() : _PyDict_NewPresized(n))
+#else
+#define __Pyx_PyDict_NewPresized(n)  PyDict_New()
+#endif
+#define __Pyx_PyNumber_Divide(x,y)         PyNumber_TrueDivide(x,y)
+#define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceTrueDivide(x,y)
+#if CYTHON_COMPILING_IN_CPYTHON && CYTHON_USE_UNICODE_INTERNALS
+#define __Pyx_PyDict_GetItemStrWithError(dict, name)  _PyDict_GetItem_KnownHash(dict, name, ((PyASCIIObject *) name)->hash)
+static CYTHON_INLINE PyObject * __Pyx_PyDict_GetItemStr(PyObject *dict, PyObject *name) {
+    PyObject *res = __Pyx_PyDict_GetItemStrWithError(dict, name);
+    if (res == NULL && PyErr_Occurred()) {
+        PyErr_WriteUnraisable(NULL);
+    }
+    return res;
+}
+#elif !CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07020000
+#define __Pyx_PyDict_GetItemStrWithError  PyDict_GetItemWithError
+#define __Pyx_PyDict_GetItemStr           PyDict_GetItem
+#else
+static CYTHON_INLINE PyObject * __Pyx_PyDict_GetItemStrWithError(PyObject *dict, PyObject *name) {
+#if CYTHON_COMPILING_IN_PYPY
+    return PyDict_GetItem(dict, name);
+#else
+    PyDictEntry *ep;
+    PyDictObject *mp = (PyDictObject*) dict;
+    long hash = ((PyStringObject *) name)->ob_shash;
+    assert(hash != -1);
+    ep = (mp->ma_lookup)(mp, name, hash);
+    if (ep == NULL) {
+        return NULL;
+    }
+    return ep->me_value;
+#endif
+}
+#define __Pyx_PyDict_GetItemStr           PyDict_GetItem
+#endif
+#if CYTHON_USE_TYPE_SLOTS
+  #define __Pyx_PyType_GetFlags(tp)   (((PyTypeObject *)tp)->tp_flags)
+  #define __Pyx_PyType_HasFeature(type, feature)  ((__Pyx_PyType_GetFlags(type) & (feature)) != 0)
+#else
+  #define __Pyx_PyType_GetFlags(tp)   (PyType_GetFlags((PyTypeObject *)tp))
+  #define __Pyx_PyType_HasFeature(type, feature)  PyType_HasFeature(type, feature)
+#endif
+#define __Pyx_PyObject_GetIterNextFunc(iterator)  __Pyx_PyObject_GetSlot(iterator, tp_iternext, iternextfunc)
+#if CYTHON_USE_TYPE_SPECS
+#define __Pyx_PyHeapTypeObject_GC_Del(obj)  {\
+    PyTypeObject *type = Py_TYPE((PyObject*)obj);\
+    assert(__Pyx_PyType_HasFeature(type, Py_TPFLAGS_HEAPTYPE));\
+    PyObject_GC_Del(obj);\
+    Py_DECREF(type);\
+}
+#else
+#define __Pyx_PyHeapTypeObject_GC_Del(obj)  PyObject_GC_Del(obj)
+#endif
+#if CYTHON_COMPILING_IN_LIMITED_API
+  #define __Pyx_PyUnicode_READY(op)       (0)
+  #define __Pyx_PyUnicode_READ_CHAR(u, i) PyUnicode_ReadChar(u, i)
+  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   ((void)u, 1114111U)
+  #define __Pyx_PyUnicode_KIND(u)         ((void)u, (0))
+  #define __Pyx_PyUnicode_KIND_04(u)      __Pyx_PyUnicode_KIND(u)
+  #define __Pyx_PyUnicode_DATA(u)         ((void*)u)
+  #define __Pyx_PyUnicode_READ(k, d, i)   ((void)k, PyUnicode_ReadChar((PyObject*)(d), i))
+  #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GetLength(u))
+#else
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_READY(op)       (0)
+  #else
+    #define __Pyx_PyUnicode_READY(op)       (likely(PyUnicode_IS_READY(op)) ?\
+                                                0 : _PyUnicode_Ready((PyObject *)(op)))
+  #endif
+  #define __Pyx_PyUnicode_READ_CHAR(u, i) PyUnicode_READ_CHAR(u, i)
+  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   PyUnicode_MAX_CHAR_VALUE(u)
+  #define __Pyx_PyUnicode_KIND(u)         ((int)PyUnicode_KIND(u))
+  #define __Pyx_PyUnicode_DATA(u)         PyUnicode_DATA(u)
+  #define __Pyx_PyUnicode_READ(k, d, i)   PyUnicode_READ(k, d, i)
+  #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  PyUnicode_WRITE(k, d, i, (Py_UCS4) ch)
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_LENGTH(u))
+  #else
+    #if CYTHON_COMPILING_IN_CPYTHON
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : ((PyCompactUnicodeObject *)(u))->wstr_length))
+    #else
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : PyUnicode_GET_SIZE(u)))
+    #endif
+  #endif
+  static CYTHON_INLINE int __Pyx_PyUnicode_KIND_04(PyObject *o) {
+      return __Pyx_PyUnicode_KIND(o) - (int) !!PyUnicode_IS_ASCII(o);
+  }
+#endif
+#if CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyUnicode_Concat(a, b)      PyNumber_Add(a, b)
+  #define __Pyx_PyUnicode_ConcatSafe(a, b)  PyNumber_Add(a, b)
+#else
+  #define __Pyx_PyUnicode_Concat(a, b)      PyUnicode_Concat(a, b)
+  #define __Pyx_PyUnicode_ConcatSafe(a, b)  ((unlikely((a) == Py_None) || unlikely((b) == Py_None)) ?\
+      PyNumber_Add(a, b) : __Pyx_PyUnicode_Concat(a, b))
+#endif
+#if CYTHON_COMPILING_IN_PYPY
+  #if !defined(PyUnicode_DecodeUnicodeEscape)
+    #define PyUnicode_DecodeUnicodeEscape(s, size, errors)  PyUnicode_Decode(s, size, "unicode_escape", errors)
+  #endif
+  #if !defined(PyUnicode_Contains)
+    #define PyUnicode_Contains(u, s)  PySequence_Contains(u, s)
+  #endif
+  #if !defined(PyByteArray_Check)
+    #define PyByteArray_Check(obj)  PyObject_TypeCheck(obj, &PyByteArray_Type)
+  #endif
+  #if !defined(PyObject_Format)
+    #define PyObject_Format(obj, fmt)  PyObject_CallMethod(obj, "__format__", "O", fmt)
+  #endif
+#endif
+#define __Pyx_PyUnicode_FormatSafe(a, b)  ((unlikely((a) == Py_None || (PyUnicode_Check(b) && !PyUnicode_CheckExact(b)))) ? PyNumber_Remainder(a, b) : PyUnicode_Format(a, b))
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  #define __Pyx_PySequence_ListKeepNew(obj)\
+    (likely(PyList_CheckExact(obj) && PyUnstable_Object_IsUniquelyReferenced(obj)) ? __Pyx_NewRef(obj) : PySequence_List(obj))
+#elif CYTHON_COMPILING_IN_CPYTHON
+  #define __Pyx_PySequence_ListKeepNew(obj)\
+    (likely(PyList_CheckExact(obj) && Py_REFCNT(obj) == 1) ? __Pyx_NewRef(obj) : PySequence_List(obj))
+#else
+  #define __Pyx_PySequence_ListKeepNew(obj)  PySequence_List(obj)
+#endif
+#ifndef PySet_CheckExact
+  #define PySet_CheckExact(obj)        Py_IS_TYPE(obj, &PySet_Type)
+#endif
+enum __Pyx_ReferenceSharing {
+  __Pyx_ReferenceSharing_DefinitelyUnique, // We created it so we know it's unshared - no need to check
+  __Pyx_ReferenceSharing_OwnStrongReference,
+  __Pyx_ReferenceSharing_FunctionArgument,
+  __Pyx_ReferenceSharing_SharedReference, // Never trust it to be unshared because it's a global or similar
+};
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING && PY_VERSION_HEX >= 0x030E0000
+#define __Pyx_IS_UNIQUELY_REFERENCED(o, sharing)\
+    (sharing == __Pyx_ReferenceSharing_DefinitelyUnique ? 1 :\
+      (sharing == __Pyx_ReferenceSharing_FunctionArgument ? PyUnstable_Object_IsUniqueReferencedTemporary(o) :\
+      (sharing == __Pyx_ReferenceSharing_OwnStrongReference ? PyUnstable_Object_IsUniquelyReferenced(o) : 0)))
+#elif (CYTHON_COMPILING_IN_CPYTHON && !CYTHON_COMPILING_IN_CPYTHON_FREETHREADING) || CYTHON_COMPILING_IN_LIMITED_API
+#define __Pyx_IS_UNIQUELY_REFERENCED(o, sharing) (((void)sharing), Py_REFCNT(o) == 1)
+#else
+#define __Pyx_IS_UNIQUELY_REFERENCED(o, sharing) (((void)o), ((void)sharing), 0)
+#endif
+#if __PYX_LIMITED_VERSION_HEX >= 0x030d0000
+  #define __Pyx_PyList_GetItemRef(o, i) PyList_GetItemRef(o, i)
+#elif CYTHON_AVOID_BORROWED_REFS || CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS
+  #if CYTHON_COMPILING_IN_LIMITED_API || !CYTHON_ASSUME_SAFE_MACROS
+    #define __Pyx_PyList_GetItemRef(o, i) (likely((i) >= 0) ? PySequence_GetItem(o, i) : (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL))
+  #else
+    #define __Pyx_PyList_GetItemRef(o, i) PySequence_ITEM(o, i)
+  #endif
+#elif CYTHON_COMPILING_IN_LIMITED_API || !(CYTHON_ASSUME_SAFE_MACROS && CYTHON_ASSUME_SAFE_SIZE)
+  #define __Pyx_PyList_GetItemRef(o, i) __Pyx_XNewRef(PyList_GetItem(o, i))
+#else
+  #define __Pyx_PyList_GetItemRef(o, i) (likely(__Pyx_is_valid_index(i, PyList_GET_SIZE(o))) ?\
+    __Pyx_NewRef(PyList_GET_ITEM(o, i)) : (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL))
+#endif
+#if CYTHON_AVOID_BORROWED_REFS || CYTHON_COMPILING_IN_LIMITED_API
+  #define __Pyx_PyList_GET_ITEM_REF(o, i, unsafe_shared)  ((void)(unsafe_shared),\
+      __Pyx_PyList_GetItemRef(o, i))
+#elif CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS
+  #if CYTHON_ASSUME_SAFE_MACROS
+  #define __Pyx_PyList_GET_ITEM_REF(o, i, unsafe_shared) (\
+      __Pyx_IS_UNIQUELY_REFERENCED(o, unsafe_shared) ?\
+      __Pyx_NewRef(PyList_GET_ITEM(o, i)) : __Pyx_PyList_GetItemRef(o, i))
+  #else
+  #define __Pyx_PyList_GET_ITEM_REF(o, i, unsafe_shared) (\
+      __Pyx_IS_UNIQUELY_REFERENCED(o, unsafe_shared) ?\
+      __Pyx_XNewRef(PyList_GetItem(o, i)) : __Pyx_PyList_GetItemRef(o, i))
+  #endif
+#elif CYTHON_ASSUME_SAFE_MACROS
+  #define __Pyx_PyList_GET_ITEM_REF(o, i, unsafe_shared)  ((void)(unsafe_shared),\
+      __Pyx_NewRef(PyList_GET_ITEM(o, i)))
+#else
+  #define __Pyx_PyList_GET_ITEM_REF(o, i, unsafe_shared)  ((void)(unsafe_shared),\
+      __Pyx_XNewRef(PyList_GetItem(o, i)))
+#endif
+#if __PYX_LIMITED_VERSION_HEX >= 0x030d0000
+#define __Pyx_PyDict_GetItemRef(dict, key, result) PyDict_GetItemRef(dict, key, result)
+#elif CYTHON_AVOID_BORROWED_REFS || CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS
+static CYTHON_INLINE int __Pyx_PyDict_GetItemRef(PyObject *dict, PyObject *key, PyObject **result) {
+  *result = PyObject_GetItem(dict, key);
+  if (*result == NULL) {
+    if (PyErr_ExceptionMatches(PyExc_KeyError)) {
+      PyErr_Clear();
+      return 0;
+    }
+    return -1;
+  }
+  return 1;
+}
+#else
+static CYTHON_INLINE int __Pyx_PyDict_GetItemRef(PyObject *dict, PyObject *key, PyObject **result) {
+  *result = PyDict_GetItemWithError(dict, key);
+  if (*result == NULL) {
+    return PyErr_Occurred() ? -1 : 0;
+  }
+  Py_INCREF(*result);
+  return 1;
+}
+#endif
+#if defined(CYTHON_DEBUG_VISIT_CONST) && CYTHON_DEBUG_VISIT_CONST
+  #define __Pyx_VISIT_CONST(obj)  Py_VISIT(obj)
+#else
+  #define __Pyx_VISIT_CONST(obj)
+#endif
+#if CYTHON_ASSUME_SAFE_MACROS
+  #define __Pyx_PySequence_ITEM(o, i) PySequence_ITEM(o, i)
+  #define __Pyx_PySequence_SIZE(seq)  Py_SIZE(seq)
+  #define __Pyx_PyTuple_SET_ITEM(o, i, v) (PyTuple_SET_ITEM(o, i, v), (0))
+  #define __Pyx_PyTuple_GET_ITEM(o, i) PyTuple_GET_ITEM(o, i)
+  #define __Pyx_PyList_SET_ITEM(o, i, v) (PyList_SET_ITEM(o, i, v), (0))
+  #define __Pyx_PyList_GET_ITEM(o, i) PyList_GET_ITEM(o, i)
+#else
+  #define __Pyx_PySequence_ITEM(o, i) PySequence_GetItem(o, i)
+  #define __Pyx_PySequence_SIZE(seq)  PySequence_Size(seq)
+  #define __Pyx_PyTuple_SET_ITEM(o, i, v) PyTuple_SetItem(o, i, v)
+  #define __Pyx_PyTuple_GET_ITEM(o, i) PyTuple_GetItem(o, i)
+  #define __Pyx_PyList_SET_ITEM(o, i, v) PyList_SetItem(o, i, v)
+  #define __Pyx_PyList_GET_ITEM(o, i) PyList_GetItem(o, i)
+#endif
+#if CYTHON_ASSUME_SAFE_SIZE
+  #define __Pyx_PyTuple_GET_SIZE(o) PyTuple_GET_SIZE(o)
+  #define __Pyx_PyList_GET_SIZE(o) PyList_GET_SIZE(o)
+  #define __Pyx_PySet_GET_SIZE(o) PySet_GET_SIZE(o)
+  #define __Pyx_PyDict_GET_SIZE(o) PyDict_GET_SIZE(o)
+  #define __Pyx_PyBytes_GET_SIZE(o) PyBytes_GET_SIZE(o)
+  #define __Pyx_PyByteArray_GET_SIZE(o) PyByteArray_GET_SIZE(o)
+  #define __Pyx_PyUnicode_GET_LENGTH(o) PyUnicode_GET_LENGTH(o)
+#else
+  #define __Pyx_PyTuple_GET_SIZE(o) PyTuple_Size(o)
+  #define __Pyx_PyList_GET_SIZE(o) PyList_Size(o)
+  #define __Pyx_PySet_GET_SIZE(o) PySet_Size(o)
+  #define __Pyx_PyDict_GET_SIZE(o) PyDict_Size(o)
+  #define __Pyx_PyBytes_GET_SIZE(o) PyBytes_Size(o)
+  #define __Pyx_PyByteArray_GET_SIZE(o) PyByteArray_Size(o)
+  #define __Pyx_PyUnicode_GET_LENGTH(o) PyUnicode_GetLength(o)
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyUnicode_InternFromString)
+  #define PyUnicode_InternFromString(s) PyUnicode_FromString(s)
+#endif
+#define __Pyx_PyLong_FromHash_t PyLong_FromSsize_t
+#define __Pyx_PyLong_AsHash_t   __Pyx_PyIndex_AsSsize_t
+#if __PYX_LIMITED_VERSION_HEX >= 0x030A0000
+    #define __Pyx_PySendResult PySendResult
+#else
+    typedef enum {
+        PYGEN_RETURN = 0,
+        PYGEN_ERROR = -1,
+        PYGEN_NEXT = 1,
+    } __Pyx_PySendResult;
+#endif
+#if CYTHON_COMPILING_IN_LIMITED_API || PY_VERSION_HEX < 0x030A00A3
+  typedef __Pyx_PySendResult (*__Pyx_pyiter_sendfunc)(PyObject *iter, PyObject *value, PyObject **result);
+#else
+  #define __Pyx_pyiter_sendfunc sendfunc
+#endif
+#if !CYTHON_USE_AM_SEND
+#define __PYX_HAS_PY_AM_SEND 0
+#elif __PYX_LIMITED_VERSION_HEX >= 0x030A0000
+#define __PYX_HAS_PY_AM_SEND 1
+#else
+#define __PYX_HAS_PY_AM_SEND 2  // our own backported implementation
+#endif
+#if __PYX_HAS_PY_AM_SEND < 2
+    #define __Pyx_PyAsyncMethodsStruct PyAsyncMethods
+#else
+    typedef struct {
+        unaryfunc am_await;
+        unaryfunc am_aiter;
+        unaryfunc am_anext;
+        __Pyx_pyiter_sendfunc am_send;
+    } __Pyx_PyAsyncMethodsStruct;
+    #define __Pyx_SlotTpAsAsync(s) ((PyAsyncMethods*)(s))
+#endif
+#if CYTHON_USE_AM_SEND && PY_VERSION_HEX < 0x030A00F0
+    #define __Pyx_TPFLAGS_HAVE_AM_SEND (1UL << 21)
+#else
+    #define __Pyx_TPFLAGS_HAVE_AM_SEND (0)
+#endif
+#if CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX < 0x030A0000
+#ifdef __cplusplus
+extern "C"
+#endif
+PyAPI_FUNC(void *) PyMem_Calloc(size_t nelem, size_t elsize);
+#endif
+#if CYTHON_COMPILING_IN_LIMITED_API
+static int __Pyx_init_co_variable(PyObject *inspect, const char* name, int *write_to) {
+    int value;
+    PyObject *py_value = PyObject_GetAttrString(inspect, name);
+    if (!py_value) return 0;
+    value = (int) PyLong_AsLong(py_value);
+    Py_DECREF(py_value);
+    *write_to = value;
+    return value != -1 || !PyErr_Occurred();
+}
+static int __Pyx_init_co_variables(void) {
+    PyObject *inspect;
+    int result;
+    inspect = PyImport_ImportModule("inspect");
+    result =
+#if !defined(CO_OPTIMIZED)
+        __Pyx_init_co_variable(inspect, "CO_OPTIMIZED", &CO_OPTIMIZED) &&
+#endif
+#if !defined(CO_NEWLOCALS)
+        __Pyx_init_co_variable(inspect, "CO_NEWLOCALS", &CO_NEWLOCALS) &&
+#endif
+#if !defined(CO_VARARGS)
+        __Pyx_init_co_variable(inspect, "CO_VARARGS", &CO_VARARGS) &&
+#endif
+#if !defined(CO_VARKEYWORDS)
+        __Pyx_init_co_variable(inspect, "CO_VARKEYWORDS", &CO_VARKEYWORDS) &&
+#endif
+#if !defined(CO_ASYNC_GENERATOR)
+        __Pyx_init_co_variable(inspect, "CO_ASYNC_GENERATOR", &CO_ASYNC_GENERATOR) &&
+#endif
+#if !defined(CO_GENERATOR)
+        __Pyx_init_co_variable(inspect, "CO_GENERATOR", &CO_GENERATOR) &&
+#endif
+#if !defined(CO_COROUTINE)
+        __Pyx_init_co_variable(inspect, "CO_COROUTINE", &CO_COROUTINE) &&
+#endif
+        1;
+    Py_DECREF(inspect);
+    return result ? 0 : -1;
+}
+static int __Pyx_init_tpflags_bitcount(unsigned long flag) {
+    int count = 0;
+    while (flag) {
+        count += (int) (flag & 1);
+        flag >>= 1;
+    }
+    return count;
+}
+static int __Pyx_init_tpflags_variables(void) {
+    if (__Pyx_Runtime_TPFLAGS_SEQUENCE != 0 && __Pyx_Runtime_TPFLAGS_MAPPING != 0) {
+        return 0;
+    }
+    PyObject *collections_abc = PyImport_ImportModule("collections.abc");
+    if (!collections_abc) return -1;
+    int result = 0;
+    PyObject *sequence = NULL, *mapping = NULL;
+#if __PYX_LIMITED_VERSION_HEX >= 0x030D0000
+    if (PyObject_GetOptionalAttrString(collections_abc, "Sequence", &sequence) != 1) goto fail;
+    if (PyObject_GetOptionalAttrString(collections_abc, "Mapping", &mapping) != 1) goto fail;
+#else
+    sequence = PyObject_GetAttrString(collections_abc, "Sequence");
+    if (!sequence) goto fail_attr_lookup;
+    mapping = PyObject_GetAttrString(collections_abc, "Mapping");
+    if (!mapping) goto fail_attr_lookup;
+#endif
+    if (!PyType_Check(sequence) || !PyType_Check(mapping)) goto fail;
+    {
+        unsigned long sequence_flags = PyType_GetFlags((PyTypeObject*)sequence);
+        unsigned long mapping_flags = PyType_GetFlags((PyTypeObject*)mapping);
+        unsigned long mutual_flags = sequence_flags & mapping_flags;
+        sequence_flags = sequence_flags ^ mutual_flags;
+        mapping_flags = mapping_flags ^ mutual_flags;
+        if (__Pyx_Runtime_TPFLAGS_SEQUENCE == 0 && __Pyx_init_tpflags_bitcount(sequence_flags) == 1) {
+            __Pyx_Runtime_TPFLAGS_SEQUENCE = sequence_flags;
+        }
+        if (__Pyx_Runtime_TPFLAGS_MAPPING == 0 && __Pyx_init_tpflags_bitcount(mapping_flags) == 1) {
+            __Pyx_Runtime_TPFLAGS_MAPPING = mapping_flags;
+        }
+    }
+    cleanup:
+    Py_XDECREF(mapping);
+    Py_XDECREF(sequence);
+    Py_DECREF(collections_abc);
+    return result;
+#if __PYX_LIMITED_VERSION_HEX < 0x030D0000
+    fail_attr_lookup:
+    if (PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        PyErr_Clear();
+    }
+#endif
+    fail:
+    result = PyErr_Occurred() ? -1 : 0;
+    goto cleanup;
+}
+#else
+static int __Pyx_init_co_variables(void) {
+    return 0;  // It's a limited API-only feature
+}
+static int __Pyx_init_tpflags_variables(void) {
+    return 0;  // It's a limited API-only feature
+}
+#endif
+
+/* MathInitCode */
+#if defined(_WIN32) || defined(WIN32) || defined(MS_WINDOWS)
+  #ifndef _USE_MATH_DEFINES
+    #define _USE_MATH_DEFINES
+  #endif
+#endif
+#include <math.h>
+#if defined(__CYGWIN__) && defined(_LDBL_EQ_DBL)
+#define __Pyx_truncl trunc
+#else
+#define __Pyx_truncl truncl
+#endif
+
+#ifndef CYTHON_CLINE_IN_TRACEBACK_RUNTIME
+#define CYTHON_CLINE_IN_TRACEBACK_RUNTIME 0
+#endif
+#ifndef CYTHON_CLINE_IN_TRACEBACK
+#define CYTHON_CLINE_IN_TRACEBACK CYTHON_CLINE_IN_TRACEBACK_RUNTIME
+#endif
+#if CYTHON_CLINE_IN_TRACEBACK
+#define __PYX_MARK_ERR_POS(f_index, lineno)  { __pyx_filename = __pyx_f[f_index]; (void) __pyx_filename; __pyx_lineno = lineno; (void) __pyx_lineno; __pyx_clineno = __LINE__; (void) __pyx_clineno; }
+#else
+#define __PYX_MARK_ERR_POS(f_index, lineno)  { __pyx_filename = __pyx_f[f_index]; (void) __pyx_filename; __pyx_lineno = lineno; (void) __pyx_lineno; (void) __pyx_clineno; }
+#endif
+#define __PYX_ERR(f_index, lineno, Ln_error) \
+    { __PYX_MARK_ERR_POS(f_index, lineno) goto Ln_error; }
+
+#ifdef CYTHON_EXTERN_C
+    #undef __PYX_EXTERN_C
+    #define __PYX_EXTERN_C CYTHON_EXTERN_C
+#elif defined(__PYX_EXTERN_C)
+    #ifdef _MSC_VER
+    #pragma message ("Please do not define the '__PYX_EXTERN_C' macro externally. Use 'CYTHON_EXTERN_C' instead.")
+    #else
+    #warning Please do not define the '__PYX_EXTERN_C' macro externally. Use 'CYTHON_EXTERN_C' instead.
+    #endif
+#else
+  #ifdef __cplusplus
+    #define __PYX_EXTERN_C extern "C"
+  #else
+    #define __PYX_EXTERN_C extern
+  #endif
+#endif
+
+#define __PYX_HAVE__mylibrary___kernels_avx512
+#define __PYX_HAVE_API__mylibrary___kernels_avx512
+/* Early includes */
+#include <math.h>
+
+    #define MYLIBRARY_KERNELS_CAPSULE "mylibrary._kernels.KernelTable"
+    
+#ifdef _OPENMP
+#include <omp.h>
+#endif /* _OPENMP */
+
+#if defined(PYREX_WITHOUT_ASSERTIONS) && !defined(CYTHON_WITHOUT_ASSERTIONS)
+#define CYTHON_WITHOUT_ASSERTIONS
+#endif
+
+#ifdef CYTHON_FREETHREADING_COMPATIBLE
+#if CYTHON_FREETHREADING_COMPATIBLE
+#define __Pyx_FREETHREADING_COMPATIBLE Py_MOD_GIL_NOT_USED
+#else
+#define __Pyx_FREETHREADING_COMPATIBLE Py_MOD_GIL_USED
+#endif
+#else
+#define __Pyx_FREETHREADING_COMPATIBLE Py_MOD_GIL_USED
+#endif
+#define __PYX_DEFAULT_STRING_ENCODING_IS_ASCII 0
+#define __PYX_DEFAULT_STRING_ENCODING_IS_UTF8 0
+#define __PYX_DEFAULT_STRING_ENCODING ""
+#define __Pyx_PyObject_FromString __Pyx_PyBytes_FromString
+#define __Pyx_PyObject_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
+#define __Pyx_uchar_cast(c) ((unsigned char)c)
+#define __Pyx_long_cast(x) ((long)x)
+#define __Pyx_fits_Py_ssize_t(v, type, is_signed)  (\
+    (sizeof(type) < sizeof(Py_ssize_t))  ||\
+    (sizeof(type) > sizeof(Py_ssize_t) &&\
+          likely(v < (type)PY_SSIZE_T_MAX ||\
+                 v == (type)PY_SSIZE_T_MAX)  &&\
+          (!is_signed || likely(v > (type)PY_SSIZE_T_MIN ||\
+                                v == (type)PY_SSIZE_T_MIN)))  ||\
+    (sizeof(type) == sizeof(Py_ssize_t) &&\
+          (is_signed || likely(v < (type)PY_SSIZE_T_MAX ||\
+                               v == (type)PY_SSIZE_T_MAX)))  )
+static CYTHON_INLINE int __Pyx_is_valid_index(Py_ssize_t i, Py_ssize_t limit) {
+    return (size_t) i < (size_t) limit;
+}
+#if defined (__cplusplus) && __cplusplus >= 201103L
+    #include <cstdlib>
+    #define __Pyx_sst_abs(value) std::abs(value)
+#elif SIZEOF_INT >= SIZEOF_SIZE_T
+    #define __Pyx_sst_abs(value) abs(value)
+#elif SIZEOF_LONG >= SIZEOF_SIZE_T
+    #define __Pyx_sst_abs(value) labs(value)
+#elif defined (_MSC_VER)
+    #define __Pyx_sst_abs(value) ((Py_ssize_t)_abs64(value))
+#elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define __Pyx_sst_abs(value) llabs(value)
+#elif defined (__GNUC__)
+    #define __Pyx_sst_abs(value) __builtin_llabs(value)
+#else
+    #define __Pyx_sst_abs(value) ((value<0) ? -value : value)
+#endif
+static CYTHON_INLINE Py_ssize_t __Pyx_ssize_strlen(const char *s);
+static CYTHON_INLINE const char* __Pyx_PyObject_AsString(PyObject*);
+static CYTHON_INLINE const char* __Pyx_PyObject_AsStringAndSize(PyObject*, Py_ssize_t* length);
+static CYTHON_INLINE PyObject* __Pyx_PyByteArray_FromString(const char*);
+#define __Pyx_PyByteArray_FromStringAndSize(s, l) PyByteArray_FromStringAndSize((const char*)s, l)
+#define __Pyx_PyBytes_FromString        PyBytes_FromString
+#define __Pyx_PyBytes_FromStringAndSize PyBytes_FromStringAndSize
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char*);
+#if CYTHON_ASSUME_SAFE_MACROS
+    #define __Pyx_PyBytes_AsWritableString(s)     ((char*) PyBytes_AS_STRING(s))
+    #define __Pyx_PyBytes_AsWritableSString(s)    ((signed char*) PyBytes_AS_STRING(s))
+    #define __Pyx_PyBytes_AsWritableUString(s)    ((unsigned char*) PyBytes_AS_STRING(s))
+    #define __Pyx_PyBytes_AsString(s)     ((const char*) PyBytes_AS_STRING(s))
+    #define __Pyx_PyBytes_AsSString(s)    ((const signed char*) PyBytes_AS_STRING(s))
+    #define __Pyx_PyBytes_AsUString(s)    ((const unsigned char*) PyBytes_AS_STRING(s))
+    #define __Pyx_PyByteArray_AsString(s) PyByteArray_AS_STRING(s)
+#else
+    #define __Pyx_PyBytes_AsWritableString(s)     ((char*) PyBytes_AsString(s))
+    #define __Pyx_PyBytes_AsWritableSString(s)    ((signed char*) PyBytes_AsString(s))
+    #define __Pyx_PyBytes_AsWritableUString(s)    ((unsigned char*) PyBytes_AsString(s))
+    #define __Pyx_PyBytes_AsString(s)     ((const char*) PyBytes_AsString(s))
+    #define __Pyx_PyBytes_AsSString(s)    ((const signed char*) PyBytes_AsString(s))
+    #define __Pyx_PyBytes_AsUString(s)    ((const unsigned char*) PyBytes_AsString(s))
+    #define __Pyx_PyByteArray_AsString(s) PyByteArray_AsString(s)
+#endif
+#define __Pyx_PyObject_AsWritableString(s)    ((char*)(__pyx_uintptr_t) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsWritableSString(s)    ((signed char*)(__pyx_uintptr_t) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsWritableUString(s)    ((unsigned char*)(__pyx_uintptr_t) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsSString(s)    ((const signed char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsUString(s)    ((const unsigned char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_FromCString(s)  __Pyx_PyObject_FromString((const char*)s)
+#define __Pyx_PyBytes_FromCString(s)   __Pyx_PyBytes_FromString((const char*)s)
+#define __Pyx_PyByteArray_FromCString(s)   __Pyx_PyByteArray_FromString((const char*)s)
+#define __Pyx_PyUnicode_FromCString(s) __Pyx_PyUnicode_FromString((const char*)s)
+#define __Pyx_PyUnicode_FromOrdinal(o)       PyUnicode_FromOrdinal((int)o)
+#define __Pyx_PyUnicode_AsUnicode            PyUnicode_AsUnicode
+static CYTHON_INLINE PyObject *__Pyx_NewRef(PyObject *obj) {
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030a0000 || defined(Py_NewRef)
+    return Py_NewRef(obj);
+#else
+    Py_INCREF(obj);
+    return obj;
+#endif
+}
+static CYTHON_INLINE PyObject *__Pyx_XNewRef(PyObject *obj) {
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030a0000 || defined(Py_XNewRef)
+    return Py_XNewRef(obj);
+#else
+    Py_XINCREF(obj);
+    return obj;
+#endif
+}
+static CYTHON_INLINE PyObject *__Pyx_Owned_Py_None(int b);
+static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b);
+static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject*);
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject*);
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_Long(PyObject* x);
+#define __Pyx_PyObject_RichCompareBool(a,b,cmp)  __Pyx_PyObject_IsTrueAndDecref(PyObject_RichCompare((a),(b),(cmp)))
+#define __Pyx_PySequence_Tuple(obj)\
+    (likely(PyTuple_CheckExact(obj)) ? __Pyx_NewRef(obj) : PySequence_Tuple(obj))
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject*);
+static CYTHON_INLINE PyObject * __Pyx_PyLong_FromSize_t(size_t);
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject*);
+#if CYTHON_ASSUME_SAFE_MACROS
+#define __Pyx_PyFloat_AsDouble(x) (PyFloat_CheckExact(x) ? PyFloat_AS_DOUBLE(x) : PyFloat_AsDouble(x))
+#define __Pyx_PyFloat_AS_DOUBLE(x) PyFloat_AS_DOUBLE(x)
+#define __Pyx_PyFloat_IsNonZero(x) (PyFloat_AS_DOUBLE(x) != 0.0)
+#else
+#define __Pyx_PyFloat_AsDouble(x) PyFloat_AsDouble(x)
+#define __Pyx_PyFloat_AS_DOUBLE(x) PyFloat_AsDouble(x)
+#define __Pyx_PyFloat_IsNonZero(x) PyObject_IsTrue(x)
+#endif
+#define __Pyx_PyFloat_AsFloat(x) ((float) __Pyx_PyFloat_AsDouble(x))
+#define __Pyx_PyNumber_Int(x) (PyLong_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Long(x))
+#if CYTHON_USE_PYLONG_INTERNALS
+  #if PY_VERSION_HEX >= 0x030C00A7
+  #ifndef _PyLong_SIGN_MASK
+    #define _PyLong_SIGN_MASK 3
+  #endif
+  #ifndef _PyLong_NON_SIZE_BITS
+    #define _PyLong_NON_SIZE_BITS 3
+  #endif
+  #define __Pyx_PyLong_SignBits(x)  ((int) (((PyLongObject*)x)->long_value.lv_tag & _PyLong_SIGN_MASK))
+  #define __Pyx_PyLong_Sign(x)  (1 - __Pyx_PyLong_SignBits(x))
+  #define __Pyx_PyLong_IsNeg(x)  ((__Pyx_PyLong_SignBits(x) & 2) != 0)
+  #define __Pyx_PyLong_IsNonNeg(x)  (!__Pyx_PyLong_IsNeg(x))
+  #define __Pyx_PyLong_IsZero(x)  (__Pyx_PyLong_SignBits(x) & 1)
+  #define __Pyx_PyLong_IsPos(x)  (__Pyx_PyLong_SignBits(x) == 0)
+  #define __Pyx_PyLong_CompactValueUnsigned(x)  (__Pyx_PyLong_Digits(x)[0])
+  #define __Pyx_PyLong_DigitCount(x)  ((Py_ssize_t) (((PyLongObject*)x)->long_value.lv_tag >> _PyLong_NON_SIZE_BITS))
+  #define __Pyx_PyLong_SignedDigitCount(x)\
+        (((Py_ssize_t) __Pyx_PyLong_Sign(x)) * __Pyx_PyLong_DigitCount(x))
+  #if defined(PyUnstable_Long_IsCompact) && defined(PyUnstable_Long_CompactValue)
+    #define __Pyx_PyLong_IsCompact(x)     PyUnstable_Long_IsCompact((PyLongObject*) x)
+    #define __Pyx_PyLong_CompactValue(x)  PyUnstable_Long_CompactValue((PyLongObject*) x)
+  #else
+    #define __Pyx_PyLong_IsCompact(x)     (((PyLongObject*)x)->long_value.lv_tag < (2 << _PyLong_NON_SIZE_BITS))
+    #define __Pyx_PyLong_CompactValue(x)  (((Py_ssize_t) __Pyx_PyLong_Sign(x)) * (Py_ssize_t) __Pyx_PyLong_Digits(x)[0])
+  #endif
+  static CYTHON_INLINE Py_ssize_t __Pyx_PyLong_CompareSignAndSize(PyObject *a, PyObject *b) {
+      uintptr_t tag_a = ((PyLongObject*)a)->long_value.lv_tag;
+      uintptr_t tag_b = ((PyLongObject*)b)->long_value.lv_tag;
+      if (tag_a == tag_b) return 0;
+      int sign_a = (int) (tag_a & _PyLong_SIGN_MASK);
+      int sign_b = (int) (tag_b & _PyLong_SIGN_MASK);
+      if (sign_a > sign_b) return -1;
+      if (sign_a < sign_b) return 1;
+      Py_ssize_t size_a = (Py_ssize_t) (tag_a >> _PyLong_NON_SIZE_BITS);
+      Py_ssize_t size_b = (Py_ssize_t) (tag_b >> _PyLong_NON_SIZE_BITS);
+      return (1 - sign_a) * (size_a - size_b);
+  }
+  typedef Py_ssize_t  __Pyx_compact_pylong;
+  typedef size_t  __Pyx_compact_upylong;
+  #else
+  #define __Pyx_PyLong_Sign(x)  ((int) ((Py_SIZE(x) == 0) ? 0 : (Py_SIZE(x) < 0) ? -1 : 1))
+  #define __Pyx_PyLong_IsNeg(x)  (Py_SIZE(x) < 0)
+  #define __Pyx_PyLong_IsNonNeg(x)  (Py_SIZE(x) >= 0)
+  #define __Pyx_PyLong_IsZero(x)  (Py_SIZE(x) == 0)
+  #define __Pyx_PyLong_IsPos(x)  (Py_SIZE(x) > 0)
+  #define __Pyx_PyLong_CompactValueUnsigned(x)  ((Py_SIZE(x) == 0) ? 0 : __Pyx_PyLong_Digits(x)[0])
+  #define __Pyx_PyLong_DigitCount(x)  __Pyx_sst_abs(Py_SIZE(x))
+  #define __Pyx_PyLong_SignedDigitCount(x)  Py_SIZE(x)
+  #define __Pyx_PyLong_IsCompact(x)  (Py_SIZE(x) == 0 || Py_SIZE(x) == 1 || Py_SIZE(x) == -1)
+  #define __Pyx_PyLong_CompactValue(x)\
+        ((Py_SIZE(x) == 0) ? (sdigit) 0 : ((Py_SIZE(x) < 0) ? -(sdigit)__Pyx_PyLong_Digits(x)[0] : (sdigit)__Pyx_PyLong_Digits(x)[0]))
+  #define __Pyx_PyLong_CompareSignAndSize(a, b)  (Py_SIZE(a) - Py_SIZE(b))
+  typedef sdigit  __Pyx_compact_pylong;
+  typedef digit  __Pyx_compact_upylong;
+  #endif
+  #if PY_VERSION_HEX >= 0x030C00A5
+  #define __Pyx_PyLong_Digits(x)  (((PyLongObject*)x)->long_value.ob_digit)
+  #else
+  #define __Pyx_PyLong_Digits(x)  (((PyLongObject*)x)->ob_digit)
+  #endif
+  #define __Pyx_PyLong_IsNonZero(x)  (!__Pyx_PyLong_IsZero(x))
+#else
+  #define __Pyx_PyLong_IsNonZero(x)  PyObject_IsTrue(x)
+#endif
+#if __PYX_DEFAULT_STRING_ENCODING_IS_UTF8
+  #define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_DecodeUTF8(c_str, size, NULL)
+#elif __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+  #define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_DecodeASCII(c_str, size, NULL)
+#else
+  #define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_Decode(c_str, size, __PYX_DEFAULT_STRING_ENCODING, NULL)
+#endif
+
+
+/* Test for GCC > 2.95 */
+#if defined(__GNUC__)     && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))
+  #define likely(x)   __builtin_expect(!!(x), 1)
+  #define unlikely(x) __builtin_expect(!!(x), 0)
+#else /* !__GNUC__ or GCC < 2.95 */
+  #define likely(x)   (x)
+  #define unlikely(x) (x)
+#endif /* __GNUC__ */
+/* PretendToInitialize */
+#ifdef __cplusplus
+#if __cplusplus > 201103L
+#include <type_traits>
+#endif
+template <typename T>
+static void __Pyx_pretend_to_initialize(T* ptr) {
+#if __cplusplus > 201103L
+    if ((std::is_trivially_default_constructible<T>::value))
+#endif
+        *ptr = T();
+    (void)ptr;
+}
+#else
+static CYTHON_INLINE void __Pyx_pretend_to_initialize(void* ptr) { (void)ptr; }
+#endif
+
+
+#if !CYTHON_USE_MODULE_STATE
+static PyObject *__pyx_m = NULL;
+#endif
+static const char * const __pyx_cfilenm = __FILE__;
+
+/* #### Code section: filename_table ### */
+
+static const char* const __pyx_f[] = {
+  "mylibrary/_kernels_avx512.pyx",
+  "mylibrary/_kernels.pxi",
+};
+/* #### Code section: utility_code_proto_before_types ### */
+/* NoFastGil.proto */
+#define __Pyx_PyGILState_Ensure PyGILState_Ensure
+#define __Pyx_PyGILState_Release PyGILState_Release
+#define __Pyx_FastGIL_Remember()
+#define __Pyx_FastGIL_Forget()
+#define __Pyx_FastGilFuncInit()
+
+/* Atomics.proto (used by CodeObjectCache) */
+#include <pythread.h>
+#ifndef CYTHON_ATOMICS
+    #define CYTHON_ATOMICS 1
+#endif
+#define __PYX_CYTHON_ATOMICS_ENABLED() CYTHON_ATOMICS
+#define __PYX_GET_CYTHON_COMPILING_IN_CPYTHON_FREETHREADING() CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+#define __pyx_atomic_int_type int
+#define __pyx_nonatomic_int_type int
+#if CYTHON_ATOMICS && (defined(__STDC_VERSION__) &&\
+                        (__STDC_VERSION__ >= 201112L) &&\
+                        !defined(__STDC_NO_ATOMICS__))
+    #include <stdatomic.h>
+#elif CYTHON_ATOMICS && (defined(__cplusplus) && (\
+                    (__cplusplus >= 201103L) ||\
+                    (defined(_MSC_VER) && _MSC_VER >= 1700)))
+    #include <atomic>
+#endif
+#if CYTHON_ATOMICS && (defined(__STDC_VERSION__) &&\
+                        (__STDC_VERSION__ >= 201112L) &&\
+                        !defined(__STDC_NO_ATOMICS__) &&\
+                       ATOMIC_INT_LOCK_FREE == 2)
+    #undef __pyx_atomic_int_type
+    #define __pyx_atomic_int_type atomic_int
+    #define __pyx_atomic_ptr_type atomic_uintptr_t
+    #define __pyx_nonatomic_ptr_type uintptr_t
+    #define __pyx_atomic_incr_relaxed(value) atomic_fetch_add_explicit(value, 1, memory_order_relaxed)
+    #define __pyx_atomic_incr_acq_rel(value) atomic_fetch_add_explicit(value, 1, memory_order_acq_rel)
+    #define __pyx_atomic_decr_acq_rel(value) atomic_fetch_sub_explicit(value, 1, memory_order_acq_rel)
+    #define __pyx_atomic_sub(value, arg) atomic_fetch_sub(value, arg)
+    #define __pyx_atomic_int_cmp_exchange(value, expected, desired) atomic_compare_exchange_strong(value, expected, desired)
+    #define __pyx_atomic_load(value) atomic_load(value)
+    #define __pyx_atomic_store(value, new_value) atomic_store(value, new_value)
+    #define __pyx_atomic_pointer_load_relaxed(value) atomic_load_explicit(value, memory_order_relaxed)
+    #define __pyx_atomic_pointer_load_acquire(value) atomic_load_explicit(value, memory_order_acquire)
+    #define __pyx_atomic_pointer_exchange(value, new_value) atomic_exchange(value, (__pyx_nonatomic_ptr_type)new_value)
+    #define __pyx_atomic_pointer_cmp_exchange(value, expected, desired) atomic_compare_exchange_strong(value, expected, desired)
+    #if defined(__PYX_DEBUG_ATOMICS) && defined(_MSC_VER)
+        #pragma message ("Using standard C atomics")
+    #elif defined(__PYX_DEBUG_ATOMICS)
+        #warning "Using standard C atomics"
+    #endif
+#elif CYTHON_ATOMICS && (defined(__cplusplus) && (\
+                    (__cplusplus >= 201103L) ||\
+\
+                    (defined(_MSC_VER) && _MSC_VER >= 1700)) &&\
+                    ATOMIC_INT_LOCK_FREE == 2)
+    #undef __pyx_atomic_int_type
+    #define __pyx_atomic_int_type std::atomic_int
+    #define __pyx_atomic_ptr_type std::atomic_uintptr_t
+    #define __pyx_nonatomic_ptr_type uintptr_t
+    #define __pyx_atomic_incr_relaxed(value) std::atomic_fetch_add_explicit(value, 1, std::memory_order_relaxed)
+    #define __pyx_atomic_incr_acq_rel(value) std::atomic_fetch_add_explicit(value, 1, std::memory_order_acq_rel)
+    #define __pyx_atomic_decr_acq_rel(value) std::atomic_fetch_sub_explicit(value, 1, std::memory_order_acq_rel)
+    #define __pyx_atomic_sub(value, arg) std::atomic_fetch_sub(value, arg)
+    #define __pyx_atomic_int_cmp_exchange(value, expected, desired) std::atomic_compare_exchange_strong(value, expected, desired)
+    #define __pyx_atomic_load(value) std::atomic_load(value)
+    #define __pyx_atomic_store(value, new_value) std::atomic_store(value, new_value)
+    #define __pyx_atomic_pointer_load_relaxed(value) std::atomic_load_explicit(value, std::memory_order_relaxed)
+    #define __pyx_atomic_pointer_load_acquire(value) std::atomic_load_explicit(value, std::memory_order_acquire)
+    #define __pyx_atomic_pointer_exchange(value, new_value) std::atomic_exchange(value, (__pyx_nonatomic_ptr_type)new_value)
+    #define __pyx_atomic_pointer_cmp_exchange(value, expected, desired) std::atomic_compare_exchange_strong(value, expected, desired)
+    #if defined(__PYX_DEBUG_ATOMICS) && defined(_MSC_VER)
+        #pragma message ("Using standard C++ atomics")
+    #elif defined(__PYX_DEBUG_ATOMICS)
+        #warning "Using standard C++ atomics"
+    #endif
+#elif CYTHON_ATOMICS && (__GNUC__ >= 5 || (__GNUC__ == 4 &&\
+                    (__GNUC_MINOR__ > 1 ||\
+                    (__GNUC_MINOR__ == 1 && __GNUC_PATCHLEVEL__ >= 2))))
+    #define __pyx_atomic_ptr_type void*
+    #define __pyx_nonatomic_ptr_type void*
+    #define __pyx_atomic_incr_relaxed(value) __sync_fetch_and_add(value, 1)
+    #define __pyx_atomic_incr_acq_rel(value) __sync_fetch_and_add(value, 1)
+    #define __pyx_atomic_decr_acq_rel(value) __sync_fetch_and_sub(value, 1)
+    #define __pyx_atomic_sub(value, arg) __sync_fetch_and_sub(value, arg)
+    static CYTHON_INLINE int __pyx_atomic_int_cmp_exchange(__pyx_atomic_int_type* value, __pyx_nonatomic_int_type* expected, __pyx_nonatomic_int_type desired) {
+        __pyx_nonatomic_int_type old = __sync_val_compare_and_swap(value, *expected, desired);
+        int result = old == *expected;
+        *expected = old;
+        return result;
+    }
+    #define __pyx_atomic_load(value) __sync_fetch_and_add(value, 0)
+    #define __pyx_atomic_store(value, new_value) __sync_lock_test_and_set(value, new_value)
+    #define __pyx_atomic_pointer_load_relaxed(value) __sync_fetch_and_add(value, 0)
+    #define __pyx_atomic_pointer_load_acquire(value) __sync_fetch_and_add(value, 0)
+    #define __pyx_atomic_pointer_exchange(value, new_value) __sync_lock_test_and_set(value, (__pyx_atomic_ptr_type)new_value)
+    static CYTHON_INLINE int __pyx_atomic_pointer_cmp_exchange(__pyx_atomic_ptr_type* value, __pyx_nonatomic_ptr_type* expected, __pyx_nonatomic_ptr_type desired) {
+        __pyx_nonatomic_ptr_type old = __sync_val_compare_and_swap(value, *expected, desired);
+        int result = old == *expected;
+        *expected = old;
+        return result;
+    }
+    #ifdef __PYX_DEBUG_ATOMICS
+        #warning "Using GNU atomics"
+    #endif
+#elif CYTHON_ATOMICS && defined(_MSC_VER)
+    #include <intrin.h>
+    #undef __pyx_atomic_int_type
+    #define __pyx_atomic_int_type long
+    #define __pyx_atomic_ptr_type void*
+    #undef __pyx_nonatomic_int_type
+    #define __pyx_nonatomic_int_type long
+    #define __pyx_nonatomic_ptr_type void*
+    #pragma intrinsic (_InterlockedExchangeAdd, _InterlockedExchange, _InterlockedCompareExchange, _InterlockedCompareExchangePointer, _InterlockedExchangePointer)
+    #define __pyx_atomic_incr_relaxed(value) _InterlockedExchangeAdd(value, 1)
+    #define __pyx_atomic_incr_acq_rel(value) _InterlockedExchangeAdd(value, 1)
+    #define __pyx_atomic_decr_acq_rel(value) _InterlockedExchangeAdd(value, -1)
+    #define __pyx_atomic_sub(value, arg) _InterlockedExchangeAdd(value, -arg)
+    static CYTHON_INLINE int __pyx_atomic_int_cmp_exchange(__pyx_atomic_int_type* value, __pyx_nonatomic_int_type* expected, __pyx_nonatomic_int_type desired) {
+        __pyx_nonatomic_int_type old = _InterlockedCompareExchange(value, desired, *expected);
+        int result = old == *expected;
+        *expected = old;
+        return result;
+    }
+    #define __pyx_atomic_load(value) _InterlockedExchangeAdd(value, 0)
+    #define __pyx_atomic_store(value, new_value) _InterlockedExchange(value, new_value)
+    #define __pyx_atomic_pointer_load_relaxed(value) *(void * volatile *)value
+    #define __pyx_atomic_pointer_load_acquire(value) _InterlockedCompareExchangePointer(value, 0, 0)
+    #define __pyx_atomic_pointer_exchange(value, new_value) _InterlockedExchangePointer(value, (__pyx_atomic_ptr_type)new_value)
+    static CYTHON_INLINE int __pyx_atomic_pointer_cmp_exchange(__pyx_atomic_ptr_type* value, __pyx_nonatomic_ptr_type* expected, __pyx_nonatomic_ptr_type desired) {
+        __pyx_atomic_ptr_type old = _InterlockedCompareExchangePointer(value, desired, *expected);
+        int result = old == *expected;
+        *expected = old;
+        return result;
+    }
+    #ifdef __PYX_DEBUG_ATOMICS
+        #pragma message ("Using MSVC atomics")
+    #endif
+#else
+    #undef CYTHON_ATOMICS
+    #define CYTHON_ATOMICS 0
+    #ifdef __PYX_DEBUG_ATOMICS
+        #warning "Not using atomics"
+    #endif
+#endif
+
+/* #### Code section: numeric_typedefs ### */
+/* #### Code section: complex_type_declarations ### */
+/* #### Code section: type_declarations ### */
+
+/*--- Type declarations ---*/
+struct __pyx_t_9mylibrary_8_kernels__Op;
+struct __pyx_t_9mylibrary_8_kernels_KernelTable;
+
+/* "mylibrary/_kernels.pxd":25
+ * # Reductions of f(x); see _reduce().
+ * #
+ * cdef enum:             # <<<<<<<<<<<<<<
+ *     _REDUCE_BLOCK     = 128  # base case of pairwise summation
+ *     _REDUCE_MAXCHUNKS = 64   # runs into which a large input is split (for threads); O(1) temporary memory
+*/
+enum  {
+  __pyx_e_9mylibrary_8_kernels__REDUCE_BLOCK = 0x80,
+  __pyx_e_9mylibrary_8_kernels__REDUCE_MAXCHUNKS = 64
+};
+
+/* "mylibrary/_kernels.pxd":29
+ *     _REDUCE_MAXCHUNKS = 64   # runs into which a large input is split (for threads); O(1) temporary memory
+ * 
+ * cdef enum _Reduction:             # <<<<<<<<<<<<<<
+ *     _REDUCE_SUM
+ *     _REDUCE_DOT
+*/
+enum __pyx_t_9mylibrary_8_kernels__Reduction {
+  __pyx_e_9mylibrary_8_kernels__REDUCE_SUM,
+  __pyx_e_9mylibrary_8_kernels__REDUCE_DOT,
+  __pyx_e_9mylibrary_8_kernels__REDUCE_MIN,
+  __pyx_e_9mylibrary_8_kernels__REDUCE_MAX
+};
+
+/* "mylibrary/_kernels.pxd":37
+ * # Fused elementwise pipelines; see _pipeline().
+ * #
+ * cdef enum:             # <<<<<<<<<<<<<<
+ *     _PIPELINE_BLOCK   = 512  # elements; 4 kB for double
+ *     _PIPELINE_MAXOPS  = 32
+*/
+enum  {
+  __pyx_e_9mylibrary_8_kernels__PIPELINE_BLOCK = 0x200,
+  __pyx_e_9mylibrary_8_kernels__PIPELINE_MAXOPS = 32
+};
+
+/* "mylibrary/_kernels.pxd":41
+ *     _PIPELINE_MAXOPS  = 32
+ * 
+ * cdef enum _OpCode:             # <<<<<<<<<<<<<<
+ *     _OP_SCALE
+ *     _OP_OFFSET
+*/
+enum __pyx_t_9mylibrary_8_kernels__OpCode {
+  __pyx_e_9mylibrary_8_kernels__OP_SCALE,
+  __pyx_e_9mylibrary_8_kernels__OP_OFFSET,
+  __pyx_e_9mylibrary_8_kernels__OP_SQRT,
+  __pyx_e_9mylibrary_8_kernels__OP_CLIP,
+  __pyx_e_9mylibrary_8_kernels__OP_ABS,
+  __pyx_e_9mylibrary_8_kernels__OP_SQUARE
+};
+
+/* "mylibrary/_kernels.pxd":49
+ *     _OP_SQUARE
+ * 
+ * cdef struct _Op:             # <<<<<<<<<<<<<<
+ *     _OpCode code
+ *     double a
+*/
+struct __pyx_t_9mylibrary_8_kernels__Op {
+  enum __pyx_t_9mylibrary_8_kernels__OpCode code;
+  double a;
+  double b;
+};
+
+/* "mylibrary/_kernels.pxd":56
+ * # One pointer per kernel and dtype. The signatures are those of the fused kernels in _kernels.pxi.
+ * #
+ * cdef struct KernelTable:             # <<<<<<<<<<<<<<
+ *     void (*sqrt_contig_float)( const float* x, float* out, Py_ssize_t n, int num_threads ) noexcept nogil
+ *     void (*sqrt_contig_double)( const double* x, double* out, Py_ssize_t n, int num_threads ) noexcept nogil
+*/
+struct __pyx_t_9mylibrary_8_kernels_KernelTable {
+  void (*sqrt_contig_float)(float const *, float *, Py_ssize_t, int);
+  void (*sqrt_contig_double)(double const *, double *, Py_ssize_t, int);
+  void (*sqrt_strided_float)(float const *, Py_ssize_t, Py_ssize_t, float *, Py_ssize_t, Py_ssize_t, Py_ssize_t, Py_ssize_t, int);
+  void (*sqrt_strided_double)(double const *, Py_ssize_t, Py_ssize_t, double *, Py_ssize_t, Py_ssize_t, Py_ssize_t, Py_ssize_t, int);
+  double (*pairwise_sum_float)(float const *, Py_ssize_t, Py_ssize_t, float const *, Py_ssize_t, Py_ssize_t, Py_ssize_t, Py_ssize_t, Py_ssize_t);
+  double (*pairwise_sum_double)(double const *, Py_ssize_t, Py_ssize_t, double const *, Py_ssize_t, Py_ssize_t, Py_ssize_t, Py_ssize_t, Py_ssize_t);
+  double (*extremum_float)(int, float const *, Py_ssize_t, Py_ssize_t, Py_ssize_t, Py_ssize_t, Py_ssize_t);
+  double (*extremum_double)(int, double const *, Py_ssize_t, Py_ssize_t, Py_ssize_t, Py_ssize_t, Py_ssize_t);
+  double (*reduce_float)(enum __pyx_t_9mylibrary_8_kernels__Reduction, float const *, Py_ssize_t, Py_ssize_t, float const *, Py_ssize_t, Py_ssize_t, Py_ssize_t, Py_ssize_t, int, int);
+  double (*reduce_double)(enum __pyx_t_9mylibrary_8_kernels__Reduction, double const *, Py_ssize_t, Py_ssize_t, double const *, Py_ssize_t, Py_ssize_t, Py_ssize_t, Py_ssize_t, int, int);
+  double (*combine)(enum __pyx_t_9mylibrary_8_kernels__Reduction, double const *, Py_ssize_t);
+  void (*pipeline_float)(struct __pyx_t_9mylibrary_8_kernels__Op const *, int, float const *, Py_ssize_t, Py_ssize_t, float *, Py_ssize_t, Py_ssize_t, Py_ssize_t, Py_ssize_t, int);
+  void (*pipeline_double)(struct __pyx_t_9mylibrary_8_kernels__Op const *, int, double const *, Py_ssize_t, Py_ssize_t, double *, Py_ssize_t, Py_ssize_t, Py_ssize_t, Py_ssize_t, int);
+};
+/* #### Code section: utility_code_proto ### */
+
+/* --- Runtime support code (head) --- */
+/* Refnanny.proto */
+#ifndef CYTHON_REFNANNY
+  #define CYTHON_REFNANNY 0
+#endif
+#if CYTHON_REFNANNY
+  typedef struct {
+    void (*INCREF)(void*, PyObject*, Py_ssize_t);
+    void (*DECREF)(void*, PyObject*, Py_ssize_t);
+    void (*GOTREF)(void*, PyObject*, Py_ssize_t);
+    void (*GIVEREF)(void*, PyObject*, Py_ssize_t);
+    void* (*SetupContext)(const char*, Py_ssize_t, const char*);
+    void (*FinishContext)(void**);
+  } __Pyx_RefNannyAPIStruct;
+  static __Pyx_RefNannyAPIStruct *__Pyx_RefNanny = NULL;
+  static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname);
+  #define __Pyx_RefNannyDeclarations void *__pyx_refnanny = NULL;
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)\
+          if (acquire_gil) {\
+              PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();\
+              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), (__LINE__), (__FILE__));\
+              PyGILState_Release(__pyx_gilstate_save);\
+          } else {\
+              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), (__LINE__), (__FILE__));\
+          }
+  #define __Pyx_RefNannyFinishContextNogil() {\
+              PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();\
+              __Pyx_RefNannyFinishContext();\
+              PyGILState_Release(__pyx_gilstate_save);\
+          }
+  #define __Pyx_RefNannyFinishContextNogil() {\
+              PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();\
+              __Pyx_RefNannyFinishContext();\
+              PyGILState_Release(__pyx_gilstate_save);\
+          }
+  #define __Pyx_RefNannyFinishContext()\
+          __Pyx_RefNanny->FinishContext(&__pyx_refnanny)
+  #define __Pyx_INCREF(r)  __Pyx_RefNanny->INCREF(__pyx_refnanny, (PyObject *)(r), (__LINE__))
+  #define __Pyx_DECREF(r)  __Pyx_RefNanny->DECREF(__pyx_refnanny, (PyObject *)(r), (__LINE__))
+  #define __Pyx_GOTREF(r)  __Pyx_RefNanny->GOTREF(__pyx_refnanny, (PyObject *)(r), (__LINE__))
+  #define __Pyx_GIVEREF(r) __Pyx_RefNanny->GIVEREF(__pyx_refnanny, (PyObject *)(r), (__LINE__))
+  #define __Pyx_XINCREF(r)  do { if((r) == NULL); else {__Pyx_INCREF(r); }} while(0)
+  #define __Pyx_XDECREF(r)  do { if((r) == NULL); else {__Pyx_DECREF(r); }} while(0)
+  #define __Pyx_XGOTREF(r)  do { if((r) == NULL); else {__Pyx_GOTREF(r); }} while(0)
+  #define __Pyx_XGIVEREF(r) do { if((r) == NULL); else {__Pyx_GIVEREF(r);}} while(0)
+#else
+  #define __Pyx_RefNannyDeclarations
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)
+  #define __Pyx_RefNannyFinishContextNogil()
+  #define __Pyx_RefNannyFinishContext()
+  #define __Pyx_INCREF(r) Py_INCREF(r)
+  #define __Pyx_DECREF(r) Py_DECREF(r)
+  #define __Pyx_GOTREF(r)
+  #define __Pyx_GIVEREF(r)
+  #define __Pyx_XINCREF(r) Py_XINCREF(r)
+  #define __Pyx_XDECREF(r) Py_XDECREF(r)
+  #define __Pyx_XGOTREF(r)
+  #define __Pyx_XGIVEREF(r)
+#endif
+#define __Pyx_Py_XDECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; Py_XDECREF(tmp);\
+    } while (0)
+#define __Pyx_XDECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; __Pyx_XDECREF(tmp);\
+    } while (0)
+#define __Pyx_DECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; __Pyx_DECREF(tmp);\
+    } while (0)
+#define __Pyx_CLEAR(r)    do { PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);} while(0)
+#define __Pyx_XCLEAR(r)   do { if((r) != NULL) {PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);}} while(0)
+
+/* ReleaseUnknownGil.proto */
+#if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030d0000
+typedef struct {
+  PyThreadState* ts;
+  PyGILState_STATE gil_state;
+} __Pyx_UnknownThreadState;
+#else
+#define __Pyx_UnknownThreadState PyThreadState*
+#endif
+static __Pyx_UnknownThreadState __Pyx_SaveUnknownThread(void);
+static void __Pyx_RestoreUnknownThread(__Pyx_UnknownThreadState state);
+static CYTHON_INLINE int __Pyx_UnknownThreadStateDefinitelyHadGil(__Pyx_UnknownThreadState state);
+static CYTHON_INLINE int __Pyx_UnknownThreadStateMayHaveHadGil(__Pyx_UnknownThreadState state);
+
+/* IncludeStdlibH.proto */
+#include <stdlib.h>
+
+/* dict_setdefault.proto (used by CLineInTraceback) */
+static CYTHON_INLINE PyObject *__Pyx_PyDict_SetDefault(PyObject *d, PyObject *key, PyObject *default_value);
+
+/* PyDictVersioning.proto (used by CLineInTraceback) */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+#define __PYX_DICT_VERSION_INIT  ((PY_UINT64_T) -1)
+#define __PYX_GET_DICT_VERSION(dict)  (((PyDictObject*)(dict))->ma_version_tag)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)\
+    (version_var) = __PYX_GET_DICT_VERSION(dict);\
+    (cache_var) = (value);
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP) {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    if (likely(__PYX_GET_DICT_VERSION(DICT) == __pyx_dict_version)) {\
+        (VAR) = __Pyx_XNewRef(__pyx_dict_cached_value);\
+    } else {\
+        (VAR) = __pyx_dict_cached_value = (LOOKUP);\
+        __pyx_dict_version = __PYX_GET_DICT_VERSION(DICT);\
+    }\
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj);
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj);
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version);
+#else
+#define __PYX_GET_DICT_VERSION(dict)  (0)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP)  (VAR) = (LOOKUP);
+#endif
+
+/* FastTypeChecks.proto (used by GivenExceptionMatches) */
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_TypeCheck(obj, type) __Pyx_IsSubtype(Py_TYPE(obj), (PyTypeObject *)type)
+#define __Pyx_TypeCheck2(obj, type1, type2) __Pyx_IsAnySubtype2(Py_TYPE(obj), (PyTypeObject *)type1, (PyTypeObject *)type2)
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b);
+static CYTHON_INLINE int __Pyx_IsAnySubtype2(PyTypeObject *cls, PyTypeObject *a, PyTypeObject *b);
+#define __Pyx_PyAnySet_Check(obj)  __Pyx_TypeCheck2(obj, &PySet_Type, &PyFrozenSet_Type)
+#else
+#define __Pyx_TypeCheck(obj, type) PyObject_TypeCheck(obj, (PyTypeObject *)type)
+#define __Pyx_TypeCheck2(obj, type1, type2) (PyObject_TypeCheck(obj, (PyTypeObject *)type1) || PyObject_TypeCheck(obj, (PyTypeObject *)type2))
+#define __Pyx_PyAnySet_Check(obj)  PyAnySet_Check(obj)
+#endif
+
+/* PyThreadStateGet.proto (used by PyErrFetchRestore) */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyThreadState_declare  PyThreadState *__pyx_tstate;
+#define __Pyx_PyThreadState_assign  __pyx_tstate = __Pyx_PyThreadState_Current;
+#if PY_VERSION_HEX >= 0x030C00A6
+#define __Pyx_PyErr_Occurred()  (__pyx_tstate->current_exception != NULL)
+#define __Pyx_PyErr_CurrentExceptionType()  (__pyx_tstate->current_exception ? (PyObject*) Py_TYPE(__pyx_tstate->current_exception) : (PyObject*) NULL)
+#else
+#define __Pyx_PyErr_Occurred()  (__pyx_tstate->curexc_type != NULL)
+#define __Pyx_PyErr_CurrentExceptionType()  (__pyx_tstate->curexc_type)
+#endif
+#else
+#define __Pyx_PyThreadState_declare
+#define __Pyx_PyThreadState_assign
+#define __Pyx_PyErr_Occurred()  (PyErr_Occurred() != NULL)
+#define __Pyx_PyErr_CurrentExceptionType()  PyErr_Occurred()
+#endif
+
+/* PyErrFetchRestore.proto (used by GivenExceptionMatches) */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_Clear() __Pyx_ErrRestore(NULL, NULL, NULL)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  __Pyx_ErrRestoreInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)    __Pyx_ErrFetchInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  __Pyx_ErrRestoreInState(__pyx_tstate, type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)    __Pyx_ErrFetchInState(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A6
+#define __Pyx_PyErr_SetNone(exc) (Py_INCREF(exc), __Pyx_ErrRestore((exc), NULL, NULL))
+#else
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#endif
+#else
+#define __Pyx_PyErr_Clear() PyErr_Clear()
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestoreInState(tstate, type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchInState(tstate, type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)  PyErr_Fetch(type, value, tb)
+#endif
+
+/* GivenExceptionMatches.proto (used by PyErrExceptionMatches) */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject *type);
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *type1, PyObject *type2);
+#else
+#define __Pyx_PyErr_GivenExceptionMatches(err, type) PyErr_GivenExceptionMatches(err, type)
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *type1, PyObject *type2) {
+    return PyErr_GivenExceptionMatches(err, type1) || PyErr_GivenExceptionMatches(err, type2);
+}
+#endif
+#define __Pyx_PyErr_ExceptionMatches2(err1, err2)  __Pyx_PyErr_GivenExceptionMatches2(__Pyx_PyErr_CurrentExceptionType(), err1, err2)
+
+/* PyErrExceptionMatches.proto (used by PyObjectGetAttrStrNoError) */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_ExceptionMatches(err) __Pyx_PyErr_ExceptionMatchesInState(__pyx_tstate, err)
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err);
+#else
+#define __Pyx_PyErr_ExceptionMatches(err)  PyErr_ExceptionMatches(err)
+#endif
+
+/* PyObjectGetAttrStr.proto (used by PyObjectGetAttrStrNoError) */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GetAttrStr(o,n) PyObject_GetAttr(o,n)
+#endif
+
+/* PyObjectGetAttrStrNoError.proto (used by CLineInTraceback) */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name);
+
+/* CLineInTraceback.proto (used by AddTraceback) */
+#if CYTHON_CLINE_IN_TRACEBACK && CYTHON_CLINE_IN_TRACEBACK_RUNTIME
+static int __Pyx_CLineForTraceback(PyThreadState *tstate, int c_line);
+#else
+#define __Pyx_CLineForTraceback(tstate, c_line)  (((CYTHON_CLINE_IN_TRACEBACK)) ? c_line : 0)
+#endif
+
+/* CodeObjectCache.proto (used by AddTraceback) */
+#if CYTHON_COMPILING_IN_LIMITED_API
+typedef PyObject __Pyx_CachedCodeObjectType;
+#else
+typedef PyCodeObject __Pyx_CachedCodeObjectType;
+#endif
+typedef struct {
+    __Pyx_CachedCodeObjectType* code_object;
+    int code_line;
+} __Pyx_CodeObjectCacheEntry;
+struct __Pyx_CodeObjectCache {
+    int count;
+    int max_count;
+    __Pyx_CodeObjectCacheEntry* entries;
+  #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    __pyx_atomic_int_type accessor_count;
+  #endif
+};
+static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line);
+static __Pyx_CachedCodeObjectType *__pyx_find_code_object(int code_line);
+static void __pyx_insert_code_object(int code_line, __Pyx_CachedCodeObjectType* code_object);
+
+/* AddTraceback.proto */
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename);
+
+/* GCCDiagnostics.proto */
+#if !defined(__INTEL_COMPILER) && defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 6))
+#define __Pyx_HAS_GCC_DIAGNOSTIC
+#endif
+
+/* PyObjectCall.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw);
+#else
+#define __Pyx_PyObject_Call(func, arg, kw) PyObject_Call(func, arg, kw)
+#endif
+
+/* PyObjectCallMethO.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg);
+#endif
+
+/* PyObjectFastCall.proto (used by PyObjectVectorcallKwds) */
+#define __Pyx_PyObject_FastCall(func, args, nargs)  __Pyx_PyObject_FastCallDict(func, args, (size_t)(nargs), NULL)
+static CYTHON_INLINE PyObject* __Pyx_PyObject_FastCallDict(PyObject *func, PyObject * const*args, size_t nargsf, PyObject *kwargs);
+
+/* PyObjectVectorcallKwds.proto (used by PyObjectVectorcallMethodKwds) */
+#if CYTHON_VECTORCALL
+#define __Pyx_Object_VectorcallKwds PyObject_Vectorcall
+CYTHON_UNUSED static int __Pyx_CheckVectorcallKwarg(PyObject *kwnames, Py_ssize_t i);
+#else
+#define __Pyx_Object_VectorcallKwds __Pyx_PyObject_FastCallDict
+CYTHON_UNUSED static PyObject *__Pyx_MakeKwargDict(PyObject **keys, PyObject **values, Py_ssize_t n);
+CYTHON_UNUSED static int __Pyx_CheckVectorcallKwarg(PyObject **kwnames, Py_ssize_t i);
+#endif
+
+/* PyObjectVectorcallMethodKwds.proto (used by CIntToPy) */
+#if CYTHON_VECTORCALL
+#define __Pyx_Object_VectorcallMethodKwds PyObject_VectorcallMethod
+#else
+static PyObject *__Pyx_Object_VectorcallMethodKwds(PyObject *name, PyObject *const *args, size_t nargsf, PyObject *kwnames);
+#endif
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyLong_From_int(int value);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE int __Pyx_PyLong_As_int(PyObject *);
+
+/* FormatTypeName.proto */
+#if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX >= 0x030d0000
+typedef PyObject *__Pyx_TypeName;
+#define __Pyx_FMT_TYPENAME "%N"
+#define __Pyx_PyType_GetFullyQualifiedName(tp) Py_NewRef((PyObject*)tp)
+#define __Pyx_DECREF_TypeName(obj) Py_DECREF(obj)
+#elif CYTHON_COMPILING_IN_LIMITED_API
+typedef PyObject *__Pyx_TypeName;
+#define __Pyx_FMT_TYPENAME "%U"
+#define __Pyx_DECREF_TypeName(obj) Py_XDECREF(obj)
+static __Pyx_TypeName __Pyx_PyType_GetFullyQualifiedName(PyTypeObject* tp);
+#else  // !LIMITED_API
+typedef const char *__Pyx_TypeName;
+#define __Pyx_FMT_TYPENAME "%.200s"
+#define __Pyx_PyType_GetFullyQualifiedName(tp) ((tp)->tp_name)
+#define __Pyx_DECREF_TypeName(obj)
+#endif
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyLong_From_long(long value);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE long __Pyx_PyLong_As_long(PyObject *);
+
+/* GetRuntimeVersion.proto */
+#if __PYX_LIMITED_VERSION_HEX < 0x030b0000
+static unsigned long __Pyx_cached_runtime_version = 0;
+static void __Pyx_init_runtime_version(void);
+#else
+#define __Pyx_init_runtime_version()
+#endif
+static unsigned long __Pyx_get_runtime_version(void);
+
+/* AddModuleRef.proto */
+#if ((CYTHON_COMPILING_IN_CPYTHON_FREETHREADING && PY_VERSION_HEX < 0x030F00a3) ||\
+     __PYX_LIMITED_VERSION_HEX < 0x030d0000)
+  static PyObject *__Pyx_PyImport_AddModuleRef(const char *name);
+#else
+  #define __Pyx_PyImport_AddModuleRef(name) PyImport_AddModuleRef(name)
+#endif
+
+/* CheckBinaryVersion.proto */
+static int __Pyx_check_binary_version(unsigned long ct_version, unsigned long rt_version, int allow_newer);
+
+/* MultiPhaseInitModuleState.proto */
+#if CYTHON_PEP489_MULTI_PHASE_INIT && CYTHON_USE_MODULE_STATE
+#include <stdlib.h>
+static PyObject *__Pyx_State_FindModule(void*);
+static int __Pyx_State_AddModule(PyObject* module, void*);
+static int __Pyx_State_RemoveModule(void*);
+#elif CYTHON_USE_MODULE_STATE
+#define __Pyx_State_FindModule PyState_FindModule
+#define __Pyx_State_AddModule PyState_AddModule
+#define __Pyx_State_RemoveModule PyState_RemoveModule
+#endif
+
+/* #### Code section: module_declarations ### */
+/* CythonABIVersion.proto */
+#if CYTHON_COMPILING_IN_LIMITED_API
+    #if CYTHON_VECTORCALL
+        #define __PYX_VECTORCALL_ABI_SUFFIX  "_vectorcall"
+    #else
+        #define __PYX_VECTORCALL_ABI_SUFFIX
+    #endif
+    #define __PYX_LIMITED_ABI_SUFFIX "limited" __PYX_VECTORCALL_ABI_SUFFIX __PYX_AM_SEND_ABI_SUFFIX
+#else
+    #define __PYX_LIMITED_ABI_SUFFIX
+#endif
+#if __PYX_HAS_PY_AM_SEND == 1
+    #define __PYX_AM_SEND_ABI_SUFFIX
+#elif __PYX_HAS_PY_AM_SEND == 2
+    #define __PYX_AM_SEND_ABI_SUFFIX "amsendbackport"
+#else
+    #define __PYX_AM_SEND_ABI_SUFFIX "noamsend"
+#endif
+#ifndef __PYX_MONITORING_ABI_SUFFIX
+    #define __PYX_MONITORING_ABI_SUFFIX
+#endif
+#if CYTHON_USE_TP_FINALIZE
+    #define __PYX_TP_FINALIZE_ABI_SUFFIX
+#else
+    #define __PYX_TP_FINALIZE_ABI_SUFFIX "nofinalize"
+#endif
+#if CYTHON_USE_FREELISTS || !defined(__Pyx_AsyncGen_USED)
+    #define __PYX_FREELISTS_ABI_SUFFIX
+#else
+    #define __PYX_FREELISTS_ABI_SUFFIX "nofreelists"
+#endif
+#if CYTHON_OPAQUE_OBJECTS && CYTHON_COMPILING_IN_LIMITED_API
+    #define __PYX_OPAQUE_OBJECTS_ABI_SUFFIX "opaque"
+#else
+    #define __PYX_OPAQUE_OBJECTS_ABI_SUFFIX
+#endif
+#define CYTHON_ABI  __PYX_ABI_VERSION __PYX_LIMITED_ABI_SUFFIX __PYX_MONITORING_ABI_SUFFIX __PYX_TP_FINALIZE_ABI_SUFFIX __PYX_FREELISTS_ABI_SUFFIX __PYX_AM_SEND_ABI_SUFFIX __PYX_OPAQUE_OBJECTS_ABI_SUFFIX
+#define __PYX_ABI_MODULE_NAME "_cython_" CYTHON_ABI
+#define __PYX_TYPE_MODULE_PREFIX __PYX_ABI_MODULE_NAME "."
+
+
+/* Module declarations from "cython" */
+
+/* Module declarations from "libc.math" */
+
+/* Module declarations from "cpython.pycapsule" */
+
+/* Module declarations from "mylibrary._kernels" */
+
+/* Module declarations from "mylibrary._kernels_avx512" */
+static struct __pyx_t_9mylibrary_8_kernels_KernelTable __pyx_v_9mylibrary_15_kernels_avx512__table;
+static double __pyx_f_9mylibrary_15_kernels_avx512__combine(enum __pyx_t_9mylibrary_8_kernels__Reduction, double const *, Py_ssize_t); /*proto*/
+static CYTHON_INLINE float __pyx_fuse_0__pyx_f_9mylibrary_15_kernels_avx512__sqrt(float); /*proto*/
+static CYTHON_INLINE double __pyx_fuse_1__pyx_f_9mylibrary_15_kernels_avx512__sqrt(double); /*proto*/
+static void __pyx_fuse_0__pyx_f_9mylibrary_15_kernels_avx512__sqrt_contig(float const *, float *, Py_ssize_t, int); /*proto*/
+static void __pyx_fuse_1__pyx_f_9mylibrary_15_kernels_avx512__sqrt_contig(double const *, double *, Py_ssize_t, int); /*proto*/
+static void __pyx_fuse_0__pyx_f_9mylibrary_15_kernels_avx512__sqrt_strided(float const *, Py_ssize_t, Py_ssize_t, float *, Py_ssize_t, Py_ssize_t, Py_ssize_t, Py_ssize_t, int); /*proto*/
+static void __pyx_fuse_1__pyx_f_9mylibrary_15_kernels_avx512__sqrt_strided(double const *, Py_ssize_t, Py_ssize_t, double *, Py_ssize_t, Py_ssize_t, Py_ssize_t, Py_ssize_t, int); /*proto*/
+static double __pyx_fuse_0__pyx_f_9mylibrary_15_kernels_avx512__pairwise_sum(float const *, Py_ssize_t, Py_ssize_t, float const *, Py_ssize_t, Py_ssize_t, Py_ssize_t, Py_ssize_t, Py_ssize_t); /*proto*/
+static double __pyx_fuse_1__pyx_f_9mylibrary_15_kernels_avx512__pairwise_sum(double const *, Py_ssize_t, Py_ssize_t, double const *, Py_ssize_t, Py_ssize_t, Py_ssize_t, Py_ssize_t, Py_ssize_t); /*proto*/
+static double __pyx_fuse_0__pyx_f_9mylibrary_15_kernels_avx512__extremum(int, float const *, Py_ssize_t, Py_ssize_t, Py_ssize_t, Py_ssize_t, Py_ssize_t); /*proto*/
+static double __pyx_fuse_1__pyx_f_9mylibrary_15_kernels_avx512__extremum(int, double const *, Py_ssize_t, Py_ssize_t, Py_ssize_t, Py_ssize_t, Py_ssize_t); /*proto*/
+static double __pyx_fuse_0__pyx_f_9mylibrary_15_kernels_avx512__reduce(enum __pyx_t_9mylibrary_8_kernels__Reduction, float const *, Py_ssize_t, Py_ssize_t, float const *, Py_ssize_t, Py_ssize_t, Py_ssize_t, Py_ssize_t, int, int); /*proto*/
+static double __pyx_fuse_1__pyx_f_9mylibrary_15_kernels_avx512__reduce(enum __pyx_t_9mylibrary_8_kernels__Reduction, double const *, Py_ssize_t, Py_ssize_t, double const *, Py_ssize_t, Py_ssize_t, Py_ssize_t, Py_ssize_t, int, int); /*proto*/
+static CYTHON_INLINE double __pyx_fuse_0__pyx_f_9mylibrary_15_kernels_avx512__reduce_run(enum __pyx_t_9mylibrary_8_kernels__Reduction, float const *, Py_ssize_t, Py_ssize_t, float const *, Py_ssize_t, Py_ssize_t, Py_ssize_t, Py_ssize_t, Py_ssize_t); /*proto*/
+static CYTHON_INLINE double __pyx_fuse_1__pyx_f_9mylibrary_15_kernels_avx512__reduce_run(enum __pyx_t_9mylibrary_8_kernels__Reduction, double const *, Py_ssize_t, Py_ssize_t, double const *, Py_ssize_t, Py_ssize_t, Py_ssize_t, Py_ssize_t, Py_ssize_t); /*proto*/
+static void __pyx_fuse_0__pyx_f_9mylibrary_15_kernels_avx512__apply_op(struct __pyx_t_9mylibrary_8_kernels__Op const *, float const *, Py_ssize_t, float *, Py_ssize_t, Py_ssize_t); /*proto*/
+static void __pyx_fuse_1__pyx_f_9mylibrary_15_kernels_avx512__apply_op(struct __pyx_t_9mylibrary_8_kernels__Op const *, double const *, Py_ssize_t, double *, Py_ssize_t, Py_ssize_t); /*proto*/
+static CYTHON_INLINE void __pyx_fuse_0__pyx_f_9mylibrary_15_kernels_avx512__apply_op_impl(struct __pyx_t_9mylibrary_8_kernels__Op const *, float const *, Py_ssize_t, float *, Py_ssize_t, Py_ssize_t); /*proto*/
+static CYTHON_INLINE void __pyx_fuse_1__pyx_f_9mylibrary_15_kernels_avx512__apply_op_impl(struct __pyx_t_9mylibrary_8_kernels__Op const *, double const *, Py_ssize_t, double *, Py_ssize_t, Py_ssize_t); /*proto*/
+static void __pyx_fuse_0__pyx_f_9mylibrary_15_kernels_avx512__run_ops(struct __pyx_t_9mylibrary_8_kernels__Op const *, int, float const *, Py_ssize_t, float *, Py_ssize_t, Py_ssize_t); /*proto*/
+static void __pyx_fuse_1__pyx_f_9mylibrary_15_kernels_avx512__run_ops(struct __pyx_t_9mylibrary_8_kernels__Op const *, int, double const *, Py_ssize_t, double *, Py_ssize_t, Py_ssize_t); /*proto*/
+static void __pyx_fuse_0__pyx_f_9mylibrary_15_kernels_avx512__pipeline_block(struct __pyx_t_9mylibrary_8_kernels__Op const *, int, float const *, Py_ssize_t, Py_ssize_t, float *, Py_ssize_t, Py_ssize_t, Py_ssize_t, Py_ssize_t, Py_ssize_t); /*proto*/
+static void __pyx_fuse_1__pyx_f_9mylibrary_15_kernels_avx512__pipeline_block(struct __pyx_t_9mylibrary_8_kernels__Op const *, int, double const *, Py_ssize_t, Py_ssize_t, double *, Py_ssize_t, Py_ssize_t, Py_ssize_t, Py_ssize_t, Py_ssize_t); /*proto*/
+static void __pyx_fuse_0__pyx_f_9mylibrary_15_kernels_avx512__pipeline(struct __pyx_t_9mylibrary_8_kernels__Op const *, int, float const *, Py_ssize_t, Py_ssize_t, float *, Py_ssize_t, Py_ssize_t, Py_ssize_t, Py_ssize_t, int); /*proto*/
+static void __pyx_fuse_1__pyx_f_9mylibrary_15_kernels_avx512__pipeline(struct __pyx_t_9mylibrary_8_kernels__Op const *, int, double const *, Py_ssize_t, Py_ssize_t, double *, Py_ssize_t, Py_ssize_t, Py_ssize_t, Py_ssize_t, int); /*proto*/
+/* #### Code section: typeinfo ### */
+/* #### Code section: before_global_var ### */
+#define __Pyx_MODULE_NAME "mylibrary._kernels_avx512"
+extern int __pyx_module_is_main_mylibrary___kernels_avx512;
+int __pyx_module_is_main_mylibrary___kernels_avx512 = 0;
+
+/* Implementation of "mylibrary._kernels_avx512" */
+/* #### Code section: global_var ### */
+/* #### Code section: string_decls ### */
+static const char __pyx_k_Kernels_of_mylibrary_compute_com[] = "Kernels of mylibrary.compute, compiled for AVX-512 (F, DQ, VL). Selected automatically at import.";
+/* #### Code section: decls ### */
+/* #### Code section: late_includes ### */
+/* #### Code section: module_state ### */
+/* SmallCodeConfig */
+#ifndef CYTHON_SMALL_CODE
+#if defined(__clang__)
+    #define CYTHON_SMALL_CODE
+#elif defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 3))
+    #define CYTHON_SMALL_CODE __attribute__((cold))
+#else
+    #define CYTHON_SMALL_CODE
+#endif
+#endif
+
+#ifdef __cplusplus
+namespace {
+  #endif
+  typedef struct {
+    PyObject *__pyx_d;
+    PyObject *__pyx_b;
+    PyObject *__pyx_cython_runtime;
+    PyObject *__pyx_empty_tuple;
+    PyObject *__pyx_empty_bytes;
+    PyObject *__pyx_empty_unicode;
+    PyObject *__pyx_string_tab[9];
+/* #### Code section: module_state_contents ### */
+/* CodeObjectCache.module_state_decls */
+struct __Pyx_CodeObjectCache __pyx_code_cache;
+
+/* #### Code section: module_state_end ### */
+} __pyx_mstatetype;
+#ifdef __cplusplus
+} /* anonymous namespace */
+#endif
+
+#if CYTHON_USE_MODULE_STATE
+#ifdef __cplusplus
+namespace {
+extern struct PyModuleDef __pyx_moduledef;
+} /* anonymous namespace */
+#else
+static struct PyModuleDef __pyx_moduledef;
+#endif
+
+#define __pyx_mstate_global (__Pyx_PyModule_GetState(__Pyx_State_FindModule(&__pyx_moduledef)))
+
+#define __pyx_m (__Pyx_State_FindModule(&__pyx_moduledef))
+#else
+static __pyx_mstatetype __pyx_mstate_global_static =
+#ifdef __cplusplus
+    {};
+#else
+    {0};
+#endif
+static __pyx_mstatetype * const __pyx_mstate_global = &__pyx_mstate_global_static;
+#endif
+/* #### Code section: constant_name_defines ### */
+#define __pyx_kp_u_ __pyx_string_tab[0]
+#define __pyx_n_u_main __pyx_string_tab[1]
+#define __pyx_n_u_module __pyx_string_tab[2]
+#define __pyx_n_u_name __pyx_string_tab[3]
+#define __pyx_n_u_qualname __pyx_string_tab[4]
+#define __pyx_n_u_test __pyx_string_tab[5]
+#define __pyx_n_u_cline_in_traceback __pyx_string_tab[6]
+#define __pyx_n_u_kernels __pyx_string_tab[7]
+#define __pyx_n_u_setdefault __pyx_string_tab[8]
+/* #### Code section: module_state_clear ### */
+#if CYTHON_USE_MODULE_STATE
+static CYTHON_SMALL_CODE int __pyx_m_clear(PyObject *m) {
+  __pyx_mstatetype *clear_module_state = __Pyx_PyModule_GetState(m);
+  if (!clear_module_state) return 0;
+  Py_CLEAR(clear_module_state->__pyx_d);
+  Py_CLEAR(clear_module_state->__pyx_b);
+  Py_CLEAR(clear_module_state->__pyx_cython_runtime);
+  Py_CLEAR(clear_module_state->__pyx_empty_tuple);
+  Py_CLEAR(clear_module_state->__pyx_empty_bytes);
+  Py_CLEAR(clear_module_state->__pyx_empty_unicode);
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  __Pyx_State_RemoveModule(NULL);
+  #endif
+  for (int i=0; i<9; ++i) { Py_CLEAR(clear_module_state->__pyx_string_tab[i]); }
+/* #### Code section: module_state_clear_contents ### */
+/* #### Code section: module_state_clear_end ### */
+return 0;
+}
+#endif
+/* #### Code section: module_state_traverse ### */
+#if CYTHON_USE_MODULE_STATE
+static CYTHON_SMALL_CODE int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
+  __pyx_mstatetype *traverse_module_state = __Pyx_PyModule_GetState(m);
+  if (!traverse_module_state) return 0;
+  Py_VISIT(traverse_module_state->__pyx_d);
+  Py_VISIT(traverse_module_state->__pyx_b);
+  Py_VISIT(traverse_module_state->__pyx_cython_runtime);
+  __Pyx_VISIT_CONST(traverse_module_state->__pyx_empty_tuple);
+  __Pyx_VISIT_CONST(traverse_module_state->__pyx_empty_bytes);
+  __Pyx_VISIT_CONST(traverse_module_state->__pyx_empty_unicode);
+  for (int i=0; i<9; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_string_tab[i]); }
+/* #### Code section: module_state_traverse_contents ### */
+/* #### Code section: module_state_traverse_end ### */
+return 0;
+}
+#endif
+/* #### Code section: module_code ### */
+
+/* "mylibrary/_kernels.pxi":43
+ * # Called once per element; not worth a profiler entry or line trace (in the "profile" build of setup.py).
+ * #
+ * @cython.profile(False)             # <<<<<<<<<<<<<<
+ * @cython.linetrace(False)
+ * cdef inline real _sqrt( real v ) noexcept nogil:
+*/
+
+static CYTHON_INLINE float __pyx_fuse_0__pyx_f_9mylibrary_15_kernels_avx512__sqrt(float __pyx_v_v) {
+  float __pyx_r;
+
+  /* "mylibrary/_kernels.pxi":47
+ * cdef inline real _sqrt( real v ) noexcept nogil:
+ *     if real is float:
+ *         return c_sqrtf(v)  # avoid a round trip through double             # <<<<<<<<<<<<<<
+ *     else:
+ *         return c_sqrt(v)
+*/
+  {
+
+    __pyx_r = sqrtf(__pyx_v_v);
+  }
+  goto __pyx_L0;
+
+  /* "mylibrary/_kernels.pxi":43
+ * # Called once per element; not worth a profiler entry or line trace (in the "profile" build of setup.py).
+ * #
+ * @cython.profile(False)             # <<<<<<<<<<<<<<
+ * @cython.linetrace(False)
+ * cdef inline real _sqrt( real v ) noexcept nogil:
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+static CYTHON_INLINE double __pyx_fuse_1__pyx_f_9mylibrary_15_kernels_avx512__sqrt(double __pyx_v_v) {
+  double __pyx_r;
+
+  /* "mylibrary/_kernels.pxi":49
+ *         return c_sqrtf(v)  # avoid a round trip through double
+ *     else:
+ *         return c_sqrt(v)             # <<<<<<<<<<<<<<
+ * 
+ * # Contiguous 1-D kernel. This is the one the C compiler can vectorize.
+*/
+  {
+
+    __pyx_r = sqrt(__pyx_v_v);
+  }
+  goto __pyx_L0;
+
+  /* "mylibrary/_kernels.pxi":43
+ * # Called once per element; not worth a profiler entry or line trace (in the "profile" build of setup.py).
+ * #
+ * @cython.profile(False)             # <<<<<<<<<<<<<<
+ * @cython.linetrace(False)
+ * cdef inline real _sqrt( real v ) noexcept nogil:
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "mylibrary/_kernels.pxi":53
+ * # Contiguous 1-D kernel. This is the one the C compiler can vectorize.
+ * #
+ * cdef void _sqrt_contig( const real* x, real* out, Py_ssize_t n, int num_threads ) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t j
+ *     if num_threads == 1:
+*/
+
+static void __pyx_fuse_0__pyx_f_9mylibrary_15_kernels_avx512__sqrt_contig(float const *__pyx_v_x, float *__pyx_v_out, Py_ssize_t __pyx_v_n, int __pyx_v_num_threads) {
+  Py_ssize_t __pyx_v_j;
+  Py_ssize_t __pyx_t_1;
+  Py_ssize_t __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+
+  /* "mylibrary/_kernels.pxi":55
+ * cdef void _sqrt_contig( const real* x, real* out, Py_ssize_t n, int num_threads ) noexcept nogil:
+ *     cdef Py_ssize_t j
+ *     if num_threads == 1:             # <<<<<<<<<<<<<<
+ *         for j in range(n):
+ *             out[j] = _sqrt(x[j])
+*/
+  switch (__pyx_v_num_threads) {
+    case 1:
+
+    /* "mylibrary/_kernels.pxi":56
+ *     cdef Py_ssize_t j
+ *     if num_threads == 1:
+ *         for j in range(n):             # <<<<<<<<<<<<<<
+ *             out[j] = _sqrt(x[j])
+ *     elif num_threads == 0:
+*/
+
+    __pyx_t_1 = __pyx_v_n;
+    __pyx_t_2 = __pyx_t_1;
+
+    for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+      __pyx_v_j = __pyx_t_3;
+
+      /* "mylibrary/_kernels.pxi":57
+ *     if num_threads == 1:
+ *         for j in range(n):
+ *             out[j] = _sqrt(x[j])             # <<<<<<<<<<<<<<
+ *     elif num_threads == 0:
+ *         for j in prange(n, schedule="static"):
+*/
+      (__pyx_v_out[__pyx_v_j]) = __pyx_fuse_0__pyx_f_9mylibrary_15_kernels_avx512__sqrt((__pyx_v_x[__pyx_v_j]));
+    }
+
+
+    /* "mylibrary/_kernels.pxi":55
+ * cdef void _sqrt_contig( const real* x, real* out, Py_ssize_t n, int num_threads ) noexcept nogil:
+ *     cdef Py_ssize_t j
+ *     if num_threads == 1:             # <<<<<<<<<<<<<<
+ *         for j in range(n):
+ *             out[j] = _sqrt(x[j])
+*/
+    break;
+    case 0:
+
+    /* "mylibrary/_kernels.pxi":59
+ *             out[j] = _sqrt(x[j])
+ *     elif num_threads == 0:
+ *         for j in prange(n, schedule="static"):             # <<<<<<<<<<<<<<
+ *             out[j] = _sqrt(x[j])
+ *     else:
+*/
+    {
+        __Pyx_UnknownThreadState _save;
+        _save = __Pyx_SaveUnknownThread();
+        __Pyx_FastGIL_Remember();
+        /*try:*/ {
+          __pyx_t_1 = __pyx_v_n;
+
+          {
+              #if ((defined(__APPLE__) || defined(__OSX__)) && (defined(__GNUC__) && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))))
+                  #undef likely
+                  #undef unlikely
+                  #define likely(x)   (x)
+                  #define unlikely(x) (x)
+              #endif
+              __pyx_t_3 = (__pyx_t_1 - 0 + 1 - 1/abs(1)) / 1;
+              if (__pyx_t_3 > 0)
+              {
+                  #ifdef _OPENMP
+                  #pragma omp parallel
+                  #endif /* _OPENMP */
+                  {
+                      #ifdef _OPENMP
+                      #pragma omp for nowait firstprivate(__pyx_v_j) lastprivate(__pyx_v_j) schedule(static)
+                      #endif /* _OPENMP */
+                      for (__pyx_t_2 = 0; __pyx_t_2 < __pyx_t_3; __pyx_t_2++){
+                          {
+                              __pyx_v_j = (Py_ssize_t)(0 + 1 * __pyx_t_2);
+
+                              /* "mylibrary/_kernels.pxi":60
+ *     elif num_threads == 0:
+ *         for j in prange(n, schedule="static"):
+ *             out[j] = _sqrt(x[j])             # <<<<<<<<<<<<<<
+ *     else:
+ *         for j in prange(n, schedule="static", num_threads=num_threads):
+*/
+                              (__pyx_v_out[__pyx_v_j]) = __pyx_fuse_0__pyx_f_9mylibrary_15_kernels_avx512__sqrt((__pyx_v_x[__pyx_v_j]));
+                          }
+                      }
+                  }
+              }
+          }
+          #if ((defined(__APPLE__) || defined(__OSX__)) && (defined(__GNUC__) && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))))
+              #undef likely
+              #undef unlikely
+              #define likely(x)   __builtin_expect(!!(x), 1)
+              #define unlikely(x) __builtin_expect(!!(x), 0)
+          #endif
+
+        }
+
+        /* "mylibrary/_kernels.pxi":59
+ *             out[j] = _sqrt(x[j])
+ *     elif num_threads == 0:
+ *         for j in prange(n, schedule="static"):             # <<<<<<<<<<<<<<
+ *             out[j] = _sqrt(x[j])
+ *     else:
+*/
+        /*finally:*/ {
+          /*normal exit:*/{
+            __Pyx_FastGIL_Forget();
+            __Pyx_RestoreUnknownThread(_save);
+            goto __pyx_L7;
+          }
+          __pyx_L7:;
+        }
+    }
+
+    /* "mylibrary/_kernels.pxi":58
+ *         for j in range(n):
+ *             out[j] = _sqrt(x[j])
+ *     elif num_threads == 0:             # <<<<<<<<<<<<<<
+ *         for j in prange(n, schedule="static"):
+ *             out[j] = _sqrt(x[j])
+*/
+    break;
+    default:
+
+    /* "mylibrary/_kernels.pxi":62
+ *             out[j] = _sqrt(x[j])
+ *     else:
+ *         for j in prange(n, schedule="static", num_threads=num_threads):             # <<<<<<<<<<<<<<
+ *             out[j] = _sqrt(x[j])
+ * 
+*/
+    {
+        __Pyx_UnknownThreadState _save;
+        _save = __Pyx_SaveUnknownThread();
+        __Pyx_FastGIL_Remember();
+        /*try:*/ {
+          __pyx_t_3 = __pyx_v_n;
+
+          {
+              #if ((defined(__APPLE__) || defined(__OSX__)) && (defined(__GNUC__) && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))))
+                  #undef likely
+                  #undef unlikely
+                  #define likely(x)   (x)
+                  #define unlikely(x) (x)
+              #endif
+              __pyx_t_1 = (__pyx_t_3 - 0 + 1 - 1/abs(1)) / 1;
+              if (__pyx_t_1 > 0)
+              {
+                  #ifdef _OPENMP
+                  #pragma omp parallel num_threads(__pyx_v_num_threads != 0 ? __pyx_v_num_threads : omp_get_max_threads())
+                  #endif /* _OPENMP */
+                  {
+                      #ifdef _OPENMP
+                      #pragma omp for nowait firstprivate(__pyx_v_j) lastprivate(__pyx_v_j) schedule(static)
+                      #endif /* _OPENMP */
+                      for (__pyx_t_2 = 0; __pyx_t_2 < __pyx_t_1; __pyx_t_2++){
+                          {
+                              __pyx_v_j = (Py_ssize_t)(0 + 1 * __pyx_t_2);
+
+                              /* "mylibrary/_kernels.pxi":63
+ *     else:
+ *         for j in prange(n, schedule="static", num_threads=num_threads):
+ *             out[j] = _sqrt(x[j])             # <<<<<<<<<<<<<<
+ * 
+ * # Strided 2-D kernel, parallelized over rows.
+*/
+                              (__pyx_v_out[__pyx_v_j]) = __pyx_fuse_0__pyx_f_9mylibrary_15_kernels_avx512__sqrt((__pyx_v_x[__pyx_v_j]));
+                          }
+                      }
+                  }
+              }
+          }
+          #if ((defined(__APPLE__) || defined(__OSX__)) && (defined(__GNUC__) && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))))
+              #undef likely
+              #undef unlikely
+              #define likely(x)   __builtin_expect(!!(x), 1)
+              #define unlikely(x) __builtin_expect(!!(x), 0)
+          #endif
+
+        }
+
+        /* "mylibrary/_kernels.pxi":62
+ *             out[j] = _sqrt(x[j])
+ *     else:
+ *         for j in prange(n, schedule="static", num_threads=num_threads):             # <<<<<<<<<<<<<<
+ *             out[j] = _sqrt(x[j])
+ * 
+*/
+        /*finally:*/ {
+          /*normal exit:*/{
+            __Pyx_FastGIL_Forget();
+            __Pyx_RestoreUnknownThread(_save);
+            goto __pyx_L16;
+          }
+          __pyx_L16:;
+        }
+    }
+    break;
+  }
+
+  /* "mylibrary/_kernels.pxi":53
+ * # Contiguous 1-D kernel. This is the one the C compiler can vectorize.
+ * #
+ * cdef void _sqrt_contig( const real* x, real* out, Py_ssize_t n, int num_threads ) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t j
+ *     if num_threads == 1:
+*/
+
+  /* function exit code */
+
+}
+
+static void __pyx_fuse_1__pyx_f_9mylibrary_15_kernels_avx512__sqrt_contig(double const *__pyx_v_x, double *__pyx_v_out, Py_ssize_t __pyx_v_n, int __pyx_v_num_threads) {
+  Py_ssize_t __pyx_v_j;
+  Py_ssize_t __pyx_t_1;
+  Py_ssize_t __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+
+  /* "mylibrary/_kernels.pxi":55
+ * cdef void _sqrt_contig( const real* x, real* out, Py_ssize_t n, int num_threads ) noexcept nogil:
+ *     cdef Py_ssize_t j
+ *     if num_threads == 1:             # <<<<<<<<<<<<<<
+ *         for j in range(n):
+ *             out[j] = _sqrt(x[j])
+*/
+  switch (__pyx_v_num_threads) {
+    case 1:
+
+    /* "mylibrary/_kernels.pxi":56
+ *     cdef Py_ssize_t j
+ *     if num_threads == 1:
+ *         for j in range(n):             # <<<<<<<<<<<<<<
+ *             out[j] = _sqrt(x[j])
+ *     elif num_threads == 0:
+*/
+
+    __pyx_t_1 = __pyx_v_n;
+    __pyx_t_2 = __pyx_t_1;
+
+    for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+      __pyx_v_j = __pyx_t_3;
+
+      /* "mylibrary/_kernels.pxi":57
+ *     if num_threads == 1:
+ *         for j in range(n):
+ *             out[j] = _sqrt(x[j])             # <<<<<<<<<<<<<<
+ *     elif num_threads == 0:
+ *         for j in prange(n, schedule="static"):
+*/
+      (__pyx_v_out[__pyx_v_j]) = __pyx_fuse_1__pyx_f_9mylibrary_15_kernels_avx512__sqrt((__pyx_v_x[__pyx_v_j]));
+    }
+
+
+    /* "mylibrary/_kernels.pxi":55
+ * cdef void _sqrt_contig( const real* x, real* out, Py_ssize_t n, int num_threads ) noexcept nogil:
+ *     cdef Py_ssize_t j
+ *     if num_threads == 1:             # <<<<<<<<<<<<<<
+ *         for j in range(n):
+ *             out[j] = _sqrt(x[j])
+*/
+    break;
+    case 0:
+
+    /* "mylibrary/_kernels.pxi":59
+ *             out[j] = _sqrt(x[j])
+ *     elif num_threads == 0:
+ *         for j in prange(n, schedule="static"):             # <<<<<<<<<<<<<<
+ *             out[j] = _sqrt(x[j])
+ *     else:
+*/
+    {
+        __Pyx_UnknownThreadState _save;
+        _save = __Pyx_SaveUnknownThread();
+        __Pyx_FastGIL_Remember();
+        /*try:*/ {
+          __pyx_t_1 = __pyx_v_n;
+
+          {
+              #if ((defined(__APPLE__) || defined(__OSX__)) && (defined(__GNUC__) && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))))
+                  #undef likely
+                  #undef unlikely
+                  #define likely(x)   (x)
+                  #define unlikely(x) (x)
+              #endif
+              __pyx_t_3 = (__pyx_t_1 - 0 + 1 - 1/abs(1)) / 1;
+              if (__pyx_t_3 > 0)
+              {
+                  #ifdef _OPENMP
+                  #pragma omp parallel
+                  #endif /* _OPENMP */
+                  {
+                      #ifdef _OPENMP
+                      #pragma omp for nowait firstprivate(__pyx_v_j) lastprivate(__pyx_v_j) schedule(static)
+                      #endif /* _OPENMP */
+                      for (__pyx_t_2 = 0; __pyx_t_2 < __pyx_t_3; __pyx_t_2++){
+                          {
+                              __pyx_v_j = (Py_ssize_t)(0 + 1 * __pyx_t_2);
+
+                              /* "mylibrary/_kernels.pxi":60
+ *     elif num_threads == 0:
+ *         for j in prange(n, schedule="static"):
+ *             out[j] = _sqrt(x[j])             # <<<<<<<<<<<<<<
+ *     else:
+ *         for j in prange(n, schedule="static", num_threads=num_threads):
+*/
+                              (__pyx_v_out[__pyx_v_j]) = __pyx_fuse_1__pyx_f_9mylibrary_15_kernels_avx512__sqrt((__pyx_v_x[__pyx_v_j]));
+                          }
+                      }
+                  }
+              }
+          }
+          #if ((defined(__APPLE__) || defined(__OSX__)) && (defined(__GNUC__) && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))))
+              #undef likely
+              #undef unlikely
+              #define likely(x)   __builtin_expect(!!(x), 1)
+              #define unlikely(x) __builtin_expect(!!(x), 0)
+          #endif
+
+        }
+
+        /* "mylibrary/_kernels.pxi":59
+ *             out[j] = _sqrt(x[j])
+ *     elif num_threads == 0:
+ *         for j in prange(n, schedule="static"):             # <<<<<<<<<<<<<<
+ *             out[j] = _sqrt(x[j])
+ *     else:
+*/
+        /*finally:*/ {
+          /*normal exit:*/{
+            __Pyx_FastGIL_Forget();
+            __Pyx_RestoreUnknownThread(_save);
+            goto __pyx_L7;
+          }
+          __pyx_L7:;
+        }
+    }
+
+    /* "mylibrary/_kernels.pxi":58
+ *         for j in range(n):
+ *             out[j] = _sqrt(x[j])
+ *     elif num_threads == 0:             # <<<<<<<<<<<<<<
+ *         for j in prange(n, schedule="static"):
+ *             out[j] = _sqrt(x[j])
+*/
+    break;
+    default:
+
+    /* "mylibrary/_kernels.pxi":62
+ *             out[j] = _sqrt(x[j])
+ *     else:
+ *         for j in prange(n, schedule="static", num_threads=num_threads):             # <<<<<<<<<<<<<<
+ *             out[j] = _sqrt(x[j])
+ * 
+*/
+    {
+        __Pyx_UnknownThreadState _save;
+        _save = __Pyx_SaveUnknownThread();
+        __Pyx_FastGIL_Remember();
+        /*try:*/ {
+          __pyx_t_3 = __pyx_v_n;
+
+          {
+              #if ((defined(__APPLE__) || defined(__OSX__)) && (defined(__GNUC__) && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))))
+                  #undef likely
+                  #undef unlikely
+                  #define likely(x)   (x)
+                  #define unlikely(x) (x)
+              #endif
+              __pyx_t_1 = (__pyx_t_3 - 0 + 1 - 1/abs(1)) / 1;
+              if (__pyx_t_1 > 0)
+              {
+                  #ifdef _OPENMP
+                  #pragma omp parallel num_threads(__pyx_v_num_threads != 0 ? __pyx_v_num_threads : omp_get_max_threads())
+                  #endif /* _OPENMP */
+                  {
+                      #ifdef _OPENMP
+                      #pragma omp for nowait firstprivate(__pyx_v_j) lastprivate(__pyx_v_j) schedule(static)
+                      #endif /* _OPENMP */
+                      for (__pyx_t_2 = 0; __pyx_t_2 < __pyx_t_1; __pyx_t_2++){
+                          {
+                              __pyx_v_j = (Py_ssize_t)(0 + 1 * __pyx_t_2);
+
+                              /* "mylibrary/_kernels.pxi":63
+ *     else:
+ *         for j in prange(n, schedule="static", num_threads=num_threads):
+ *             out[j] = _sqrt(x[j])             # <<<<<<<<<<<<<<
+ * 
+ * # Strided 2-D kernel, parallelized over rows.
+*/
+                              (__pyx_v_out[__pyx_v_j]) = __pyx_fuse_1__pyx_f_9mylibrary_15_kernels_avx512__sqrt((__pyx_v_x[__pyx_v_j]));
+                          }
+                      }
+                  }
+              }
+          }
+          #if ((defined(__APPLE__) || defined(__OSX__)) && (defined(__GNUC__) && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))))
+              #undef likely
+              #undef unlikely
+              #define likely(x)   __builtin_expect(!!(x), 1)
+              #define unlikely(x) __builtin_expect(!!(x), 0)
+          #endif
+
+        }
+
+        /* "mylibrary/_kernels.pxi":62
+ *             out[j] = _sqrt(x[j])
+ *     else:
+ *         for j in prange(n, schedule="static", num_threads=num_threads):             # <<<<<<<<<<<<<<
+ *             out[j] = _sqrt(x[j])
+ * 
+*/
+        /*finally:*/ {
+          /*normal exit:*/{
+            __Pyx_FastGIL_Forget();
+            __Pyx_RestoreUnknownThread(_save);
+            goto __pyx_L16;
+          }
+          __pyx_L16:;
+        }
+    }
+    break;
+  }
+
+  /* "mylibrary/_kernels.pxi":53
+ * # Contiguous 1-D kernel. This is the one the C compiler can vectorize.
+ * #
+ * cdef void _sqrt_contig( const real* x, real* out, Py_ssize_t n, int num_threads ) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t j
+ *     if num_threads == 1:
+*/
+
+  /* function exit code */
+
+}
+
+/* "mylibrary/_kernels.pxi":70
+ * # slices such as  x[::2]  and  x[:, 3:7]  as well as Fortran-ordered data.
+ * #
+ * cdef void _sqrt_strided( const real* x, Py_ssize_t xs0, Py_ssize_t xs1,             # <<<<<<<<<<<<<<
+ *                          real* out, Py_ssize_t os0, Py_ssize_t os1,
+ *                          Py_ssize_t m, Py_ssize_t n, int num_threads ) noexcept nogil:
+*/
+
+static void __pyx_fuse_0__pyx_f_9mylibrary_15_kernels_avx512__sqrt_strided(float const *__pyx_v_x, Py_ssize_t __pyx_v_xs0, Py_ssize_t __pyx_v_xs1, float *__pyx_v_out, Py_ssize_t __pyx_v_os0, Py_ssize_t __pyx_v_os1, Py_ssize_t __pyx_v_m, Py_ssize_t __pyx_v_n, int __pyx_v_num_threads) {
+  Py_ssize_t __pyx_v_i;
+  Py_ssize_t __pyx_v_j;
+  Py_ssize_t __pyx_t_1;
+  Py_ssize_t __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  Py_ssize_t __pyx_t_4;
+  Py_ssize_t __pyx_t_5;
+  Py_ssize_t __pyx_t_6;
+
+  /* "mylibrary/_kernels.pxi":74
+ *                          Py_ssize_t m, Py_ssize_t n, int num_threads ) noexcept nogil:
+ *     cdef Py_ssize_t i, j
+ *     if num_threads == 1:             # <<<<<<<<<<<<<<
+ *         for i in range(m):
+ *             for j in range(n):
+*/
+  switch (__pyx_v_num_threads) {
+    case 1:
+
+    /* "mylibrary/_kernels.pxi":75
+ *     cdef Py_ssize_t i, j
+ *     if num_threads == 1:
+ *         for i in range(m):             # <<<<<<<<<<<<<<
+ *             for j in range(n):
+ *                 out[i*os0 + j*os1] = _sqrt(x[i*xs0 + j*xs1])
+*/
+
+    __pyx_t_1 = __pyx_v_m;
+    __pyx_t_2 = __pyx_t_1;
+
+    for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+      __pyx_v_i = __pyx_t_3;
+
+      /* "mylibrary/_kernels.pxi":76
+ *     if num_threads == 1:
+ *         for i in range(m):
+ *             for j in range(n):             # <<<<<<<<<<<<<<
+ *                 out[i*os0 + j*os1] = _sqrt(x[i*xs0 + j*xs1])
+ *     elif num_threads == 0:
+*/
+
+      __pyx_t_4 = __pyx_v_n;
+      __pyx_t_5 = __pyx_t_4;
+
+      for (__pyx_t_6 = 0; __pyx_t_6 < __pyx_t_5; __pyx_t_6+=1) {
+        __pyx_v_j = __pyx_t_6;
+
+        /* "mylibrary/_kernels.pxi":77
+ *         for i in range(m):
+ *             for j in range(n):
+ *                 out[i*os0 + j*os1] = _sqrt(x[i*xs0 + j*xs1])             # <<<<<<<<<<<<<<
+ *     elif num_threads == 0:
+ *         for i in prange(m, schedule="static"):
+*/
+        (__pyx_v_out[((__pyx_v_i * __pyx_v_os0) + (__pyx_v_j * __pyx_v_os1))]) = __pyx_fuse_0__pyx_f_9mylibrary_15_kernels_avx512__sqrt((__pyx_v_x[((__pyx_v_i * __pyx_v_xs0) + (__pyx_v_j * __pyx_v_xs1))]));
+      }
+
+    }
+
+
+    /* "mylibrary/_kernels.pxi":74
+ *                          Py_ssize_t m, Py_ssize_t n, int num_threads ) noexcept nogil:
+ *     cdef Py_ssize_t i, j
+ *     if num_threads == 1:             # <<<<<<<<<<<<<<
+ *         for i in range(m):
+ *             for j in range(n):
+*/
+    break;
+    case 0:
+
+    /* "mylibrary/_kernels.pxi":79
+ *                 out[i*os0 + j*os1] = _sqrt(x[i*xs0 + j*xs1])
+ *     elif num_threads == 0:
+ *         for i in prange(m, schedule="static"):             # <<<<<<<<<<<<<<
+ *             for j in range(n):
+ *                 out[i*os0 + j*os1] = _sqrt(x[i*xs0 + j*xs1])
+*/
+    {
+        __Pyx_UnknownThreadState _save;
+        _save = __Pyx_SaveUnknownThread();
+        __Pyx_FastGIL_Remember();
+        /*try:*/ {
+          __pyx_t_1 = __pyx_v_m;
+
+          {
+              #if ((defined(__APPLE__) || defined(__OSX__)) && (defined(__GNUC__) && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))))
+                  #undef likely
+                  #undef unlikely
+                  #define likely(x)   (x)
+                  #define unlikely(x) (x)
+              #endif
+              __pyx_t_3 = (__pyx_t_1 - 0 + 1 - 1/abs(1)) / 1;
+              if (__pyx_t_3 > 0)
+              {
+                  #ifdef _OPENMP
+                  #pragma omp parallel private(__pyx_t_4, __pyx_t_5, __pyx_t_6)
+                  #endif /* _OPENMP */
+                  {
+                      #ifdef _OPENMP
+                      #pragma omp for nowait firstprivate(__pyx_v_i) lastprivate(__pyx_v_i) firstprivate(__pyx_v_j) lastprivate(__pyx_v_j) schedule(static)
+                      #endif /* _OPENMP */
+                      for (__pyx_t_2 = 0; __pyx_t_2 < __pyx_t_3; __pyx_t_2++){
+                          {
+                              __pyx_v_i = (Py_ssize_t)(0 + 1 * __pyx_t_2);
+
+                              /* "mylibrary/_kernels.pxi":80
+ *     elif num_threads == 0:
+ *         for i in prange(m, schedule="static"):
+ *             for j in range(n):             # <<<<<<<<<<<<<<
+ *                 out[i*os0 + j*os1] = _sqrt(x[i*xs0 + j*xs1])
+ *     else:
+*/
+
+                              __pyx_t_4 = __pyx_v_n;
+                              __pyx_t_5 = __pyx_t_4;
+
+                              for (__pyx_t_6 = 0; __pyx_t_6 < __pyx_t_5; __pyx_t_6+=1) {
+                                __pyx_v_j = __pyx_t_6;
+
+                                /* "mylibrary/_kernels.pxi":81
+ *         for i in prange(m, schedule="static"):
+ *             for j in range(n):
+ *                 out[i*os0 + j*os1] = _sqrt(x[i*xs0 + j*xs1])             # <<<<<<<<<<<<<<
+ *     else:
+ *         for i in prange(m, schedule="static", num_threads=num_threads):
+*/
+                                (__pyx_v_out[((__pyx_v_i * __pyx_v_os0) + (__pyx_v_j * __pyx_v_os1))]) = __pyx_fuse_0__pyx_f_9mylibrary_15_kernels_avx512__sqrt((__pyx_v_x[((__pyx_v_i * __pyx_v_xs0) + (__pyx_v_j * __pyx_v_xs1))]));
+                              }
+
+                          }
+                      }
+                  }
+              }
+          }
+          #if ((defined(__APPLE__) || defined(__OSX__)) && (defined(__GNUC__) && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))))
+              #undef likely
+              #undef unlikely
+              #define likely(x)   __builtin_expect(!!(x), 1)
+              #define unlikely(x) __builtin_expect(!!(x), 0)
+          #endif
+
+        }
+
+        /* "mylibrary/_kernels.pxi":79
+ *                 out[i*os0 + j*os1] = _sqrt(x[i*xs0 + j*xs1])
+ *     elif num_threads == 0:
+ *         for i in prange(m, schedule="static"):             # <<<<<<<<<<<<<<
+ *             for j in range(n):
+ *                 out[i*os0 + j*os1] = _sqrt(x[i*xs0 + j*xs1])
+*/
+        /*finally:*/ {
+          /*normal exit:*/{
+            __Pyx_FastGIL_Forget();
+            __Pyx_RestoreUnknownThread(_save);
+            goto __pyx_L9;
+          }
+          __pyx_L9:;
+        }
+    }
+
+    /* "mylibrary/_kernels.pxi":78
+ *             for j in range(n):
+ *                 out[i*os0 + j*os1] = _sqrt(x[i*xs0 + j*xs1])
+ *     elif num_threads == 0:             # <<<<<<<<<<<<<<
+ *         for i in prange(m, schedule="static"):
+ *             for j in range(n):
+*/
+    break;
+    default:
+
+    /* "mylibrary/_kernels.pxi":83
+ *                 out[i*os0 + j*os1] = _sqrt(x[i*xs0 + j*xs1])
+ *     else:
+ *         for i in prange(m, schedule="static", num_threads=num_threads):             # <<<<<<<<<<<<<<
+ *             for j in range(n):
+ *                 out[i*os0 + j*os1] = _sqrt(x[i*xs0 + j*xs1])
+*/
+    {
+        __Pyx_UnknownThreadState _save;
+        _save = __Pyx_SaveUnknownThread();
+        __Pyx_FastGIL_Remember();
+        /*try:*/ {
+          __pyx_t_3 = __pyx_v_m;
+
+          {
+              #if ((defined(__APPLE__) || defined(__OSX__)) && (defined(__GNUC__) && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))))
+                  #undef likely
+                  #undef unlikely
+                  #define likely(x)   (x)
+                  #define unlikely(x) (x)
+              #endif
+              __pyx_t_1 = (__pyx_t_3 - 0 + 1 - 1/abs(1)) / 1;
+              if (__pyx_t_1 > 0)
+              {
+                  #ifdef _OPENMP
+                  #pragma omp parallel num_threads(__pyx_v_num_threads != 0 ? __pyx_v_num_threads : omp_get_max_threads()) private(__pyx_t_4, __pyx_t_5, __pyx_t_6)
+                  #endif /* _OPENMP */
+                  {
+                      #ifdef _OPENMP
+                      #pragma omp for nowait firstprivate(__pyx_v_i) lastprivate(__pyx_v_i) firstprivate(__pyx_v_j) lastprivate(__pyx_v_j) schedule(static)
+                      #endif /* _OPENMP */
+                      for (__pyx_t_2 = 0; __pyx_t_2 < __pyx_t_1; __pyx_t_2++){
+                          {
+                              __pyx_v_i = (Py_ssize_t)(0 + 1 * __pyx_t_2);
+
+                              /* "mylibrary/_kernels.pxi":84
+ *     else:
+ *         for i in prange(m, schedule="static", num_threads=num_threads):
+ *             for j in range(n):             # <<<<<<<<<<<<<<
+ *                 out[i*os0 + j*os1] = _sqrt(x[i*xs0 + j*xs1])
+ * 
+*/
+
+                              __pyx_t_4 = __pyx_v_n;
+                              __pyx_t_5 = __pyx_t_4;
+
+                              for (__pyx_t_6 = 0; __pyx_t_6 < __pyx_t_5; __pyx_t_6+=1) {
+                                __pyx_v_j = __pyx_t_6;
+
+                                /* "mylibrary/_kernels.pxi":85
+ *         for i in prange(m, schedule="static", num_threads=num_threads):
+ *             for j in range(n):
+ *                 out[i*os0 + j*os1] = _sqrt(x[i*xs0 + j*xs1])             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+                                (__pyx_v_out[((__pyx_v_i * __pyx_v_os0) + (__pyx_v_j * __pyx_v_os1))]) = __pyx_fuse_0__pyx_f_9mylibrary_15_kernels_avx512__sqrt((__pyx_v_x[((__pyx_v_i * __pyx_v_xs0) + (__pyx_v_j * __pyx_v_xs1))]));
+                              }
+
+                          }
+                      }
+                  }
+              }
+          }
+          #if ((defined(__APPLE__) || defined(__OSX__)) && (defined(__GNUC__) && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))))
+              #undef likely
+              #undef unlikely
+              #define likely(x)   __builtin_expect(!!(x), 1)
+              #define unlikely(x) __builtin_expect(!!(x), 0)
+          #endif
+
+        }
+
+        /* "mylibrary/_kernels.pxi":83
+ *                 out[i*os0 + j*os1] = _sqrt(x[i*xs0 + j*xs1])
+ *     else:
+ *         for i in prange(m, schedule="static", num_threads=num_threads):             # <<<<<<<<<<<<<<
+ *             for j in range(n):
+ *                 out[i*os0 + j*os1] = _sqrt(x[i*xs0 + j*xs1])
+*/
+        /*finally:*/ {
+          /*normal exit:*/{
+            __Pyx_FastGIL_Forget();
+            __Pyx_RestoreUnknownThread(_save);
+            goto __pyx_L20;
+          }
+          __pyx_L20:;
+        }
+    }
+    break;
+  }
+
+  /* "mylibrary/_kernels.pxi":70
+ * # slices such as  x[::2]  and  x[:, 3:7]  as well as Fortran-ordered data.
+ * #
+ * cdef void _sqrt_strided( const real* x, Py_ssize_t xs0, Py_ssize_t xs1,             # <<<<<<<<<<<<<<
+ *                          real* out, Py_ssize_t os0, Py_ssize_t os1,
+ *                          Py_ssize_t m, Py_ssize_t n, int num_threads ) noexcept nogil:
+*/
+
+  /* function exit code */
+
+
+}
+
+static void __pyx_fuse_1__pyx_f_9mylibrary_15_kernels_avx512__sqrt_strided(double const *__pyx_v_x, Py_ssize_t __pyx_v_xs0, Py_ssize_t __pyx_v_xs1, double *__pyx_v_out, Py_ssize_t __pyx_v_os0, Py_ssize_t __pyx_v_os1, Py_ssize_t __pyx_v_m, Py_ssize_t __pyx_v_n, int __pyx_v_num_threads) {
+  Py_ssize_t __pyx_v_i;
+  Py_ssize_t __pyx_v_j;
+  Py_ssize_t __pyx_t_1;
+  Py_ssize_t __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  Py_ssize_t __pyx_t_4;
+  Py_ssize_t __pyx_t_5;
+  Py_ssize_t __pyx_t_6;
+
+  /* "mylibrary/_kernels.pxi":74
+ *                          Py_ssize_t m, Py_ssize_t n, int num_threads ) noexcept nogil:
+ *     cdef Py_ssize_t i, j
+ *     if num_threads == 1:             # <<<<<<<<<<<<<<
+ *         for i in range(m):
+ *             for j in range(n):
+*/
+  switch (__pyx_v_num_threads) {
+    case 1:
+
+    /* "mylibrary/_kernels.pxi":75
+ *     cdef Py_ssize_t i, j
+ *     if num_threads == 1:
+ *         for i in range(m):             # <<<<<<<<<<<<<<
+ *             for j in range(n):
+ *                 out[i*os0 + j*os1] = _sqrt(x[i*xs0 + j*xs1])
+*/
+
+    __pyx_t_1 = __pyx_v_m;
+    __pyx_t_2 = __pyx_t_1;
+
+    for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+      __pyx_v_i = __pyx_t_3;
+
+      /* "mylibrary/_kernels.pxi":76
+ *     if num_threads == 1:
+ *         for i in range(m):
+ *             for j in range(n):             # <<<<<<<<<<<<<<
+ *                 out[i*os0 + j*os1] = _sqrt(x[i*xs0 + j*xs1])
+ *     elif num_threads == 0:
+*/
+
+      __pyx_t_4 = __pyx_v_n;
+      __pyx_t_5 = __pyx_t_4;
+
+      for (__pyx_t_6 = 0; __pyx_t_6 < __pyx_t_5; __pyx_t_6+=1) {
+        __pyx_v_j = __pyx_t_6;
+
+        /* "mylibrary/_kernels.pxi":77
+ *         for i in range(m):
+ *             for j in range(n):
+ *                 out[i*os0 + j*os1] = _sqrt(x[i*xs0 + j*xs1])             # <<<<<<<<<<<<<<
+ *     elif num_threads == 0:
+ *         for i in prange(m, schedule="static"):
+*/
+        (__pyx_v_out[((__pyx_v_i * __pyx_v_os0) + (__pyx_v_j * __pyx_v_os1))]) = __pyx_fuse_1__pyx_f_9mylibrary_15_kernels_avx512__sqrt((__pyx_v_x[((__pyx_v_i * __pyx_v_xs0) + (__pyx_v_j * __pyx_v_xs1))]));
+      }
+
+    }
+
+
+    /* "mylibrary/_kernels.pxi":74
+ *                          Py_ssize_t m, Py_ssize_t n, int num_threads ) noexcept nogil:
+ *     cdef Py_ssize_t i, j
+ *     if num_threads == 1:             # <<<<<<<<<<<<<<
+ *         for i in range(m):
+ *             for j in range(n):
+*/
+    break;
+    case 0:
+
+    /* "mylibrary/_kernels.pxi":79
+ *                 out[i*os0 + j*os1] = _sqrt(x[i*xs0 + j*xs1])
+ *     elif num_threads == 0:
+ *         for i in prange(m, schedule="static"):             # <<<<<<<<<<<<<<
+ *             for j in range(n):
+ *                 out[i*os0 + j*os1] = _sqrt(x[i*xs0 + j*xs1])
+*/
+    {
+        __Pyx_UnknownThreadState _save;
+        _save = __Pyx_SaveUnknownThread();
+        __Pyx_FastGIL_Remember();
+        /*try:*/ {
+          __pyx_t_1 = __pyx_v_m;
+
+          {
+              #if ((defined(__APPLE__) || defined(__OSX__)) && (defined(__GNUC__) && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))))
+                  #undef likely
+                  #undef unlikely
+                  #define likely(x)   (x)
+                  #define unlikely(x) (x)
+              #endif
+              __pyx_t_3 = (__pyx_t_1 - 0 + 1 - 1/abs(1)) / 1;
+              if (__pyx_t_3 > 0)
+              {
+                  #ifdef _OPENMP
+                  #pragma omp parallel private(__pyx_t_4, __pyx_t_5, __pyx_t_6)
+                  #endif /* _OPENMP */
+                  {
+                      #ifdef _OPENMP
+                      #pragma omp for nowait firstprivate(__pyx_v_i) lastprivate(__pyx_v_i) firstprivate(__pyx_v_j) lastprivate(__pyx_v_j) schedule(static)
+                      #endif /* _OPENMP */
+                      for (__pyx_t_2 = 0; __pyx_t_2 < __pyx_t_3; __pyx_t_2++){
+                          {
+                              __pyx_v_i = (Py_ssize_t)(0 + 1 * __pyx_t_2);
+
+                              /* "mylibrary/_kernels.pxi":80
+ *     elif num_threads == 0:
+ *         for i in prange(m, schedule="static"):
+ *             for j in range(n):             # <<<<<<<<<<<<<<
+ *                 out[i*os0 + j*os1] = _sqrt(x[i*xs0 + j*xs1])
+ *     else:
+*/
+
+                              __pyx_t_4 = __pyx_v_n;
+                              __pyx_t_5 = __pyx_t_4;
+
+                              for (__pyx_t_6 = 0; __pyx_t_6 < __pyx_t_5; __pyx_t_6+=1) {
+                                __pyx_v_j = __pyx_t_6;
+
+                                /* "mylibrary/_kernels.pxi":81
+ *         for i in prange(m, schedule="static"):
+ *             for j in range(n):
+ *                 out[i*os0 + j*os1] = _sqrt(x[i*xs0 + j*xs1])             # <<<<<<<<<<<<<<
+ *     else:
+ *         for i in prange(m, schedule="static", num_threads=num_threads):
+*/
+                                (__pyx_v_out[((__pyx_v_i * __pyx_v_os0) + (__pyx_v_j * __pyx_v_os1))]) = __pyx_fuse_1__pyx_f_9mylibrary_15_kernels_avx512__sqrt((__pyx_v_x[((__pyx_v_i * __pyx_v_xs0) + (__pyx_v_j * __pyx_v_xs1))]));
+                              }
+
+                          }
+                      }
+                  }
+              }
+          }
+          #if ((defined(__APPLE__) || defined(__OSX__)) && (defined(__GNUC__) && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))))
+              #undef likely
+              #undef unlikely
+              #define likely(x)   __builtin_expect(!!(x), 1)
+              #define unlikely(x) __builtin_expect(!!(x), 0)
+          #endif
+
+        }
+
+        /* "mylibrary/_kernels.pxi":79
+ *                 out[i*os0 + j*os1] = _sqrt(x[i*xs0 + j*xs1])
+ *     elif num_threads == 0:
+ *         for i in prange(m, schedule="static"):             # <<<<<<<<<<<<<<
+ *             for j in range(n):
+ *                 out[i*os0 + j*os1] = _sqrt(x[i*xs0 + j*xs1])
+*/
+        /*finally:*/ {
+          /*normal exit:*/{
+            __Pyx_FastGIL_Forget();
+            __Pyx_RestoreUnknownThread(_save);
+            goto __pyx_L9;
+          }
+          __pyx_L9:;
+        }
+    }
+
+    /* "mylibrary/_kernels.pxi":78
+ *             for j in range(n):
+ *                 out[i*os0 + j*os1] = _sqrt(x[i*xs0 + j*xs1])
+ *     elif num_threads == 0:             # <<<<<<<<<<<<<<
+ *         for i in prange(m, schedule="static"):
+ *             for j in range(n):
+*/
+    break;
+    default:
+
+    /* "mylibrary/_kernels.pxi":83
+ *                 out[i*os0 + j*os1] = _sqrt(x[i*xs0 + j*xs1])
+ *     else:
+ *         for i in prange(m, schedule="static", num_threads=num_threads):             # <<<<<<<<<<<<<<
+ *             for j in range(n):
+ *                 out[i*os0 + j*os1] = _sqrt(x[i*xs0 + j*xs1])
+*/
+    {
+        __Pyx_UnknownThreadState _save;
+        _save = __Pyx_SaveUnknownThread();
+        __Pyx_FastGIL_Remember();
+        /*try:*/ {
+          __pyx_t_3 = __pyx_v_m;
+
+          {
+              #if ((defined(__APPLE__) || defined(__OSX__)) && (defined(__GNUC__) && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))))
+                  #undef likely
+                  #undef unlikely
+                  #define likely(x)   (x)
+                  #define unlikely(x) (x)
+              #endif
+              __pyx_t_1 = (__pyx_t_3 - 0 + 1 - 1/abs(1)) / 1;
+              if (__pyx_t_1 > 0)
+              {
+                  #ifdef _OPENMP
+                  #pragma omp parallel num_threads(__pyx_v_num_threads != 0 ? __pyx_v_num_threads : omp_get_max_threads()) private(__pyx_t_4, __pyx_t_5, __pyx_t_6)
+                  #endif /* _OPENMP */
+                  {
+                      #ifdef _OPENMP
+                      #pragma omp for nowait firstprivate(__pyx_v_i) lastprivate(__pyx_v_i) firstprivate(__pyx_v_j) lastprivate(__pyx_v_j) schedule(static)
+                      #endif /* _OPENMP */
+                      for (__pyx_t_2 = 0; __pyx_t_2 < __pyx_t_1; __pyx_t_2++){
+                          {
+                              __pyx_v_i = (Py_ssize_t)(0 + 1 * __pyx_t_2);
+
+                              /* "mylibrary/_kernels.pxi":84
+ *     else:
+ *         for i in prange(m, schedule="static", num_threads=num_threads):
+ *             for j in range(n):             # <<<<<<<<<<<<<<
+ *                 out[i*os0 + j*os1] = _sqrt(x[i*xs0 + j*xs1])
+ * 
+*/
+
+                              __pyx_t_4 = __pyx_v_n;
+                              __pyx_t_5 = __pyx_t_4;
+
+                              for (__pyx_t_6 = 0; __pyx_t_6 < __pyx_t_5; __pyx_t_6+=1) {
+                                __pyx_v_j = __pyx_t_6;
+
+                                /* "mylibrary/_kernels.pxi":85
+ *         for i in prange(m, schedule="static", num_threads=num_threads):
+ *             for j in range(n):
+ *                 out[i*os0 + j*os1] = _sqrt(x[i*xs0 + j*xs1])             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+                                (__pyx_v_out[((__pyx_v_i * __pyx_v_os0) + (__pyx_v_j * __pyx_v_os1))]) = __pyx_fuse_1__pyx_f_9mylibrary_15_kernels_avx512__sqrt((__pyx_v_x[((__pyx_v_i * __pyx_v_xs0) + (__pyx_v_j * __pyx_v_xs1))]));
+                              }
+
+                          }
+                      }
+                  }
+              }
+          }
+          #if ((defined(__APPLE__) || defined(__OSX__)) && (defined(__GNUC__) && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))))
+              #undef likely
+              #undef unlikely
+              #define likely(x)   __builtin_expect(!!(x), 1)
+              #define unlikely(x) __builtin_expect(!!(x), 0)
+          #endif
+
+        }
+
+        /* "mylibrary/_kernels.pxi":83
+ *                 out[i*os0 + j*os1] = _sqrt(x[i*xs0 + j*xs1])
+ *     else:
+ *         for i in prange(m, schedule="static", num_threads=num_threads):             # <<<<<<<<<<<<<<
+ *             for j in range(n):
+ *                 out[i*os0 + j*os1] = _sqrt(x[i*xs0 + j*xs1])
+*/
+        /*finally:*/ {
+          /*normal exit:*/{
+            __Pyx_FastGIL_Forget();
+            __Pyx_RestoreUnknownThread(_save);
+            goto __pyx_L20;
+          }
+          __pyx_L20:;
+        }
+    }
+    break;
+  }
+
+  /* "mylibrary/_kernels.pxi":70
+ * # slices such as  x[::2]  and  x[:, 3:7]  as well as Fortran-ordered data.
+ * #
+ * cdef void _sqrt_strided( const real* x, Py_ssize_t xs0, Py_ssize_t xs1,             # <<<<<<<<<<<<<<
+ *                          real* out, Py_ssize_t os0, Py_ssize_t os1,
+ *                          Py_ssize_t m, Py_ssize_t n, int num_threads ) noexcept nogil:
+*/
+
+  /* function exit code */
+
+
+}
+
+/* "mylibrary/_kernels.pxi":99
+ * # Sum of f(x) (times y, if y is not NULL) over a run of the flattened array.
+ * #
+ * cdef double _pairwise_sum( const real* x, Py_ssize_t xs0, Py_ssize_t xs1,             # <<<<<<<<<<<<<<
+ *                            const real* y, Py_ssize_t ys0, Py_ssize_t ys1,
+ *                            Py_ssize_t ncols, Py_ssize_t k0, Py_ssize_t count ) noexcept nogil:
+*/
+
+static double __pyx_fuse_0__pyx_f_9mylibrary_15_kernels_avx512__pairwise_sum(float const *__pyx_v_x, Py_ssize_t __pyx_v_xs0, Py_ssize_t __pyx_v_xs1, float const *__pyx_v_y, Py_ssize_t __pyx_v_ys0, Py_ssize_t __pyx_v_ys1, Py_ssize_t __pyx_v_ncols, Py_ssize_t __pyx_v_k0, Py_ssize_t __pyx_v_count) {
+  Py_ssize_t __pyx_v_half;
+  Py_ssize_t __pyx_v_i;
+  Py_ssize_t __pyx_v_j;
+  Py_ssize_t __pyx_v_t;
+  Py_ssize_t __pyx_v_seg;
+  float const *__pyx_v_px;
+  float const *__pyx_v_py;
+  double __pyx_v_s;
+  double __pyx_r;
+  int __pyx_t_1;
+  Py_ssize_t __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  Py_ssize_t __pyx_t_4;
+
+
+  /* "mylibrary/_kernels.pxi":103
+ *                            Py_ssize_t ncols, Py_ssize_t k0, Py_ssize_t count ) noexcept nogil:
+ *     cdef Py_ssize_t half
+ *     if count > _REDUCE_BLOCK:             # <<<<<<<<<<<<<<
+ *         half = count // 2
+ *         return ( _pairwise_sum(x, xs0, xs1, y, ys0, ys1, ncols, k0,        half)
+*/
+  __pyx_t_1 = (__pyx_v_count > __pyx_e_9mylibrary_8_kernels__REDUCE_BLOCK);
+
+  if (__pyx_t_1) {
+
+
+    /* "mylibrary/_kernels.pxi":104
+ *     cdef Py_ssize_t half
+ *     if count > _REDUCE_BLOCK:
+ *         half = count // 2             # <<<<<<<<<<<<<<
+ *         return ( _pairwise_sum(x, xs0, xs1, y, ys0, ys1, ncols, k0,        half)
+ *                + _pairwise_sum(x, xs0, xs1, y, ys0, ys1, ncols, k0 + half, count - half) )
+*/
+    __pyx_v_half = (__pyx_v_count / 2);
+
+    /* "mylibrary/_kernels.pxi":106
+ *         half = count // 2
+ *         return ( _pairwise_sum(x, xs0, xs1, y, ys0, ys1, ncols, k0,        half)
+ *                + _pairwise_sum(x, xs0, xs1, y, ys0, ys1, ncols, k0 + half, count - half) )             # <<<<<<<<<<<<<<
+ * 
+ *     # Base case: plain loop, one row segment at a time (a block may straddle rows).
+*/
+    {
+
+      __pyx_r = (__pyx_fuse_0__pyx_f_9mylibrary_15_kernels_avx512__pairwise_sum(__pyx_v_x, __pyx_v_xs0, __pyx_v_xs1, __pyx_v_y, __pyx_v_ys0, __pyx_v_ys1, __pyx_v_ncols, __pyx_v_k0, __pyx_v_half) + __pyx_fuse_0__pyx_f_9mylibrary_15_kernels_avx512__pairwise_sum(__pyx_v_x, __pyx_v_xs0, __pyx_v_xs1, __pyx_v_y, __pyx_v_ys0, __pyx_v_ys1, __pyx_v_ncols, (__pyx_v_k0 + __pyx_v_half), (__pyx_v_count - __pyx_v_half)));
+    }
+    goto __pyx_L0;
+
+    /* "mylibrary/_kernels.pxi":103
+ *                            Py_ssize_t ncols, Py_ssize_t k0, Py_ssize_t count ) noexcept nogil:
+ *     cdef Py_ssize_t half
+ *     if count > _REDUCE_BLOCK:             # <<<<<<<<<<<<<<
+ *         half = count // 2
+ *         return ( _pairwise_sum(x, xs0, xs1, y, ys0, ys1, ncols, k0,        half)
+*/
+  }
+
+  /* "mylibrary/_kernels.pxi":109
+ * 
+ *     # Base case: plain loop, one row segment at a time (a block may straddle rows).
+ *     cdef Py_ssize_t i = k0 // ncols, j = k0 - i*ncols             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t t, seg
+ *     cdef const real* px
+*/
+  __pyx_v_i = (__pyx_v_k0 / __pyx_v_ncols);
+  __pyx_v_j = (__pyx_v_k0 - (__pyx_v_i * __pyx_v_ncols));
+
+  /* "mylibrary/_kernels.pxi":113
+ *     cdef const real* px
+ *     cdef const real* py
+ *     cdef double s = 0.0             # <<<<<<<<<<<<<<
+ *     while count > 0:
+ *         seg = min(count, ncols - j)
+*/
+  __pyx_v_s = 0.0;
+
+  /* "mylibrary/_kernels.pxi":114
+ *     cdef const real* py
+ *     cdef double s = 0.0
+ *     while count > 0:             # <<<<<<<<<<<<<<
+ *         seg = min(count, ncols - j)
+ *         px  = x + i*xs0 + j*xs1
+*/
+  while (1) {
+    __pyx_t_1 = (__pyx_v_count > 0);
+
+
+    if (!__pyx_t_1) break;
+
+    /* "mylibrary/_kernels.pxi":115
+ *     cdef double s = 0.0
+ *     while count > 0:
+ *         seg = min(count, ncols - j)             # <<<<<<<<<<<<<<
+ *         px  = x + i*xs0 + j*xs1
+ *         if y == NULL:
+*/
+
+    __pyx_t_2 = (__pyx_v_ncols - __pyx_v_j);
+
+    __pyx_t_3 = __pyx_v_count;
+    __pyx_t_1 = (__pyx_t_2 < __pyx_t_3);
+
+    if (__pyx_t_1) {
+
+      __pyx_t_4 = __pyx_t_2;
+    } else {
+
+      __pyx_t_4 = __pyx_t_3;
+    }
+
+    __pyx_v_seg = __pyx_t_4;
+
+
+    /* "mylibrary/_kernels.pxi":116
+ *     while count > 0:
+ *         seg = min(count, ncols - j)
+ *         px  = x + i*xs0 + j*xs1             # <<<<<<<<<<<<<<
+ *         if y == NULL:
+ *             for t in range(seg):
+*/
+    __pyx_v_px = ((__pyx_v_x + (__pyx_v_i * __pyx_v_xs0)) + (__pyx_v_j * __pyx_v_xs1));
+
+    /* "mylibrary/_kernels.pxi":117
+ *         seg = min(count, ncols - j)
+ *         px  = x + i*xs0 + j*xs1
+ *         if y == NULL:             # <<<<<<<<<<<<<<
+ *             for t in range(seg):
+ *                 s += _sqrt(px[t*xs1])
+*/
+    __pyx_t_1 = (__pyx_v_y == NULL);
+
+    if (__pyx_t_1) {
+
+
+      /* "mylibrary/_kernels.pxi":118
+ *         px  = x + i*xs0 + j*xs1
+ *         if y == NULL:
+ *             for t in range(seg):             # <<<<<<<<<<<<<<
+ *                 s += _sqrt(px[t*xs1])
+ *         else:
+*/
+
+      __pyx_t_4 = __pyx_v_seg;
+      __pyx_t_2 = __pyx_t_4;
+
+      for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+        __pyx_v_t = __pyx_t_3;
+
+        /* "mylibrary/_kernels.pxi":119
+ *         if y == NULL:
+ *             for t in range(seg):
+ *                 s += _sqrt(px[t*xs1])             # <<<<<<<<<<<<<<
+ *         else:
+ *             py = y + i*ys0 + j*ys1
+*/
+        __pyx_v_s = (__pyx_v_s + __pyx_fuse_0__pyx_f_9mylibrary_15_kernels_avx512__sqrt((__pyx_v_px[(__pyx_v_t * __pyx_v_xs1)])));
+      }
+
+
+      /* "mylibrary/_kernels.pxi":117
+ *         seg = min(count, ncols - j)
+ *         px  = x + i*xs0 + j*xs1
+ *         if y == NULL:             # <<<<<<<<<<<<<<
+ *             for t in range(seg):
+ *                 s += _sqrt(px[t*xs1])
+*/
+      goto __pyx_L6;
+    }
+
+    /* "mylibrary/_kernels.pxi":121
+ *                 s += _sqrt(px[t*xs1])
+ *         else:
+ *             py = y + i*ys0 + j*ys1             # <<<<<<<<<<<<<<
+ *             for t in range(seg):
+ *                 s += <double>_sqrt(px[t*xs1]) * py[t*ys1]
+*/
+    /*else*/ {
+      __pyx_v_py = ((__pyx_v_y + (__pyx_v_i * __pyx_v_ys0)) + (__pyx_v_j * __pyx_v_ys1));
+
+      /* "mylibrary/_kernels.pxi":122
+ *         else:
+ *             py = y + i*ys0 + j*ys1
+ *             for t in range(seg):             # <<<<<<<<<<<<<<
+ *                 s += <double>_sqrt(px[t*xs1]) * py[t*ys1]
+ *         count -= seg
+*/
+
+      __pyx_t_4 = __pyx_v_seg;
+      __pyx_t_2 = __pyx_t_4;
+
+      for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+        __pyx_v_t = __pyx_t_3;
+
+        /* "mylibrary/_kernels.pxi":123
+ *             py = y + i*ys0 + j*ys1
+ *             for t in range(seg):
+ *                 s += <double>_sqrt(px[t*xs1]) * py[t*ys1]             # <<<<<<<<<<<<<<
+ *         count -= seg
+ *         i += 1
+*/
+        __pyx_v_s = (__pyx_v_s + (((double)__pyx_fuse_0__pyx_f_9mylibrary_15_kernels_avx512__sqrt((__pyx_v_px[(__pyx_v_t * __pyx_v_xs1)]))) * (__pyx_v_py[(__pyx_v_t * __pyx_v_ys1)])));
+      }
+
+    }
+    __pyx_L6:;
+
+    /* "mylibrary/_kernels.pxi":124
+ *             for t in range(seg):
+ *                 s += <double>_sqrt(px[t*xs1]) * py[t*ys1]
+ *         count -= seg             # <<<<<<<<<<<<<<
+ *         i += 1
+ *         j  = 0
+*/
+    __pyx_v_count = (__pyx_v_count - __pyx_v_seg);
+
+    /* "mylibrary/_kernels.pxi":125
+ *                 s += <double>_sqrt(px[t*xs1]) * py[t*ys1]
+ *         count -= seg
+ *         i += 1             # <<<<<<<<<<<<<<
+ *         j  = 0
+ *     return s
+*/
+    __pyx_v_i = (__pyx_v_i + 1);
+
+    /* "mylibrary/_kernels.pxi":126
+ *         count -= seg
+ *         i += 1
+ *         j  = 0             # <<<<<<<<<<<<<<
+ *     return s
+ * 
+*/
+    __pyx_v_j = 0;
+  }
+
+  /* "mylibrary/_kernels.pxi":127
+ *         i += 1
+ *         j  = 0
+ *     return s             # <<<<<<<<<<<<<<
+ * 
+ * # Maximum (or minimum) of f(x) over a run of the flattened array. NaNs propagate, like in np.max().
+*/
+  {
+
+    __pyx_r = __pyx_v_s;
+  }
+  goto __pyx_L0;
+
+  /* "mylibrary/_kernels.pxi":99
+ * # Sum of f(x) (times y, if y is not NULL) over a run of the flattened array.
+ * #
+ * cdef double _pairwise_sum( const real* x, Py_ssize_t xs0, Py_ssize_t xs1,             # <<<<<<<<<<<<<<
+ *                            const real* y, Py_ssize_t ys0, Py_ssize_t ys1,
+ *                            Py_ssize_t ncols, Py_ssize_t k0, Py_ssize_t count ) noexcept nogil:
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+
+
+
+
+
+
+
+
+
+  return __pyx_r;
+}
+
+static double __pyx_fuse_1__pyx_f_9mylibrary_15_kernels_avx512__pairwise_sum(double const *__pyx_v_x, Py_ssize_t __pyx_v_xs0, Py_ssize_t __pyx_v_xs1, double const *__pyx_v_y, Py_ssize_t __pyx_v_ys0, Py_ssize_t __pyx_v_ys1, Py_ssize_t __pyx_v_ncols, Py_ssize_t __pyx_v_k0, Py_ssize_t __pyx_v_count) {
+  Py_ssize_t __pyx_v_half;
+  Py_ssize_t __pyx_v_i;
+  Py_ssize_t __pyx_v_j;
+  Py_ssize_t __pyx_v_t;
+  Py_ssize_t __pyx_v_seg;
+  double const *__pyx_v_px;
+  double const *__pyx_v_py;
+  double __pyx_v_s;
+  double __pyx_r;
+  int __pyx_t_1;
+  Py_ssize_t __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  Py_ssize_t __pyx_t_4;
+
+
+  /* "mylibrary/_kernels.pxi":103
+ *                            Py_ssize_t ncols, Py_ssize_t k0, Py_ssize_t count ) noexcept nogil:
+ *     cdef Py_ssize_t half
+ *     if count > _REDUCE_BLOCK:             # <<<<<<<<<<<<<<
+ *         half = count // 2
+ *         return ( _pairwise_sum(x, xs0, xs1, y, ys0, ys1, ncols, k0,        half)
+*/
+  __pyx_t_1 = (__pyx_v_count > __pyx_e_9mylibrary_8_kernels__REDUCE_BLOCK);
+
+  if (__pyx_t_1) {
+
+
+    /* "mylibrary/_kernels.pxi":104
+ *     cdef Py_ssize_t half
+ *     if count > _REDUCE_BLOCK:
+ *         half = count // 2             # <<<<<<<<<<<<<<
+ *         return ( _pairwise_sum(x, xs0, xs1, y, ys0, ys1, ncols, k0,        half)
+ *                + _pairwise_sum(x, xs0, xs1, y, ys0, ys1, ncols, k0 + half, count - half) )
+*/
+    __pyx_v_half = (__pyx_v_count / 2);
+
+    /* "mylibrary/_kernels.pxi":106
+ *         half = count // 2
+ *         return ( _pairwise_sum(x, xs0, xs1, y, ys0, ys1, ncols, k0,        half)
+ *                + _pairwise_sum(x, xs0, xs1, y, ys0, ys1, ncols, k0 + half, count - half) )             # <<<<<<<<<<<<<<
+ * 
+ *     # Base case: plain loop, one row segment at a time (a block may straddle rows).
+*/
+    {
+
+      __pyx_r = (__pyx_fuse_1__pyx_f_9mylibrary_15_kernels_avx512__pairwise_sum(__pyx_v_x, __pyx_v_xs0, __pyx_v_xs1, __pyx_v_y, __pyx_v_ys0, __pyx_v_ys1, __pyx_v_ncols, __pyx_v_k0, __pyx_v_half) + __pyx_fuse_1__pyx_f_9mylibrary_15_kernels_avx512__pairwise_sum(__pyx_v_x, __pyx_v_xs0, __pyx_v_xs1, __pyx_v_y, __pyx_v_ys0, __pyx_v_ys1, __pyx_v_ncols, (__pyx_v_k0 + __pyx_v_half), (__pyx_v_count - __pyx_v_half)));
+    }
+    goto __pyx_L0;
+
+    /* "mylibrary/_kernels.pxi":103
+ *                            Py_ssize_t ncols, Py_ssize_t k0, Py_ssize_t count ) noexcept nogil:
+ *     cdef Py_ssize_t half
+ *     if count > _REDUCE_BLOCK:             # <<<<<<<<<<<<<<
+ *         half = count // 2
+ *         return ( _pairwise_sum(x, xs0, xs1, y, ys0, ys1, ncols, k0,        half)
+*/
+  }
+
+  /* "mylibrary/_kernels.pxi":109
+ * 
+ *     # Base case: plain loop, one row segment at a time (a block may straddle rows).
+ *     cdef Py_ssize_t i = k0 // ncols, j = k0 - i*ncols             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t t, seg
+ *     cdef const real* px
+*/
+  __pyx_v_i = (__pyx_v_k0 / __pyx_v_ncols);
+  __pyx_v_j = (__pyx_v_k0 - (__pyx_v_i * __pyx_v_ncols));
+
+  /* "mylibrary/_kernels.pxi":113
+ *     cdef const real* px
+ *     cdef const real* py
+ *     cdef double s = 0.0             # <<<<<<<<<<<<<<
+ *     while count > 0:
+ *         seg = min(count, ncols - j)
+*/
+  __pyx_v_s = 0.0;
+
+  /* "mylibrary/_kernels.pxi":114
+ *     cdef const real* py
+ *     cdef double s = 0.0
+ *     while count > 0:             # <<<<<<<<<<<<<<
+ *         seg = min(count, ncols - j)
+ *         px  = x + i*xs0 + j*xs1
+*/
+  while (1) {
+    __pyx_t_1 = (__pyx_v_count > 0);
+
+
+    if (!__pyx_t_1) break;
+
+    /* "mylibrary/_kernels.pxi":115
+ *     cdef double s = 0.0
+ *     while count > 0:
+ *         seg = min(count, ncols - j)             # <<<<<<<<<<<<<<
+ *         px  = x + i*xs0 + j*xs1
+ *         if y == NULL:
+*/
+
+    __pyx_t_2 = (__pyx_v_ncols - __pyx_v_j);
+
+    __pyx_t_3 = __pyx_v_count;
+    __pyx_t_1 = (__pyx_t_2 < __pyx_t_3);
+
+    if (__pyx_t_1) {
+
+      __pyx_t_4 = __pyx_t_2;
+    } else {
+
+      __pyx_t_4 = __pyx_t_3;
+    }
+
+    __pyx_v_seg = __pyx_t_4;
+
+
+    /* "mylibrary/_kernels.pxi":116
+ *     while count > 0:
+ *         seg = min(count, ncols - j)
+ *         px  = x + i*xs0 + j*xs1             # <<<<<<<<<<<<<<
+ *         if y == NULL:
+ *             for t in range(seg):
+*/
+    __pyx_v_px = ((__pyx_v_x + (__pyx_v_i * __pyx_v_xs0)) + (__pyx_v_j * __pyx_v_xs1));
+
+    /* "mylibrary/_kernels.pxi":117
+ *         seg = min(count, ncols - j)
+ *         px  = x + i*xs0 + j*xs1
+ *         if y == NULL:             # <<<<<<<<<<<<<<
+ *             for t in range(seg):
+ *                 s += _sqrt(px[t*xs1])
+*/
+    __pyx_t_1 = (__pyx_v_y == NULL);
+
+    if (__pyx_t_1) {
+
+
+      /* "mylibrary/_kernels.pxi":118
+ *         px  = x + i*xs0 + j*xs1
+ *         if y == NULL:
+ *             for t in range(seg):             # <<<<<<<<<<<<<<
+ *                 s += _sqrt(px[t*xs1])
+ *         else:
+*/
+
+      __pyx_t_4 = __pyx_v_seg;
+      __pyx_t_2 = __pyx_t_4;
+
+      for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+        __pyx_v_t = __pyx_t_3;
+
+        /* "mylibrary/_kernels.pxi":119
+ *         if y == NULL:
+ *             for t in range(seg):
+ *                 s += _sqrt(px[t*xs1])             # <<<<<<<<<<<<<<
+ *         else:
+ *             py = y + i*ys0 + j*ys1
+*/
+        __pyx_v_s = (__pyx_v_s + __pyx_fuse_1__pyx_f_9mylibrary_15_kernels_avx512__sqrt((__pyx_v_px[(__pyx_v_t * __pyx_v_xs1)])));
+      }
+
+
+      /* "mylibrary/_kernels.pxi":117
+ *         seg = min(count, ncols - j)
+ *         px  = x + i*xs0 + j*xs1
+ *         if y == NULL:             # <<<<<<<<<<<<<<
+ *             for t in range(seg):
+ *                 s += _sqrt(px[t*xs1])
+*/
+      goto __pyx_L6;
+    }
+
+    /* "mylibrary/_kernels.pxi":121
+ *                 s += _sqrt(px[t*xs1])
+ *         else:
+ *             py = y + i*ys0 + j*ys1             # <<<<<<<<<<<<<<
+ *             for t in range(seg):
+ *                 s += <double>_sqrt(px[t*xs1]) * py[t*ys1]
+*/
+    /*else*/ {
+      __pyx_v_py = ((__pyx_v_y + (__pyx_v_i * __pyx_v_ys0)) + (__pyx_v_j * __pyx_v_ys1));
+
+      /* "mylibrary/_kernels.pxi":122
+ *         else:
+ *             py = y + i*ys0 + j*ys1
+ *             for t in range(seg):             # <<<<<<<<<<<<<<
+ *                 s += <double>_sqrt(px[t*xs1]) * py[t*ys1]
+ *         count -= seg
+*/
+
+      __pyx_t_4 = __pyx_v_seg;
+      __pyx_t_2 = __pyx_t_4;
+
+      for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+        __pyx_v_t = __pyx_t_3;
+
+        /* "mylibrary/_kernels.pxi":123
+ *             py = y + i*ys0 + j*ys1
+ *             for t in range(seg):
+ *                 s += <double>_sqrt(px[t*xs1]) * py[t*ys1]             # <<<<<<<<<<<<<<
+ *         count -= seg
+ *         i += 1
+*/
+        __pyx_v_s = (__pyx_v_s + (((double)__pyx_fuse_1__pyx_f_9mylibrary_15_kernels_avx512__sqrt((__pyx_v_px[(__pyx_v_t * __pyx_v_xs1)]))) * (__pyx_v_py[(__pyx_v_t * __pyx_v_ys1)])));
+      }
+
+    }
+    __pyx_L6:;
+
+    /* "mylibrary/_kernels.pxi":124
+ *             for t in range(seg):
+ *                 s += <double>_sqrt(px[t*xs1]) * py[t*ys1]
+ *         count -= seg             # <<<<<<<<<<<<<<
+ *         i += 1
+ *         j  = 0
+*/
+    __pyx_v_count = (__pyx_v_count - __pyx_v_seg);
+
+    /* "mylibrary/_kernels.pxi":125
+ *                 s += <double>_sqrt(px[t*xs1]) * py[t*ys1]
+ *         count -= seg
+ *         i += 1             # <<<<<<<<<<<<<<
+ *         j  = 0
+ *     return s
+*/
+    __pyx_v_i = (__pyx_v_i + 1);
+
+    /* "mylibrary/_kernels.pxi":126
+ *         count -= seg
+ *         i += 1
+ *         j  = 0             # <<<<<<<<<<<<<<
+ *     return s
+ * 
+*/
+    __pyx_v_j = 0;
+  }
+
+  /* "mylibrary/_kernels.pxi":127
+ *         i += 1
+ *         j  = 0
+ *     return s             # <<<<<<<<<<<<<<
+ * 
+ * # Maximum (or minimum) of f(x) over a run of the flattened array. NaNs propagate, like in np.max().
+*/
+  {
+
+    __pyx_r = __pyx_v_s;
+  }
+  goto __pyx_L0;
+
+  /* "mylibrary/_kernels.pxi":99
+ * # Sum of f(x) (times y, if y is not NULL) over a run of the flattened array.
+ * #
+ * cdef double _pairwise_sum( const real* x, Py_ssize_t xs0, Py_ssize_t xs1,             # <<<<<<<<<<<<<<
+ *                            const real* y, Py_ssize_t ys0, Py_ssize_t ys1,
+ *                            Py_ssize_t ncols, Py_ssize_t k0, Py_ssize_t count ) noexcept nogil:
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+
+
+
+
+
+
+
+
+
+  return __pyx_r;
+}
+
+/* "mylibrary/_kernels.pxi":131
+ * # Maximum (or minimum) of f(x) over a run of the flattened array. NaNs propagate, like in np.max().
+ * #
+ * cdef double _extremum( bint is_max, const real* x, Py_ssize_t xs0, Py_ssize_t xs1,             # <<<<<<<<<<<<<<
+ *                        Py_ssize_t ncols, Py_ssize_t k0, Py_ssize_t count ) noexcept nogil:
+ *     cdef Py_ssize_t i = k0 // ncols, j = k0 - i*ncols
+*/
+
+static double __pyx_fuse_0__pyx_f_9mylibrary_15_kernels_avx512__extremum(int __pyx_v_is_max, float const *__pyx_v_x, Py_ssize_t __pyx_v_xs0, Py_ssize_t __pyx_v_xs1, Py_ssize_t __pyx_v_ncols, Py_ssize_t __pyx_v_k0, Py_ssize_t __pyx_v_count) {
+  Py_ssize_t __pyx_v_i;
+  Py_ssize_t __pyx_v_j;
+  Py_ssize_t __pyx_v_t;
+  Py_ssize_t __pyx_v_seg;
+  float const *__pyx_v_px;
+  double __pyx_v_v;
+  double __pyx_v_result;
+  double __pyx_r;
+  int __pyx_t_1;
+  Py_ssize_t __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  Py_ssize_t __pyx_t_4;
+  int __pyx_t_5;
+
+
+  /* "mylibrary/_kernels.pxi":133
+ * cdef double _extremum( bint is_max, const real* x, Py_ssize_t xs0, Py_ssize_t xs1,
+ *                        Py_ssize_t ncols, Py_ssize_t k0, Py_ssize_t count ) noexcept nogil:
+ *     cdef Py_ssize_t i = k0 // ncols, j = k0 - i*ncols             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t t, seg
+ *     cdef const real* px
+*/
+  __pyx_v_i = (__pyx_v_k0 / __pyx_v_ncols);
+  __pyx_v_j = (__pyx_v_k0 - (__pyx_v_i * __pyx_v_ncols));
+
+  /* "mylibrary/_kernels.pxi":137
+ *     cdef const real* px
+ *     cdef double v
+ *     cdef double result = _sqrt(x[i*xs0 + j*xs1])             # <<<<<<<<<<<<<<
+ *     while count > 0:
+ *         seg = min(count, ncols - j)
+*/
+  __pyx_v_result = __pyx_fuse_0__pyx_f_9mylibrary_15_kernels_avx512__sqrt((__pyx_v_x[((__pyx_v_i * __pyx_v_xs0) + (__pyx_v_j * __pyx_v_xs1))]));
+
+  /* "mylibrary/_kernels.pxi":138
+ *     cdef double v
+ *     cdef double result = _sqrt(x[i*xs0 + j*xs1])
+ *     while count > 0:             # <<<<<<<<<<<<<<
+ *         seg = min(count, ncols - j)
+ *         px  = x + i*xs0 + j*xs1
+*/
+  while (1) {
+    __pyx_t_1 = (__pyx_v_count > 0);
+
+
+    if (!__pyx_t_1) break;
+
+    /* "mylibrary/_kernels.pxi":139
+ *     cdef double result = _sqrt(x[i*xs0 + j*xs1])
+ *     while count > 0:
+ *         seg = min(count, ncols - j)             # <<<<<<<<<<<<<<
+ *         px  = x + i*xs0 + j*xs1
+ *         for t in range(seg):
+*/
+
+    __pyx_t_2 = (__pyx_v_ncols - __pyx_v_j);
+
+    __pyx_t_3 = __pyx_v_count;
+    __pyx_t_1 = (__pyx_t_2 < __pyx_t_3);
+
+    if (__pyx_t_1) {
+
+      __pyx_t_4 = __pyx_t_2;
+    } else {
+
+      __pyx_t_4 = __pyx_t_3;
+    }
+
+    __pyx_v_seg = __pyx_t_4;
+
+
+    /* "mylibrary/_kernels.pxi":140
+ *     while count > 0:
+ *         seg = min(count, ncols - j)
+ *         px  = x + i*xs0 + j*xs1             # <<<<<<<<<<<<<<
+ *         for t in range(seg):
+ *             v = _sqrt(px[t*xs1])
+*/
+    __pyx_v_px = ((__pyx_v_x + (__pyx_v_i * __pyx_v_xs0)) + (__pyx_v_j * __pyx_v_xs1));
+
+    /* "mylibrary/_kernels.pxi":141
+ *         seg = min(count, ncols - j)
+ *         px  = x + i*xs0 + j*xs1
+ *         for t in range(seg):             # <<<<<<<<<<<<<<
+ *             v = _sqrt(px[t*xs1])
+ *             if v != v:  # NaN
+*/
+
+    __pyx_t_4 = __pyx_v_seg;
+    __pyx_t_2 = __pyx_t_4;
+
+    for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+      __pyx_v_t = __pyx_t_3;
+
+      /* "mylibrary/_kernels.pxi":142
+ *         px  = x + i*xs0 + j*xs1
+ *         for t in range(seg):
+ *             v = _sqrt(px[t*xs1])             # <<<<<<<<<<<<<<
+ *             if v != v:  # NaN
+ *                 return v
+*/
+      __pyx_v_v = __pyx_fuse_0__pyx_f_9mylibrary_15_kernels_avx512__sqrt((__pyx_v_px[(__pyx_v_t * __pyx_v_xs1)]));
+
+      /* "mylibrary/_kernels.pxi":143
+ *         for t in range(seg):
+ *             v = _sqrt(px[t*xs1])
+ *             if v != v:  # NaN             # <<<<<<<<<<<<<<
+ *                 return v
+ *             if (is_max and v > result)  or  (not is_max and v < result):
+*/
+      __pyx_t_1 = (__pyx_v_v != __pyx_v_v);
+
+      if (__pyx_t_1) {
+
+
+        /* "mylibrary/_kernels.pxi":144
+ *             v = _sqrt(px[t*xs1])
+ *             if v != v:  # NaN
+ *                 return v             # <<<<<<<<<<<<<<
+ *             if (is_max and v > result)  or  (not is_max and v < result):
+ *                 result = v
+*/
+        {
+
+          __pyx_r = __pyx_v_v;
+        }
+        goto __pyx_L0;
+
+        /* "mylibrary/_kernels.pxi":143
+ *         for t in range(seg):
+ *             v = _sqrt(px[t*xs1])
+ *             if v != v:  # NaN             # <<<<<<<<<<<<<<
+ *                 return v
+ *             if (is_max and v > result)  or  (not is_max and v < result):
+*/
+      }
+
+      /* "mylibrary/_kernels.pxi":145
+ *             if v != v:  # NaN
+ *                 return v
+ *             if (is_max and v > result)  or  (not is_max and v < result):             # <<<<<<<<<<<<<<
+ *                 result = v
+ *         count -= seg
+*/
+      if (!__pyx_v_is_max) {
+        goto __pyx_L10_next_or;
+      } else {
+      }
+      __pyx_t_5 = (__pyx_v_v > __pyx_v_result);
+
+      if (!__pyx_t_5) {
+
+      } else {
+
+        __pyx_t_1 = __pyx_t_5;
+
+        goto __pyx_L9_bool_binop_done;
+      }
+      __pyx_L10_next_or:;
+      __pyx_t_5 = (!__pyx_v_is_max);
+
+      if (__pyx_t_5) {
+
+      } else {
+
+        __pyx_t_1 = __pyx_t_5;
+
+        goto __pyx_L9_bool_binop_done;
+      }
+      __pyx_t_5 = (__pyx_v_v < __pyx_v_result);
+
+
+      __pyx_t_1 = __pyx_t_5;
+
+      __pyx_L9_bool_binop_done:;
+      if (__pyx_t_1) {
+
+
+        /* "mylibrary/_kernels.pxi":146
+ *                 return v
+ *             if (is_max and v > result)  or  (not is_max and v < result):
+ *                 result = v             # <<<<<<<<<<<<<<
+ *         count -= seg
+ *         i += 1
+*/
+        __pyx_v_result = __pyx_v_v;
+
+        /* "mylibrary/_kernels.pxi":145
+ *             if v != v:  # NaN
+ *                 return v
+ *             if (is_max and v > result)  or  (not is_max and v < result):             # <<<<<<<<<<<<<<
+ *                 result = v
+ *         count -= seg
+*/
+      }
+    }
+
+
+    /* "mylibrary/_kernels.pxi":147
+ *             if (is_max and v > result)  or  (not is_max and v < result):
+ *                 result = v
+ *         count -= seg             # <<<<<<<<<<<<<<
+ *         i += 1
+ *         j  = 0
+*/
+    __pyx_v_count = (__pyx_v_count - __pyx_v_seg);
+
+    /* "mylibrary/_kernels.pxi":148
+ *                 result = v
+ *         count -= seg
+ *         i += 1             # <<<<<<<<<<<<<<
+ *         j  = 0
+ *     return result
+*/
+    __pyx_v_i = (__pyx_v_i + 1);
+
+    /* "mylibrary/_kernels.pxi":149
+ *         count -= seg
+ *         i += 1
+ *         j  = 0             # <<<<<<<<<<<<<<
+ *     return result
+ * 
+*/
+    __pyx_v_j = 0;
+  }
+
+  /* "mylibrary/_kernels.pxi":150
+ *         i += 1
+ *         j  = 0
+ *     return result             # <<<<<<<<<<<<<<
+ * 
+ * # Reduce all m*n elements. The input must be nonempty.
+*/
+  {
+
+    __pyx_r = __pyx_v_result;
+  }
+  goto __pyx_L0;
+
+  /* "mylibrary/_kernels.pxi":131
+ * # Maximum (or minimum) of f(x) over a run of the flattened array. NaNs propagate, like in np.max().
+ * #
+ * cdef double _extremum( bint is_max, const real* x, Py_ssize_t xs0, Py_ssize_t xs1,             # <<<<<<<<<<<<<<
+ *                        Py_ssize_t ncols, Py_ssize_t k0, Py_ssize_t count ) noexcept nogil:
+ *     cdef Py_ssize_t i = k0 // ncols, j = k0 - i*ncols
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+
+
+
+
+
+
+
+
+  return __pyx_r;
+}
+
+static double __pyx_fuse_1__pyx_f_9mylibrary_15_kernels_avx512__extremum(int __pyx_v_is_max, double const *__pyx_v_x, Py_ssize_t __pyx_v_xs0, Py_ssize_t __pyx_v_xs1, Py_ssize_t __pyx_v_ncols, Py_ssize_t __pyx_v_k0, Py_ssize_t __pyx_v_count) {
+  Py_ssize_t __pyx_v_i;
+  Py_ssize_t __pyx_v_j;
+  Py_ssize_t __pyx_v_t;
+  Py_ssize_t __pyx_v_seg;
+  double const *__pyx_v_px;
+  double __pyx_v_v;
+  double __pyx_v_result;
+  double __pyx_r;
+  int __pyx_t_1;
+  Py_ssize_t __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  Py_ssize_t __pyx_t_4;
+  int __pyx_t_5;
+
+
+  /* "mylibrary/_kernels.pxi":133
+ * cdef double _extremum( bint is_max, const real* x, Py_ssize_t xs0, Py_ssize_t xs1,
+ *                        Py_ssize_t ncols, Py_ssize_t k0, Py_ssize_t count ) noexcept nogil:
+ *     cdef Py_ssize_t i = k0 // ncols, j = k0 - i*ncols             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t t, seg
+ *     cdef const real* px
+*/
+  __pyx_v_i = (__pyx_v_k0 / __pyx_v_ncols);
+  __pyx_v_j = (__pyx_v_k0 - (__pyx_v_i * __pyx_v_ncols));
+
+  /* "mylibrary/_kernels.pxi":137
+ *     cdef const real* px
+ *     cdef double v
+ *     cdef double result = _sqrt(x[i*xs0 + j*xs1])             # <<<<<<<<<<<<<<
+ *     while count > 0:
+ *         seg = min(count, ncols - j)
+*/
+  __pyx_v_result = __pyx_fuse_1__pyx_f_9mylibrary_15_kernels_avx512__sqrt((__pyx_v_x[((__pyx_v_i * __pyx_v_xs0) + (__pyx_v_j * __pyx_v_xs1))]));
+
+  /* "mylibrary/_kernels.pxi":138
+ *     cdef double v
+ *     cdef double result = _sqrt(x[i*xs0 + j*xs1])
+ *     while count > 0:             # <<<<<<<<<<<<<<
+ *         seg = min(count, ncols - j)
+ *         px  = x + i*xs0 + j*xs1
+*/
+  while (1) {
+    __pyx_t_1 = (__pyx_v_count > 0);
+
+
+    if (!__pyx_t_1) break;
+
+    /* "mylibrary/_kernels.pxi":139
+ *     cdef double result = _sqrt(x[i*xs0 + j*xs1])
+ *     while count > 0:
+ *         seg = min(count, ncols - j)             # <<<<<<<<<<<<<<
+ *         px  = x + i*xs0 + j*xs1
+ *         for t in range(seg):
+*/
+
+    __pyx_t_2 = (__pyx_v_ncols - __pyx_v_j);
+
+    __pyx_t_3 = __pyx_v_count;
+    __pyx_t_1 = (__pyx_t_2 < __pyx_t_3);
+
+    if (__pyx_t_1) {
+
+      __pyx_t_4 = __pyx_t_2;
+    } else {
+
+      __pyx_t_4 = __pyx_t_3;
+    }
+
+    __pyx_v_seg = __pyx_t_4;
+
+
+    /* "mylibrary/_kernels.pxi":140
+ *     while count > 0:
+ *         seg = min(count, ncols - j)
+ *         px  = x + i*xs0 + j*xs1             # <<<<<<<<<<<<<<
+ *         for t in range(seg):
+ *             v = _sqrt(px[t*xs1])
+*/
+    __pyx_v_px = ((__pyx_v_x + (__pyx_v_i * __pyx_v_xs0)) + (__pyx_v_j * __pyx_v_xs1));
+
+    /* "mylibrary/_kernels.pxi":141
+ *         seg = min(count, ncols - j)
+ *         px  = x + i*xs0 + j*xs1
+ *         for t in range(seg):             # <<<<<<<<<<<<<<
+ *             v = _sqrt(px[t*xs1])
+ *             if v != v:  # NaN
+*/
+
+    __pyx_t_4 = __pyx_v_seg;
+    __pyx_t_2 = __pyx_t_4;
+
+    for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+      __pyx_v_t = __pyx_t_3;
+
+      /* "mylibrary/_kernels.pxi":142
+ *         px  = x + i*xs0 + j*xs1
+ *         for t in range(seg):
+ *             v = _sqrt(px[t*xs1])             # <<<<<<<<<<<<<<
+ *             if v != v:  # NaN
+ *                 return v
+*/
+      __pyx_v_v = __pyx_fuse_1__pyx_f_9mylibrary_15_kernels_avx512__sqrt((__pyx_v_px[(__pyx_v_t * __pyx_v_xs1)]));
+
+      /* "mylibrary/_kernels.pxi":143
+ *         for t in range(seg):
+ *             v = _sqrt(px[t*xs1])
+ *             if v != v:  # NaN             # <<<<<<<<<<<<<<
+ *                 return v
+ *             if (is_max and v > result)  or  (not is_max and v < result):
+*/
+      __pyx_t_1 = (__pyx_v_v != __pyx_v_v);
+
+      if (__pyx_t_1) {
+
+
+        /* "mylibrary/_kernels.pxi":144
+ *             v = _sqrt(px[t*xs1])
+ *             if v != v:  # NaN
+ *                 return v             # <<<<<<<<<<<<<<
+ *             if (is_max and v > result)  or  (not is_max and v < result):
+ *                 result = v
+*/
+        {
+
+          __pyx_r = __pyx_v_v;
+        }
+        goto __pyx_L0;
+
+        /* "mylibrary/_kernels.pxi":143
+ *         for t in range(seg):
+ *             v = _sqrt(px[t*xs1])
+ *             if v != v:  # NaN             # <<<<<<<<<<<<<<
+ *                 return v
+ *             if (is_max and v > result)  or  (not is_max and v < result):
+*/
+      }
+
+      /* "mylibrary/_kernels.pxi":145
+ *             if v != v:  # NaN
+ *                 return v
+ *             if (is_max and v > result)  or  (not is_max and v < result):             # <<<<<<<<<<<<<<
+ *                 result = v
+ *         count -= seg
+*/
+      if (!__pyx_v_is_max) {
+        goto __pyx_L10_next_or;
+      } else {
+      }
+      __pyx_t_5 = (__pyx_v_v > __pyx_v_result);
+
+      if (!__pyx_t_5) {
+
+      } else {
+
+        __pyx_t_1 = __pyx_t_5;
+
+        goto __pyx_L9_bool_binop_done;
+      }
+      __pyx_L10_next_or:;
+      __pyx_t_5 = (!__pyx_v_is_max);
+
+      if (__pyx_t_5) {
+
+      } else {
+
+        __pyx_t_1 = __pyx_t_5;
+
+        goto __pyx_L9_bool_binop_done;
+      }
+      __pyx_t_5 = (__pyx_v_v < __pyx_v_result);
+
+
+      __pyx_t_1 = __pyx_t_5;
+
+      __pyx_L9_bool_binop_done:;
+      if (__pyx_t_1) {
+
+
+        /* "mylibrary/_kernels.pxi":146
+ *                 return v
+ *             if (is_max and v > result)  or  (not is_max and v < result):
+ *                 result = v             # <<<<<<<<<<<<<<
+ *         count -= seg
+ *         i += 1
+*/
+        __pyx_v_result = __pyx_v_v;
+
+        /* "mylibrary/_kernels.pxi":145
+ *             if v != v:  # NaN
+ *                 return v
+ *             if (is_max and v > result)  or  (not is_max and v < result):             # <<<<<<<<<<<<<<
+ *                 result = v
+ *         count -= seg
+*/
+      }
+    }
+
+
+    /* "mylibrary/_kernels.pxi":147
+ *             if (is_max and v > result)  or  (not is_max and v < result):
+ *                 result = v
+ *         count -= seg             # <<<<<<<<<<<<<<
+ *         i += 1
+ *         j  = 0
+*/
+    __pyx_v_count = (__pyx_v_count - __pyx_v_seg);
+
+    /* "mylibrary/_kernels.pxi":148
+ *                 result = v
+ *         count -= seg
+ *         i += 1             # <<<<<<<<<<<<<<
+ *         j  = 0
+ *     return result
+*/
+    __pyx_v_i = (__pyx_v_i + 1);
+
+    /* "mylibrary/_kernels.pxi":149
+ *         count -= seg
+ *         i += 1
+ *         j  = 0             # <<<<<<<<<<<<<<
+ *     return result
+ * 
+*/
+    __pyx_v_j = 0;
+  }
+
+  /* "mylibrary/_kernels.pxi":150
+ *         i += 1
+ *         j  = 0
+ *     return result             # <<<<<<<<<<<<<<
+ * 
+ * # Reduce all m*n elements. The input must be nonempty.
+*/
+  {
+
+    __pyx_r = __pyx_v_result;
+  }
+  goto __pyx_L0;
+
+  /* "mylibrary/_kernels.pxi":131
+ * # Maximum (or minimum) of f(x) over a run of the flattened array. NaNs propagate, like in np.max().
+ * #
+ * cdef double _extremum( bint is_max, const real* x, Py_ssize_t xs0, Py_ssize_t xs1,             # <<<<<<<<<<<<<<
+ *                        Py_ssize_t ncols, Py_ssize_t k0, Py_ssize_t count ) noexcept nogil:
+ *     cdef Py_ssize_t i = k0 // ncols, j = k0 - i*ncols
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+
+
+
+
+
+
+
+
+  return __pyx_r;
+}
+
+/* "mylibrary/_kernels.pxi":157
+ * # is too), which are reduced in parallel, and then combined.
+ * #
+ * cdef double _reduce( _Reduction op, const real* x, Py_ssize_t xs0, Py_ssize_t xs1,             # <<<<<<<<<<<<<<
+ *                      const real* y, Py_ssize_t ys0, Py_ssize_t ys1,
+ *                      Py_ssize_t m, Py_ssize_t n, bint chunked, int num_threads ) noexcept nogil:
+*/
+
+static double __pyx_fuse_0__pyx_f_9mylibrary_15_kernels_avx512__reduce(enum __pyx_t_9mylibrary_8_kernels__Reduction __pyx_v_op, float const *__pyx_v_x, Py_ssize_t __pyx_v_xs0, Py_ssize_t __pyx_v_xs1, float const *__pyx_v_y, Py_ssize_t __pyx_v_ys0, Py_ssize_t __pyx_v_ys1, Py_ssize_t __pyx_v_m, Py_ssize_t __pyx_v_n, int __pyx_v_chunked, int __pyx_v_num_threads) {
+  Py_ssize_t __pyx_v_total;
+  Py_ssize_t __pyx_v_nchunks;
+  Py_ssize_t __pyx_v_base;
+  Py_ssize_t __pyx_v_extra;
+  Py_ssize_t __pyx_v_c;
+  Py_ssize_t __pyx_v_k0;
+  Py_ssize_t __pyx_v_count;
+  double __pyx_v_partials[__pyx_e_9mylibrary_8_kernels__REDUCE_MAXCHUNKS];
+  double __pyx_r;
+  Py_ssize_t __pyx_t_1;
+  Py_ssize_t __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  Py_ssize_t __pyx_t_4;
+  int __pyx_t_5;
+  Py_ssize_t __pyx_t_6;
+  Py_ssize_t __pyx_t_7;
+
+  /* "mylibrary/_kernels.pxi":160
+ *                      const real* y, Py_ssize_t ys0, Py_ssize_t ys1,
+ *                      Py_ssize_t m, Py_ssize_t n, bint chunked, int num_threads ) noexcept nogil:
+ *     cdef Py_ssize_t total = m * n             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t nchunks = min(<Py_ssize_t>_REDUCE_MAXCHUNKS, total) if chunked else 1
+ *     cdef Py_ssize_t base = total // nchunks, extra = total % nchunks
+*/
+  __pyx_v_total = (__pyx_v_m * __pyx_v_n);
+
+  /* "mylibrary/_kernels.pxi":161
+ *                      Py_ssize_t m, Py_ssize_t n, bint chunked, int num_threads ) noexcept nogil:
+ *     cdef Py_ssize_t total = m * n
+ *     cdef Py_ssize_t nchunks = min(<Py_ssize_t>_REDUCE_MAXCHUNKS, total) if chunked else 1             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t base = total // nchunks, extra = total % nchunks
+ *     cdef Py_ssize_t c, k0, count
+*/
+  if (__pyx_v_chunked) {
+
+    __pyx_t_2 = __pyx_v_total;
+
+    __pyx_t_3 = ((Py_ssize_t)__pyx_e_9mylibrary_8_kernels__REDUCE_MAXCHUNKS);
+    __pyx_t_5 = (__pyx_t_2 < __pyx_t_3);
+
+    if (__pyx_t_5) {
+
+      __pyx_t_4 = __pyx_t_2;
+    } else {
+
+      __pyx_t_4 = __pyx_t_3;
+    }
+
+
+    __pyx_t_1 = __pyx_t_4;
+
+  } else {
+
+    __pyx_t_1 = 1;
+  }
+  __pyx_v_nchunks = __pyx_t_1;
+
+  /* "mylibrary/_kernels.pxi":162
+ *     cdef Py_ssize_t total = m * n
+ *     cdef Py_ssize_t nchunks = min(<Py_ssize_t>_REDUCE_MAXCHUNKS, total) if chunked else 1
+ *     cdef Py_ssize_t base = total // nchunks, extra = total % nchunks             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t c, k0, count
+ *     cdef double partials[_REDUCE_MAXCHUNKS]
+*/
+  __pyx_v_base = (__pyx_v_total / __pyx_v_nchunks);
+  __pyx_v_extra = (__pyx_v_total % __pyx_v_nchunks);
+
+  /* "mylibrary/_kernels.pxi":166
+ *     cdef double partials[_REDUCE_MAXCHUNKS]
+ * 
+ *     if num_threads == 1:             # <<<<<<<<<<<<<<
+ *         for c in range(nchunks):
+ *             k0    = c*base + min(c, extra)
+*/
+  switch (__pyx_v_num_threads) {
+    case 1:
+
+    /* "mylibrary/_kernels.pxi":167
+ * 
+ *     if num_threads == 1:
+ *         for c in range(nchunks):             # <<<<<<<<<<<<<<
+ *             k0    = c*base + min(c, extra)
+ *             count = base + (1 if c < extra else 0)
+*/
+
+    __pyx_t_1 = __pyx_v_nchunks;
+    __pyx_t_4 = __pyx_t_1;
+
+    for (__pyx_t_2 = 0; __pyx_t_2 < __pyx_t_4; __pyx_t_2+=1) {
+      __pyx_v_c = __pyx_t_2;
+
+      /* "mylibrary/_kernels.pxi":168
+ *     if num_threads == 1:
+ *         for c in range(nchunks):
+ *             k0    = c*base + min(c, extra)             # <<<<<<<<<<<<<<
+ *             count = base + (1 if c < extra else 0)
+ *             partials[c] = _reduce_run(op, x, xs0, xs1, y, ys0, ys1, n, k0, count)
+*/
+
+      __pyx_t_3 = __pyx_v_extra;
+
+      __pyx_t_6 = __pyx_v_c;
+      __pyx_t_5 = (__pyx_t_3 < __pyx_t_6);
+
+      if (__pyx_t_5) {
+
+        __pyx_t_7 = __pyx_t_3;
+      } else {
+
+        __pyx_t_7 = __pyx_t_6;
+      }
+
+      __pyx_v_k0 = ((__pyx_v_c * __pyx_v_base) + __pyx_t_7);
+
+
+      /* "mylibrary/_kernels.pxi":169
+ *         for c in range(nchunks):
+ *             k0    = c*base + min(c, extra)
+ *             count = base + (1 if c < extra else 0)             # <<<<<<<<<<<<<<
+ *             partials[c] = _reduce_run(op, x, xs0, xs1, y, ys0, ys1, n, k0, count)
+ *     elif num_threads == 0:
+*/
+      __pyx_t_5 = (__pyx_v_c < __pyx_v_extra);
+
+      if (__pyx_t_5) {
+
+        __pyx_t_7 = 1;
+      } else {
+
+        __pyx_t_7 = 0;
+      }
+
+      __pyx_v_count = (__pyx_v_base + __pyx_t_7);
+
+
+      /* "mylibrary/_kernels.pxi":170
+ *             k0    = c*base + min(c, extra)
+ *             count = base + (1 if c < extra else 0)
+ *             partials[c] = _reduce_run(op, x, xs0, xs1, y, ys0, ys1, n, k0, count)             # <<<<<<<<<<<<<<
+ *     elif num_threads == 0:
+ *         for c in prange(nchunks, schedule="static"):
+*/
+      (__pyx_v_partials[__pyx_v_c]) = __pyx_fuse_0__pyx_f_9mylibrary_15_kernels_avx512__reduce_run(__pyx_v_op, __pyx_v_x, __pyx_v_xs0, __pyx_v_xs1, __pyx_v_y, __pyx_v_ys0, __pyx_v_ys1, __pyx_v_n, __pyx_v_k0, __pyx_v_count);
+    }
+
+
+    /* "mylibrary/_kernels.pxi":166
+ *     cdef double partials[_REDUCE_MAXCHUNKS]
+ * 
+ *     if num_threads == 1:             # <<<<<<<<<<<<<<
+ *         for c in range(nchunks):
+ *             k0    = c*base + min(c, extra)
+*/
+    break;
+    case 0:
+
+    /* "mylibrary/_kernels.pxi":172
+ *             partials[c] = _reduce_run(op, x, xs0, xs1, y, ys0, ys1, n, k0, count)
+ *     elif num_threads == 0:
+ *         for c in prange(nchunks, schedule="static"):             # <<<<<<<<<<<<<<
+ *             k0    = c*base + min(c, extra)
+ *             count = base + (1 if c < extra else 0)
+*/
+    {
+        __Pyx_UnknownThreadState _save;
+        _save = __Pyx_SaveUnknownThread();
+        __Pyx_FastGIL_Remember();
+        /*try:*/ {
+          __pyx_t_1 = __pyx_v_nchunks;
+
+          {
+              #if ((defined(__APPLE__) || defined(__OSX__)) && (defined(__GNUC__) && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))))
+                  #undef likely
+                  #undef unlikely
+                  #define likely(x)   (x)
+                  #define unlikely(x) (x)
+              #endif
+              __pyx_t_2 = (__pyx_t_1 - 0 + 1 - 1/abs(1)) / 1;
+              if (__pyx_t_2 > 0)
+              {
+                  #ifdef _OPENMP
+                  #pragma omp parallel private(__pyx_t_3, __pyx_t_5, __pyx_t_6, __pyx_t_7)
+                  #endif /* _OPENMP */
+                  {
+                      #ifdef _OPENMP
+                      #pragma omp for nowait firstprivate(__pyx_v_c) lastprivate(__pyx_v_c) firstprivate(__pyx_v_count) lastprivate(__pyx_v_count) firstprivate(__pyx_v_k0) lastprivate(__pyx_v_k0) schedule(static)
+                      #endif /* _OPENMP */
+                      for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_2; __pyx_t_4++){
+                          {
+                              __pyx_v_c = (Py_ssize_t)(0 + 1 * __pyx_t_4);
+
+                              /* "mylibrary/_kernels.pxi":173
+ *     elif num_threads == 0:
+ *         for c in prange(nchunks, schedule="static"):
+ *             k0    = c*base + min(c, extra)             # <<<<<<<<<<<<<<
+ *             count = base + (1 if c < extra else 0)
+ *             partials[c] = _reduce_run(op, x, xs0, xs1, y, ys0, ys1, n, k0, count)
+*/
+
+                              __pyx_t_7 = __pyx_v_extra;
+
+                              __pyx_t_3 = __pyx_v_c;
+                              __pyx_t_5 = (__pyx_t_7 < __pyx_t_3);
+
+                              if (__pyx_t_5) {
+
+                                __pyx_t_6 = __pyx_t_7;
+                              } else {
+
+                                __pyx_t_6 = __pyx_t_3;
+                              }
+
+                              __pyx_v_k0 = ((__pyx_v_c * __pyx_v_base) + __pyx_t_6);
+
+
+                              /* "mylibrary/_kernels.pxi":174
+ *         for c in prange(nchunks, schedule="static"):
+ *             k0    = c*base + min(c, extra)
+ *             count = base + (1 if c < extra else 0)             # <<<<<<<<<<<<<<
+ *             partials[c] = _reduce_run(op, x, xs0, xs1, y, ys0, ys1, n, k0, count)
+ *     else:
+*/
+                              __pyx_t_5 = (__pyx_v_c < __pyx_v_extra);
+
+                              if (__pyx_t_5) {
+
+                                __pyx_t_6 = 1;
+                              } else {
+
+                                __pyx_t_6 = 0;
+                              }
+
+                              __pyx_v_count = (__pyx_v_base + __pyx_t_6);
+
+
+                              /* "mylibrary/_kernels.pxi":175
+ *             k0    = c*base + min(c, extra)
+ *             count = base + (1 if c < extra else 0)
+ *             partials[c] = _reduce_run(op, x, xs0, xs1, y, ys0, ys1, n, k0, count)             # <<<<<<<<<<<<<<
+ *     else:
+ *         for c in prange(nchunks, schedule="static", num_threads=num_threads):
+*/
+                              (__pyx_v_partials[__pyx_v_c]) = __pyx_fuse_0__pyx_f_9mylibrary_15_kernels_avx512__reduce_run(__pyx_v_op, __pyx_v_x, __pyx_v_xs0, __pyx_v_xs1, __pyx_v_y, __pyx_v_ys0, __pyx_v_ys1, __pyx_v_n, __pyx_v_k0, __pyx_v_count);
+                          }
+                      }
+                  }
+              }
+          }
+          #if ((defined(__APPLE__) || defined(__OSX__)) && (defined(__GNUC__) && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))))
+              #undef likely
+              #undef unlikely
+              #define likely(x)   __builtin_expect(!!(x), 1)
+              #define unlikely(x) __builtin_expect(!!(x), 0)
+          #endif
+
+        }
+
+        /* "mylibrary/_kernels.pxi":172
+ *             partials[c] = _reduce_run(op, x, xs0, xs1, y, ys0, ys1, n, k0, count)
+ *     elif num_threads == 0:
+ *         for c in prange(nchunks, schedule="static"):             # <<<<<<<<<<<<<<
+ *             k0    = c*base + min(c, extra)
+ *             count = base + (1 if c < extra else 0)
+*/
+        /*finally:*/ {
+          /*normal exit:*/{
+            __Pyx_FastGIL_Forget();
+            __Pyx_RestoreUnknownThread(_save);
+            goto __pyx_L7;
+          }
+          __pyx_L7:;
+        }
+    }
+
+    /* "mylibrary/_kernels.pxi":171
+ *             count = base + (1 if c < extra else 0)
+ *             partials[c] = _reduce_run(op, x, xs0, xs1, y, ys0, ys1, n, k0, count)
+ *     elif num_threads == 0:             # <<<<<<<<<<<<<<
+ *         for c in prange(nchunks, schedule="static"):
+ *             k0    = c*base + min(c, extra)
+*/
+    break;
+    default:
+
+    /* "mylibrary/_kernels.pxi":177
+ *             partials[c] = _reduce_run(op, x, xs0, xs1, y, ys0, ys1, n, k0, count)
+ *     else:
+ *         for c in prange(nchunks, schedule="static", num_threads=num_threads):             # <<<<<<<<<<<<<<
+ *             k0    = c*base + min(c, extra)
+ *             count = base + (1 if c < extra else 0)
+*/
+    {
+        __Pyx_UnknownThreadState _save;
+        _save = __Pyx_SaveUnknownThread();
+        __Pyx_FastGIL_Remember();
+        /*try:*/ {
+          __pyx_t_2 = __pyx_v_nchunks;
+
+          {
+              #if ((defined(__APPLE__) || defined(__OSX__)) && (defined(__GNUC__) && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))))
+                  #undef likely
+                  #undef unlikely
+                  #define likely(x)   (x)
+                  #define unlikely(x) (x)
+              #endif
+              __pyx_t_1 = (__pyx_t_2 - 0 + 1 - 1/abs(1)) / 1;
+              if (__pyx_t_1 > 0)
+              {
+                  #ifdef _OPENMP
+                  #pragma omp parallel num_threads(__pyx_v_num_threads != 0 ? __pyx_v_num_threads : omp_get_max_threads()) private(__pyx_t_3, __pyx_t_5, __pyx_t_6, __pyx_t_7)
+                  #endif /* _OPENMP */
+                  {
+                      #ifdef _OPENMP
+                      #pragma omp for nowait firstprivate(__pyx_v_c) lastprivate(__pyx_v_c) firstprivate(__pyx_v_count) lastprivate(__pyx_v_count) firstprivate(__pyx_v_k0) lastprivate(__pyx_v_k0) schedule(static)
+                      #endif /* _OPENMP */
+                      for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_1; __pyx_t_4++){
+                          {
+                              __pyx_v_c = (Py_ssize_t)(0 + 1 * __pyx_t_4);
+
+                              /* "mylibrary/_kernels.pxi":178
+ *     else:
+ *         for c in prange(nchunks, schedule="static", num_threads=num_threads):
+ *             k0    = c*base + min(c, extra)             # <<<<<<<<<<<<<<
+ *             count = base + (1 if c < extra else 0)
+ *             partials[c] = _reduce_run(op, x, xs0, xs1, y, ys0, ys1, n, k0, count)
+*/
+
+                              __pyx_t_6 = __pyx_v_extra;
+
+                              __pyx_t_7 = __pyx_v_c;
+                              __pyx_t_5 = (__pyx_t_6 < __pyx_t_7);
+
+                              if (__pyx_t_5) {
+
+                                __pyx_t_3 = __pyx_t_6;
+                              } else {
+
+                                __pyx_t_3 = __pyx_t_7;
+                              }
+
+                              __pyx_v_k0 = ((__pyx_v_c * __pyx_v_base) + __pyx_t_3);
+
+
+                              /* "mylibrary/_kernels.pxi":179
+ *         for c in prange(nchunks, schedule="static", num_threads=num_threads):
+ *             k0    = c*base + min(c, extra)
+ *             count = base + (1 if c < extra else 0)             # <<<<<<<<<<<<<<
+ *             partials[c] = _reduce_run(op, x, xs0, xs1, y, ys0, ys1, n, k0, count)
+ * 
+*/
+                              __pyx_t_5 = (__pyx_v_c < __pyx_v_extra);
+
+                              if (__pyx_t_5) {
+
+                                __pyx_t_3 = 1;
+                              } else {
+
+                                __pyx_t_3 = 0;
+                              }
+
+                              __pyx_v_count = (__pyx_v_base + __pyx_t_3);
+
+
+                              /* "mylibrary/_kernels.pxi":180
+ *             k0    = c*base + min(c, extra)
+ *             count = base + (1 if c < extra else 0)
+ *             partials[c] = _reduce_run(op, x, xs0, xs1, y, ys0, ys1, n, k0, count)             # <<<<<<<<<<<<<<
+ * 
+ *     return _combine(op, partials, nchunks)
+*/
+                              (__pyx_v_partials[__pyx_v_c]) = __pyx_fuse_0__pyx_f_9mylibrary_15_kernels_avx512__reduce_run(__pyx_v_op, __pyx_v_x, __pyx_v_xs0, __pyx_v_xs1, __pyx_v_y, __pyx_v_ys0, __pyx_v_ys1, __pyx_v_n, __pyx_v_k0, __pyx_v_count);
+                          }
+                      }
+                  }
+              }
+          }
+          #if ((defined(__APPLE__) || defined(__OSX__)) && (defined(__GNUC__) && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))))
+              #undef likely
+              #undef unlikely
+              #define likely(x)   __builtin_expect(!!(x), 1)
+              #define unlikely(x) __builtin_expect(!!(x), 0)
+          #endif
+
+        }
+
+        /* "mylibrary/_kernels.pxi":177
+ *             partials[c] = _reduce_run(op, x, xs0, xs1, y, ys0, ys1, n, k0, count)
+ *     else:
+ *         for c in prange(nchunks, schedule="static", num_threads=num_threads):             # <<<<<<<<<<<<<<
+ *             k0    = c*base + min(c, extra)
+ *             count = base + (1 if c < extra else 0)
+*/
+        /*finally:*/ {
+          /*normal exit:*/{
+            __Pyx_FastGIL_Forget();
+            __Pyx_RestoreUnknownThread(_save);
+            goto __pyx_L16;
+          }
+          __pyx_L16:;
+        }
+    }
+    break;
+  }
+
+  /* "mylibrary/_kernels.pxi":182
+ *             partials[c] = _reduce_run(op, x, xs0, xs1, y, ys0, ys1, n, k0, count)
+ * 
+ *     return _combine(op, partials, nchunks)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline double _reduce_run( _Reduction op, const real* x, Py_ssize_t xs0, Py_ssize_t xs1,
+*/
+  {
+
+    __pyx_r = __pyx_f_9mylibrary_15_kernels_avx512__combine(__pyx_v_op, __pyx_v_partials, __pyx_v_nchunks);
+  }
+  goto __pyx_L0;
+
+  /* "mylibrary/_kernels.pxi":157
+ * # is too), which are reduced in parallel, and then combined.
+ * #
+ * cdef double _reduce( _Reduction op, const real* x, Py_ssize_t xs0, Py_ssize_t xs1,             # <<<<<<<<<<<<<<
+ *                      const real* y, Py_ssize_t ys0, Py_ssize_t ys1,
+ *                      Py_ssize_t m, Py_ssize_t n, bint chunked, int num_threads ) noexcept nogil:
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+
+
+
+
+
+
+
+
+  return __pyx_r;
+}
+
+static double __pyx_fuse_1__pyx_f_9mylibrary_15_kernels_avx512__reduce(enum __pyx_t_9mylibrary_8_kernels__Reduction __pyx_v_op, double const *__pyx_v_x, Py_ssize_t __pyx_v_xs0, Py_ssize_t __pyx_v_xs1, double const *__pyx_v_y, Py_ssize_t __pyx_v_ys0, Py_ssize_t __pyx_v_ys1, Py_ssize_t __pyx_v_m, Py_ssize_t __pyx_v_n, int __pyx_v_chunked, int __pyx_v_num_threads) {
+  Py_ssize_t __pyx_v_total;
+  Py_ssize_t __pyx_v_nchunks;
+  Py_ssize_t __pyx_v_base;
+  Py_ssize_t __pyx_v_extra;
+  Py_ssize_t __pyx_v_c;
+  Py_ssize_t __pyx_v_k0;
+  Py_ssize_t __pyx_v_count;
+  double __pyx_v_partials[__pyx_e_9mylibrary_8_kernels__REDUCE_MAXCHUNKS];
+  double __pyx_r;
+  Py_ssize_t __pyx_t_1;
+  Py_ssize_t __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  Py_ssize_t __pyx_t_4;
+  int __pyx_t_5;
+  Py_ssize_t __pyx_t_6;
+  Py_ssize_t __pyx_t_7;
+
+  /* "mylibrary/_kernels.pxi":160
+ *                      const real* y, Py_ssize_t ys0, Py_ssize_t ys1,
+ *                      Py_ssize_t m, Py_ssize_t n, bint chunked, int num_threads ) noexcept nogil:
+ *     cdef Py_ssize_t total = m * n             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t nchunks = min(<Py_ssize_t>_REDUCE_MAXCHUNKS, total) if chunked else 1
+ *     cdef Py_ssize_t base = total // nchunks, extra = total % nchunks
+*/
+  __pyx_v_total = (__pyx_v_m * __pyx_v_n);
+
+  /* "mylibrary/_kernels.pxi":161
+ *                      Py_ssize_t m, Py_ssize_t n, bint chunked, int num_threads ) noexcept nogil:
+ *     cdef Py_ssize_t total = m * n
+ *     cdef Py_ssize_t nchunks = min(<Py_ssize_t>_REDUCE_MAXCHUNKS, total) if chunked else 1             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t base = total // nchunks, extra = total % nchunks
+ *     cdef Py_ssize_t c, k0, count
+*/
+  if (__pyx_v_chunked) {
+
+    __pyx_t_2 = __pyx_v_total;
+
+    __pyx_t_3 = ((Py_ssize_t)__pyx_e_9mylibrary_8_kernels__REDUCE_MAXCHUNKS);
+    __pyx_t_5 = (__pyx_t_2 < __pyx_t_3);
+
+    if (__pyx_t_5) {
+
+      __pyx_t_4 = __pyx_t_2;
+    } else {
+
+      __pyx_t_4 = __pyx_t_3;
+    }
+
+
+    __pyx_t_1 = __pyx_t_4;
+
+  } else {
+
+    __pyx_t_1 = 1;
+  }
+  __pyx_v_nchunks = __pyx_t_1;
+
+  /* "mylibrary/_kernels.pxi":162
+ *     cdef Py_ssize_t total = m * n
+ *     cdef Py_ssize_t nchunks = min(<Py_ssize_t>_REDUCE_MAXCHUNKS, total) if chunked else 1
+ *     cdef Py_ssize_t base = total // nchunks, extra = total % nchunks             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t c, k0, count
+ *     cdef double partials[_REDUCE_MAXCHUNKS]
+*/
+  __pyx_v_base = (__pyx_v_total / __pyx_v_nchunks);
+  __pyx_v_extra = (__pyx_v_total % __pyx_v_nchunks);
+
+  /* "mylibrary/_kernels.pxi":166
+ *     cdef double partials[_REDUCE_MAXCHUNKS]
+ * 
+ *     if num_threads == 1:             # <<<<<<<<<<<<<<
+ *         for c in range(nchunks):
+ *             k0    = c*base + min(c, extra)
+*/
+  switch (__pyx_v_num_threads) {
+    case 1:
+
+    /* "mylibrary/_kernels.pxi":167
+ * 
+ *     if num_threads == 1:
+ *         for c in range(nchunks):             # <<<<<<<<<<<<<<
+ *             k0    = c*base + min(c, extra)
+ *             count = base + (1 if c < extra else 0)
+*/
+
+    __pyx_t_1 = __pyx_v_nchunks;
+    __pyx_t_4 = __pyx_t_1;
+
+    for (__pyx_t_2 = 0; __pyx_t_2 < __pyx_t_4; __pyx_t_2+=1) {
+      __pyx_v_c = __pyx_t_2;
+
+      /* "mylibrary/_kernels.pxi":168
+ *     if num_threads == 1:
+ *         for c in range(nchunks):
+ *             k0    = c*base + min(c, extra)             # <<<<<<<<<<<<<<
+ *             count = base + (1 if c < extra else 0)
+ *             partials[c] = _reduce_run(op, x, xs0, xs1, y, ys0, ys1, n, k0, count)
+*/
+
+      __pyx_t_3 = __pyx_v_extra;
+
+      __pyx_t_6 = __pyx_v_c;
+      __pyx_t_5 = (__pyx_t_3 < __pyx_t_6);
+
+      if (__pyx_t_5) {
+
+        __pyx_t_7 = __pyx_t_3;
+      } else {
+
+        __pyx_t_7 = __pyx_t_6;
+      }
+
+      __pyx_v_k0 = ((__pyx_v_c * __pyx_v_base) + __pyx_t_7);
+
+
+      /* "mylibrary/_kernels.pxi":169
+ *         for c in range(nchunks):
+ *             k0    = c*base + min(c, extra)
+ *             count = base + (1 if c < extra else 0)             # <<<<<<<<<<<<<<
+ *             partials[c] = _reduce_run(op, x, xs0, xs1, y, ys0, ys1, n, k0, count)
+ *     elif num_threads == 0:
+*/
+      __pyx_t_5 = (__pyx_v_c < __pyx_v_extra);
+
+      if (__pyx_t_5) {
+
+        __pyx_t_7 = 1;
+      } else {
+
+        __pyx_t_7 = 0;
+      }
+
+      __pyx_v_count = (__pyx_v_base + __pyx_t_7);
+
+
+      /* "mylibrary/_kernels.pxi":170
+ *             k0    = c*base + min(c, extra)
+ *             count = base + (1 if c < extra else 0)
+ *             partials[c] = _reduce_run(op, x, xs0, xs1, y, ys0, ys1, n, k0, count)             # <<<<<<<<<<<<<<
+ *     elif num_threads == 0:
+ *         for c in prange(nchunks, schedule="static"):
+*/
+      (__pyx_v_partials[__pyx_v_c]) = __pyx_fuse_1__pyx_f_9mylibrary_15_kernels_avx512__reduce_run(__pyx_v_op, __pyx_v_x, __pyx_v_xs0, __pyx_v_xs1, __pyx_v_y, __pyx_v_ys0, __pyx_v_ys1, __pyx_v_n, __pyx_v_k0, __pyx_v_count);
+    }
+
+
+    /* "mylibrary/_kernels.pxi":166
+ *     cdef double partials[_REDUCE_MAXCHUNKS]
+ * 
+ *     if num_threads == 1:             # <<<<<<<<<<<<<<
+ *         for c in range(nchunks):
+ *             k0    = c*base + min(c, extra)
+*/
+    break;
+    case 0:
+
+    /* "mylibrary/_kernels.pxi":172
+ *             partials[c] = _reduce_run(op, x, xs0, xs1, y, ys0, ys1, n, k0, count)
+ *     elif num_threads == 0:
+ *         for c in prange(nchunks, schedule="static"):             # <<<<<<<<<<<<<<
+ *             k0    = c*base + min(c, extra)
+ *             count = base + (1 if c < extra else 0)
+*/
+    {
+        __Pyx_UnknownThreadState _save;
+        _save = __Pyx_SaveUnknownThread();
+        __Pyx_FastGIL_Remember();
+        /*try:*/ {
+          __pyx_t_1 = __pyx_v_nchunks;
+
+          {
+              #if ((defined(__APPLE__) || defined(__OSX__)) && (defined(__GNUC__) && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))))
+                  #undef likely
+                  #undef unlikely
+                  #define likely(x)   (x)
+                  #define unlikely(x) (x)
+              #endif
+              __pyx_t_2 = (__pyx_t_1 - 0 + 1 - 1/abs(1)) / 1;
+              if (__pyx_t_2 > 0)
+              {
+                  #ifdef _OPENMP
+                  #pragma omp parallel private(__pyx_t_3, __pyx_t_5, __pyx_t_6, __pyx_t_7)
+                  #endif /* _OPENMP */
+                  {
+                      #ifdef _OPENMP
+                      #pragma omp for nowait firstprivate(__pyx_v_c) lastprivate(__pyx_v_c) firstprivate(__pyx_v_count) lastprivate(__pyx_v_count) firstprivate(__pyx_v_k0) lastprivate(__pyx_v_k0) schedule(static)
+                      #endif /* _OPENMP */
+                      for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_2; __pyx_t_4++){
+                          {
+                              __pyx_v_c = (Py_ssize_t)(0 + 1 * __pyx_t_4);
+
+                              /* "mylibrary/_kernels.pxi":173
+ *     elif num_threads == 0:
+ *         for c in prange(nchunks, schedule="static"):
+ *             k0    = c*base + min(c, extra)             # <<<<<<<<<<<<<<
+ *             count = base + (1 if c < extra else 0)
+ *             partials[c] = _reduce_run(op, x, xs0, xs1, y, ys0, ys1, n, k0, count)
+*/
+
+                              __pyx_t_7 = __pyx_v_extra;
+
+                              __pyx_t_3 = __pyx_v_c;
+                              __pyx_t_5 = (__pyx_t_7 < __pyx_t_3);
+
+                              if (__pyx_t_5) {
+
+                                __pyx_t_6 = __pyx_t_7;
+                              } else {
+
+                                __pyx_t_6 = __pyx_t_3;
+                              }
+
+                              __pyx_v_k0 = ((__pyx_v_c * __pyx_v_base) + __pyx_t_6);
+
+
+                              /* "mylibrary/_kernels.pxi":174
+ *         for c in prange(nchunks, schedule="static"):
+ *             k0    = c*base + min(c, extra)
+ *             count = base + (1 if c < extra else 0)             # <<<<<<<<<<<<<<
+ *             partials[c] = _reduce_run(op, x, xs0, xs1, y, ys0, ys1, n, k0, count)
+ *     else:
+*/
+                              __pyx_t_5 = (__pyx_v_c < __pyx_v_extra);
+
+                              if (__pyx_t_5) {
+
+                                __pyx_t_6 = 1;
+                              } else {
+
+                                __pyx_t_6 = 0;
+                              }
+
+                              __pyx_v_count = (__pyx_v_base + __pyx_t_6);
+
+
+                              /* "mylibrary/_kernels.pxi":175
+ *             k0    = c*base + min(c, extra)
+ *             count = base + (1 if c < extra else 0)
+ *             partials[c] = _reduce_run(op, x, xs0, xs1, y, ys0, ys1, n, k0, count)             # <<<<<<<<<<<<<<
+ *     else:
+ *         for c in prange(nchunks, schedule="static", num_threads=num_threads):
+*/
+                              (__pyx_v_partials[__pyx_v_c]) = __pyx_fuse_1__pyx_f_9mylibrary_15_kernels_avx512__reduce_run(__pyx_v_op, __pyx_v_x, __pyx_v_xs0, __pyx_v_xs1, __pyx_v_y, __pyx_v_ys0, __pyx_v_ys1, __pyx_v_n, __pyx_v_k0, __pyx_v_count);
+                          }
+                      }
+                  }
+              }
+          }
+          #if ((defined(__APPLE__) || defined(__OSX__)) && (defined(__GNUC__) && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))))
+              #undef likely
+              #undef unlikely
+              #define likely(x)   __builtin_expect(!!(x), 1)
+              #define unlikely(x) __builtin_expect(!!(x), 0)
+          #endif
+
+        }
+
+        /* "mylibrary/_kernels.pxi":172
+ *             partials[c] = _reduce_run(op, x, xs0, xs1, y, ys0, ys1, n, k0, count)
+ *     elif num_threads == 0:
+ *         for c in prange(nchunks, schedule="static"):             # <<<<<<<<<<<<<<
+ *             k0    = c*base + min(c, extra)
+ *             count = base + (1 if c < extra else 0)
+*/
+        /*finally:*/ {
+          /*normal exit:*/{
+            __Pyx_FastGIL_Forget();
+            __Pyx_RestoreUnknownThread(_save);
+            goto __pyx_L7;
+          }
+          __pyx_L7:;
+        }
+    }
+
+    /* "mylibrary/_kernels.pxi":171
+ *             count = base + (1 if c < extra else 0)
+ *             partials[c] = _reduce_run(op, x, xs0, xs1, y, ys0, ys1, n, k0, count)
+ *     elif num_threads == 0:             # <<<<<<<<<<<<<<
+ *         for c in prange(nchunks, schedule="static"):
+ *             k0    = c*base + min(c, extra)
+*/
+    break;
+    default:
+
+    /* "mylibrary/_kernels.pxi":177
+ *             partials[c] = _reduce_run(op, x, xs0, xs1, y, ys0, ys1, n, k0, count)
+ *     else:
+ *         for c in prange(nchunks, schedule="static", num_threads=num_threads):             # <<<<<<<<<<<<<<
+ *             k0    = c*base + min(c, extra)
+ *             count = base + (1 if c < extra else 0)
+*/
+    {
+        __Pyx_UnknownThreadState _save;
+        _save = __Pyx_SaveUnknownThread();
+        __Pyx_FastGIL_Remember();
+        /*try:*/ {
+          __pyx_t_2 = __pyx_v_nchunks;
+
+          {
+              #if ((defined(__APPLE__) || defined(__OSX__)) && (defined(__GNUC__) && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))))
+                  #undef likely
+                  #undef unlikely
+                  #define likely(x)   (x)
+                  #define unlikely(x) (x)
+              #endif
+              __pyx_t_1 = (__pyx_t_2 - 0 + 1 - 1/abs(1)) / 1;
+              if (__pyx_t_1 > 0)
+              {
+                  #ifdef _OPENMP
+                  #pragma omp parallel num_threads(__pyx_v_num_threads != 0 ? __pyx_v_num_threads : omp_get_max_threads()) private(__pyx_t_3, __pyx_t_5, __pyx_t_6, __pyx_t_7)
+                  #endif /* _OPENMP */
+                  {
+                      #ifdef _OPENMP
+                      #pragma omp for nowait firstprivate(__pyx_v_c) lastprivate(__pyx_v_c) firstprivate(__pyx_v_count) lastprivate(__pyx_v_count) firstprivate(__pyx_v_k0) lastprivate(__pyx_v_k0) schedule(static)
+                      #endif /* _OPENMP */
+                      for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_1; __pyx_t_4++){
+                          {
+                              __pyx_v_c = (Py_ssize_t)(0 + 1 * __pyx_t_4);
+
+                              /* "mylibrary/_kernels.pxi":178
+ *     else:
+ *         for c in prange(nchunks, schedule="static", num_threads=num_threads):
+ *             k0    = c*base + min(c, extra)             # <<<<<<<<<<<<<<
+ *             count = base + (1 if c < extra else 0)
+ *             partials[c] = _reduce_run(op, x, xs0, xs1, y, ys0, ys1, n, k0, count)
+*/
+
+                              __pyx_t_6 = __pyx_v_extra;
+
+                              __pyx_t_7 = __pyx_v_c;
+                              __pyx_t_5 = (__pyx_t_6 < __pyx_t_7);
+
+                              if (__pyx_t_5) {
+
+                                __pyx_t_3 = __pyx_t_6;
+                              } else {
+
+                                __pyx_t_3 = __pyx_t_7;
+                              }
+
+                              __pyx_v_k0 = ((__pyx_v_c * __pyx_v_base) + __pyx_t_3);
+
+
+                              /* "mylibrary/_kernels.pxi":179
+ *         for c in prange(nchunks, schedule="static", num_threads=num_threads):
+ *             k0    = c*base + min(c, extra)
+ *             count = base + (1 if c < extra else 0)             # <<<<<<<<<<<<<<
+ *             partials[c] = _reduce_run(op, x, xs0, xs1, y, ys0, ys1, n, k0, count)
+ * 
+*/
+                              __pyx_t_5 = (__pyx_v_c < __pyx_v_extra);
+
+                              if (__pyx_t_5) {
+
+                                __pyx_t_3 = 1;
+                              } else {
+
+                                __pyx_t_3 = 0;
+                              }
+
+                              __pyx_v_count = (__pyx_v_base + __pyx_t_3);
+
+
+                              /* "mylibrary/_kernels.pxi":180
+ *             k0    = c*base + min(c, extra)
+ *             count = base + (1 if c < extra else 0)
+ *             partials[c] = _reduce_run(op, x, xs0, xs1, y, ys0, ys1, n, k0, count)             # <<<<<<<<<<<<<<
+ * 
+ *     return _combine(op, partials, nchunks)
+*/
+                              (__pyx_v_partials[__pyx_v_c]) = __pyx_fuse_1__pyx_f_9mylibrary_15_kernels_avx512__reduce_run(__pyx_v_op, __pyx_v_x, __pyx_v_xs0, __pyx_v_xs1, __pyx_v_y, __pyx_v_ys0, __pyx_v_ys1, __pyx_v_n, __pyx_v_k0, __pyx_v_count);
+                          }
+                      }
+                  }
+              }
+          }
+          #if ((defined(__APPLE__) || defined(__OSX__)) && (defined(__GNUC__) && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))))
+              #undef likely
+              #undef unlikely
+              #define likely(x)   __builtin_expect(!!(x), 1)
+              #define unlikely(x) __builtin_expect(!!(x), 0)
+          #endif
+
+        }
+
+        /* "mylibrary/_kernels.pxi":177
+ *             partials[c] = _reduce_run(op, x, xs0, xs1, y, ys0, ys1, n, k0, count)
+ *     else:
+ *         for c in prange(nchunks, schedule="static", num_threads=num_threads):             # <<<<<<<<<<<<<<
+ *             k0    = c*base + min(c, extra)
+ *             count = base + (1 if c < extra else 0)
+*/
+        /*finally:*/ {
+          /*normal exit:*/{
+            __Pyx_FastGIL_Forget();
+            __Pyx_RestoreUnknownThread(_save);
+            goto __pyx_L16;
+          }
+          __pyx_L16:;
+        }
+    }
+    break;
+  }
+
+  /* "mylibrary/_kernels.pxi":182
+ *             partials[c] = _reduce_run(op, x, xs0, xs1, y, ys0, ys1, n, k0, count)
+ * 
+ *     return _combine(op, partials, nchunks)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline double _reduce_run( _Reduction op, const real* x, Py_ssize_t xs0, Py_ssize_t xs1,
+*/
+  {
+
+    __pyx_r = __pyx_f_9mylibrary_15_kernels_avx512__combine(__pyx_v_op, __pyx_v_partials, __pyx_v_nchunks);
+  }
+  goto __pyx_L0;
+
+  /* "mylibrary/_kernels.pxi":157
+ * # is too), which are reduced in parallel, and then combined.
+ * #
+ * cdef double _reduce( _Reduction op, const real* x, Py_ssize_t xs0, Py_ssize_t xs1,             # <<<<<<<<<<<<<<
+ *                      const real* y, Py_ssize_t ys0, Py_ssize_t ys1,
+ *                      Py_ssize_t m, Py_ssize_t n, bint chunked, int num_threads ) noexcept nogil:
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+
+
+
+
+
+
+
+
+  return __pyx_r;
+}
+
+/* "mylibrary/_kernels.pxi":184
+ *     return _combine(op, partials, nchunks)
+ * 
+ * cdef inline double _reduce_run( _Reduction op, const real* x, Py_ssize_t xs0, Py_ssize_t xs1,             # <<<<<<<<<<<<<<
+ *                                 const real* y, Py_ssize_t ys0, Py_ssize_t ys1,
+ *                                 Py_ssize_t ncols, Py_ssize_t k0, Py_ssize_t count ) noexcept nogil:
+*/
+
+static CYTHON_INLINE double __pyx_fuse_0__pyx_f_9mylibrary_15_kernels_avx512__reduce_run(enum __pyx_t_9mylibrary_8_kernels__Reduction __pyx_v_op, float const *__pyx_v_x, Py_ssize_t __pyx_v_xs0, Py_ssize_t __pyx_v_xs1, float const *__pyx_v_y, Py_ssize_t __pyx_v_ys0, Py_ssize_t __pyx_v_ys1, Py_ssize_t __pyx_v_ncols, Py_ssize_t __pyx_v_k0, Py_ssize_t __pyx_v_count) {
+  double __pyx_r;
+
+  /* "mylibrary/_kernels.pxi":187
+ *                                 const real* y, Py_ssize_t ys0, Py_ssize_t ys1,
+ *                                 Py_ssize_t ncols, Py_ssize_t k0, Py_ssize_t count ) noexcept nogil:
+ *     if op == _REDUCE_SUM:             # <<<<<<<<<<<<<<
+ *         return _pairwise_sum(x, xs0, xs1, <const real*>NULL, 0, 0, ncols, k0, count)
+ *     elif op == _REDUCE_DOT:
+*/
+  switch (__pyx_v_op) {
+    case __pyx_e_9mylibrary_8_kernels__REDUCE_SUM:
+
+    /* "mylibrary/_kernels.pxi":188
+ *                                 Py_ssize_t ncols, Py_ssize_t k0, Py_ssize_t count ) noexcept nogil:
+ *     if op == _REDUCE_SUM:
+ *         return _pairwise_sum(x, xs0, xs1, <const real*>NULL, 0, 0, ncols, k0, count)             # <<<<<<<<<<<<<<
+ *     elif op == _REDUCE_DOT:
+ *         return _pairwise_sum(x, xs0, xs1, y, ys0, ys1, ncols, k0, count)
+*/
+    {
+
+      __pyx_r = __pyx_fuse_0__pyx_f_9mylibrary_15_kernels_avx512__pairwise_sum(__pyx_v_x, __pyx_v_xs0, __pyx_v_xs1, ((float const *)NULL), 0, 0, __pyx_v_ncols, __pyx_v_k0, __pyx_v_count);
+    }
+    goto __pyx_L0;
+
+    /* "mylibrary/_kernels.pxi":187
+ *                                 const real* y, Py_ssize_t ys0, Py_ssize_t ys1,
+ *                                 Py_ssize_t ncols, Py_ssize_t k0, Py_ssize_t count ) noexcept nogil:
+ *     if op == _REDUCE_SUM:             # <<<<<<<<<<<<<<
+ *         return _pairwise_sum(x, xs0, xs1, <const real*>NULL, 0, 0, ncols, k0, count)
+ *     elif op == _REDUCE_DOT:
+*/
+    break;
+    case __pyx_e_9mylibrary_8_kernels__REDUCE_DOT:
+
+    /* "mylibrary/_kernels.pxi":190
+ *         return _pairwise_sum(x, xs0, xs1, <const real*>NULL, 0, 0, ncols, k0, count)
+ *     elif op == _REDUCE_DOT:
+ *         return _pairwise_sum(x, xs0, xs1, y, ys0, ys1, ncols, k0, count)             # <<<<<<<<<<<<<<
+ *     else:
+ *         return _extremum(op == _REDUCE_MAX, x, xs0, xs1, ncols, k0, count)
+*/
+    {
+
+      __pyx_r = __pyx_fuse_0__pyx_f_9mylibrary_15_kernels_avx512__pairwise_sum(__pyx_v_x, __pyx_v_xs0, __pyx_v_xs1, __pyx_v_y, __pyx_v_ys0, __pyx_v_ys1, __pyx_v_ncols, __pyx_v_k0, __pyx_v_count);
+    }
+    goto __pyx_L0;
+
+    /* "mylibrary/_kernels.pxi":189
+ *     if op == _REDUCE_SUM:
+ *         return _pairwise_sum(x, xs0, xs1, <const real*>NULL, 0, 0, ncols, k0, count)
+ *     elif op == _REDUCE_DOT:             # <<<<<<<<<<<<<<
+ *         return _pairwise_sum(x, xs0, xs1, y, ys0, ys1, ncols, k0, count)
+ *     else:
+*/
+    break;
+    default:
+
+    /* "mylibrary/_kernels.pxi":192
+ *         return _pairwise_sum(x, xs0, xs1, y, ys0, ys1, ncols, k0, count)
+ *     else:
+ *         return _extremum(op == _REDUCE_MAX, x, xs0, xs1, ncols, k0, count)             # <<<<<<<<<<<<<<
+ * 
+ * # Combine partial results of the runs.
+*/
+    {
+
+      __pyx_r = __pyx_fuse_0__pyx_f_9mylibrary_15_kernels_avx512__extremum((__pyx_v_op == __pyx_e_9mylibrary_8_kernels__REDUCE_MAX), __pyx_v_x, __pyx_v_xs0, __pyx_v_xs1, __pyx_v_ncols, __pyx_v_k0, __pyx_v_count);
+    }
+    goto __pyx_L0;
+    break;
+  }
+
+  /* "mylibrary/_kernels.pxi":184
+ *     return _combine(op, partials, nchunks)
+ * 
+ * cdef inline double _reduce_run( _Reduction op, const real* x, Py_ssize_t xs0, Py_ssize_t xs1,             # <<<<<<<<<<<<<<
+ *                                 const real* y, Py_ssize_t ys0, Py_ssize_t ys1,
+ *                                 Py_ssize_t ncols, Py_ssize_t k0, Py_ssize_t count ) noexcept nogil:
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+static CYTHON_INLINE double __pyx_fuse_1__pyx_f_9mylibrary_15_kernels_avx512__reduce_run(enum __pyx_t_9mylibrary_8_kernels__Reduction __pyx_v_op, double const *__pyx_v_x, Py_ssize_t __pyx_v_xs0, Py_ssize_t __pyx_v_xs1, double const *__pyx_v_y, Py_ssize_t __pyx_v_ys0, Py_ssize_t __pyx_v_ys1, Py_ssize_t __pyx_v_ncols, Py_ssize_t __pyx_v_k0, Py_ssize_t __pyx_v_count) {
+  double __pyx_r;
+
+  /* "mylibrary/_kernels.pxi":187
+ *                                 const real* y, Py_ssize_t ys0, Py_ssize_t ys1,
+ *                                 Py_ssize_t ncols, Py_ssize_t k0, Py_ssize_t count ) noexcept nogil:
+ *     if op == _REDUCE_SUM:             # <<<<<<<<<<<<<<
+ *         return _pairwise_sum(x, xs0, xs1, <const real*>NULL, 0, 0, ncols, k0, count)
+ *     elif op == _REDUCE_DOT:
+*/
+  switch (__pyx_v_op) {
+    case __pyx_e_9mylibrary_8_kernels__REDUCE_SUM:
+
+    /* "mylibrary/_kernels.pxi":188
+ *                                 Py_ssize_t ncols, Py_ssize_t k0, Py_ssize_t count ) noexcept nogil:
+ *     if op == _REDUCE_SUM:
+ *         return _pairwise_sum(x, xs0, xs1, <const real*>NULL, 0, 0, ncols, k0, count)             # <<<<<<<<<<<<<<
+ *     elif op == _REDUCE_DOT:
+ *         return _pairwise_sum(x, xs0, xs1, y, ys0, ys1, ncols, k0, count)
+*/
+    {
+
+      __pyx_r = __pyx_fuse_1__pyx_f_9mylibrary_15_kernels_avx512__pairwise_sum(__pyx_v_x, __pyx_v_xs0, __pyx_v_xs1, ((double const *)NULL), 0, 0, __pyx_v_ncols, __pyx_v_k0, __pyx_v_count);
+    }
+    goto __pyx_L0;
+
+    /* "mylibrary/_kernels.pxi":187
+ *                                 const real* y, Py_ssize_t ys0, Py_ssize_t ys1,
+ *                                 Py_ssize_t ncols, Py_ssize_t k0, Py_ssize_t count ) noexcept nogil:
+ *     if op == _REDUCE_SUM:             # <<<<<<<<<<<<<<
+ *         return _pairwise_sum(x, xs0, xs1, <const real*>NULL, 0, 0, ncols, k0, count)
+ *     elif op == _REDUCE_DOT:
+*/
+    break;
+    case __pyx_e_9mylibrary_8_kernels__REDUCE_DOT:
+
+    /* "mylibrary/_kernels.pxi":190
+ *         return _pairwise_sum(x, xs0, xs1, <const real*>NULL, 0, 0, ncols, k0, count)
+ *     elif op == _REDUCE_DOT:
+ *         return _pairwise_sum(x, xs0, xs1, y, ys0, ys1, ncols, k0, count)             # <<<<<<<<<<<<<<
+ *     else:
+ *         return _extremum(op == _REDUCE_MAX, x, xs0, xs1, ncols, k0, count)
+*/
+    {
+
+      __pyx_r = __pyx_fuse_1__pyx_f_9mylibrary_15_kernels_avx512__pairwise_sum(__pyx_v_x, __pyx_v_xs0, __pyx_v_xs1, __pyx_v_y, __pyx_v_ys0, __pyx_v_ys1, __pyx_v_ncols, __pyx_v_k0, __pyx_v_count);
+    }
+    goto __pyx_L0;
+
+    /* "mylibrary/_kernels.pxi":189
+ *     if op == _REDUCE_SUM:
+ *         return _pairwise_sum(x, xs0, xs1, <const real*>NULL, 0, 0, ncols, k0, count)
+ *     elif op == _REDUCE_DOT:             # <<<<<<<<<<<<<<
+ *         return _pairwise_sum(x, xs0, xs1, y, ys0, ys1, ncols, k0, count)
+ *     else:
+*/
+    break;
+    default:
+
+    /* "mylibrary/_kernels.pxi":192
+ *         return _pairwise_sum(x, xs0, xs1, y, ys0, ys1, ncols, k0, count)
+ *     else:
+ *         return _extremum(op == _REDUCE_MAX, x, xs0, xs1, ncols, k0, count)             # <<<<<<<<<<<<<<
+ * 
+ * # Combine partial results of the runs.
+*/
+    {
+
+      __pyx_r = __pyx_fuse_1__pyx_f_9mylibrary_15_kernels_avx512__extremum((__pyx_v_op == __pyx_e_9mylibrary_8_kernels__REDUCE_MAX), __pyx_v_x, __pyx_v_xs0, __pyx_v_xs1, __pyx_v_ncols, __pyx_v_k0, __pyx_v_count);
+    }
+    goto __pyx_L0;
+    break;
+  }
+
+  /* "mylibrary/_kernels.pxi":184
+ *     return _combine(op, partials, nchunks)
+ * 
+ * cdef inline double _reduce_run( _Reduction op, const real* x, Py_ssize_t xs0, Py_ssize_t xs1,             # <<<<<<<<<<<<<<
+ *                                 const real* y, Py_ssize_t ys0, Py_ssize_t ys1,
+ *                                 Py_ssize_t ncols, Py_ssize_t k0, Py_ssize_t count ) noexcept nogil:
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "mylibrary/_kernels.pxi":196
+ * # Combine partial results of the runs.
+ * #
+ * cdef double _combine( _Reduction op, const double* partials, Py_ssize_t n ) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t c
+ *     cdef double result = partials[0]
+*/
+
+static double __pyx_f_9mylibrary_15_kernels_avx512__combine(enum __pyx_t_9mylibrary_8_kernels__Reduction __pyx_v_op, double const *__pyx_v_partials, Py_ssize_t __pyx_v_n) {
+  Py_ssize_t __pyx_v_c;
+  double __pyx_v_result;
+  double __pyx_r;
+  Py_ssize_t __pyx_t_1;
+  Py_ssize_t __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+
+  /* "mylibrary/_kernels.pxi":198
+ * cdef double _combine( _Reduction op, const double* partials, Py_ssize_t n ) noexcept nogil:
+ *     cdef Py_ssize_t c
+ *     cdef double result = partials[0]             # <<<<<<<<<<<<<<
+ *     for c in range(1, n):
+ *         if op == _REDUCE_SUM  or  op == _REDUCE_DOT:
+*/
+  __pyx_v_result = (__pyx_v_partials[0]);
+
+  /* "mylibrary/_kernels.pxi":199
+ *     cdef Py_ssize_t c
+ *     cdef double result = partials[0]
+ *     for c in range(1, n):             # <<<<<<<<<<<<<<
+ *         if op == _REDUCE_SUM  or  op == _REDUCE_DOT:
+ *             result += partials[c]
+*/
+
+  __pyx_t_1 = __pyx_v_n;
+  __pyx_t_2 = __pyx_t_1;
+
+  for (__pyx_t_3 = 1; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_v_c = __pyx_t_3;
+
+    /* "mylibrary/_kernels.pxi":200
+ *     cdef double result = partials[0]
+ *     for c in range(1, n):
+ *         if op == _REDUCE_SUM  or  op == _REDUCE_DOT:             # <<<<<<<<<<<<<<
+ *             result += partials[c]
+ *         elif result != result:  # NaN propagates
+*/
+    switch (__pyx_v_op) {
+      case __pyx_e_9mylibrary_8_kernels__REDUCE_SUM:
+      case __pyx_e_9mylibrary_8_kernels__REDUCE_DOT:
+      __pyx_t_4 = 1;
+      break;
+      default:
+      __pyx_t_4 = 0;
+      break;
+    }
+    if (__pyx_t_4) {
+
+
+      /* "mylibrary/_kernels.pxi":201
+ *     for c in range(1, n):
+ *         if op == _REDUCE_SUM  or  op == _REDUCE_DOT:
+ *             result += partials[c]             # <<<<<<<<<<<<<<
+ *         elif result != result:  # NaN propagates
+ *             break
+*/
+      __pyx_v_result = (__pyx_v_result + (__pyx_v_partials[__pyx_v_c]));
+
+      /* "mylibrary/_kernels.pxi":200
+ *     cdef double result = partials[0]
+ *     for c in range(1, n):
+ *         if op == _REDUCE_SUM  or  op == _REDUCE_DOT:             # <<<<<<<<<<<<<<
+ *             result += partials[c]
+ *         elif result != result:  # NaN propagates
+*/
+      goto __pyx_L5;
+    }
+
+    /* "mylibrary/_kernels.pxi":202
+ *         if op == _REDUCE_SUM  or  op == _REDUCE_DOT:
+ *             result += partials[c]
+ *         elif result != result:  # NaN propagates             # <<<<<<<<<<<<<<
+ *             break
+ *         elif ( partials[c] != partials[c]
+*/
+    __pyx_t_4 = (__pyx_v_result != __pyx_v_result);
+
+    if (__pyx_t_4) {
+
+
+      /* "mylibrary/_kernels.pxi":203
+ *             result += partials[c]
+ *         elif result != result:  # NaN propagates
+ *             break             # <<<<<<<<<<<<<<
+ *         elif ( partials[c] != partials[c]
+ *                or (op == _REDUCE_MAX and partials[c] > result)
+*/
+      goto __pyx_L4_break;
+
+      /* "mylibrary/_kernels.pxi":202
+ *         if op == _REDUCE_SUM  or  op == _REDUCE_DOT:
+ *             result += partials[c]
+ *         elif result != result:  # NaN propagates             # <<<<<<<<<<<<<<
+ *             break
+ *         elif ( partials[c] != partials[c]
+*/
+    }
+
+    /* "mylibrary/_kernels.pxi":204
+ *         elif result != result:  # NaN propagates
+ *             break
+ *         elif ( partials[c] != partials[c]             # <<<<<<<<<<<<<<
+ *                or (op == _REDUCE_MAX and partials[c] > result)
+ *                or (op == _REDUCE_MIN and partials[c] < result) ):
+*/
+    __pyx_t_5 = ((__pyx_v_partials[__pyx_v_c]) != (__pyx_v_partials[__pyx_v_c]));
+
+    if (!__pyx_t_5) {
+
+    } else {
+
+      __pyx_t_4 = __pyx_t_5;
+
+      goto __pyx_L6_bool_binop_done;
+    }
+
+    /* "mylibrary/_kernels.pxi":205
+ *             break
+ *         elif ( partials[c] != partials[c]
+ *                or (op == _REDUCE_MAX and partials[c] > result)             # <<<<<<<<<<<<<<
+ *                or (op == _REDUCE_MIN and partials[c] < result) ):
+ *             result = partials[c]
+*/
+    __pyx_t_5 = (__pyx_v_op == __pyx_e_9mylibrary_8_kernels__REDUCE_MAX);
+
+    if (!__pyx_t_5) {
+
+      goto __pyx_L8_next_or;
+    } else {
+
+    }
+    __pyx_t_5 = ((__pyx_v_partials[__pyx_v_c]) > __pyx_v_result);
+
+    if (!__pyx_t_5) {
+
+    } else {
+
+      __pyx_t_4 = __pyx_t_5;
+
+      goto __pyx_L6_bool_binop_done;
+    }
+    __pyx_L8_next_or:;
+
+    /* "mylibrary/_kernels.pxi":206
+ *         elif ( partials[c] != partials[c]
+ *                or (op == _REDUCE_MAX and partials[c] > result)
+ *                or (op == _REDUCE_MIN and partials[c] < result) ):             # <<<<<<<<<<<<<<
+ *             result = partials[c]
+ *     return result
+*/
+    __pyx_t_5 = (__pyx_v_op == __pyx_e_9mylibrary_8_kernels__REDUCE_MIN);
+
+    if (__pyx_t_5) {
+
+    } else {
+
+      __pyx_t_4 = __pyx_t_5;
+
+      goto __pyx_L6_bool_binop_done;
+    }
+    __pyx_t_5 = ((__pyx_v_partials[__pyx_v_c]) < __pyx_v_result);
+
+
+    __pyx_t_4 = __pyx_t_5;
+
+    __pyx_L6_bool_binop_done:;
+
+    /* "mylibrary/_kernels.pxi":204
+ *         elif result != result:  # NaN propagates
+ *             break
+ *         elif ( partials[c] != partials[c]             # <<<<<<<<<<<<<<
+ *                or (op == _REDUCE_MAX and partials[c] > result)
+ *                or (op == _REDUCE_MIN and partials[c] < result) ):
+*/
+    if (__pyx_t_4) {
+
+
+      /* "mylibrary/_kernels.pxi":207
+ *                or (op == _REDUCE_MAX and partials[c] > result)
+ *                or (op == _REDUCE_MIN and partials[c] < result) ):
+ *             result = partials[c]             # <<<<<<<<<<<<<<
+ *     return result
+ * 
+*/
+      __pyx_v_result = (__pyx_v_partials[__pyx_v_c]);
+
+      /* "mylibrary/_kernels.pxi":204
+ *         elif result != result:  # NaN propagates
+ *             break
+ *         elif ( partials[c] != partials[c]             # <<<<<<<<<<<<<<
+ *                or (op == _REDUCE_MAX and partials[c] > result)
+ *                or (op == _REDUCE_MIN and partials[c] < result) ):
+*/
+    }
+    __pyx_L5:;
+  }
+  __pyx_L4_break:;
+
+
+  /* "mylibrary/_kernels.pxi":208
+ *                or (op == _REDUCE_MIN and partials[c] < result) ):
+ *             result = partials[c]
+ *     return result             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  {
+
+    __pyx_r = __pyx_v_result;
+  }
+  goto __pyx_L0;
+
+  /* "mylibrary/_kernels.pxi":196
+ * # Combine partial results of the runs.
+ * #
+ * cdef double _combine( _Reduction op, const double* partials, Py_ssize_t n ) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t c
+ *     cdef double result = partials[0]
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+
+
+  return __pyx_r;
+}
+
+/* "mylibrary/_kernels.pxi":221
+ * # Apply one operation to a run of n elements, from src to dst (which may be the same).
+ * #
+ * cdef void _apply_op( const _Op* op, const real* src, Py_ssize_t ss, real* dst, Py_ssize_t ds, Py_ssize_t n ) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     if ss == 1  and  ds == 1:
+ *         _apply_op_impl(op, src, 1, dst, 1, n)  # constant strides, so that the C compiler can vectorize the inlined copy
+*/
+
+static void __pyx_fuse_0__pyx_f_9mylibrary_15_kernels_avx512__apply_op(struct __pyx_t_9mylibrary_8_kernels__Op const *__pyx_v_op, float const *__pyx_v_src, Py_ssize_t __pyx_v_ss, float *__pyx_v_dst, Py_ssize_t __pyx_v_ds, Py_ssize_t __pyx_v_n) {
+  int __pyx_t_1;
+  int __pyx_t_2;
+
+  /* "mylibrary/_kernels.pxi":222
+ * #
+ * cdef void _apply_op( const _Op* op, const real* src, Py_ssize_t ss, real* dst, Py_ssize_t ds, Py_ssize_t n ) noexcept nogil:
+ *     if ss == 1  and  ds == 1:             # <<<<<<<<<<<<<<
+ *         _apply_op_impl(op, src, 1, dst, 1, n)  # constant strides, so that the C compiler can vectorize the inlined copy
+ *     else:
+*/
+  __pyx_t_2 = (__pyx_v_ss == 1);
+
+  if (__pyx_t_2) {
+
+  } else {
+
+    __pyx_t_1 = __pyx_t_2;
+
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = (__pyx_v_ds == 1);
+
+
+  __pyx_t_1 = __pyx_t_2;
+
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
+
+
+    /* "mylibrary/_kernels.pxi":223
+ * cdef void _apply_op( const _Op* op, const real* src, Py_ssize_t ss, real* dst, Py_ssize_t ds, Py_ssize_t n ) noexcept nogil:
+ *     if ss == 1  and  ds == 1:
+ *         _apply_op_impl(op, src, 1, dst, 1, n)  # constant strides, so that the C compiler can vectorize the inlined copy             # <<<<<<<<<<<<<<
+ *     else:
+ *         _apply_op_impl(op, src, ss, dst, ds, n)
+*/
+    __pyx_fuse_0__pyx_f_9mylibrary_15_kernels_avx512__apply_op_impl(__pyx_v_op, __pyx_v_src, 1, __pyx_v_dst, 1, __pyx_v_n);
+
+    /* "mylibrary/_kernels.pxi":222
+ * #
+ * cdef void _apply_op( const _Op* op, const real* src, Py_ssize_t ss, real* dst, Py_ssize_t ds, Py_ssize_t n ) noexcept nogil:
+ *     if ss == 1  and  ds == 1:             # <<<<<<<<<<<<<<
+ *         _apply_op_impl(op, src, 1, dst, 1, n)  # constant strides, so that the C compiler can vectorize the inlined copy
+ *     else:
+*/
+    goto __pyx_L3;
+  }
+
+  /* "mylibrary/_kernels.pxi":225
+ *         _apply_op_impl(op, src, 1, dst, 1, n)  # constant strides, so that the C compiler can vectorize the inlined copy
+ *     else:
+ *         _apply_op_impl(op, src, ss, dst, ds, n)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline void _apply_op_impl( const _Op* op, const real* src, Py_ssize_t ss, real* dst, Py_ssize_t ds, Py_ssize_t n ) noexcept nogil:
+*/
+  /*else*/ {
+    __pyx_fuse_0__pyx_f_9mylibrary_15_kernels_avx512__apply_op_impl(__pyx_v_op, __pyx_v_src, __pyx_v_ss, __pyx_v_dst, __pyx_v_ds, __pyx_v_n);
+  }
+  __pyx_L3:;
+
+  /* "mylibrary/_kernels.pxi":221
+ * # Apply one operation to a run of n elements, from src to dst (which may be the same).
+ * #
+ * cdef void _apply_op( const _Op* op, const real* src, Py_ssize_t ss, real* dst, Py_ssize_t ds, Py_ssize_t n ) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     if ss == 1  and  ds == 1:
+ *         _apply_op_impl(op, src, 1, dst, 1, n)  # constant strides, so that the C compiler can vectorize the inlined copy
+*/
+
+  /* function exit code */
+}
+
+static void __pyx_fuse_1__pyx_f_9mylibrary_15_kernels_avx512__apply_op(struct __pyx_t_9mylibrary_8_kernels__Op const *__pyx_v_op, double const *__pyx_v_src, Py_ssize_t __pyx_v_ss, double *__pyx_v_dst, Py_ssize_t __pyx_v_ds, Py_ssize_t __pyx_v_n) {
+  int __pyx_t_1;
+  int __pyx_t_2;
+
+  /* "mylibrary/_kernels.pxi":222
+ * #
+ * cdef void _apply_op( const _Op* op, const real* src, Py_ssize_t ss, real* dst, Py_ssize_t ds, Py_ssize_t n ) noexcept nogil:
+ *     if ss == 1  and  ds == 1:             # <<<<<<<<<<<<<<
+ *         _apply_op_impl(op, src, 1, dst, 1, n)  # constant strides, so that the C compiler can vectorize the inlined copy
+ *     else:
+*/
+  __pyx_t_2 = (__pyx_v_ss == 1);
+
+  if (__pyx_t_2) {
+
+  } else {
+
+    __pyx_t_1 = __pyx_t_2;
+
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = (__pyx_v_ds == 1);
+
+
+  __pyx_t_1 = __pyx_t_2;
+
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
+
+
+    /* "mylibrary/_kernels.pxi":223
+ * cdef void _apply_op( const _Op* op, const real* src, Py_ssize_t ss, real* dst, Py_ssize_t ds, Py_ssize_t n ) noexcept nogil:
+ *     if ss == 1  and  ds == 1:
+ *         _apply_op_impl(op, src, 1, dst, 1, n)  # constant strides, so that the C compiler can vectorize the inlined copy             # <<<<<<<<<<<<<<
+ *     else:
+ *         _apply_op_impl(op, src, ss, dst, ds, n)
+*/
+    __pyx_fuse_1__pyx_f_9mylibrary_15_kernels_avx512__apply_op_impl(__pyx_v_op, __pyx_v_src, 1, __pyx_v_dst, 1, __pyx_v_n);
+
+    /* "mylibrary/_kernels.pxi":222
+ * #
+ * cdef void _apply_op( const _Op* op, const real* src, Py_ssize_t ss, real* dst, Py_ssize_t ds, Py_ssize_t n ) noexcept nogil:
+ *     if ss == 1  and  ds == 1:             # <<<<<<<<<<<<<<
+ *         _apply_op_impl(op, src, 1, dst, 1, n)  # constant strides, so that the C compiler can vectorize the inlined copy
+ *     else:
+*/
+    goto __pyx_L3;
+  }
+
+  /* "mylibrary/_kernels.pxi":225
+ *         _apply_op_impl(op, src, 1, dst, 1, n)  # constant strides, so that the C compiler can vectorize the inlined copy
+ *     else:
+ *         _apply_op_impl(op, src, ss, dst, ds, n)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline void _apply_op_impl( const _Op* op, const real* src, Py_ssize_t ss, real* dst, Py_ssize_t ds, Py_ssize_t n ) noexcept nogil:
+*/
+  /*else*/ {
+    __pyx_fuse_1__pyx_f_9mylibrary_15_kernels_avx512__apply_op_impl(__pyx_v_op, __pyx_v_src, __pyx_v_ss, __pyx_v_dst, __pyx_v_ds, __pyx_v_n);
+  }
+  __pyx_L3:;
+
+  /* "mylibrary/_kernels.pxi":221
+ * # Apply one operation to a run of n elements, from src to dst (which may be the same).
+ * #
+ * cdef void _apply_op( const _Op* op, const real* src, Py_ssize_t ss, real* dst, Py_ssize_t ds, Py_ssize_t n ) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     if ss == 1  and  ds == 1:
+ *         _apply_op_impl(op, src, 1, dst, 1, n)  # constant strides, so that the C compiler can vectorize the inlined copy
+*/
+
+  /* function exit code */
+}
+
+/* "mylibrary/_kernels.pxi":227
+ *         _apply_op_impl(op, src, ss, dst, ds, n)
+ * 
+ * cdef inline void _apply_op_impl( const _Op* op, const real* src, Py_ssize_t ss, real* dst, Py_ssize_t ds, Py_ssize_t n ) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t t
+ *     cdef real a = <real>op.a, b = <real>op.b, v
+*/
+
+static CYTHON_INLINE void __pyx_fuse_0__pyx_f_9mylibrary_15_kernels_avx512__apply_op_impl(struct __pyx_t_9mylibrary_8_kernels__Op const *__pyx_v_op, float const *__pyx_v_src, Py_ssize_t __pyx_v_ss, float *__pyx_v_dst, Py_ssize_t __pyx_v_ds, Py_ssize_t __pyx_v_n) {
+  Py_ssize_t __pyx_v_t;
+  float __pyx_v_a;
+  float __pyx_v_b;
+  float __pyx_v_v;
+  Py_ssize_t __pyx_t_1;
+  Py_ssize_t __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  float __pyx_t_4;
+  int __pyx_t_5;
+  float __pyx_t_6;
+  int __pyx_t_7;
+
+  /* "mylibrary/_kernels.pxi":229
+ * cdef inline void _apply_op_impl( const _Op* op, const real* src, Py_ssize_t ss, real* dst, Py_ssize_t ds, Py_ssize_t n ) noexcept nogil:
+ *     cdef Py_ssize_t t
+ *     cdef real a = <real>op.a, b = <real>op.b, v             # <<<<<<<<<<<<<<
+ *     if op.code == _OP_SCALE:
+ *         for t in range(n):
+*/
+  __pyx_v_a = ((float)__pyx_v_op->a);
+  __pyx_v_b = ((float)__pyx_v_op->b);
+
+  /* "mylibrary/_kernels.pxi":230
+ *     cdef Py_ssize_t t
+ *     cdef real a = <real>op.a, b = <real>op.b, v
+ *     if op.code == _OP_SCALE:             # <<<<<<<<<<<<<<
+ *         for t in range(n):
+ *             dst[t*ds] = src[t*ss] * a
+*/
+  switch (__pyx_v_op->code) {
+    case __pyx_e_9mylibrary_8_kernels__OP_SCALE:
+
+    /* "mylibrary/_kernels.pxi":231
+ *     cdef real a = <real>op.a, b = <real>op.b, v
+ *     if op.code == _OP_SCALE:
+ *         for t in range(n):             # <<<<<<<<<<<<<<
+ *             dst[t*ds] = src[t*ss] * a
+ *     elif op.code == _OP_OFFSET:
+*/
+
+    __pyx_t_1 = __pyx_v_n;
+    __pyx_t_2 = __pyx_t_1;
+
+    for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+      __pyx_v_t = __pyx_t_3;
+
+      /* "mylibrary/_kernels.pxi":232
+ *     if op.code == _OP_SCALE:
+ *         for t in range(n):
+ *             dst[t*ds] = src[t*ss] * a             # <<<<<<<<<<<<<<
+ *     elif op.code == _OP_OFFSET:
+ *         for t in range(n):
+*/
+      (__pyx_v_dst[(__pyx_v_t * __pyx_v_ds)]) = ((__pyx_v_src[(__pyx_v_t * __pyx_v_ss)]) * __pyx_v_a);
+    }
+
+
+    /* "mylibrary/_kernels.pxi":230
+ *     cdef Py_ssize_t t
+ *     cdef real a = <real>op.a, b = <real>op.b, v
+ *     if op.code == _OP_SCALE:             # <<<<<<<<<<<<<<
+ *         for t in range(n):
+ *             dst[t*ds] = src[t*ss] * a
+*/
+    break;
+    case __pyx_e_9mylibrary_8_kernels__OP_OFFSET:
+
+    /* "mylibrary/_kernels.pxi":234
+ *             dst[t*ds] = src[t*ss] * a
+ *     elif op.code == _OP_OFFSET:
+ *         for t in range(n):             # <<<<<<<<<<<<<<
+ *             dst[t*ds] = src[t*ss] + b
+ *     elif op.code == _OP_SQRT:
+*/
+
+    __pyx_t_1 = __pyx_v_n;
+    __pyx_t_2 = __pyx_t_1;
+
+    for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+      __pyx_v_t = __pyx_t_3;
+
+      /* "mylibrary/_kernels.pxi":235
+ *     elif op.code == _OP_OFFSET:
+ *         for t in range(n):
+ *             dst[t*ds] = src[t*ss] + b             # <<<<<<<<<<<<<<
+ *     elif op.code == _OP_SQRT:
+ *         for t in range(n):
+*/
+      (__pyx_v_dst[(__pyx_v_t * __pyx_v_ds)]) = ((__pyx_v_src[(__pyx_v_t * __pyx_v_ss)]) + __pyx_v_b);
+    }
+
+
+    /* "mylibrary/_kernels.pxi":233
+ *         for t in range(n):
+ *             dst[t*ds] = src[t*ss] * a
+ *     elif op.code == _OP_OFFSET:             # <<<<<<<<<<<<<<
+ *         for t in range(n):
+ *             dst[t*ds] = src[t*ss] + b
+*/
+    break;
+    case __pyx_e_9mylibrary_8_kernels__OP_SQRT:
+
+    /* "mylibrary/_kernels.pxi":237
+ *             dst[t*ds] = src[t*ss] + b
+ *     elif op.code == _OP_SQRT:
+ *         for t in range(n):             # <<<<<<<<<<<<<<
+ *             dst[t*ds] = _sqrt(src[t*ss])
+ *     elif op.code == _OP_CLIP:
+*/
+
+    __pyx_t_1 = __pyx_v_n;
+    __pyx_t_2 = __pyx_t_1;
+
+    for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+      __pyx_v_t = __pyx_t_3;
+
+      /* "mylibrary/_kernels.pxi":238
+ *     elif op.code == _OP_SQRT:
+ *         for t in range(n):
+ *             dst[t*ds] = _sqrt(src[t*ss])             # <<<<<<<<<<<<<<
+ *     elif op.code == _OP_CLIP:
+ *         for t in range(n):
+*/
+      (__pyx_v_dst[(__pyx_v_t * __pyx_v_ds)]) = __pyx_fuse_0__pyx_f_9mylibrary_15_kernels_avx512__sqrt((__pyx_v_src[(__pyx_v_t * __pyx_v_ss)]));
+    }
+
+
+    /* "mylibrary/_kernels.pxi":236
+ *         for t in range(n):
+ *             dst[t*ds] = src[t*ss] + b
+ *     elif op.code == _OP_SQRT:             # <<<<<<<<<<<<<<
+ *         for t in range(n):
+ *             dst[t*ds] = _sqrt(src[t*ss])
+*/
+    break;
+    case __pyx_e_9mylibrary_8_kernels__OP_CLIP:
+
+    /* "mylibrary/_kernels.pxi":240
+ *             dst[t*ds] = _sqrt(src[t*ss])
+ *     elif op.code == _OP_CLIP:
+ *         for t in range(n):             # <<<<<<<<<<<<<<
+ *             v = src[t*ss]
+ *             dst[t*ds] = a if v < a else (b if v > b else v)  # NaN passes through, like np.clip()
+*/
+
+    __pyx_t_1 = __pyx_v_n;
+    __pyx_t_2 = __pyx_t_1;
+
+    for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+      __pyx_v_t = __pyx_t_3;
+
+      /* "mylibrary/_kernels.pxi":241
+ *     elif op.code == _OP_CLIP:
+ *         for t in range(n):
+ *             v = src[t*ss]             # <<<<<<<<<<<<<<
+ *             dst[t*ds] = a if v < a else (b if v > b else v)  # NaN passes through, like np.clip()
+ *     elif op.code == _OP_ABS:
+*/
+      __pyx_v_v = (__pyx_v_src[(__pyx_v_t * __pyx_v_ss)]);
+
+      /* "mylibrary/_kernels.pxi":242
+ *         for t in range(n):
+ *             v = src[t*ss]
+ *             dst[t*ds] = a if v < a else (b if v > b else v)  # NaN passes through, like np.clip()             # <<<<<<<<<<<<<<
+ *     elif op.code == _OP_ABS:
+ *         for t in range(n):
+*/
+      __pyx_t_5 = (__pyx_v_v < __pyx_v_a);
+
+      if (__pyx_t_5) {
+
+        __pyx_t_4 = __pyx_v_a;
+      } else {
+        __pyx_t_7 = (__pyx_v_v > __pyx_v_b);
+
+        if (__pyx_t_7) {
+
+          __pyx_t_6 = __pyx_v_b;
+        } else {
+
+          __pyx_t_6 = __pyx_v_v;
+        }
+
+        __pyx_t_4 = __pyx_t_6;
+      }
+
+      (__pyx_v_dst[(__pyx_v_t * __pyx_v_ds)]) = __pyx_t_4;
+
+    }
+
+
+    /* "mylibrary/_kernels.pxi":239
+ *         for t in range(n):
+ *             dst[t*ds] = _sqrt(src[t*ss])
+ *     elif op.code == _OP_CLIP:             # <<<<<<<<<<<<<<
+ *         for t in range(n):
+ *             v = src[t*ss]
+*/
+    break;
+    case __pyx_e_9mylibrary_8_kernels__OP_ABS:
+
+    /* "mylibrary/_kernels.pxi":244
+ *             dst[t*ds] = a if v < a else (b if v > b else v)  # NaN passes through, like np.clip()
+ *     elif op.code == _OP_ABS:
+ *         for t in range(n):             # <<<<<<<<<<<<<<
+ *             v = src[t*ss]
+ *             dst[t*ds] = -v if v < 0 else v
+*/
+
+    __pyx_t_1 = __pyx_v_n;
+    __pyx_t_2 = __pyx_t_1;
+
+    for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+      __pyx_v_t = __pyx_t_3;
+
+      /* "mylibrary/_kernels.pxi":245
+ *     elif op.code == _OP_ABS:
+ *         for t in range(n):
+ *             v = src[t*ss]             # <<<<<<<<<<<<<<
+ *             dst[t*ds] = -v if v < 0 else v
+ *     elif op.code == _OP_SQUARE:
+*/
+      __pyx_v_v = (__pyx_v_src[(__pyx_v_t * __pyx_v_ss)]);
+
+      /* "mylibrary/_kernels.pxi":246
+ *         for t in range(n):
+ *             v = src[t*ss]
+ *             dst[t*ds] = -v if v < 0 else v             # <<<<<<<<<<<<<<
+ *     elif op.code == _OP_SQUARE:
+ *         for t in range(n):
+*/
+      __pyx_t_5 = (__pyx_v_v < 0.0);
+
+      if (__pyx_t_5) {
+
+        __pyx_t_4 = (-__pyx_v_v);
+      } else {
+
+        __pyx_t_4 = __pyx_v_v;
+      }
+
+      (__pyx_v_dst[(__pyx_v_t * __pyx_v_ds)]) = __pyx_t_4;
+
+    }
+
+
+    /* "mylibrary/_kernels.pxi":243
+ *             v = src[t*ss]
+ *             dst[t*ds] = a if v < a else (b if v > b else v)  # NaN passes through, like np.clip()
+ *     elif op.code == _OP_ABS:             # <<<<<<<<<<<<<<
+ *         for t in range(n):
+ *             v = src[t*ss]
+*/
+    break;
+    case __pyx_e_9mylibrary_8_kernels__OP_SQUARE:
+
+    /* "mylibrary/_kernels.pxi":248
+ *             dst[t*ds] = -v if v < 0 else v
+ *     elif op.code == _OP_SQUARE:
+ *         for t in range(n):             # <<<<<<<<<<<<<<
+ *             v = src[t*ss]
+ *             dst[t*ds] = v * v
+*/
+
+    __pyx_t_1 = __pyx_v_n;
+    __pyx_t_2 = __pyx_t_1;
+
+    for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+      __pyx_v_t = __pyx_t_3;
+
+      /* "mylibrary/_kernels.pxi":249
+ *     elif op.code == _OP_SQUARE:
+ *         for t in range(n):
+ *             v = src[t*ss]             # <<<<<<<<<<<<<<
+ *             dst[t*ds] = v * v
+ * 
+*/
+      __pyx_v_v = (__pyx_v_src[(__pyx_v_t * __pyx_v_ss)]);
+
+      /* "mylibrary/_kernels.pxi":250
+ *         for t in range(n):
+ *             v = src[t*ss]
+ *             dst[t*ds] = v * v             # <<<<<<<<<<<<<<
+ * 
+ * # Run the whole program on a run of elements within one row. The first operation reads x,
+*/
+      (__pyx_v_dst[(__pyx_v_t * __pyx_v_ds)]) = (__pyx_v_v * __pyx_v_v);
+    }
+
+
+    /* "mylibrary/_kernels.pxi":247
+ *             v = src[t*ss]
+ *             dst[t*ds] = -v if v < 0 else v
+ *     elif op.code == _OP_SQUARE:             # <<<<<<<<<<<<<<
+ *         for t in range(n):
+ *             v = src[t*ss]
+*/
+    break;
+    default: break;
+  }
+
+  /* "mylibrary/_kernels.pxi":227
+ *         _apply_op_impl(op, src, ss, dst, ds, n)
+ * 
+ * cdef inline void _apply_op_impl( const _Op* op, const real* src, Py_ssize_t ss, real* dst, Py_ssize_t ds, Py_ssize_t n ) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t t
+ *     cdef real a = <real>op.a, b = <real>op.b, v
+*/
+
+  /* function exit code */
+
+
+
+
+}
+
+static CYTHON_INLINE void __pyx_fuse_1__pyx_f_9mylibrary_15_kernels_avx512__apply_op_impl(struct __pyx_t_9mylibrary_8_kernels__Op const *__pyx_v_op, double const *__pyx_v_src, Py_ssize_t __pyx_v_ss, double *__pyx_v_dst, Py_ssize_t __pyx_v_ds, Py_ssize_t __pyx_v_n) {
+  Py_ssize_t __pyx_v_t;
+  double __pyx_v_a;
+  double __pyx_v_b;
+  double __pyx_v_v;
+  Py_ssize_t __pyx_t_1;
+  Py_ssize_t __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  double __pyx_t_4;
+  int __pyx_t_5;
+  double __pyx_t_6;
+  int __pyx_t_7;
+
+  /* "mylibrary/_kernels.pxi":229
+ * cdef inline void _apply_op_impl( const _Op* op, const real* src, Py_ssize_t ss, real* dst, Py_ssize_t ds, Py_ssize_t n ) noexcept nogil:
+ *     cdef Py_ssize_t t
+ *     cdef real a = <real>op.a, b = <real>op.b, v             # <<<<<<<<<<<<<<
+ *     if op.code == _OP_SCALE:
+ *         for t in range(n):
+*/
+  __pyx_v_a = ((double)__pyx_v_op->a);
+  __pyx_v_b = ((double)__pyx_v_op->b);
+
+  /* "mylibrary/_kernels.pxi":230
+ *     cdef Py_ssize_t t
+ *     cdef real a = <real>op.a, b = <real>op.b, v
+ *     if op.code == _OP_SCALE:             # <<<<<<<<<<<<<<
+ *         for t in range(n):
+ *             dst[t*ds] = src[t*ss] * a
+*/
+  switch (__pyx_v_op->code) {
+    case __pyx_e_9mylibrary_8_kernels__OP_SCALE:
+
+    /* "mylibrary/_kernels.pxi":231
+ *     cdef real a = <real>op.a, b = <real>op.b, v
+ *     if op.code == _OP_SCALE:
+ *         for t in range(n):             # <<<<<<<<<<<<<<
+ *             dst[t*ds] = src[t*ss] * a
+ *     elif op.code == _OP_OFFSET:
+*/
+
+    __pyx_t_1 = __pyx_v_n;
+    __pyx_t_2 = __pyx_t_1;
+
+    for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+      __pyx_v_t = __pyx_t_3;
+
+      /* "mylibrary/_kernels.pxi":232
+ *     if op.code == _OP_SCALE:
+ *         for t in range(n):
+ *             dst[t*ds] = src[t*ss] * a             # <<<<<<<<<<<<<<
+ *     elif op.code == _OP_OFFSET:
+ *         for t in range(n):
+*/
+      (__pyx_v_dst[(__pyx_v_t * __pyx_v_ds)]) = ((__pyx_v_src[(__pyx_v_t * __pyx_v_ss)]) * __pyx_v_a);
+    }
+
+
+    /* "mylibrary/_kernels.pxi":230
+ *     cdef Py_ssize_t t
+ *     cdef real a = <real>op.a, b = <real>op.b, v
+ *     if op.code == _OP_SCALE:             # <<<<<<<<<<<<<<
+ *         for t in range(n):
+ *             dst[t*ds] = src[t*ss] * a
+*/
+    break;
+    case __pyx_e_9mylibrary_8_kernels__OP_OFFSET:
+
+    /* "mylibrary/_kernels.pxi":234
+ *             dst[t*ds] = src[t*ss] * a
+ *     elif op.code == _OP_OFFSET:
+ *         for t in range(n):             # <<<<<<<<<<<<<<
+ *             dst[t*ds] = src[t*ss] + b
+ *     elif op.code == _OP_SQRT:
+*/
+
+    __pyx_t_1 = __pyx_v_n;
+    __pyx_t_2 = __pyx_t_1;
+
+    for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+      __pyx_v_t = __pyx_t_3;
+
+      /* "mylibrary/_kernels.pxi":235
+ *     elif op.code == _OP_OFFSET:
+ *         for t in range(n):
+ *             dst[t*ds] = src[t*ss] + b             # <<<<<<<<<<<<<<
+ *     elif op.code == _OP_SQRT:
+ *         for t in range(n):
+*/
+      (__pyx_v_dst[(__pyx_v_t * __pyx_v_ds)]) = ((__pyx_v_src[(__pyx_v_t * __pyx_v_ss)]) + __pyx_v_b);
+    }
+
+
+    /* "mylibrary/_kernels.pxi":233
+ *         for t in range(n):
+ *             dst[t*ds] = src[t*ss] * a
+ *     elif op.code == _OP_OFFSET:             # <<<<<<<<<<<<<<
+ *         for t in range(n):
+ *             dst[t*ds] = src[t*ss] + b
+*/
+    break;
+    case __pyx_e_9mylibrary_8_kernels__OP_SQRT:
+
+    /* "mylibrary/_kernels.pxi":237
+ *             dst[t*ds] = src[t*ss] + b
+ *     elif op.code == _OP_SQRT:
+ *         for t in range(n):             # <<<<<<<<<<<<<<
+ *             dst[t*ds] = _sqrt(src[t*ss])
+ *     elif op.code == _OP_CLIP:
+*/
+
+    __pyx_t_1 = __pyx_v_n;
+    __pyx_t_2 = __pyx_t_1;
+
+    for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+      __pyx_v_t = __pyx_t_3;
+
+      /* "mylibrary/_kernels.pxi":238
+ *     elif op.code == _OP_SQRT:
+ *         for t in range(n):
+ *             dst[t*ds] = _sqrt(src[t*ss])             # <<<<<<<<<<<<<<
+ *     elif op.code == _OP_CLIP:
+ *         for t in range(n):
+*/
+      (__pyx_v_dst[(__pyx_v_t * __pyx_v_ds)]) = __pyx_fuse_1__pyx_f_9mylibrary_15_kernels_avx512__sqrt((__pyx_v_src[(__pyx_v_t * __pyx_v_ss)]));
+    }
+
+
+    /* "mylibrary/_kernels.pxi":236
+ *         for t in range(n):
+ *             dst[t*ds] = src[t*ss] + b
+ *     elif op.code == _OP_SQRT:             # <<<<<<<<<<<<<<
+ *         for t in range(n):
+ *             dst[t*ds] = _sqrt(src[t*ss])
+*/
+    break;
+    case __pyx_e_9mylibrary_8_kernels__OP_CLIP:
+
+    /* "mylibrary/_kernels.pxi":240
+ *             dst[t*ds] = _sqrt(src[t*ss])
+ *     elif op.code == _OP_CLIP:
+ *         for t in range(n):             # <<<<<<<<<<<<<<
+ *             v = src[t*ss]
+ *             dst[t*ds] = a if v < a else (b if v > b else v)  # NaN passes through, like np.clip()
+*/
+
+    __pyx_t_1 = __pyx_v_n;
+    __pyx_t_2 = __pyx_t_1;
+
+    for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+      __pyx_v_t = __pyx_t_3;
+
+      /* "mylibrary/_kernels.pxi":241
+ *     elif op.code == _OP_CLIP:
+ *         for t in range(n):
+ *             v = src[t*ss]             # <<<<<<<<<<<<<<
+ *             dst[t*ds] = a if v < a else (b if v > b else v)  # NaN passes through, like np.clip()
+ *     elif op.code == _OP_ABS:
+*/
+      __pyx_v_v = (__pyx_v_src[(__pyx_v_t * __pyx_v_ss)]);
+
+      /* "mylibrary/_kernels.pxi":242
+ *         for t in range(n):
+ *             v = src[t*ss]
+ *             dst[t*ds] = a if v < a else (b if v > b else v)  # NaN passes through, like np.clip()             # <<<<<<<<<<<<<<
+ *     elif op.code == _OP_ABS:
+ *         for t in range(n):
+*/
+      __pyx_t_5 = (__pyx_v_v < __pyx_v_a);
+
+      if (__pyx_t_5) {
+
+        __pyx_t_4 = __pyx_v_a;
+      } else {
+        __pyx_t_7 = (__pyx_v_v > __pyx_v_b);
+
+        if (__pyx_t_7) {
+
+          __pyx_t_6 = __pyx_v_b;
+        } else {
+
+          __pyx_t_6 = __pyx_v_v;
+        }
+
+        __pyx_t_4 = __pyx_t_6;
+      }
+
+      (__pyx_v_dst[(__pyx_v_t * __pyx_v_ds)]) = __pyx_t_4;
+
+    }
+
+
+    /* "mylibrary/_kernels.pxi":239
+ *         for t in range(n):
+ *             dst[t*ds] = _sqrt(src[t*ss])
+ *     elif op.code == _OP_CLIP:             # <<<<<<<<<<<<<<
+ *         for t in range(n):
+ *             v = src[t*ss]
+*/
+    break;
+    case __pyx_e_9mylibrary_8_kernels__OP_ABS:
+
+    /* "mylibrary/_kernels.pxi":244
+ *             dst[t*ds] = a if v < a else (b if v > b else v)  # NaN passes through, like np.clip()
+ *     elif op.code == _OP_ABS:
+ *         for t in range(n):             # <<<<<<<<<<<<<<
+ *             v = src[t*ss]
+ *             dst[t*ds] = -v if v < 0 else v
+*/
+
+    __pyx_t_1 = __pyx_v_n;
+    __pyx_t_2 = __pyx_t_1;
+
+    for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+      __pyx_v_t = __pyx_t_3;
+
+      /* "mylibrary/_kernels.pxi":245
+ *     elif op.code == _OP_ABS:
+ *         for t in range(n):
+ *             v = src[t*ss]             # <<<<<<<<<<<<<<
+ *             dst[t*ds] = -v if v < 0 else v
+ *     elif op.code == _OP_SQUARE:
+*/
+      __pyx_v_v = (__pyx_v_src[(__pyx_v_t * __pyx_v_ss)]);
+
+      /* "mylibrary/_kernels.pxi":246
+ *         for t in range(n):
+ *             v = src[t*ss]
+ *             dst[t*ds] = -v if v < 0 else v             # <<<<<<<<<<<<<<
+ *     elif op.code == _OP_SQUARE:
+ *         for t in range(n):
+*/
+      __pyx_t_5 = (__pyx_v_v < 0.0);
+
+      if (__pyx_t_5) {
+
+        __pyx_t_4 = (-__pyx_v_v);
+      } else {
+
+        __pyx_t_4 = __pyx_v_v;
+      }
+
+      (__pyx_v_dst[(__pyx_v_t * __pyx_v_ds)]) = __pyx_t_4;
+
+    }
+
+
+    /* "mylibrary/_kernels.pxi":243
+ *             v = src[t*ss]
+ *             dst[t*ds] = a if v < a else (b if v > b else v)  # NaN passes through, like np.clip()
+ *     elif op.code == _OP_ABS:             # <<<<<<<<<<<<<<
+ *         for t in range(n):
+ *             v = src[t*ss]
+*/
+    break;
+    case __pyx_e_9mylibrary_8_kernels__OP_SQUARE:
+
+    /* "mylibrary/_kernels.pxi":248
+ *             dst[t*ds] = -v if v < 0 else v
+ *     elif op.code == _OP_SQUARE:
+ *         for t in range(n):             # <<<<<<<<<<<<<<
+ *             v = src[t*ss]
+ *             dst[t*ds] = v * v
+*/
+
+    __pyx_t_1 = __pyx_v_n;
+    __pyx_t_2 = __pyx_t_1;
+
+    for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+      __pyx_v_t = __pyx_t_3;
+
+      /* "mylibrary/_kernels.pxi":249
+ *     elif op.code == _OP_SQUARE:
+ *         for t in range(n):
+ *             v = src[t*ss]             # <<<<<<<<<<<<<<
+ *             dst[t*ds] = v * v
+ * 
+*/
+      __pyx_v_v = (__pyx_v_src[(__pyx_v_t * __pyx_v_ss)]);
+
+      /* "mylibrary/_kernels.pxi":250
+ *         for t in range(n):
+ *             v = src[t*ss]
+ *             dst[t*ds] = v * v             # <<<<<<<<<<<<<<
+ * 
+ * # Run the whole program on a run of elements within one row. The first operation reads x,
+*/
+      (__pyx_v_dst[(__pyx_v_t * __pyx_v_ds)]) = (__pyx_v_v * __pyx_v_v);
+    }
+
+
+    /* "mylibrary/_kernels.pxi":247
+ *             v = src[t*ss]
+ *             dst[t*ds] = -v if v < 0 else v
+ *     elif op.code == _OP_SQUARE:             # <<<<<<<<<<<<<<
+ *         for t in range(n):
+ *             v = src[t*ss]
+*/
+    break;
+    default: break;
+  }
+
+  /* "mylibrary/_kernels.pxi":227
+ *         _apply_op_impl(op, src, ss, dst, ds, n)
+ * 
+ * cdef inline void _apply_op_impl( const _Op* op, const real* src, Py_ssize_t ss, real* dst, Py_ssize_t ds, Py_ssize_t n ) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t t
+ *     cdef real a = <real>op.a, b = <real>op.b, v
+*/
+
+  /* function exit code */
+
+
+
+
+}
+
+/* "mylibrary/_kernels.pxi":255
+ * # the rest work in place on out (which is in cache by then).
+ * #
+ * cdef void _run_ops( const _Op* ops, int nops, const real* x, Py_ssize_t xs, real* out, Py_ssize_t os, Py_ssize_t n ) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t t
+ *     cdef int k
+*/
+
+static void __pyx_fuse_0__pyx_f_9mylibrary_15_kernels_avx512__run_ops(struct __pyx_t_9mylibrary_8_kernels__Op const *__pyx_v_ops, int __pyx_v_nops, float const *__pyx_v_x, Py_ssize_t __pyx_v_xs, float *__pyx_v_out, Py_ssize_t __pyx_v_os, Py_ssize_t __pyx_v_n) {
+  Py_ssize_t __pyx_v_t;
+  int __pyx_v_k;
+  int __pyx_t_1;
+  Py_ssize_t __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  Py_ssize_t __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_t_7;
+
+  /* "mylibrary/_kernels.pxi":258
+ *     cdef Py_ssize_t t
+ *     cdef int k
+ *     if nops == 0:  # identity             # <<<<<<<<<<<<<<
+ *         for t in range(n):
+ *             out[t*os] = x[t*xs]
+*/
+  __pyx_t_1 = (__pyx_v_nops == 0);
+
+  if (__pyx_t_1) {
+
+
+    /* "mylibrary/_kernels.pxi":259
+ *     cdef int k
+ *     if nops == 0:  # identity
+ *         for t in range(n):             # <<<<<<<<<<<<<<
+ *             out[t*os] = x[t*xs]
+ *         return
+*/
+
+    __pyx_t_2 = __pyx_v_n;
+    __pyx_t_3 = __pyx_t_2;
+
+    for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+      __pyx_v_t = __pyx_t_4;
+
+      /* "mylibrary/_kernels.pxi":260
+ *     if nops == 0:  # identity
+ *         for t in range(n):
+ *             out[t*os] = x[t*xs]             # <<<<<<<<<<<<<<
+ *         return
+ *     _apply_op(&ops[0], x, xs, out, os, n)
+*/
+      (__pyx_v_out[(__pyx_v_t * __pyx_v_os)]) = (__pyx_v_x[(__pyx_v_t * __pyx_v_xs)]);
+    }
+
+
+    /* "mylibrary/_kernels.pxi":261
+ *         for t in range(n):
+ *             out[t*os] = x[t*xs]
+ *         return             # <<<<<<<<<<<<<<
+ *     _apply_op(&ops[0], x, xs, out, os, n)
+ *     for k in range(1, nops):
+*/
+    {
+    }
+    goto __pyx_L0;
+
+    /* "mylibrary/_kernels.pxi":258
+ *     cdef Py_ssize_t t
+ *     cdef int k
+ *     if nops == 0:  # identity             # <<<<<<<<<<<<<<
+ *         for t in range(n):
+ *             out[t*os] = x[t*xs]
+*/
+  }
+
+  /* "mylibrary/_kernels.pxi":262
+ *             out[t*os] = x[t*xs]
+ *         return
+ *     _apply_op(&ops[0], x, xs, out, os, n)             # <<<<<<<<<<<<<<
+ *     for k in range(1, nops):
+ *         _apply_op(&ops[k], out, os, out, os, n)
+*/
+  __pyx_fuse_0__pyx_f_9mylibrary_15_kernels_avx512__apply_op((&(__pyx_v_ops[0])), __pyx_v_x, __pyx_v_xs, __pyx_v_out, __pyx_v_os, __pyx_v_n);
+
+  /* "mylibrary/_kernels.pxi":263
+ *         return
+ *     _apply_op(&ops[0], x, xs, out, os, n)
+ *     for k in range(1, nops):             # <<<<<<<<<<<<<<
+ *         _apply_op(&ops[k], out, os, out, os, n)
+ * 
+*/
+
+  __pyx_t_5 = __pyx_v_nops;
+  __pyx_t_6 = __pyx_t_5;
+
+  for (__pyx_t_7 = 1; __pyx_t_7 < __pyx_t_6; __pyx_t_7+=1) {
+    __pyx_v_k = __pyx_t_7;
+
+    /* "mylibrary/_kernels.pxi":264
+ *     _apply_op(&ops[0], x, xs, out, os, n)
+ *     for k in range(1, nops):
+ *         _apply_op(&ops[k], out, os, out, os, n)             # <<<<<<<<<<<<<<
+ * 
+ * # Run the program on block number blk of the flattened (row-major) rank-2 array of m rows, n columns.
+*/
+    __pyx_fuse_0__pyx_f_9mylibrary_15_kernels_avx512__apply_op((&(__pyx_v_ops[__pyx_v_k])), __pyx_v_out, __pyx_v_os, __pyx_v_out, __pyx_v_os, __pyx_v_n);
+  }
+
+
+  /* "mylibrary/_kernels.pxi":255
+ * # the rest work in place on out (which is in cache by then).
+ * #
+ * cdef void _run_ops( const _Op* ops, int nops, const real* x, Py_ssize_t xs, real* out, Py_ssize_t os, Py_ssize_t n ) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t t
+ *     cdef int k
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+
+
+}
+
+static void __pyx_fuse_1__pyx_f_9mylibrary_15_kernels_avx512__run_ops(struct __pyx_t_9mylibrary_8_kernels__Op const *__pyx_v_ops, int __pyx_v_nops, double const *__pyx_v_x, Py_ssize_t __pyx_v_xs, double *__pyx_v_out, Py_ssize_t __pyx_v_os, Py_ssize_t __pyx_v_n) {
+  Py_ssize_t __pyx_v_t;
+  int __pyx_v_k;
+  int __pyx_t_1;
+  Py_ssize_t __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  Py_ssize_t __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_t_7;
+
+  /* "mylibrary/_kernels.pxi":258
+ *     cdef Py_ssize_t t
+ *     cdef int k
+ *     if nops == 0:  # identity             # <<<<<<<<<<<<<<
+ *         for t in range(n):
+ *             out[t*os] = x[t*xs]
+*/
+  __pyx_t_1 = (__pyx_v_nops == 0);
+
+  if (__pyx_t_1) {
+
+
+    /* "mylibrary/_kernels.pxi":259
+ *     cdef int k
+ *     if nops == 0:  # identity
+ *         for t in range(n):             # <<<<<<<<<<<<<<
+ *             out[t*os] = x[t*xs]
+ *         return
+*/
+
+    __pyx_t_2 = __pyx_v_n;
+    __pyx_t_3 = __pyx_t_2;
+
+    for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+      __pyx_v_t = __pyx_t_4;
+
+      /* "mylibrary/_kernels.pxi":260
+ *     if nops == 0:  # identity
+ *         for t in range(n):
+ *             out[t*os] = x[t*xs]             # <<<<<<<<<<<<<<
+ *         return
+ *     _apply_op(&ops[0], x, xs, out, os, n)
+*/
+      (__pyx_v_out[(__pyx_v_t * __pyx_v_os)]) = (__pyx_v_x[(__pyx_v_t * __pyx_v_xs)]);
+    }
+
+
+    /* "mylibrary/_kernels.pxi":261
+ *         for t in range(n):
+ *             out[t*os] = x[t*xs]
+ *         return             # <<<<<<<<<<<<<<
+ *     _apply_op(&ops[0], x, xs, out, os, n)
+ *     for k in range(1, nops):
+*/
+    {
+    }
+    goto __pyx_L0;
+
+    /* "mylibrary/_kernels.pxi":258
+ *     cdef Py_ssize_t t
+ *     cdef int k
+ *     if nops == 0:  # identity             # <<<<<<<<<<<<<<
+ *         for t in range(n):
+ *             out[t*os] = x[t*xs]
+*/
+  }
+
+  /* "mylibrary/_kernels.pxi":262
+ *             out[t*os] = x[t*xs]
+ *         return
+ *     _apply_op(&ops[0], x, xs, out, os, n)             # <<<<<<<<<<<<<<
+ *     for k in range(1, nops):
+ *         _apply_op(&ops[k], out, os, out, os, n)
+*/
+  __pyx_fuse_1__pyx_f_9mylibrary_15_kernels_avx512__apply_op((&(__pyx_v_ops[0])), __pyx_v_x, __pyx_v_xs, __pyx_v_out, __pyx_v_os, __pyx_v_n);
+
+  /* "mylibrary/_kernels.pxi":263
+ *         return
+ *     _apply_op(&ops[0], x, xs, out, os, n)
+ *     for k in range(1, nops):             # <<<<<<<<<<<<<<
+ *         _apply_op(&ops[k], out, os, out, os, n)
+ * 
+*/
+
+  __pyx_t_5 = __pyx_v_nops;
+  __pyx_t_6 = __pyx_t_5;
+
+  for (__pyx_t_7 = 1; __pyx_t_7 < __pyx_t_6; __pyx_t_7+=1) {
+    __pyx_v_k = __pyx_t_7;
+
+    /* "mylibrary/_kernels.pxi":264
+ *     _apply_op(&ops[0], x, xs, out, os, n)
+ *     for k in range(1, nops):
+ *         _apply_op(&ops[k], out, os, out, os, n)             # <<<<<<<<<<<<<<
+ * 
+ * # Run the program on block number blk of the flattened (row-major) rank-2 array of m rows, n columns.
+*/
+    __pyx_fuse_1__pyx_f_9mylibrary_15_kernels_avx512__apply_op((&(__pyx_v_ops[__pyx_v_k])), __pyx_v_out, __pyx_v_os, __pyx_v_out, __pyx_v_os, __pyx_v_n);
+  }
+
+
+  /* "mylibrary/_kernels.pxi":255
+ * # the rest work in place on out (which is in cache by then).
+ * #
+ * cdef void _run_ops( const _Op* ops, int nops, const real* x, Py_ssize_t xs, real* out, Py_ssize_t os, Py_ssize_t n ) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t t
+ *     cdef int k
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+
+
+}
+
+/* "mylibrary/_kernels.pxi":268
+ * # Run the program on block number blk of the flattened (row-major) rank-2 array of m rows, n columns.
+ * #
+ * cdef void _pipeline_block( const _Op* ops, int nops, const real* x, Py_ssize_t xs0, Py_ssize_t xs1,             # <<<<<<<<<<<<<<
+ *                            real* out, Py_ssize_t os0, Py_ssize_t os1,
+ *                            Py_ssize_t m, Py_ssize_t n, Py_ssize_t blk ) noexcept nogil:
+*/
+
+static void __pyx_fuse_0__pyx_f_9mylibrary_15_kernels_avx512__pipeline_block(struct __pyx_t_9mylibrary_8_kernels__Op const *__pyx_v_ops, int __pyx_v_nops, float const *__pyx_v_x, Py_ssize_t __pyx_v_xs0, Py_ssize_t __pyx_v_xs1, float *__pyx_v_out, Py_ssize_t __pyx_v_os0, Py_ssize_t __pyx_v_os1, Py_ssize_t __pyx_v_m, Py_ssize_t __pyx_v_n, Py_ssize_t __pyx_v_blk) {
+  Py_ssize_t __pyx_v_k0;
+  Py_ssize_t __pyx_v_count;
+  Py_ssize_t __pyx_v_i;
+  Py_ssize_t __pyx_v_j;
+  Py_ssize_t __pyx_v_seg;
+  Py_ssize_t __pyx_t_1;
+  Py_ssize_t __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  int __pyx_t_4;
+
+  /* "mylibrary/_kernels.pxi":271
+ *                            real* out, Py_ssize_t os0, Py_ssize_t os1,
+ *                            Py_ssize_t m, Py_ssize_t n, Py_ssize_t blk ) noexcept nogil:
+ *     cdef Py_ssize_t k0 = blk * _PIPELINE_BLOCK             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t count = min(<Py_ssize_t>_PIPELINE_BLOCK, m*n - k0)
+ *     cdef Py_ssize_t i = k0 // n, j = k0 - i*n
+*/
+  __pyx_v_k0 = (__pyx_v_blk * __pyx_e_9mylibrary_8_kernels__PIPELINE_BLOCK);
+
+  /* "mylibrary/_kernels.pxi":272
+ *                            Py_ssize_t m, Py_ssize_t n, Py_ssize_t blk ) noexcept nogil:
+ *     cdef Py_ssize_t k0 = blk * _PIPELINE_BLOCK
+ *     cdef Py_ssize_t count = min(<Py_ssize_t>_PIPELINE_BLOCK, m*n - k0)             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t i = k0 // n, j = k0 - i*n
+ *     cdef Py_ssize_t seg
+*/
+
+  __pyx_t_1 = ((__pyx_v_m * __pyx_v_n) - __pyx_v_k0);
+
+  __pyx_t_2 = ((Py_ssize_t)__pyx_e_9mylibrary_8_kernels__PIPELINE_BLOCK);
+  __pyx_t_4 = (__pyx_t_1 < __pyx_t_2);
+
+  if (__pyx_t_4) {
+
+    __pyx_t_3 = __pyx_t_1;
+  } else {
+
+    __pyx_t_3 = __pyx_t_2;
+  }
+
+  __pyx_v_count = __pyx_t_3;
+
+
+  /* "mylibrary/_kernels.pxi":273
+ *     cdef Py_ssize_t k0 = blk * _PIPELINE_BLOCK
+ *     cdef Py_ssize_t count = min(<Py_ssize_t>_PIPELINE_BLOCK, m*n - k0)
+ *     cdef Py_ssize_t i = k0 // n, j = k0 - i*n             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t seg
+ *     while count > 0:  # a block may straddle rows
+*/
+  __pyx_v_i = (__pyx_v_k0 / __pyx_v_n);
+  __pyx_v_j = (__pyx_v_k0 - (__pyx_v_i * __pyx_v_n));
+
+  /* "mylibrary/_kernels.pxi":275
+ *     cdef Py_ssize_t i = k0 // n, j = k0 - i*n
+ *     cdef Py_ssize_t seg
+ *     while count > 0:  # a block may straddle rows             # <<<<<<<<<<<<<<
+ *         seg = min(count, n - j)
+ *         _run_ops(ops, nops, x + i*xs0 + j*xs1, xs1, out + i*os0 + j*os1, os1, seg)
+*/
+  while (1) {
+    __pyx_t_4 = (__pyx_v_count > 0);
+
+
+    if (!__pyx_t_4) break;
+
+    /* "mylibrary/_kernels.pxi":276
+ *     cdef Py_ssize_t seg
+ *     while count > 0:  # a block may straddle rows
+ *         seg = min(count, n - j)             # <<<<<<<<<<<<<<
+ *         _run_ops(ops, nops, x + i*xs0 + j*xs1, xs1, out + i*os0 + j*os1, os1, seg)
+ *         count -= seg
+*/
+
+    __pyx_t_3 = (__pyx_v_n - __pyx_v_j);
+
+    __pyx_t_1 = __pyx_v_count;
+    __pyx_t_4 = (__pyx_t_3 < __pyx_t_1);
+
+    if (__pyx_t_4) {
+
+      __pyx_t_2 = __pyx_t_3;
+    } else {
+
+      __pyx_t_2 = __pyx_t_1;
+    }
+
+    __pyx_v_seg = __pyx_t_2;
+
+
+    /* "mylibrary/_kernels.pxi":277
+ *     while count > 0:  # a block may straddle rows
+ *         seg = min(count, n - j)
+ *         _run_ops(ops, nops, x + i*xs0 + j*xs1, xs1, out + i*os0 + j*os1, os1, seg)             # <<<<<<<<<<<<<<
+ *         count -= seg
+ *         i += 1
+*/
+    __pyx_fuse_0__pyx_f_9mylibrary_15_kernels_avx512__run_ops(__pyx_v_ops, __pyx_v_nops, ((__pyx_v_x + (__pyx_v_i * __pyx_v_xs0)) + (__pyx_v_j * __pyx_v_xs1)), __pyx_v_xs1, ((__pyx_v_out + (__pyx_v_i * __pyx_v_os0)) + (__pyx_v_j * __pyx_v_os1)), __pyx_v_os1, __pyx_v_seg);
+
+    /* "mylibrary/_kernels.pxi":278
+ *         seg = min(count, n - j)
+ *         _run_ops(ops, nops, x + i*xs0 + j*xs1, xs1, out + i*os0 + j*os1, os1, seg)
+ *         count -= seg             # <<<<<<<<<<<<<<
+ *         i += 1
+ *         j  = 0
+*/
+    __pyx_v_count = (__pyx_v_count - __pyx_v_seg);
+
+    /* "mylibrary/_kernels.pxi":279
+ *         _run_ops(ops, nops, x + i*xs0 + j*xs1, xs1, out + i*os0 + j*os1, os1, seg)
+ *         count -= seg
+ *         i += 1             # <<<<<<<<<<<<<<
+ *         j  = 0
+ * 
+*/
+    __pyx_v_i = (__pyx_v_i + 1);
+
+    /* "mylibrary/_kernels.pxi":280
+ *         count -= seg
+ *         i += 1
+ *         j  = 0             # <<<<<<<<<<<<<<
+ * 
+ * cdef void _pipeline( const _Op* ops, int nops, const real* x, Py_ssize_t xs0, Py_ssize_t xs1,
+*/
+    __pyx_v_j = 0;
+  }
+
+  /* "mylibrary/_kernels.pxi":268
+ * # Run the program on block number blk of the flattened (row-major) rank-2 array of m rows, n columns.
+ * #
+ * cdef void _pipeline_block( const _Op* ops, int nops, const real* x, Py_ssize_t xs0, Py_ssize_t xs1,             # <<<<<<<<<<<<<<
+ *                            real* out, Py_ssize_t os0, Py_ssize_t os1,
+ *                            Py_ssize_t m, Py_ssize_t n, Py_ssize_t blk ) noexcept nogil:
+*/
+
+  /* function exit code */
+
+
+
+
+
+}
+
+static void __pyx_fuse_1__pyx_f_9mylibrary_15_kernels_avx512__pipeline_block(struct __pyx_t_9mylibrary_8_kernels__Op const *__pyx_v_ops, int __pyx_v_nops, double const *__pyx_v_x, Py_ssize_t __pyx_v_xs0, Py_ssize_t __pyx_v_xs1, double *__pyx_v_out, Py_ssize_t __pyx_v_os0, Py_ssize_t __pyx_v_os1, Py_ssize_t __pyx_v_m, Py_ssize_t __pyx_v_n, Py_ssize_t __pyx_v_blk) {
+  Py_ssize_t __pyx_v_k0;
+  Py_ssize_t __pyx_v_count;
+  Py_ssize_t __pyx_v_i;
+  Py_ssize_t __pyx_v_j;
+  Py_ssize_t __pyx_v_seg;
+  Py_ssize_t __pyx_t_1;
+  Py_ssize_t __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  int __pyx_t_4;
+
+  /* "mylibrary/_kernels.pxi":271
+ *                            real* out, Py_ssize_t os0, Py_ssize_t os1,
+ *                            Py_ssize_t m, Py_ssize_t n, Py_ssize_t blk ) noexcept nogil:
+ *     cdef Py_ssize_t k0 = blk * _PIPELINE_BLOCK             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t count = min(<Py_ssize_t>_PIPELINE_BLOCK, m*n - k0)
+ *     cdef Py_ssize_t i = k0 // n, j = k0 - i*n
+*/
+  __pyx_v_k0 = (__pyx_v_blk * __pyx_e_9mylibrary_8_kernels__PIPELINE_BLOCK);
+
+  /* "mylibrary/_kernels.pxi":272
+ *                            Py_ssize_t m, Py_ssize_t n, Py_ssize_t blk ) noexcept nogil:
+ *     cdef Py_ssize_t k0 = blk * _PIPELINE_BLOCK
+ *     cdef Py_ssize_t count = min(<Py_ssize_t>_PIPELINE_BLOCK, m*n - k0)             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t i = k0 // n, j = k0 - i*n
+ *     cdef Py_ssize_t seg
+*/
+
+  __pyx_t_1 = ((__pyx_v_m * __pyx_v_n) - __pyx_v_k0);
+
+  __pyx_t_2 = ((Py_ssize_t)__pyx_e_9mylibrary_8_kernels__PIPELINE_BLOCK);
+  __pyx_t_4 = (__pyx_t_1 < __pyx_t_2);
+
+  if (__pyx_t_4) {
+
+    __pyx_t_3 = __pyx_t_1;
+  } else {
+
+    __pyx_t_3 = __pyx_t_2;
+  }
+
+  __pyx_v_count = __pyx_t_3;
+
+
+  /* "mylibrary/_kernels.pxi":273
+ *     cdef Py_ssize_t k0 = blk * _PIPELINE_BLOCK
+ *     cdef Py_ssize_t count = min(<Py_ssize_t>_PIPELINE_BLOCK, m*n - k0)
+ *     cdef Py_ssize_t i = k0 // n, j = k0 - i*n             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t seg
+ *     while count > 0:  # a block may straddle rows
+*/
+  __pyx_v_i = (__pyx_v_k0 / __pyx_v_n);
+  __pyx_v_j = (__pyx_v_k0 - (__pyx_v_i * __pyx_v_n));
+
+  /* "mylibrary/_kernels.pxi":275
+ *     cdef Py_ssize_t i = k0 // n, j = k0 - i*n
+ *     cdef Py_ssize_t seg
+ *     while count > 0:  # a block may straddle rows             # <<<<<<<<<<<<<<
+ *         seg = min(count, n - j)
+ *         _run_ops(ops, nops, x + i*xs0 + j*xs1, xs1, out + i*os0 + j*os1, os1, seg)
+*/
+  while (1) {
+    __pyx_t_4 = (__pyx_v_count > 0);
+
+
+    if (!__pyx_t_4) break;
+
+    /* "mylibrary/_kernels.pxi":276
+ *     cdef Py_ssize_t seg
+ *     while count > 0:  # a block may straddle rows
+ *         seg = min(count, n - j)             # <<<<<<<<<<<<<<
+ *         _run_ops(ops, nops, x + i*xs0 + j*xs1, xs1, out + i*os0 + j*os1, os1, seg)
+ *         count -= seg
+*/
+
+    __pyx_t_3 = (__pyx_v_n - __pyx_v_j);
+
+    __pyx_t_1 = __pyx_v_count;
+    __pyx_t_4 = (__pyx_t_3 < __pyx_t_1);
+
+    if (__pyx_t_4) {
+
+      __pyx_t_2 = __pyx_t_3;
+    } else {
+
+      __pyx_t_2 = __pyx_t_1;
+    }
+
+    __pyx_v_seg = __pyx_t_2;
+
+
+    /* "mylibrary/_kernels.pxi":277
+ *     while count > 0:  # a block may straddle rows
+ *         seg = min(count, n - j)
+ *         _run_ops(ops, nops, x + i*xs0 + j*xs1, xs1, out + i*os0 + j*os1, os1, seg)             # <<<<<<<<<<<<<<
+ *         count -= seg
+ *         i += 1
+*/
+    __pyx_fuse_1__pyx_f_9mylibrary_15_kernels_avx512__run_ops(__pyx_v_ops, __pyx_v_nops, ((__pyx_v_x + (__pyx_v_i * __pyx_v_xs0)) + (__pyx_v_j * __pyx_v_xs1)), __pyx_v_xs1, ((__pyx_v_out + (__pyx_v_i * __pyx_v_os0)) + (__pyx_v_j * __pyx_v_os1)), __pyx_v_os1, __pyx_v_seg);
+
+    /* "mylibrary/_kernels.pxi":278
+ *         seg = min(count, n - j)
+ *         _run_ops(ops, nops, x + i*xs0 + j*xs1, xs1, out + i*os0 + j*os1, os1, seg)
+ *         count -= seg             # <<<<<<<<<<<<<<
+ *         i += 1
+ *         j  = 0
+*/
+    __pyx_v_count = (__pyx_v_count - __pyx_v_seg);
+
+    /* "mylibrary/_kernels.pxi":279
+ *         _run_ops(ops, nops, x + i*xs0 + j*xs1, xs1, out + i*os0 + j*os1, os1, seg)
+ *         count -= seg
+ *         i += 1             # <<<<<<<<<<<<<<
+ *         j  = 0
+ * 
+*/
+    __pyx_v_i = (__pyx_v_i + 1);
+
+    /* "mylibrary/_kernels.pxi":280
+ *         count -= seg
+ *         i += 1
+ *         j  = 0             # <<<<<<<<<<<<<<
+ * 
+ * cdef void _pipeline( const _Op* ops, int nops, const real* x, Py_ssize_t xs0, Py_ssize_t xs1,
+*/
+    __pyx_v_j = 0;
+  }
+
+  /* "mylibrary/_kernels.pxi":268
+ * # Run the program on block number blk of the flattened (row-major) rank-2 array of m rows, n columns.
+ * #
+ * cdef void _pipeline_block( const _Op* ops, int nops, const real* x, Py_ssize_t xs0, Py_ssize_t xs1,             # <<<<<<<<<<<<<<
+ *                            real* out, Py_ssize_t os0, Py_ssize_t os1,
+ *                            Py_ssize_t m, Py_ssize_t n, Py_ssize_t blk ) noexcept nogil:
+*/
+
+  /* function exit code */
+
+
+
+
+
+}
+
+/* "mylibrary/_kernels.pxi":282
+ *         j  = 0
+ * 
+ * cdef void _pipeline( const _Op* ops, int nops, const real* x, Py_ssize_t xs0, Py_ssize_t xs1,             # <<<<<<<<<<<<<<
+ *                      real* out, Py_ssize_t os0, Py_ssize_t os1,
+ *                      Py_ssize_t m, Py_ssize_t n, int num_threads ) noexcept nogil:
+*/
+
+static void __pyx_fuse_0__pyx_f_9mylibrary_15_kernels_avx512__pipeline(struct __pyx_t_9mylibrary_8_kernels__Op const *__pyx_v_ops, int __pyx_v_nops, float const *__pyx_v_x, Py_ssize_t __pyx_v_xs0, Py_ssize_t __pyx_v_xs1, float *__pyx_v_out, Py_ssize_t __pyx_v_os0, Py_ssize_t __pyx_v_os1, Py_ssize_t __pyx_v_m, Py_ssize_t __pyx_v_n, int __pyx_v_num_threads) {
+  Py_ssize_t __pyx_v_nblocks;
+  Py_ssize_t __pyx_v_blk;
+  Py_ssize_t __pyx_t_1;
+  Py_ssize_t __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+
+  /* "mylibrary/_kernels.pxi":285
+ *                      real* out, Py_ssize_t os0, Py_ssize_t os1,
+ *                      Py_ssize_t m, Py_ssize_t n, int num_threads ) noexcept nogil:
+ *     cdef Py_ssize_t nblocks = (m*n + _PIPELINE_BLOCK - 1) // _PIPELINE_BLOCK             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t blk
+ *     if num_threads == 1:
+*/
+  __pyx_v_nblocks = ((((__pyx_v_m * __pyx_v_n) + __pyx_e_9mylibrary_8_kernels__PIPELINE_BLOCK) - 1) / __pyx_e_9mylibrary_8_kernels__PIPELINE_BLOCK);
+
+  /* "mylibrary/_kernels.pxi":287
+ *     cdef Py_ssize_t nblocks = (m*n + _PIPELINE_BLOCK - 1) // _PIPELINE_BLOCK
+ *     cdef Py_ssize_t blk
+ *     if num_threads == 1:             # <<<<<<<<<<<<<<
+ *         for blk in range(nblocks):
+ *             _pipeline_block(ops, nops, x, xs0, xs1, out, os0, os1, m, n, blk)
+*/
+  switch (__pyx_v_num_threads) {
+    case 1:
+
+    /* "mylibrary/_kernels.pxi":288
+ *     cdef Py_ssize_t blk
+ *     if num_threads == 1:
+ *         for blk in range(nblocks):             # <<<<<<<<<<<<<<
+ *             _pipeline_block(ops, nops, x, xs0, xs1, out, os0, os1, m, n, blk)
+ *     elif num_threads == 0:
+*/
+
+    __pyx_t_1 = __pyx_v_nblocks;
+    __pyx_t_2 = __pyx_t_1;
+
+    for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+      __pyx_v_blk = __pyx_t_3;
+
+      /* "mylibrary/_kernels.pxi":289
+ *     if num_threads == 1:
+ *         for blk in range(nblocks):
+ *             _pipeline_block(ops, nops, x, xs0, xs1, out, os0, os1, m, n, blk)             # <<<<<<<<<<<<<<
+ *     elif num_threads == 0:
+ *         for blk in prange(nblocks, schedule="static"):
+*/
+      __pyx_fuse_0__pyx_f_9mylibrary_15_kernels_avx512__pipeline_block(__pyx_v_ops, __pyx_v_nops, __pyx_v_x, __pyx_v_xs0, __pyx_v_xs1, __pyx_v_out, __pyx_v_os0, __pyx_v_os1, __pyx_v_m, __pyx_v_n, __pyx_v_blk);
+    }
+
+
+    /* "mylibrary/_kernels.pxi":287
+ *     cdef Py_ssize_t nblocks = (m*n + _PIPELINE_BLOCK - 1) // _PIPELINE_BLOCK
+ *     cdef Py_ssize_t blk
+ *     if num_threads == 1:             # <<<<<<<<<<<<<<
+ *         for blk in range(nblocks):
+ *             _pipeline_block(ops, nops, x, xs0, xs1, out, os0, os1, m, n, blk)
+*/
+    break;
+    case 0:
+
+    /* "mylibrary/_kernels.pxi":291
+ *             _pipeline_block(ops, nops, x, xs0, xs1, out, os0, os1, m, n, blk)
+ *     elif num_threads == 0:
+ *         for blk in prange(nblocks, schedule="static"):             # <<<<<<<<<<<<<<
+ *             _pipeline_block(ops, nops, x, xs0, xs1, out, os0, os1, m, n, blk)
+ *     else:
+*/
+    {
+        __Pyx_UnknownThreadState _save;
+        _save = __Pyx_SaveUnknownThread();
+        __Pyx_FastGIL_Remember();
+        /*try:*/ {
+          __pyx_t_1 = __pyx_v_nblocks;
+
+          {
+              #if ((defined(__APPLE__) || defined(__OSX__)) && (defined(__GNUC__) && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))))
+                  #undef likely
+                  #undef unlikely
+                  #define likely(x)   (x)
+                  #define unlikely(x) (x)
+              #endif
+              __pyx_t_3 = (__pyx_t_1 - 0 + 1 - 1/abs(1)) / 1;
+              if (__pyx_t_3 > 0)
+              {
+                  #ifdef _OPENMP
+                  #pragma omp parallel
+                  #endif /* _OPENMP */
+                  {
+                      #ifdef _OPENMP
+                      #pragma omp for nowait firstprivate(__pyx_v_blk) lastprivate(__pyx_v_blk) schedule(static)
+                      #endif /* _OPENMP */
+                      for (__pyx_t_2 = 0; __pyx_t_2 < __pyx_t_3; __pyx_t_2++){
+                          {
+                              __pyx_v_blk = (Py_ssize_t)(0 + 1 * __pyx_t_2);
+
+                              /* "mylibrary/_kernels.pxi":292
+ *     elif num_threads == 0:
+ *         for blk in prange(nblocks, schedule="static"):
+ *             _pipeline_block(ops, nops, x, xs0, xs1, out, os0, os1, m, n, blk)             # <<<<<<<<<<<<<<
+ *     else:
+ *         for blk in prange(nblocks, schedule="static", num_threads=num_threads):
+*/
+                              __pyx_fuse_0__pyx_f_9mylibrary_15_kernels_avx512__pipeline_block(__pyx_v_ops, __pyx_v_nops, __pyx_v_x, __pyx_v_xs0, __pyx_v_xs1, __pyx_v_out, __pyx_v_os0, __pyx_v_os1, __pyx_v_m, __pyx_v_n, __pyx_v_blk);
+                          }
+                      }
+                  }
+              }
+          }
+          #if ((defined(__APPLE__) || defined(__OSX__)) && (defined(__GNUC__) && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))))
+              #undef likely
+              #undef unlikely
+              #define likely(x)   __builtin_expect(!!(x), 1)
+              #define unlikely(x) __builtin_expect(!!(x), 0)
+          #endif
+
+        }
+
+        /* "mylibrary/_kernels.pxi":291
+ *             _pipeline_block(ops, nops, x, xs0, xs1, out, os0, os1, m, n, blk)
+ *     elif num_threads == 0:
+ *         for blk in prange(nblocks, schedule="static"):             # <<<<<<<<<<<<<<
+ *             _pipeline_block(ops, nops, x, xs0, xs1, out, os0, os1, m, n, blk)
+ *     else:
+*/
+        /*finally:*/ {
+          /*normal exit:*/{
+            __Pyx_FastGIL_Forget();
+            __Pyx_RestoreUnknownThread(_save);
+            goto __pyx_L7;
+          }
+          __pyx_L7:;
+        }
+    }
+
+    /* "mylibrary/_kernels.pxi":290
+ *         for blk in range(nblocks):
+ *             _pipeline_block(ops, nops, x, xs0, xs1, out, os0, os1, m, n, blk)
+ *     elif num_threads == 0:             # <<<<<<<<<<<<<<
+ *         for blk in prange(nblocks, schedule="static"):
+ *             _pipeline_block(ops, nops, x, xs0, xs1, out, os0, os1, m, n, blk)
+*/
+    break;
+    default:
+
+    /* "mylibrary/_kernels.pxi":294
+ *             _pipeline_block(ops, nops, x, xs0, xs1, out, os0, os1, m, n, blk)
+ *     else:
+ *         for blk in prange(nblocks, schedule="static", num_threads=num_threads):             # <<<<<<<<<<<<<<
+ *             _pipeline_block(ops, nops, x, xs0, xs1, out, os0, os1, m, n, blk)
+ * 
+*/
+    {
+        __Pyx_UnknownThreadState _save;
+        _save = __Pyx_SaveUnknownThread();
+        __Pyx_FastGIL_Remember();
+        /*try:*/ {
+          __pyx_t_3 = __pyx_v_nblocks;
+
+          {
+              #if ((defined(__APPLE__) || defined(__OSX__)) && (defined(__GNUC__) && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))))
+                  #undef likely
+                  #undef unlikely
+                  #define likely(x)   (x)
+                  #define unlikely(x) (x)
+              #endif
+              __pyx_t_1 = (__pyx_t_3 - 0 + 1 - 1/abs(1)) / 1;
+              if (__pyx_t_1 > 0)
+              {
+                  #ifdef _OPENMP
+                  #pragma omp parallel num_threads(__pyx_v_num_threads != 0 ? __pyx_v_num_threads : omp_get_max_threads())
+                  #endif /* _OPENMP */
+                  {
+                      #ifdef _OPENMP
+                      #pragma omp for nowait firstprivate(__pyx_v_blk) lastprivate(__pyx_v_blk) schedule(static)
+                      #endif /* _OPENMP */
+                      for (__pyx_t_2 = 0; __pyx_t_2 < __pyx_t_1; __pyx_t_2++){
+                          {
+                              __pyx_v_blk = (Py_ssize_t)(0 + 1 * __pyx_t_2);
+
+                              /* "mylibrary/_kernels.pxi":295
+ *     else:
+ *         for blk in prange(nblocks, schedule="static", num_threads=num_threads):
+ *             _pipeline_block(ops, nops, x, xs0, xs1, out, os0, os1, m, n, blk)             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+                              __pyx_fuse_0__pyx_f_9mylibrary_15_kernels_avx512__pipeline_block(__pyx_v_ops, __pyx_v_nops, __pyx_v_x, __pyx_v_xs0, __pyx_v_xs1, __pyx_v_out, __pyx_v_os0, __pyx_v_os1, __pyx_v_m, __pyx_v_n, __pyx_v_blk);
+                          }
+                      }
+                  }
+              }
+          }
+          #if ((defined(__APPLE__) || defined(__OSX__)) && (defined(__GNUC__) && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))))
+              #undef likely
+              #undef unlikely
+              #define likely(x)   __builtin_expect(!!(x), 1)
+              #define unlikely(x) __builtin_expect(!!(x), 0)
+          #endif
+
+        }
+
+        /* "mylibrary/_kernels.pxi":294
+ *             _pipeline_block(ops, nops, x, xs0, xs1, out, os0, os1, m, n, blk)
+ *     else:
+ *         for blk in prange(nblocks, schedule="static", num_threads=num_threads):             # <<<<<<<<<<<<<<
+ *             _pipeline_block(ops, nops, x, xs0, xs1, out, os0, os1, m, n, blk)
+ * 
+*/
+        /*finally:*/ {
+          /*normal exit:*/{
+            __Pyx_FastGIL_Forget();
+            __Pyx_RestoreUnknownThread(_save);
+            goto __pyx_L16;
+          }
+          __pyx_L16:;
+        }
+    }
+    break;
+  }
+
+  /* "mylibrary/_kernels.pxi":282
+ *         j  = 0
+ * 
+ * cdef void _pipeline( const _Op* ops, int nops, const real* x, Py_ssize_t xs0, Py_ssize_t xs1,             # <<<<<<<<<<<<<<
+ *                      real* out, Py_ssize_t os0, Py_ssize_t os1,
+ *                      Py_ssize_t m, Py_ssize_t n, int num_threads ) noexcept nogil:
+*/
+
+  /* function exit code */
+
+
+}
+
+static void __pyx_fuse_1__pyx_f_9mylibrary_15_kernels_avx512__pipeline(struct __pyx_t_9mylibrary_8_kernels__Op const *__pyx_v_ops, int __pyx_v_nops, double const *__pyx_v_x, Py_ssize_t __pyx_v_xs0, Py_ssize_t __pyx_v_xs1, double *__pyx_v_out, Py_ssize_t __pyx_v_os0, Py_ssize_t __pyx_v_os1, Py_ssize_t __pyx_v_m, Py_ssize_t __pyx_v_n, int __pyx_v_num_threads) {
+  Py_ssize_t __pyx_v_nblocks;
+  Py_ssize_t __pyx_v_blk;
+  Py_ssize_t __pyx_t_1;
+  Py_ssize_t __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+
+  /* "mylibrary/_kernels.pxi":285
+ *                      real* out, Py_ssize_t os0, Py_ssize_t os1,
+ *                      Py_ssize_t m, Py_ssize_t n, int num_threads ) noexcept nogil:
+ *     cdef Py_ssize_t nblocks = (m*n + _PIPELINE_BLOCK - 1) // _PIPELINE_BLOCK             # <<<<<<<<<<<<<<
+ *     cdef Py_ssize_t blk
+ *     if num_threads == 1:
+*/
+  __pyx_v_nblocks = ((((__pyx_v_m * __pyx_v_n) + __pyx_e_9mylibrary_8_kernels__PIPELINE_BLOCK) - 1) / __pyx_e_9mylibrary_8_kernels__PIPELINE_BLOCK);
+
+  /* "mylibrary/_kernels.pxi":287
+ *     cdef Py_ssize_t nblocks = (m*n + _PIPELINE_BLOCK - 1) // _PIPELINE_BLOCK
+ *     cdef Py_ssize_t blk
+ *     if num_threads == 1:             # <<<<<<<<<<<<<<
+ *         for blk in range(nblocks):
+ *             _pipeline_block(ops, nops, x, xs0, xs1, out, os0, os1, m, n, blk)
+*/
+  switch (__pyx_v_num_threads) {
+    case 1:
+
+    /* "mylibrary/_kernels.pxi":288
+ *     cdef Py_ssize_t blk
+ *     if num_threads == 1:
+ *         for blk in range(nblocks):             # <<<<<<<<<<<<<<
+ *             _pipeline_block(ops, nops, x, xs0, xs1, out, os0, os1, m, n, blk)
+ *     elif num_threads == 0:
+*/
+
+    __pyx_t_1 = __pyx_v_nblocks;
+    __pyx_t_2 = __pyx_t_1;
+
+    for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+      __pyx_v_blk = __pyx_t_3;
+
+      /* "mylibrary/_kernels.pxi":289
+ *     if num_threads == 1:
+ *         for blk in range(nblocks):
+ *             _pipeline_block(ops, nops, x, xs0, xs1, out, os0, os1, m, n, blk)             # <<<<<<<<<<<<<<
+ *     elif num_threads == 0:
+ *         for blk in prange(nblocks, schedule="static"):
+*/
+      __pyx_fuse_1__pyx_f_9mylibrary_15_kernels_avx512__pipeline_block(__pyx_v_ops, __pyx_v_nops, __pyx_v_x, __pyx_v_xs0, __pyx_v_xs1, __pyx_v_out, __pyx_v_os0, __pyx_v_os1, __pyx_v_m, __pyx_v_n, __pyx_v_blk);
+    }
+
+
+    /* "mylibrary/_kernels.pxi":287
+ *     cdef Py_ssize_t nblocks = (m*n + _PIPELINE_BLOCK - 1) // _PIPELINE_BLOCK
+ *     cdef Py_ssize_t blk
+ *     if num_threads == 1:             # <<<<<<<<<<<<<<
+ *         for blk in range(nblocks):
+ *             _pipeline_block(ops, nops, x, xs0, xs1, out, os0, os1, m, n, blk)
+*/
+    break;
+    case 0:
+
+    /* "mylibrary/_kernels.pxi":291
+ *             _pipeline_block(ops, nops, x, xs0, xs1, out, os0, os1, m, n, blk)
+ *     elif num_threads == 0:
+ *         for blk in prange(nblocks, schedule="static"):             # <<<<<<<<<<<<<<
+ *             _pipeline_block(ops, nops, x, xs0, xs1, out, os0, os1, m, n, blk)
+ *     else:
+*/
+    {
+        __Pyx_UnknownThreadState _save;
+        _save = __Pyx_SaveUnknownThread();
+        __Pyx_FastGIL_Remember();
+        /*try:*/ {
+          __pyx_t_1 = __pyx_v_nblocks;
+
+          {
+              #if ((defined(__APPLE__) || defined(__OSX__)) && (defined(__GNUC__) && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))))
+                  #undef likely
+                  #undef unlikely
+                  #define likely(x)   (x)
+                  #define unlikely(x) (x)
+              #endif
+              __pyx_t_3 = (__pyx_t_1 - 0 + 1 - 1/abs(1)) / 1;
+              if (__pyx_t_3 > 0)
+              {
+                  #ifdef _OPENMP
+                  #pragma omp parallel
+                  #endif /* _OPENMP */
+                  {
+                      #ifdef _OPENMP
+                      #pragma omp for nowait firstprivate(__pyx_v_blk) lastprivate(__pyx_v_blk) schedule(static)
+                      #endif /* _OPENMP */
+                      for (__pyx_t_2 = 0; __pyx_t_2 < __pyx_t_3; __pyx_t_2++){
+                          {
+                              __pyx_v_blk = (Py_ssize_t)(0 + 1 * __pyx_t_2);
+
+                              /* "mylibrary/_kernels.pxi":292
+ *     elif num_threads == 0:
+ *         for blk in prange(nblocks, schedule="static"):
+ *             _pipeline_block(ops, nops, x, xs0, xs1, out, os0, os1, m, n, blk)             # <<<<<<<<<<<<<<
+ *     else:
+ *         for blk in prange(nblocks, schedule="static", num_threads=num_threads):
+*/
+                              __pyx_fuse_1__pyx_f_9mylibrary_15_kernels_avx512__pipeline_block(__pyx_v_ops, __pyx_v_nops, __pyx_v_x, __pyx_v_xs0, __pyx_v_xs1, __pyx_v_out, __pyx_v_os0, __pyx_v_os1, __pyx_v_m, __pyx_v_n, __pyx_v_blk);
+                          }
+                      }
+                  }
+              }
+          }
+          #if ((defined(__APPLE__) || defined(__OSX__)) && (defined(__GNUC__) && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))))
+              #undef likely
+              #undef unlikely
+              #define likely(x)   __builtin_expect(!!(x), 1)
+              #define unlikely(x) __builtin_expect(!!(x), 0)
+          #endif
+
+        }
+
+        /* "mylibrary/_kernels.pxi":291
+ *             _pipeline_block(ops, nops, x, xs0, xs1, out, os0, os1, m, n, blk)
+ *     elif num_threads == 0:
+ *         for blk in prange(nblocks, schedule="static"):             # <<<<<<<<<<<<<<
+ *             _pipeline_block(ops, nops, x, xs0, xs1, out, os0, os1, m, n, blk)
+ *     else:
+*/
+        /*finally:*/ {
+          /*normal exit:*/{
+            __Pyx_FastGIL_Forget();
+            __Pyx_RestoreUnknownThread(_save);
+            goto __pyx_L7;
+          }
+          __pyx_L7:;
+        }
+    }
+
+    /* "mylibrary/_kernels.pxi":290
+ *         for blk in range(nblocks):
+ *             _pipeline_block(ops, nops, x, xs0, xs1, out, os0, os1, m, n, blk)
+ *     elif num_threads == 0:             # <<<<<<<<<<<<<<
+ *         for blk in prange(nblocks, schedule="static"):
+ *             _pipeline_block(ops, nops, x, xs0, xs1, out, os0, os1, m, n, blk)
+*/
+    break;
+    default:
+
+    /* "mylibrary/_kernels.pxi":294
+ *             _pipeline_block(ops, nops, x, xs0, xs1, out, os0, os1, m, n, blk)
+ *     else:
+ *         for blk in prange(nblocks, schedule="static", num_threads=num_threads):             # <<<<<<<<<<<<<<
+ *             _pipeline_block(ops, nops, x, xs0, xs1, out, os0, os1, m, n, blk)
+ * 
+*/
+    {
+        __Pyx_UnknownThreadState _save;
+        _save = __Pyx_SaveUnknownThread();
+        __Pyx_FastGIL_Remember();
+        /*try:*/ {
+          __pyx_t_3 = __pyx_v_nblocks;
+
+          {
+              #if ((defined(__APPLE__) || defined(__OSX__)) && (defined(__GNUC__) && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))))
+                  #undef likely
+                  #undef unlikely
+                  #define likely(x)   (x)
+                  #define unlikely(x) (x)
+              #endif
+              __pyx_t_1 = (__pyx_t_3 - 0 + 1 - 1/abs(1)) / 1;
+              if (__pyx_t_1 > 0)
+              {
+                  #ifdef _OPENMP
+                  #pragma omp parallel num_threads(__pyx_v_num_threads != 0 ? __pyx_v_num_threads : omp_get_max_threads())
+                  #endif /* _OPENMP */
+                  {
+                      #ifdef _OPENMP
+                      #pragma omp for nowait firstprivate(__pyx_v_blk) lastprivate(__pyx_v_blk) schedule(static)
+                      #endif /* _OPENMP */
+                      for (__pyx_t_2 = 0; __pyx_t_2 < __pyx_t_1; __pyx_t_2++){
+                          {
+                              __pyx_v_blk = (Py_ssize_t)(0 + 1 * __pyx_t_2);
+
+                              /* "mylibrary/_kernels.pxi":295
+ *     else:
+ *         for blk in prange(nblocks, schedule="static", num_threads=num_threads):
+ *             _pipeline_block(ops, nops, x, xs0, xs1, out, os0, os1, m, n, blk)             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+                              __pyx_fuse_1__pyx_f_9mylibrary_15_kernels_avx512__pipeline_block(__pyx_v_ops, __pyx_v_nops, __pyx_v_x, __pyx_v_xs0, __pyx_v_xs1, __pyx_v_out, __pyx_v_os0, __pyx_v_os1, __pyx_v_m, __pyx_v_n, __pyx_v_blk);
+                          }
+                      }
+                  }
+              }
+          }
+          #if ((defined(__APPLE__) || defined(__OSX__)) && (defined(__GNUC__) && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))))
+              #undef likely
+              #undef unlikely
+              #define likely(x)   __builtin_expect(!!(x), 1)
+              #define unlikely(x) __builtin_expect(!!(x), 0)
+          #endif
+
+        }
+
+        /* "mylibrary/_kernels.pxi":294
+ *             _pipeline_block(ops, nops, x, xs0, xs1, out, os0, os1, m, n, blk)
+ *     else:
+ *         for blk in prange(nblocks, schedule="static", num_threads=num_threads):             # <<<<<<<<<<<<<<
+ *             _pipeline_block(ops, nops, x, xs0, xs1, out, os0, os1, m, n, blk)
+ * 
+*/
+        /*finally:*/ {
+          /*normal exit:*/{
+            __Pyx_FastGIL_Forget();
+            __Pyx_RestoreUnknownThread(_save);
+            goto __pyx_L16;
+          }
+          __pyx_L16:;
+        }
+    }
+    break;
+  }
+
+  /* "mylibrary/_kernels.pxi":282
+ *         j  = 0
+ * 
+ * cdef void _pipeline( const _Op* ops, int nops, const real* x, Py_ssize_t xs0, Py_ssize_t xs1,             # <<<<<<<<<<<<<<
+ *                      real* out, Py_ssize_t os0, Py_ssize_t os1,
+ *                      Py_ssize_t m, Py_ssize_t n, int num_threads ) noexcept nogil:
+*/
+
+  /* function exit code */
+
+
+}
+/* #### Code section: module_exttypes ### */
+
+static PyMethodDef __pyx_methods[] = {
+  {0, 0, 0, 0}
+};
+/* #### Code section: initfunc_declarations ### */
+static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_InitGlobals(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_InitAfterSharedUtility(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_InitConstants(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_Global_init_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_Variable_export_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_Function_export_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_Type_import_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_Variable_import_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_Function_import_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_CreateCodeObjects(__pyx_mstatetype *__pyx_mstate); /*proto*/
+/* #### Code section: init_module ### */
+
+static int __Pyx_modinit_Global_init_code(__pyx_mstatetype *__pyx_mstate) {
+  __Pyx_RefNannyDeclarations
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  __Pyx_RefNannySetupContext("__Pyx_modinit_Global_init_code", 0);
+  /*--- Global init code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_Variable_export_code(__pyx_mstatetype *__pyx_mstate) {
+  __Pyx_RefNannyDeclarations
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  __Pyx_RefNannySetupContext("__Pyx_modinit_Variable_export_code", 0);
+  /*--- Variable export code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_Function_export_code(__pyx_mstatetype *__pyx_mstate) {
+  __Pyx_RefNannyDeclarations
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  __Pyx_RefNannySetupContext("__Pyx_modinit_Function_export_code", 0);
+  /*--- Function export code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_Type_import_code(__pyx_mstatetype *__pyx_mstate) {
+  __Pyx_RefNannyDeclarations
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  __Pyx_RefNannySetupContext("__Pyx_modinit_Type_import_code", 0);
+  /*--- Type import code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_Variable_import_code(__pyx_mstatetype *__pyx_mstate) {
+  __Pyx_RefNannyDeclarations
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  __Pyx_RefNannySetupContext("__Pyx_modinit_Variable_import_code", 0);
+  /*--- Variable import code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_Function_import_code(__pyx_mstatetype *__pyx_mstate) {
+  __Pyx_RefNannyDeclarations
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  __Pyx_RefNannySetupContext("__Pyx_modinit_Function_import_code", 0);
+  /*--- Function import code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+static PyObject* __pyx_pymod_create(PyObject *spec, PyModuleDef *def); /*proto*/
+static int __pyx_pymod_exec__kernels_avx512(PyObject* module); /*proto*/
+static PyModuleDef_Slot __pyx_moduledef_slots[] = {
+  {Py_mod_create, (void*)__pyx_pymod_create},
+  {Py_mod_exec, (void*)__pyx_pymod_exec__kernels_avx512},
+  #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+  {Py_mod_gil, __Pyx_FREETHREADING_COMPATIBLE},
+  #endif
+  #if PY_VERSION_HEX >= 0x030C0000 && CYTHON_USE_MODULE_STATE
+  {Py_mod_multiple_interpreters, Py_MOD_MULTIPLE_INTERPRETERS_NOT_SUPPORTED},
+  #endif
+  {0, NULL}
+};
+#endif
+
+#ifdef __cplusplus
+namespace {
+  struct PyModuleDef __pyx_moduledef =
+  #else
+  static struct PyModuleDef __pyx_moduledef =
+  #endif
+  {
+      PyModuleDef_HEAD_INIT,
+      "_kernels_avx512",
+      __pyx_k_Kernels_of_mylibrary_compute_com, /* m_doc */
+    #if CYTHON_USE_MODULE_STATE
+      sizeof(__pyx_mstatetype), /* m_size */
+    #else
+      (CYTHON_PEP489_MULTI_PHASE_INIT) ? 0 : -1, /* m_size */
+    #endif
+      __pyx_methods /* m_methods */,
+    #if CYTHON_PEP489_MULTI_PHASE_INIT
+      __pyx_moduledef_slots, /* m_slots */
+    #else
+      NULL, /* m_reload */
+    #endif
+    #if CYTHON_USE_MODULE_STATE
+      __pyx_m_traverse, /* m_traverse */
+      __pyx_m_clear, /* m_clear */
+      NULL /* m_free */
+    #else
+      NULL, /* m_traverse */
+      NULL, /* m_clear */
+      NULL /* m_free */
+    #endif
+  };
+  #ifdef __cplusplus
+} /* anonymous namespace */
+#endif
+
+/* PyModInitFuncType */
+#ifndef CYTHON_NO_PYINIT_EXPORT
+  #define __Pyx_PyMODINIT_FUNC PyMODINIT_FUNC
+#else
+  #ifdef __cplusplus
+  #define __Pyx_PyMODINIT_FUNC extern "C" PyObject *
+  #else
+  #define __Pyx_PyMODINIT_FUNC PyObject *
+  #endif
+#endif
+
+__Pyx_PyMODINIT_FUNC PyInit__kernels_avx512(void) CYTHON_SMALL_CODE; /*proto*/
+__Pyx_PyMODINIT_FUNC PyInit__kernels_avx512(void)
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+{
+  return PyModuleDef_Init(&__pyx_moduledef);
+}
+/* ModuleCreationPEP489 */
+#if CYTHON_COMPILING_IN_LIMITED_API && (__PYX_LIMITED_VERSION_HEX < 0x030A0000 &&\
+      (defined(_WIN32) || defined(WIN32) || defined(MS_WINDOWS)))
+static PY_INT64_T __Pyx_GetCurrentInterpreterId(void) {
+    {
+        PyObject *module = PyImport_ImportModule("_interpreters"); // 3.13+ I think
+        if (!module) {
+            if (!PyErr_ExceptionMatches(PyExc_Exception)) {
+                goto bad; // BaseException
+            }
+            PyErr_Clear(); // just try the 3.8-3.12 version
+            module = PyImport_ImportModule("_xxsubinterpreters");
+            if (!module) goto bad;
+        }
+        PyObject *current = PyObject_CallMethod(module, "get_current", NULL);
+        Py_DECREF(module);
+        if (!current) goto bad;
+        if (PyTuple_Check(current)) {
+            PyObject *new_current = PySequence_GetItem(current, 0);
+            Py_DECREF(current);
+            current = new_current;
+            if (!new_current) goto bad;
+        }
+        long long as_c_int = PyLong_AsLongLong(current);
+        Py_DECREF(current);
+        return as_c_int;
+    }
+  bad:
+    PySys_WriteStderr("__Pyx_GetCurrentInterpreterId failed. Try setting the C define CYTHON_PEP489_MULTI_PHASE_INIT=0\n");
+    return -1;
+}
+#endif
+#if !CYTHON_USE_MODULE_STATE
+static CYTHON_SMALL_CODE int __Pyx_check_single_interpreter(void) {
+    static PY_INT64_T main_interpreter_id = -1;
+#if CYTHON_COMPILING_IN_GRAAL && defined(GRAALPY_VERSION_NUM) && GRAALPY_VERSION_NUM > 0x19000000
+    PY_INT64_T current_id = GraalPyInterpreterState_GetIDFromThreadState(PyThreadState_Get());
+#elif CYTHON_COMPILING_IN_GRAAL
+    PY_INT64_T current_id = PyInterpreterState_GetIDFromThreadState(PyThreadState_Get());
+#elif CYTHON_COMPILING_IN_LIMITED_API && (__PYX_LIMITED_VERSION_HEX < 0x030A0000 &&\
+      (defined(_WIN32) || defined(WIN32) || defined(MS_WINDOWS)))
+    PY_INT64_T current_id = __Pyx_GetCurrentInterpreterId();
+#elif CYTHON_COMPILING_IN_LIMITED_API
+    PY_INT64_T current_id = PyInterpreterState_GetID(PyInterpreterState_Get());
+#else
+    PY_INT64_T current_id = PyInterpreterState_GetID(PyThreadState_Get()->interp);
+#endif
+    if (unlikely(current_id == -1)) {
+        return -1;
+    }
+    if (main_interpreter_id == -1) {
+        main_interpreter_id = current_id;
+        return 0;
+    } else if (unlikely(main_interpreter_id != current_id)) {
+        PyErr_SetString(
+            PyExc_ImportError,
+            "Interpreter change detected - this module can only be loaded into one interpreter per process.");
+        return -1;
+    }
+    return 0;
+}
+#endif
+static CYTHON_SMALL_CODE int __Pyx_copy_spec_to_module(PyObject *spec, PyObject *moddict, const char* from_name, const char* to_name, int allow_none)
+{
+    PyObject *value = PyObject_GetAttrString(spec, from_name);
+    int result = 0;
+    if (likely(value)) {
+        if (allow_none || value != Py_None) {
+            result = PyDict_SetItemString(moddict, to_name, value);
+        }
+        Py_DECREF(value);
+    } else if (PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        PyErr_Clear();
+    } else {
+        result = -1;
+    }
+    return result;
+}
+static CYTHON_SMALL_CODE PyObject* __pyx_pymod_create(PyObject *spec, PyModuleDef *def) {
+    PyObject *module = NULL, *moddict, *modname;
+    CYTHON_UNUSED_VAR(def);
+    #if !CYTHON_USE_MODULE_STATE
+    if (__Pyx_check_single_interpreter())
+        return NULL;
+    #endif
+    if (__pyx_m)
+        return __Pyx_NewRef(__pyx_m);
+    modname = PyObject_GetAttrString(spec, "name");
+    if (unlikely(!modname)) goto bad;
+    module = PyModule_NewObject(modname);
+    Py_DECREF(modname);
+    if (unlikely(!module)) goto bad;
+    moddict = PyModule_GetDict(module);
+    if (unlikely(!moddict)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "loader", "__loader__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "origin", "__file__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "parent", "__package__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "submodule_search_locations", "__path__", 0) < 0)) goto bad;
+    return module;
+bad:
+    Py_XDECREF(module);
+    return NULL;
+}
+
+
+static CYTHON_SMALL_CODE int __pyx_pymod_exec__kernels_avx512(PyObject *__pyx_pyinit_module)
+#endif
+{
+  int stringtab_initialized = 0;
+  #if CYTHON_USE_MODULE_STATE
+  int pystate_addmodule_run = 0;
+  #endif
+  __pyx_mstatetype *__pyx_mstate = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannyDeclarations
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  if (__pyx_m) {
+    if (__pyx_m == __pyx_pyinit_module) return 0;
+    PyErr_SetString(PyExc_RuntimeError, "Module '_kernels_avx512' has already been imported. Re-initialisation is not supported.");
+    return -1;
+  }
+  #else
+  if (__pyx_m) return __Pyx_NewRef(__pyx_m);
+  #endif
+  /*--- Module creation code ---*/
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  __pyx_t_1 = __pyx_pyinit_module;
+  Py_INCREF(__pyx_t_1);
+  #else
+  __pyx_t_1 = PyModule_Create(&__pyx_moduledef); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #if CYTHON_USE_MODULE_STATE
+  {
+    int add_module_result = __Pyx_State_AddModule(__pyx_t_1, &__pyx_moduledef);
+    __pyx_t_1 = 0; /* transfer ownership from __pyx_t_1 to "_kernels_avx512" pseudovariable */
+    if (unlikely((add_module_result < 0))) __PYX_ERR(0, 1, __pyx_L1_error)
+    pystate_addmodule_run = 1;
+  }
+  #else
+  __pyx_m = __pyx_t_1;
+  #endif
+  #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+  PyUnstable_Module_SetGIL(__pyx_m, Py_MOD_GIL_USED);
+  #endif
+  __pyx_mstate = __pyx_mstate_global;
+  CYTHON_UNUSED_VAR(__pyx_t_1);
+  __pyx_mstate->__pyx_d = PyModule_GetDict(__pyx_m); if (unlikely(!__pyx_mstate->__pyx_d)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_mstate->__pyx_d);
+  __pyx_mstate->__pyx_b = __Pyx_PyImport_AddModuleRef(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_mstate->__pyx_b)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_mstate->__pyx_cython_runtime = __Pyx_PyImport_AddModuleRef("cython_runtime"); if (unlikely(!__pyx_mstate->__pyx_cython_runtime)) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (PyObject_SetAttrString(__pyx_m, "__builtins__", __pyx_mstate->__pyx_b) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /* ImportRefnannyAPI */
+  #if CYTHON_REFNANNY
+  __Pyx_RefNanny = __Pyx_RefNannyImportAPI("refnanny");
+  if (!__Pyx_RefNanny) {
+    if (PyErr_ExceptionMatches(PyExc_Exception)) {
+      PyErr_Clear();
+      __Pyx_RefNanny = __Pyx_RefNannyImportAPI("Cython.Runtime.refnanny");
+    }
+    if (!__Pyx_RefNanny)
+        Py_FatalError("failed to import 'refnanny' module");
+  }
+  #endif
+  
+__Pyx_RefNannySetupContext("PyInit__kernels_avx512", 0);
+  __Pyx_init_runtime_version();
+  if (__Pyx_check_binary_version(__PYX_LIMITED_VERSION_HEX, __Pyx_get_runtime_version(), CYTHON_COMPILING_IN_LIMITED_API) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_mstate->__pyx_empty_tuple = PyTuple_New(0); if (unlikely(!__pyx_mstate->__pyx_empty_tuple)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_mstate->__pyx_empty_bytes = PyBytes_FromStringAndSize("", 0); if (unlikely(!__pyx_mstate->__pyx_empty_bytes)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_mstate->__pyx_empty_unicode = PyUnicode_FromStringAndSize("", 0); if (unlikely(!__pyx_mstate->__pyx_empty_unicode)) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Library function declarations ---*/
+  /*--- Initialize various global constants etc. ---*/
+  if (__Pyx_InitConstants(__pyx_mstate) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  stringtab_initialized = 1;
+  if (__Pyx_InitGlobals() < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__pyx_module_is_main_mylibrary___kernels_avx512) {
+    if (PyObject_SetAttr(__pyx_m, __pyx_mstate_global->__pyx_n_u_name, __pyx_mstate_global->__pyx_n_u_main) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  }
+  {
+    PyObject *modules = PyImport_GetModuleDict(); if (unlikely(!modules)) __PYX_ERR(0, 1, __pyx_L1_error)
+    if (!PyDict_GetItemString(modules, "mylibrary._kernels_avx512")) {
+      if (unlikely((PyDict_SetItemString(modules, "mylibrary._kernels_avx512", __pyx_m) < 0))) __PYX_ERR(0, 1, __pyx_L1_error)
+    }
+  }
+  /*--- Builtin init code ---*/
+  if (__Pyx_InitCachedBuiltins(__pyx_mstate) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Constants init code ---*/
+  if (__Pyx_InitCachedConstants(__pyx_mstate) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_CreateCodeObjects(__pyx_mstate) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Global type/function init code ---*/
+  (void)__Pyx_modinit_Global_init_code(__pyx_mstate);
+  (void)__Pyx_modinit_Variable_export_code(__pyx_mstate);
+  (void)__Pyx_modinit_Function_export_code(__pyx_mstate);
+  /*--- Type init code ---*/
+  (void)__Pyx_modinit_Type_import_code(__pyx_mstate);
+  (void)__Pyx_modinit_Variable_import_code(__pyx_mstate);
+  (void)__Pyx_modinit_Function_import_code(__pyx_mstate);
+  if (__Pyx_InitAfterSharedUtility() < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Execution code ---*/
+
+  /* "mylibrary/_kernels.pxi":303
+ * 
+ * cdef KernelTable _table
+ * _table.sqrt_contig_float   = _sqrt_contig[float]             # <<<<<<<<<<<<<<
+ * _table.sqrt_contig_double  = _sqrt_contig[double]
+ * _table.sqrt_strided_float  = _sqrt_strided[float]
+*/
+  __pyx_v_9mylibrary_15_kernels_avx512__table.sqrt_contig_float = __pyx_fuse_0__pyx_f_9mylibrary_15_kernels_avx512__sqrt_contig;
+
+  /* "mylibrary/_kernels.pxi":304
+ * cdef KernelTable _table
+ * _table.sqrt_contig_float   = _sqrt_contig[float]
+ * _table.sqrt_contig_double  = _sqrt_contig[double]             # <<<<<<<<<<<<<<
+ * _table.sqrt_strided_float  = _sqrt_strided[float]
+ * _table.sqrt_strided_double = _sqrt_strided[double]
+*/
+  __pyx_v_9mylibrary_15_kernels_avx512__table.sqrt_contig_double = __pyx_fuse_1__pyx_f_9mylibrary_15_kernels_avx512__sqrt_contig;
+
+  /* "mylibrary/_kernels.pxi":305
+ * _table.sqrt_contig_float   = _sqrt_contig[float]
+ * _table.sqrt_contig_double  = _sqrt_contig[double]
+ * _table.sqrt_strided_float  = _sqrt_strided[float]             # <<<<<<<<<<<<<<
+ * _table.sqrt_strided_double = _sqrt_strided[double]
+ * _table.pairwise_sum_float  = _pairwise_sum[float]
+*/
+  __pyx_v_9mylibrary_15_kernels_avx512__table.sqrt_strided_float = __pyx_fuse_0__pyx_f_9mylibrary_15_kernels_avx512__sqrt_strided;
+
+  /* "mylibrary/_kernels.pxi":306
+ * _table.sqrt_contig_double  = _sqrt_contig[double]
+ * _table.sqrt_strided_float  = _sqrt_strided[float]
+ * _table.sqrt_strided_double = _sqrt_strided[double]             # <<<<<<<<<<<<<<
+ * _table.pairwise_sum_float  = _pairwise_sum[float]
+ * _table.pairwise_sum_double = _pairwise_sum[double]
+*/
+  __pyx_v_9mylibrary_15_kernels_avx512__table.sqrt_strided_double = __pyx_fuse_1__pyx_f_9mylibrary_15_kernels_avx512__sqrt_strided;
+
+  /* "mylibrary/_kernels.pxi":307
+ * _table.sqrt_strided_float  = _sqrt_strided[float]
+ * _table.sqrt_strided_double = _sqrt_strided[double]
+ * _table.pairwise_sum_float  = _pairwise_sum[float]             # <<<<<<<<<<<<<<
+ * _table.pairwise_sum_double = _pairwise_sum[double]
+ * _table.extremum_float      = _extremum[float]
+*/
+  __pyx_v_9mylibrary_15_kernels_avx512__table.pairwise_sum_float = __pyx_fuse_0__pyx_f_9mylibrary_15_kernels_avx512__pairwise_sum;
+
+  /* "mylibrary/_kernels.pxi":308
+ * _table.sqrt_strided_double = _sqrt_strided[double]
+ * _table.pairwise_sum_float  = _pairwise_sum[float]
+ * _table.pairwise_sum_double = _pairwise_sum[double]             # <<<<<<<<<<<<<<
+ * _table.extremum_float      = _extremum[float]
+ * _table.extremum_double     = _extremum[double]
+*/
+  __pyx_v_9mylibrary_15_kernels_avx512__table.pairwise_sum_double = __pyx_fuse_1__pyx_f_9mylibrary_15_kernels_avx512__pairwise_sum;
+
+  /* "mylibrary/_kernels.pxi":309
+ * _table.pairwise_sum_float  = _pairwise_sum[float]
+ * _table.pairwise_sum_double = _pairwise_sum[double]
+ * _table.extremum_float      = _extremum[float]             # <<<<<<<<<<<<<<
+ * _table.extremum_double     = _extremum[double]
+ * _table.reduce_float        = _reduce[float]
+*/
+  __pyx_v_9mylibrary_15_kernels_avx512__table.extremum_float = __pyx_fuse_0__pyx_f_9mylibrary_15_kernels_avx512__extremum;
+
+  /* "mylibrary/_kernels.pxi":310
+ * _table.pairwise_sum_double = _pairwise_sum[double]
+ * _table.extremum_float      = _extremum[float]
+ * _table.extremum_double     = _extremum[double]             # <<<<<<<<<<<<<<
+ * _table.reduce_float        = _reduce[float]
+ * _table.reduce_double       = _reduce[double]
+*/
+  __pyx_v_9mylibrary_15_kernels_avx512__table.extremum_double = __pyx_fuse_1__pyx_f_9mylibrary_15_kernels_avx512__extremum;
+
+  /* "mylibrary/_kernels.pxi":311
+ * _table.extremum_float      = _extremum[float]
+ * _table.extremum_double     = _extremum[double]
+ * _table.reduce_float        = _reduce[float]             # <<<<<<<<<<<<<<
+ * _table.reduce_double       = _reduce[double]
+ * _table.combine             = _combine
+*/
+  __pyx_v_9mylibrary_15_kernels_avx512__table.reduce_float = __pyx_fuse_0__pyx_f_9mylibrary_15_kernels_avx512__reduce;
+
+  /* "mylibrary/_kernels.pxi":312
+ * _table.extremum_double     = _extremum[double]
+ * _table.reduce_float        = _reduce[float]
+ * _table.reduce_double       = _reduce[double]             # <<<<<<<<<<<<<<
+ * _table.combine             = _combine
+ * _table.pipeline_float      = _pipeline[float]
+*/
+  __pyx_v_9mylibrary_15_kernels_avx512__table.reduce_double = __pyx_fuse_1__pyx_f_9mylibrary_15_kernels_avx512__reduce;
+
+  /* "mylibrary/_kernels.pxi":313
+ * _table.reduce_float        = _reduce[float]
+ * _table.reduce_double       = _reduce[double]
+ * _table.combine             = _combine             # <<<<<<<<<<<<<<
+ * _table.pipeline_float      = _pipeline[float]
+ * _table.pipeline_double     = _pipeline[double]
+*/
+  __pyx_v_9mylibrary_15_kernels_avx512__table.combine = __pyx_f_9mylibrary_15_kernels_avx512__combine;
+
+  /* "mylibrary/_kernels.pxi":314
+ * _table.reduce_double       = _reduce[double]
+ * _table.combine             = _combine
+ * _table.pipeline_float      = _pipeline[float]             # <<<<<<<<<<<<<<
+ * _table.pipeline_double     = _pipeline[double]
+ * 
+*/
+  __pyx_v_9mylibrary_15_kernels_avx512__table.pipeline_float = __pyx_fuse_0__pyx_f_9mylibrary_15_kernels_avx512__pipeline;
+
+  /* "mylibrary/_kernels.pxi":315
+ * _table.combine             = _combine
+ * _table.pipeline_float      = _pipeline[float]
+ * _table.pipeline_double     = _pipeline[double]             # <<<<<<<<<<<<<<
+ * 
+ * # The table is static, so it lives as long as the module.
+*/
+  __pyx_v_9mylibrary_15_kernels_avx512__table.pipeline_double = __pyx_fuse_1__pyx_f_9mylibrary_15_kernels_avx512__pipeline;
+
+  /* "mylibrary/_kernels.pxi":318
+ * 
+ * # The table is static, so it lives as long as the module.
+ * kernels = PyCapsule_New(&_table, KERNELS_CAPSULE, NULL)             # <<<<<<<<<<<<<<
+*/
+  __pyx_t_2 = PyCapsule_New((&__pyx_v_9mylibrary_15_kernels_avx512__table), MYLIBRARY_KERNELS_CAPSULE, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(1, 318, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_kernels, __pyx_t_2) < (0)) __PYX_ERR(1, 318, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "mylibrary/_kernels_avx512.pyx":1
+ * # -*- coding: utf-8 -*-             # <<<<<<<<<<<<<<
+ * #
+ * # cython: wraparound  = False
+*/
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_test, __pyx_t_2) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /*--- Wrapped vars code ---*/
+
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  if (__pyx_m) {
+    if (__pyx_mstate->__pyx_d && stringtab_initialized) {
+      __Pyx_AddTraceback("init mylibrary._kernels_avx512", __pyx_clineno, __pyx_lineno, __pyx_filename);
+    }
+    #if !CYTHON_USE_MODULE_STATE
+    Py_CLEAR(__pyx_m);
+    #else
+    Py_DECREF(__pyx_m);
+    if (pystate_addmodule_run) {
+      PyObject *tp, *value, *tb;
+      __Pyx_PyErr_FetchException(&tp, &value, &tb);
+      __Pyx_State_RemoveModule(&__pyx_moduledef);
+      __Pyx_PyErr_RestoreException(tp, value, tb);
+    }
+    #endif
+  } else if (!PyErr_Occurred()) {
+    PyErr_SetString(PyExc_ImportError, "init mylibrary._kernels_avx512");
+  }
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  return (__pyx_m != NULL) ? 0 : -1;
+  #else
+  return __pyx_m;
+  #endif
+}
+/* #### Code section: pystring_table ### */
+/* #### Code section: cached_builtins ### */
+
+static int __Pyx_InitCachedBuiltins(__pyx_mstatetype *__pyx_mstate) {
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  return 0;
+}
+/* #### Code section: cached_constants ### */
+
+static int __Pyx_InitCachedConstants(__pyx_mstatetype *__pyx_mstate) {
+  __Pyx_RefNannyDeclarations
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+/* #### Code section: init_constants ### */
+
+static int __Pyx_InitConstants(__pyx_mstatetype *__pyx_mstate) {
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  {
+    const struct { const unsigned int length: 5; } str_length_index[] = {{1},{8},{10},{8},{12},{8},{18},{7},{10}};
+    /* compression: none (82 bytes) */
+static const char bytes[] = "?__main____module____name____qualname____test__cline_in_tracebackkernelssetdefault";
+    PyObject *data = NULL;
+    PyObject **stringtab = __pyx_mstate->__pyx_string_tab;
+    Py_ssize_t pos = 0;
+    for (int i = 0; i < 9; i++) {
+      Py_ssize_t bytes_length = str_length_index[i].length;
+      PyObject *string = PyUnicode_DecodeUTF8(bytes + pos, bytes_length, NULL);
+      if (likely(string) && i >= 1) PyUnicode_InternInPlace(&string);
+      if (unlikely(!string)) {
+        Py_XDECREF(data);
+        __PYX_ERR(0, 1, __pyx_L1_error)
+      }
+      stringtab[i] = string;
+      pos += bytes_length;
+    }
+    Py_XDECREF(data);
+    for (Py_ssize_t i = 0; i < 9; i++) {
+      if (unlikely(PyObject_Hash(stringtab[i]) == -1)) {
+        __PYX_ERR(0, 1, __pyx_L1_error)
+      }
+    }
+  }
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+/* #### Code section: init_codeobjects ### */
+
+static int __Pyx_CreateCodeObjects(__pyx_mstatetype *__pyx_mstate) {
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  return 0;
+}
+/* #### Code section: init_globals ### */
+
+static int __Pyx_InitGlobals(void) {
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  /* PythonCompatibility.init */
+  if (likely(__Pyx_init_co_variables() == 0 && __Pyx_init_tpflags_variables() == 0)); else
+  
+  if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 1, __pyx_L1_error)
+
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+/* #### Code section: init_after_shared_utility ### */
+
+static int __Pyx_InitAfterSharedUtility(void) {
+  return 0;
+}
+/* #### Code section: cleanup_globals ### */
+/* #### Code section: cleanup_module ### */
+/* #### Code section: main_method ### */
+/* #### Code section: utility_code_pragmas ### */
+#ifdef _MSC_VER
+#pragma warning( push )
+/* Warning 4127: conditional expression is constant
+ * Cython uses constant conditional expressions to allow in inline functions to be optimized at
+ * compile-time, so this warning is not useful
+ */
+#pragma warning( disable : 4127 )
+#endif
+
+
+
+/* #### Code section: utility_code_def ### */
+
+/* --- Runtime support code --- */
+/* Refnanny */
+#if CYTHON_REFNANNY
+static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname) {
+    PyObject *m = NULL, *p = NULL;
+    void *r = NULL;
+    m = PyImport_ImportModule(modname);
+    if (!m) goto end;
+    p = PyObject_GetAttrString(m, "RefNannyAPI");
+    if (!p) goto end;
+    r = PyLong_AsVoidPtr(p);
+end:
+    Py_XDECREF(p);
+    Py_XDECREF(m);
+    return (__Pyx_RefNannyAPIStruct *)r;
+}
+#endif
+
+/* ReleaseUnknownGil */
+static __Pyx_UnknownThreadState __Pyx_SaveUnknownThread(void) {
+#if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030d0000
+    if (__Pyx_get_runtime_version() >= 0x030d0000) {
+        PyThreadState *ts = PyThreadState_Swap(NULL);
+        __Pyx_UnknownThreadState out = { ts, PyGILState_UNLOCKED  };
+        return out;
+    } else {
+        PyGILState_STATE gil_state = PyGILState_Ensure();
+        PyThreadState *ts = PyEval_SaveThread();
+        __Pyx_UnknownThreadState out = { ts, gil_state };
+        return out;
+    }
+#elif __PYX_LIMITED_VERSION_HEX >= 0x030d0000
+    return PyThreadState_Swap(NULL);
+#else
+  #if CYTHON_COMPILING_IN_PYPY || PY_VERSION_HEX < 0x030C0000
+    if (PyGILState_Check())
+  #else
+    if (_PyThreadState_UncheckedGet())  // UncheckedGet is a reliable check for the GIL from 3.12 upwards
+  #endif
+    {
+      return PyEval_SaveThread();
+    }
+    return NULL; // Nothing to release - we don't have the GIL
+#endif
+}
+static void __Pyx_RestoreUnknownThread(__Pyx_UnknownThreadState state) {
+#if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030d0000
+    if (!state.ts) return;
+    PyEval_RestoreThread(state.ts);
+    if (__Pyx_get_runtime_version() < 0x030d0000) {
+        PyGILState_Release(state.gil_state);
+    }
+#else
+    if (state) {
+        PyEval_RestoreThread(state);
+    }
+#endif
+}
+static CYTHON_INLINE int __Pyx_UnknownThreadStateDefinitelyHadGil(__Pyx_UnknownThreadState state) {
+  #if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030d0000
+  return ((state.ts != NULL) && (__Pyx_get_runtime_version() >= 0x030d0000));
+  #else
+  return state != NULL;
+  #endif
+}
+static CYTHON_INLINE int __Pyx_UnknownThreadStateMayHaveHadGil(__Pyx_UnknownThreadState state) {
+  #if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030d0000
+  return state.ts != NULL;
+  #else
+  return state != NULL;
+  #endif
+}
+
+/* dict_setdefault (used by CLineInTraceback) */
+static CYTHON_INLINE PyObject *__Pyx_PyDict_SetDefault(PyObject *d, PyObject *key, PyObject *default_value) {
+    PyObject* value;
+#if __PYX_LIMITED_VERSION_HEX >= 0x030F0000 || (!CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x030d00A4)
+    PyDict_SetDefaultRef(d, key, default_value, &value);
+#elif CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX >= 0x030C0000
+    PyObject *args[] = {d, key, default_value};
+    value = PyObject_VectorcallMethod(__pyx_mstate_global->__pyx_n_u_setdefault, args, 3 | PY_VECTORCALL_ARGUMENTS_OFFSET, NULL);
+#elif CYTHON_COMPILING_IN_LIMITED_API
+    value = PyObject_CallMethodObjArgs(d, __pyx_mstate_global->__pyx_n_u_setdefault, key, default_value, NULL);
+#else
+    value = PyDict_SetDefault(d, key, default_value);
+    if (unlikely(!value)) return NULL;
+    Py_INCREF(value);
+#endif
+    return value;
+}
+
+/* PyDictVersioning (used by CLineInTraceback) */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    return likely(dict) ? __PYX_GET_DICT_VERSION(dict) : 0;
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj) {
+    PyObject **dictptr = NULL;
+    Py_ssize_t offset = Py_TYPE(obj)->tp_dictoffset;
+    if (offset) {
+#if CYTHON_COMPILING_IN_CPYTHON
+        dictptr = (likely(offset > 0)) ? (PyObject **) ((char *)obj + offset) : _PyObject_GetDictPtr(obj);
+#else
+        dictptr = _PyObject_GetDictPtr(obj);
+#endif
+    }
+    return (dictptr && *dictptr) ? __PYX_GET_DICT_VERSION(*dictptr) : 0;
+}
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    if (unlikely(!dict) || unlikely(tp_dict_version != __PYX_GET_DICT_VERSION(dict)))
+        return 0;
+    return obj_dict_version == __Pyx_get_object_dict_version(obj);
+}
+#endif
+
+/* FastTypeChecks (used by GivenExceptionMatches) */
+#if CYTHON_COMPILING_IN_CPYTHON
+static int __Pyx_InBases(PyTypeObject *a, PyTypeObject *b) {
+    while (a) {
+        a = __Pyx_PyType_GetSlot(a, tp_base, PyTypeObject*);
+        if (a == b)
+            return 1;
+    }
+    return b == &PyBaseObject_Type;
+}
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b) {
+    PyObject *mro;
+    if (a == b) return 1;
+    mro = a->tp_mro;
+    if (likely(mro)) {
+        Py_ssize_t i, n;
+        n = PyTuple_GET_SIZE(mro);
+        for (i = 0; i < n; i++) {
+            if (PyTuple_GET_ITEM(mro, i) == (PyObject *)b)
+                return 1;
+        }
+        return 0;
+    }
+    return __Pyx_InBases(a, b);
+}
+static CYTHON_INLINE int __Pyx_IsAnySubtype2(PyTypeObject *cls, PyTypeObject *a, PyTypeObject *b) {
+    PyObject *mro;
+    if (cls == a || cls == b) return 1;
+    mro = cls->tp_mro;
+    if (likely(mro)) {
+        Py_ssize_t i, n;
+        n = PyTuple_GET_SIZE(mro);
+        for (i = 0; i < n; i++) {
+            PyObject *base = PyTuple_GET_ITEM(mro, i);
+            if (base == (PyObject *)a || base == (PyObject *)b)
+                return 1;
+        }
+        return 0;
+    }
+    return __Pyx_InBases(cls, a) || __Pyx_InBases(cls, b);
+}
+#endif
+
+/* PyErrFetchRestore (used by GivenExceptionMatches) */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
+#if PY_VERSION_HEX >= 0x030C00A6
+    PyObject *tmp_value;
+    assert(type == NULL || (value != NULL && type == (PyObject*) Py_TYPE(value)));
+    if (value) {
+        #if CYTHON_COMPILING_IN_CPYTHON
+        if (unlikely(((PyBaseExceptionObject*) value)->traceback != tb))
+        #endif
+            PyException_SetTraceback(value, tb);
+    }
+    tmp_value = tstate->current_exception;
+    tstate->current_exception = value;
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(type);
+    Py_XDECREF(tb);
+#else
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    tmp_type = tstate->curexc_type;
+    tmp_value = tstate->curexc_value;
+    tmp_tb = tstate->curexc_traceback;
+    tstate->curexc_type = type;
+    tstate->curexc_value = value;
+    tstate->curexc_traceback = tb;
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+#endif
+}
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+#if PY_VERSION_HEX >= 0x030C00A6
+    PyObject* exc_value;
+    exc_value = tstate->current_exception;
+    tstate->current_exception = 0;
+    *value = exc_value;
+    *type = NULL;
+    *tb = NULL;
+    if (exc_value) {
+        *type = (PyObject*) Py_TYPE(exc_value);
+        Py_INCREF(*type);
+        #if CYTHON_COMPILING_IN_CPYTHON
+        *tb = ((PyBaseExceptionObject*) exc_value)->traceback;
+        Py_XINCREF(*tb);
+        #else
+        *tb = PyException_GetTraceback(exc_value);
+        #endif
+    }
+#else
+    *type = tstate->curexc_type;
+    *value = tstate->curexc_value;
+    *tb = tstate->curexc_traceback;
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+#endif
+}
+#endif
+
+/* GivenExceptionMatches (used by PyErrExceptionMatches) */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject *exc_type2) {
+    if (exc_type1) {
+        return __Pyx_IsAnySubtype2((PyTypeObject*)err, (PyTypeObject*)exc_type1, (PyTypeObject*)exc_type2);
+    } else {
+        return __Pyx_IsSubtype((PyTypeObject*)err, (PyTypeObject*)exc_type2);
+    }
+}
+static int __Pyx_PyErr_GivenExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    assert(PyExceptionClass_Check(exc_type));
+    n = PyTuple_GET_SIZE(tuple);
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+    for (i=0; i<n; i++) {
+        PyObject *t = PyTuple_GET_ITEM(tuple, i);
+        if (likely(PyExceptionClass_Check(t))) {
+            if (__Pyx_inner_PyErr_GivenExceptionMatches2(exc_type, NULL, t)) return 1;
+        } else {
+        }
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject* exc_type) {
+    if (likely(err == exc_type)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        if (likely(PyExceptionClass_Check(exc_type))) {
+            return __Pyx_inner_PyErr_GivenExceptionMatches2(err, NULL, exc_type);
+        } else if (likely(PyTuple_Check(exc_type))) {
+            return __Pyx_PyErr_GivenExceptionMatchesTuple(err, exc_type);
+        } else {
+        }
+    }
+    return PyErr_GivenExceptionMatches(err, exc_type);
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *exc_type1, PyObject *exc_type2) {
+    assert(PyExceptionClass_Check(exc_type1));
+    assert(PyExceptionClass_Check(exc_type2));
+    if (likely(err == exc_type1 || err == exc_type2)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        return __Pyx_inner_PyErr_GivenExceptionMatches2(err, exc_type1, exc_type2);
+    }
+    return (PyErr_GivenExceptionMatches(err, exc_type1) || PyErr_GivenExceptionMatches(err, exc_type2));
+}
+#endif
+
+/* PyErrExceptionMatches (used by PyObjectGetAttrStrNoError) */
+#if CYTHON_FAST_THREAD_STATE
+static int __Pyx_PyErr_ExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    n = PyTuple_GET_SIZE(tuple);
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+    for (i=0; i<n; i++) {
+        if (__Pyx_PyErr_GivenExceptionMatches(exc_type, PyTuple_GET_ITEM(tuple, i))) return 1;
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err) {
+    int result;
+    PyObject *exc_type;
+#if PY_VERSION_HEX >= 0x030C00A6
+    PyObject *current_exception = tstate->current_exception;
+    if (unlikely(!current_exception)) return 0;
+    exc_type = (PyObject*) Py_TYPE(current_exception);
+    if (exc_type == err) return 1;
+#else
+    exc_type = tstate->curexc_type;
+    if (exc_type == err) return 1;
+    if (unlikely(!exc_type)) return 0;
+#endif
+    #if CYTHON_AVOID_BORROWED_REFS
+    Py_INCREF(exc_type);
+    #endif
+    if (unlikely(PyTuple_Check(err))) {
+        result = __Pyx_PyErr_ExceptionMatchesTuple(exc_type, err);
+    } else {
+        result = __Pyx_PyErr_GivenExceptionMatches(exc_type, err);
+    }
+    #if CYTHON_AVOID_BORROWED_REFS
+    Py_DECREF(exc_type);
+    #endif
+    return result;
+}
+#endif
+
+/* PyObjectGetAttrStr (used by PyObjectGetAttrStrNoError) */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name) {
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro))
+        return tp->tp_getattro(obj, attr_name);
+    return PyObject_GetAttr(obj, attr_name);
+}
+#endif
+
+/* PyObjectGetAttrStrNoError (used by CLineInTraceback) */
+#if __PYX_LIMITED_VERSION_HEX < 0x030d0000
+static void __Pyx_PyObject_GetAttrStr_ClearAttributeError(void) {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    if (likely(__Pyx_PyErr_ExceptionMatches(PyExc_AttributeError)))
+        __Pyx_PyErr_Clear();
+}
+#endif
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name) {
+    PyObject *result;
+#if __PYX_LIMITED_VERSION_HEX >= 0x030d0000
+    (void) PyObject_GetOptionalAttr(obj, attr_name, &result);
+    return result;
+#else
+#if CYTHON_COMPILING_IN_CPYTHON && CYTHON_USE_TYPE_SLOTS
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro == PyObject_GenericGetAttr)) {
+        return _PyObject_GenericGetAttrWithDict(obj, attr_name, NULL, 1);
+    }
+#endif
+    result = __Pyx_PyObject_GetAttrStr(obj, attr_name);
+    if (unlikely(!result)) {
+        __Pyx_PyObject_GetAttrStr_ClearAttributeError();
+    }
+    return result;
+#endif
+}
+
+/* CLineInTraceback (used by AddTraceback) */
+#if CYTHON_CLINE_IN_TRACEBACK && CYTHON_CLINE_IN_TRACEBACK_RUNTIME
+#if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030A0000
+#define __Pyx_PyProbablyModule_GetDict(o) __Pyx_XNewRef(PyModule_GetDict(o))
+#elif !CYTHON_COMPILING_IN_CPYTHON || CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+#define __Pyx_PyProbablyModule_GetDict(o) PyObject_GenericGetDict(o, NULL);
+#else
+PyObject* __Pyx_PyProbablyModule_GetDict(PyObject *o) {
+    PyObject **dict_ptr = _PyObject_GetDictPtr(o);
+    return dict_ptr ? __Pyx_XNewRef(*dict_ptr) : NULL;
+}
+#endif
+static int __Pyx_CLineForTraceback(PyThreadState *tstate, int c_line) {
+    PyObject *use_cline = NULL;
+    PyObject *ptype, *pvalue, *ptraceback;
+    PyObject *cython_runtime_dict;
+    CYTHON_MAYBE_UNUSED_VAR(tstate);
+    if (unlikely(!__pyx_mstate_global->__pyx_cython_runtime)) {
+        return c_line;
+    }
+    __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
+    cython_runtime_dict = __Pyx_PyProbablyModule_GetDict(__pyx_mstate_global->__pyx_cython_runtime);
+    if (likely(cython_runtime_dict)) {
+        __PYX_PY_DICT_LOOKUP_IF_MODIFIED(
+            use_cline, cython_runtime_dict,
+            __Pyx_PyDict_SetDefault(cython_runtime_dict, __pyx_mstate_global->__pyx_n_u_cline_in_traceback, Py_False))
+    }
+    if (use_cline == NULL || use_cline == Py_False || (use_cline != Py_True && PyObject_Not(use_cline) != 0)) {
+        c_line = 0;
+    }
+    Py_XDECREF(use_cline);
+    Py_XDECREF(cython_runtime_dict);
+    __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
+    return c_line;
+}
+#endif
+
+/* CodeObjectCache (used by AddTraceback) */
+static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line) {
+    int start = 0, mid = 0, end = count - 1;
+    if (end >= 0 && code_line > entries[end].code_line) {
+        return count;
+    }
+    while (start < end) {
+        mid = start + (end - start) / 2;
+        if (code_line < entries[mid].code_line) {
+            end = mid;
+        } else if (code_line > entries[mid].code_line) {
+             start = mid + 1;
+        } else {
+            return mid;
+        }
+    }
+    if (code_line <= entries[mid].code_line) {
+        return mid;
+    } else {
+        return mid + 1;
+    }
+}
+static __Pyx_CachedCodeObjectType *__pyx__find_code_object(struct __Pyx_CodeObjectCache *code_cache, int code_line) {
+    __Pyx_CachedCodeObjectType* code_object;
+    int pos;
+    if (unlikely(!code_line) || unlikely(!code_cache->entries)) {
+        return NULL;
+    }
+    pos = __pyx_bisect_code_objects(code_cache->entries, code_cache->count, code_line);
+    if (unlikely(pos >= code_cache->count) || unlikely(code_cache->entries[pos].code_line != code_line)) {
+        return NULL;
+    }
+    code_object = code_cache->entries[pos].code_object;
+    Py_INCREF(code_object);
+    return code_object;
+}
+static __Pyx_CachedCodeObjectType *__pyx_find_code_object(int code_line) {
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING && !CYTHON_ATOMICS
+    (void)__pyx__find_code_object;
+    return NULL; // Most implementation should have atomics. But otherwise, don't make it thread-safe, just miss.
+#else
+    struct __Pyx_CodeObjectCache *code_cache = &__pyx_mstate_global->__pyx_code_cache;
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    __pyx_nonatomic_int_type old_count = __pyx_atomic_incr_acq_rel(&code_cache->accessor_count);
+    if (old_count < 0) {
+        __pyx_atomic_decr_acq_rel(&code_cache->accessor_count);
+        return NULL;
+    }
+#endif
+    __Pyx_CachedCodeObjectType *result = __pyx__find_code_object(code_cache, code_line);
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    __pyx_atomic_decr_acq_rel(&code_cache->accessor_count);
+#endif
+    return result;
+#endif
+}
+static void __pyx__insert_code_object(struct __Pyx_CodeObjectCache *code_cache, int code_line, __Pyx_CachedCodeObjectType* code_object)
+{
+    int pos, i;
+    __Pyx_CodeObjectCacheEntry* entries = code_cache->entries;
+    if (unlikely(!code_line)) {
+        return;
+    }
+    if (unlikely(!entries)) {
+        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Malloc(64*sizeof(__Pyx_CodeObjectCacheEntry));
+        if (likely(entries)) {
+            code_cache->entries = entries;
+            code_cache->max_count = 64;
+            code_cache->count = 1;
+            entries[0].code_line = code_line;
+            entries[0].code_object = code_object;
+            Py_INCREF(code_object);
+        }
+        return;
+    }
+    pos = __pyx_bisect_code_objects(code_cache->entries, code_cache->count, code_line);
+    if ((pos < code_cache->count) && unlikely(code_cache->entries[pos].code_line == code_line)) {
+        __Pyx_CachedCodeObjectType* tmp = entries[pos].code_object;
+        entries[pos].code_object = code_object;
+        Py_INCREF(code_object);
+        Py_DECREF(tmp);
+        return;
+    }
+    if (code_cache->count == code_cache->max_count) {
+        int new_max = code_cache->max_count + 64;
+        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Realloc(
+            code_cache->entries, ((size_t)new_max) * sizeof(__Pyx_CodeObjectCacheEntry));
+        if (unlikely(!entries)) {
+            return;
+        }
+        code_cache->entries = entries;
+        code_cache->max_count = new_max;
+    }
+    for (i=code_cache->count; i>pos; i--) {
+        entries[i] = entries[i-1];
+    }
+    entries[pos].code_line = code_line;
+    entries[pos].code_object = code_object;
+    code_cache->count++;
+    Py_INCREF(code_object);
+}
+static void __pyx_insert_code_object(int code_line, __Pyx_CachedCodeObjectType* code_object) {
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING && !CYTHON_ATOMICS
+    (void)__pyx__insert_code_object;
+    return; // Most implementation should have atomics. But otherwise, don't make it thread-safe, just fail.
+#else
+    struct __Pyx_CodeObjectCache *code_cache = &__pyx_mstate_global->__pyx_code_cache;
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    __pyx_nonatomic_int_type expected = 0;
+    if (!__pyx_atomic_int_cmp_exchange(&code_cache->accessor_count, &expected, INT_MIN)) {
+        return;
+    }
+#endif
+    __pyx__insert_code_object(code_cache, code_line, code_object);
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    __pyx_atomic_sub(&code_cache->accessor_count, INT_MIN);
+#endif
+#endif
+}
+
+/* AddTraceback */
+#include "compile.h"
+#include "frameobject.h"
+#include "traceback.h"
+#if PY_VERSION_HEX >= 0x030b00a6 && !CYTHON_COMPILING_IN_LIMITED_API && !defined(PYPY_VERSION)
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
+#if CYTHON_COMPILING_IN_LIMITED_API
+static PyObject *__Pyx_PyCode_Replace_For_AddTraceback(PyObject *code, PyObject *scratch_dict,
+                                                       PyObject *firstlineno, PyObject *name) {
+    PyObject *replace = NULL;
+    if (unlikely(PyDict_SetItemString(scratch_dict, "co_firstlineno", firstlineno))) return NULL;
+    if (unlikely(PyDict_SetItemString(scratch_dict, "co_name", name))) return NULL;
+    replace = PyObject_GetAttrString(code, "replace");
+    if (likely(replace)) {
+        PyObject *result = PyObject_Call(replace, __pyx_mstate_global->__pyx_empty_tuple, scratch_dict);
+        Py_DECREF(replace);
+        return result;
+    }
+    return NULL;
+}
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename) {
+    PyObject *code_object = NULL, *py_py_line = NULL, *py_funcname = NULL, *dict = NULL;
+    PyObject *replace = NULL, *getframe = NULL, *frame = NULL;
+    PyObject *exc_type, *exc_value, *exc_traceback;
+    int success = 0;
+    if (c_line) {
+        c_line = __Pyx_CLineForTraceback(__Pyx_PyThreadState_Current, c_line);
+    }
+    __Pyx_PyErr_FetchException(&exc_type, &exc_value, &exc_traceback);
+    code_object = __pyx_find_code_object(c_line ? -c_line : py_line);
+    if (!code_object) {
+        code_object = Py_CompileString("_getframe()", filename, Py_eval_input);
+        if (unlikely(!code_object)) goto bad;
+        py_py_line = PyLong_FromLong(py_line);
+        if (unlikely(!py_py_line)) goto bad;
+        if (c_line) {
+            py_funcname = PyUnicode_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        } else {
+            py_funcname = PyUnicode_FromString(funcname);
+        }
+        if (unlikely(!py_funcname)) goto bad;
+        dict = PyDict_New();
+        if (unlikely(!dict)) goto bad;
+        {
+            PyObject *old_code_object = code_object;
+            code_object = __Pyx_PyCode_Replace_For_AddTraceback(code_object, dict, py_py_line, py_funcname);
+            Py_DECREF(old_code_object);
+        }
+        if (unlikely(!code_object)) goto bad;
+        __pyx_insert_code_object(c_line ? -c_line : py_line, code_object);
+    } else {
+        dict = PyDict_New();
+    }
+    getframe = PySys_GetObject("_getframe");
+    if (unlikely(!getframe)) goto bad;
+    if (unlikely(PyDict_SetItemString(dict, "_getframe", getframe))) goto bad;
+    frame = PyEval_EvalCode(code_object, dict, dict);
+    if (unlikely(!frame) || frame == Py_None) goto bad;
+    success = 1;
+  bad:
+    __Pyx_PyErr_RestoreException(exc_type, exc_value, exc_traceback);
+    Py_XDECREF(code_object);
+    Py_XDECREF(py_py_line);
+    Py_XDECREF(py_funcname);
+    Py_XDECREF(dict);
+    Py_XDECREF(replace);
+    if (success) {
+        PyTraceBack_Here(
+            (struct _frame*)frame);
+    }
+    Py_XDECREF(frame);
+}
+#else
+static PyCodeObject* __Pyx_CreateCodeObjectForTraceback(
+            const char *funcname, int c_line,
+            int py_line, const char *filename) {
+    PyCodeObject *py_code = NULL;
+    PyObject *py_funcname = NULL;
+    if (c_line) {
+        py_funcname = PyUnicode_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
+        funcname = PyUnicode_AsUTF8(py_funcname);
+        if (!funcname) goto bad;
+    }
+    py_code = PyCode_NewEmpty(filename, funcname, py_line);
+    Py_XDECREF(py_funcname);
+    return py_code;
+bad:
+    Py_XDECREF(py_funcname);
+    return NULL;
+}
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename) {
+    PyCodeObject *py_code = 0;
+    PyFrameObject *py_frame = 0;
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject *ptype, *pvalue, *ptraceback;
+    if (c_line) {
+        c_line = __Pyx_CLineForTraceback(tstate, c_line);
+    }
+    py_code = __pyx_find_code_object(c_line ? -c_line : py_line);
+    if (!py_code) {
+        __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
+        py_code = __Pyx_CreateCodeObjectForTraceback(
+            funcname, c_line, py_line, filename);
+        if (!py_code) {
+            /* If the code object creation fails, then we should clear the
+               fetched exception references and propagate the new exception */
+            Py_XDECREF(ptype);
+            Py_XDECREF(pvalue);
+            Py_XDECREF(ptraceback);
+            goto bad;
+        }
+        __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
+        __pyx_insert_code_object(c_line ? -c_line : py_line, py_code);
+    }
+    py_frame = PyFrame_New(
+        tstate,            /*PyThreadState *tstate,*/
+        py_code,           /*PyCodeObject *code,*/
+        __pyx_mstate_global->__pyx_d,    /*PyObject *globals,*/
+        0                  /*PyObject *locals*/
+    );
+    if (!py_frame) goto bad;
+    __Pyx_PyFrame_SetLineNumber(py_frame, py_line);
+    PyTraceBack_Here(py_frame);
+bad:
+    Py_XDECREF(py_code);
+    Py_XDECREF(py_frame);
+}
+#endif
+
+/* PyObjectCall */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw) {
+    PyObject *result;
+    ternaryfunc call = Py_TYPE(func)->tp_call;
+    if (unlikely(!call))
+        return PyObject_Call(func, arg, kw);
+    if (unlikely(Py_EnterRecursiveCall(" while calling a Python object")))
+        return NULL;
+    result = (*call)(func, arg, kw);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* PyObjectCallMethO */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg) {
+    PyObject *self, *result;
+    PyCFunction cfunc;
+    cfunc = __Pyx_CyOrPyCFunction_GET_FUNCTION(func);
+    self = __Pyx_CyOrPyCFunction_GET_SELF(func);
+    if (unlikely(Py_EnterRecursiveCall(" while calling a Python object")))
+        return NULL;
+    result = cfunc(self, arg);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* CIntFromPyVerify */
+#define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 0)
+#define __PYX_VERIFY_RETURN_INT_EXC(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 1)
+#define __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, exc)\
+    {\
+        func_type value = func_value;\
+        if (sizeof(target_type) < sizeof(func_type)) {\
+            if (unlikely(value != (func_type) (target_type) value)) {\
+                func_type zero = 0;\
+                if (exc && unlikely(value == (func_type)-1 && PyErr_Occurred()))\
+                    return (target_type) -1;\
+                if (is_unsigned && unlikely(value < zero))\
+                    goto raise_neg_overflow;\
+                else\
+                    goto raise_overflow;\
+            }\
+        }\
+        return (target_type) value;\
+    }
+
+/* PyObjectFastCall (used by PyObjectVectorcallKwds) */
+#if CYTHON_COMPILING_IN_LIMITED_API
+static PyObject* __Pyx_PyObject_FastCall_fallback(PyObject *func, PyObject * const*args, size_t nargs, PyObject *kwargs) {
+    PyObject *argstuple;
+    PyObject *result = 0;
+    size_t i;
+    argstuple = PyTuple_New((Py_ssize_t)nargs);
+    if (unlikely(!argstuple)) return NULL;
+    for (i = 0; i < nargs; i++) {
+        Py_INCREF(args[i]);
+        if (__Pyx_PyTuple_SET_ITEM(argstuple, (Py_ssize_t)i, args[i]) != (0)) goto bad;
+    }
+    result = __Pyx_PyObject_Call(func, argstuple, kwargs);
+  bad:
+    Py_DECREF(argstuple);
+    return result;
+}
+#endif
+#if CYTHON_VECTORCALL && !(CYTHON_COMPILING_IN_LIMITED_API || CYTHON_COMPILING_IN_PYPY)
+  #if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE vectorcallfunc __Pyx_PyVectorcall_Function(PyObject *callable) {
+    PyTypeObject *tp = Py_TYPE(callable);
+    #if defined(__Pyx_CyFunction_USED)
+    if (__Pyx_CyFunction_CheckExact(callable)) {
+        return __Pyx_CyFunction_func_vectorcall(callable);
+    }
+    #endif
+    if (!PyType_HasFeature(tp, Py_TPFLAGS_HAVE_VECTORCALL)) {
+        return NULL;
+    }
+    assert(PyCallable_Check(callable));
+    Py_ssize_t offset = tp->tp_vectorcall_offset;
+    assert(offset > 0);
+    vectorcallfunc ptr;
+    memcpy(&ptr, (char *) callable + offset, sizeof(ptr));
+    return ptr;
+}
+  #else
+    #define __Pyx_PyVectorcall_Function(callable) PyVectorcall_Function(callable)
+  #endif
+#endif
+static CYTHON_INLINE PyObject* __Pyx_PyObject_FastCallDict(PyObject *func, PyObject *const *args, size_t nargsf, PyObject *kwargs) {
+    Py_ssize_t nargs = __Pyx_PyVectorcall_NARGS(nargsf);
+#if CYTHON_COMPILING_IN_CPYTHON
+    if (nargs == 0 && kwargs == NULL) {
+        if (__Pyx_CyOrPyCFunction_Check(func) && likely( __Pyx_CyOrPyCFunction_GET_FLAGS(func) & METH_NOARGS))
+            return __Pyx_PyObject_CallMethO(func, NULL);
+    }
+    else if (nargs == 1 && kwargs == NULL) {
+        if (__Pyx_CyOrPyCFunction_Check(func) && likely( __Pyx_CyOrPyCFunction_GET_FLAGS(func) & METH_O))
+            return __Pyx_PyObject_CallMethO(func, args[0]);
+    }
+#endif
+    if (kwargs == NULL) {
+        #if CYTHON_VECTORCALL
+          #if CYTHON_COMPILING_IN_LIMITED_API || CYTHON_COMPILING_IN_PYPY
+            return PyObject_Vectorcall(func, args, nargsf, NULL);
+          #else
+            vectorcallfunc f = __Pyx_PyVectorcall_Function(func);
+            if (f) {
+                return f(func, args, nargsf, NULL);
+            }
+          #endif
+        #endif
+    }
+    if (nargs == 0) {
+        return __Pyx_PyObject_Call(func, __pyx_mstate_global->__pyx_empty_tuple, kwargs);
+    }
+    #if CYTHON_COMPILING_IN_LIMITED_API
+    return __Pyx_PyObject_FastCall_fallback(func, args, (size_t)nargs, kwargs);
+    #elif CYTHON_COMPILING_IN_PYPY
+    return PyObject_VectorcallDict(func, args, (size_t) nargs, kwargs);
+    #else
+    return PyObject_VectorcallDict(func, args, nargsf, kwargs);
+    #endif
+}
+
+/* PyObjectVectorcallKwds (used by PyObjectVectorcallMethodKwds) */
+#if CYTHON_VECTORCALL
+CYTHON_UNUSED static int __Pyx_CheckVectorcallKwarg(PyObject *kwnames, Py_ssize_t i) {
+    PyObject *key = __Pyx_PyTuple_GET_ITEM(kwnames, i);
+#if !CYTHON_ASSUME_SAFE_MACROS
+    if (unlikely(!key)) return -1;
+#endif
+    if (unlikely(!PyUnicode_Check(key))) {
+        PyErr_SetString(PyExc_TypeError, "keywords must be strings");
+        return -1;
+    }
+    return 0;
+}
+#else
+CYTHON_UNUSED static PyObject *__Pyx_MakeKwargDict(PyObject **keys, PyObject **values, Py_ssize_t n) {
+    PyObject *out = PyDict_New();
+    if (unlikely(!out)) return NULL;
+    for (Py_ssize_t i=0; i<n; ++i) {
+        if (unlikely(PyDict_SetItem(out, keys[i], values[i]) < 0)) {
+            Py_DECREF(out);
+            return NULL;
+        }
+    }
+    return out;
+}
+CYTHON_UNUSED static int __Pyx_CheckVectorcallKwarg(PyObject **kwnames, Py_ssize_t i) {
+    PyObject *key = kwnames[i];
+    if (unlikely(!PyUnicode_Check(key))) {
+        PyErr_SetString(PyExc_TypeError, "keywords must be strings");
+        return -1;
+    }
+    return 0;
+}
+#endif
+
+/* PyObjectVectorcallMethodKwds (used by CIntToPy) */
+#if !CYTHON_VECTORCALL
+static PyObject *__Pyx_Object_VectorcallMethodKwds(PyObject *name, PyObject *const *args, size_t nargsf, PyObject *kwnames) {
+    PyObject *result;
+    PyObject *obj = PyObject_GetAttr(args[0], name);
+    if (unlikely(!obj))
+        return NULL;
+    result = __Pyx_Object_VectorcallKwds(obj, args+1, nargsf-1, kwnames);
+    Py_DECREF(obj);
+    return result;
+}
+#endif
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyLong_From_int(int value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(int) < sizeof(long)) {
+            return PyLong_FromLong((long) value);
+        } else if (sizeof(int) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#if !CYTHON_COMPILING_IN_PYPY
+        } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(int) <= sizeof(long)) {
+            return PyLong_FromLong((long) value);
+        } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+        }
+    }
+    {
+        unsigned char *bytes = (unsigned char *)&value;
+#if !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x030d00A4
+        if (is_unsigned) {
+            return PyLong_FromUnsignedNativeBytes(bytes, sizeof(value), -1);
+        } else {
+            return PyLong_FromNativeBytes(bytes, sizeof(value), -1);
+        }
+#elif !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX < 0x030d0000
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        return _PyLong_FromByteArray(bytes, sizeof(int),
+                                     little, !is_unsigned);
+#else
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        PyObject *result = NULL, *kwds = NULL;
+        PyObject *py_bytes = NULL, *order_str = NULL, *from_bytes_str = NULL;;
+        py_bytes = PyBytes_FromStringAndSize((char*)bytes, sizeof(int));
+        if (!py_bytes) goto limited_bad;
+        from_bytes_str = PyUnicode_FromStringAndSize("from_bytes", 10);
+        if (!from_bytes_str) goto limited_bad;
+        order_str = PyUnicode_FromString(little ? "little" : "big");
+        if (!order_str) goto limited_bad;
+        {
+            PyObject *args[] = { (PyObject*)&PyLong_Type, py_bytes, order_str, Py_True };
+            if (!is_unsigned) {
+                PyObject *signed_str = PyUnicode_FromStringAndSize("signed", 6);
+                if (!signed_str) goto limited_bad;
+#if CYTHON_VECTORCALL
+                kwds = PyTuple_Pack(1, signed_str);
+#else
+                {
+                    PyObject *keys[] = {signed_str};
+                    PyObject *values[] = {Py_True};
+                    kwds = __Pyx_MakeKwargDict(keys, values, 1);
+                }
+#endif
+                Py_DECREF(signed_str);
+                if (unlikely(!kwds)) goto limited_bad;
+            }
+            result = __Pyx_Object_VectorcallMethodKwds(from_bytes_str, args, 3 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET, kwds);
+        }
+        limited_bad:
+        Py_XDECREF(kwds);
+        Py_XDECREF(order_str);
+        Py_XDECREF(py_bytes);
+        Py_XDECREF(from_bytes_str);
+        return result;
+#endif
+    }
+}
+
+/* CIntFromPy */
+static int __Pyx_LargePyLong___Pyx_PyLong_As_int(PyObject *x);
+static int __Pyx_raise_neg_overflow___Pyx_PyLong_As_int(void) {
+    const char* type_name = "int";
+    PyErr_Format(PyExc_OverflowError,
+        "can't convert negative value to %.200s", type_name);
+    return (int) -1;
+}
+static int __Pyx_raise_overflow___Pyx_PyLong_As_int(void) {
+    const char* type_name = "int";
+    PyErr_Format(PyExc_OverflowError,
+        "value too large to convert to %.200s", type_name);
+    return (int) -1;
+}
+static CYTHON_INLINE int __Pyx_PyULong___Pyx_PyLong_As_int(PyObject *x) {
+    const int is_unsigned = 1;
+#if CYTHON_USE_PYLONG_INTERNALS
+    {
+        const digit* digits = __Pyx_PyLong_Digits(x);
+        const Py_ssize_t size = __Pyx_PyLong_DigitCount(x);
+        if (size == 2 && (8 * sizeof(int) > 1 * PyLong_SHIFT)) {
+            if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(int) >= 2 * PyLong_SHIFT)) {
+                return (int) (((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+            }
+        } else
+        if (size == 3 && (8 * sizeof(int) > 2 * PyLong_SHIFT)) {
+            if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(int) >= 3 * PyLong_SHIFT)) {
+                return (int) (((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+            }
+        } else
+        if (size == 4 && (8 * sizeof(int) > 3 * PyLong_SHIFT)) {
+            if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(int) >= 4 * PyLong_SHIFT)) {
+                return (int) (((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+            }
+        } else
+        {}
+    }
+#elif CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+    if (unlikely(Py_SIZE(x) < 0)) {
+        goto raise_neg_overflow;
+    }
+#else
+    {
+        int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+        if (unlikely(result < 0))
+            return (int) -1;
+        if (unlikely(result == 1))
+            goto raise_neg_overflow;
+    }
+#endif
+    if ((sizeof(int) <= sizeof(unsigned long))) {
+        __PYX_VERIFY_RETURN_INT_EXC(int, unsigned long, PyLong_AsUnsignedLong(x))
+    } else if ((sizeof(int) <= sizeof(unsigned PY_LONG_LONG))) {
+        __PYX_VERIFY_RETURN_INT_EXC(int, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+    }
+    return __Pyx_LargePyLong___Pyx_PyLong_As_int(x);
+raise_neg_overflow:
+    return __Pyx_raise_neg_overflow___Pyx_PyLong_As_int();
+raise_overflow:
+    return __Pyx_raise_overflow___Pyx_PyLong_As_int();
+}
+static CYTHON_INLINE int __Pyx_PySLong___Pyx_PyLong_As_int(PyObject *x) {
+    const int is_unsigned = 0;
+#if CYTHON_USE_PYLONG_INTERNALS
+    if (__Pyx_PyLong_IsNeg(x)) {
+        const Py_ssize_t size = __Pyx_PyLong_DigitCount(x);
+        const digit* digits = __Pyx_PyLong_Digits(x);
+        if (size == 2 && (8 * sizeof(int) > 1 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 2 * PyLong_SHIFT)) {
+                long ival = - (long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                __PYX_VERIFY_RETURN_INT(int, long, ival)
+            } else if ((8 * sizeof(int) - 1 > 2 * PyLong_SHIFT)) {
+                return (int) (((int) -1) * (((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+            }
+        } else
+        if (size == 3 && (8 * sizeof(int) > 2 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 3 * PyLong_SHIFT)) {
+                long ival = - (long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                __PYX_VERIFY_RETURN_INT(int, long, ival)
+            } else if ((8 * sizeof(int) - 1 > 3 * PyLong_SHIFT)) {
+                return (int) (((int) -1) * (((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+            }
+        } else
+        if (size == 4 && (8 * sizeof(int) > 3 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 4 * PyLong_SHIFT)) {
+                long ival = - (long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                __PYX_VERIFY_RETURN_INT(int, long, ival)
+            } else if ((8 * sizeof(int) - 1 > 4 * PyLong_SHIFT)) {
+                return (int) (((int) -1) * (((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+            }
+        } else
+        {}
+    } else {
+        const Py_ssize_t size = __Pyx_PyLong_DigitCount(x);
+        const digit* digits = __Pyx_PyLong_Digits(x);
+        if (size == 2 && (8 * sizeof(int) > 1 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 2 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(int) - 1 > 2 * PyLong_SHIFT)) {
+                return (int) (((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+            }
+        } else
+        if (size == 3 && (8 * sizeof(int) > 2 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 3 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(int) - 1 > 3 * PyLong_SHIFT)) {
+                return (int) (((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+            }
+        } else
+        if (size == 4 && (8 * sizeof(int) > 3 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 4 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(int) - 1 > 4 * PyLong_SHIFT)) {
+                return (int) (((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+            }
+        } else
+        {}
+    }
+#endif
+    #if __PYX_LIMITED_VERSION_HEX >= 0x030d0000
+    if ((sizeof(int) <= sizeof(int)) && (sizeof(int) < sizeof(long))) {
+        __PYX_VERIFY_RETURN_INT_EXC(int, int, PyLong_AsInt(x))
+    } else
+    #endif
+    if ((sizeof(int) <= sizeof(long))) {
+        __PYX_VERIFY_RETURN_INT_EXC(int, long, PyLong_AsLong(x))
+    } else if ((sizeof(int) <= sizeof(PY_LONG_LONG))) {
+        __PYX_VERIFY_RETURN_INT_EXC(int, PY_LONG_LONG, PyLong_AsLongLong(x))
+    }
+    return __Pyx_LargePyLong___Pyx_PyLong_As_int(x);
+raise_neg_overflow:
+    return __Pyx_raise_neg_overflow___Pyx_PyLong_As_int();
+raise_overflow:
+    return __Pyx_raise_overflow___Pyx_PyLong_As_int();
+}
+static int __Pyx_LargePyLong___Pyx_PyLong_As_int(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    int val;
+    int ret = -1;
+#if PY_VERSION_HEX >= 0x030d00A6 && !CYTHON_COMPILING_IN_LIMITED_API
+    Py_ssize_t bytes_copied = PyLong_AsNativeBytes(
+        x, &val, sizeof(val), Py_ASNATIVEBYTES_NATIVE_ENDIAN | (is_unsigned ? Py_ASNATIVEBYTES_UNSIGNED_BUFFER | Py_ASNATIVEBYTES_REJECT_NEGATIVE : 0));
+    if (unlikely(bytes_copied == -1)) {
+    } else if (unlikely(bytes_copied > (Py_ssize_t) sizeof(val))) {
+        goto raise_overflow;
+    } else {
+        ret = 0;
+    }
+#elif PY_VERSION_HEX < 0x030d0000 && !(CYTHON_COMPILING_IN_PYPY || CYTHON_COMPILING_IN_LIMITED_API) || defined(_PyLong_AsByteArray)
+    int one = 1; int is_little = (int)*(unsigned char *)&one;
+    unsigned char *bytes = (unsigned char *)&val;
+    ret = _PyLong_AsByteArray((PyLongObject *)x,
+                                bytes, sizeof(val),
+                                is_little, !is_unsigned);
+    if ((0)) goto raise_overflow;
+#else
+    PyObject *v;
+    PyObject *stepval = NULL, *mask = NULL, *shift = NULL;
+    int bits, remaining_bits, is_negative = 0;
+    int chunk_size = (sizeof(long) < 8) ? 30 : 62;
+    if (likely(PyLong_CheckExact(x))) {
+        v = __Pyx_NewRef(x);
+    } else {
+        v = PyNumber_Long(x);
+        if (unlikely(!v)) return (int) -1;
+        assert(PyLong_CheckExact(v));
+    }
+    {
+        int result = PyObject_RichCompareBool(v, Py_False, Py_LT);
+        if (unlikely(result < 0)) {
+            Py_DECREF(v);
+            return (int) -1;
+        }
+        is_negative = result == 1;
+    }
+    if (is_unsigned && unlikely(is_negative)) {
+        Py_DECREF(v);
+        PyErr_SetString(PyExc_OverflowError,
+            "can't convert negative value to int");
+        return (int) -1;
+    } else if (is_negative) {
+        stepval = PyNumber_Invert(v);
+        Py_DECREF(v);
+        if (unlikely(!stepval))
+            return (int) -1;
+    } else {
+        stepval = v;
+    }
+    v = NULL;
+    val = (int) 0;
+    mask = PyLong_FromLong((1L << chunk_size) - 1); if (unlikely(!mask)) goto done;
+    shift = PyLong_FromLong(chunk_size); if (unlikely(!shift)) goto done;
+    for (bits = 0; bits < (int) sizeof(int) * 8 - chunk_size; bits += chunk_size) {
+        PyObject *tmp, *digit;
+        long idigit;
+        digit = PyNumber_And(stepval, mask);
+        if (unlikely(!digit)) goto done;
+        idigit = PyLong_AsLong(digit);
+        Py_DECREF(digit);
+        if (unlikely(idigit < 0)) goto done;
+        val |= ((int) idigit) << bits;
+        tmp = PyNumber_Rshift(stepval, shift);
+        if (unlikely(!tmp)) goto done;
+        Py_DECREF(stepval); stepval = tmp;
+    }
+    Py_DECREF(shift); shift = NULL;
+    Py_DECREF(mask); mask = NULL;
+    {
+        long idigit = PyLong_AsLong(stepval);
+        if (unlikely(idigit < 0)) goto done;
+        remaining_bits = ((int) sizeof(int) * 8) - bits - (is_unsigned ? 0 : 1);
+        if (unlikely(idigit >= (1L << remaining_bits)))
+            goto raise_overflow;
+        val |= ((int) idigit) << bits;
+    }
+    if (!is_unsigned) {
+        if (unlikely(val & (((int) 1) << (sizeof(int) * 8 - 1))))
+            goto raise_overflow;
+        if (is_negative)
+            val = ~val;
+    }
+    ret = 0;
+done:
+    Py_XDECREF(shift);
+    Py_XDECREF(mask);
+    Py_XDECREF(stepval);
+#endif
+    if (unlikely(ret))
+        return (int) -1;
+    return val;
+raise_overflow:
+    return __Pyx_raise_overflow___Pyx_PyLong_As_int();
+}
+static CYTHON_INLINE int __Pyx_PyLong___Pyx_PyLong_As_int(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        #if CYTHON_USE_PYLONG_INTERNALS
+        if (unlikely(__Pyx_PyLong_IsNeg(x))) {
+            goto raise_neg_overflow;
+        } else if (__Pyx_PyLong_IsCompact(x)) {
+            __PYX_VERIFY_RETURN_INT(int, __Pyx_compact_upylong, __Pyx_PyLong_CompactValueUnsigned(x))
+        } else
+        #endif
+        {
+            return __Pyx_PyULong___Pyx_PyLong_As_int(x);
+        }
+    } else {
+        #if CYTHON_USE_PYLONG_INTERNALS
+        if (__Pyx_PyLong_IsCompact(x)) {
+            __PYX_VERIFY_RETURN_INT(int, __Pyx_compact_pylong, __Pyx_PyLong_CompactValue(x))
+        } else
+        #endif
+        {
+            return __Pyx_PySLong___Pyx_PyLong_As_int(x);
+        }
+    }
+#if CYTHON_USE_PYLONG_INTERNALS
+raise_neg_overflow:
+    return __Pyx_raise_neg_overflow___Pyx_PyLong_As_int();
+raise_overflow:
+    return __Pyx_raise_overflow___Pyx_PyLong_As_int();
+#endif
+}
+static int __Pyx_NonPyLong___Pyx_PyLong_As_int(PyObject *x) {
+    int val;
+    PyObject *tmp = __Pyx_PyNumber_Long(x);
+    if (!tmp) return (int) -1;
+    val = __Pyx_PyLong_As_int(tmp);
+    Py_DECREF(tmp);
+    return val;
+}
+static CYTHON_INLINE int __Pyx_PyLong_As_int(PyObject *x) {
+    if (likely(PyLong_Check(x))) {
+        return __Pyx_PyLong___Pyx_PyLong_As_int(x);
+    } else {
+        return __Pyx_NonPyLong___Pyx_PyLong_As_int(x);
+    }
+}
+
+/* FormatTypeName */
+#if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030d0000
+static __Pyx_TypeName
+__Pyx_PyType_GetFullyQualifiedName(PyTypeObject* tp)
+{
+    PyObject *module = NULL, *name = NULL, *result = NULL;
+    #if __PYX_LIMITED_VERSION_HEX < 0x030b0000
+    name = __Pyx_PyObject_GetAttrStr((PyObject *)tp,
+                                               __pyx_mstate_global->__pyx_n_u_qualname);
+    #else
+    name = PyType_GetQualName(tp);
+    #endif
+    if (unlikely(name == NULL) || unlikely(!PyUnicode_Check(name))) goto bad;
+    module = __Pyx_PyObject_GetAttrStr((PyObject *)tp,
+                                               __pyx_mstate_global->__pyx_n_u_module);
+    if (unlikely(module == NULL) || unlikely(!PyUnicode_Check(module))) goto bad;
+    if (PyUnicode_CompareWithASCIIString(module, "builtins") == 0) {
+        result = name;
+        name = NULL;
+        goto done;
+    }
+    result = PyUnicode_FromFormat("%U.%U", module, name);
+    if (unlikely(result == NULL)) goto bad;
+  done:
+    Py_XDECREF(name);
+    Py_XDECREF(module);
+    return result;
+  bad:
+    PyErr_Clear();
+    if (name) {
+        result = name;
+        name = NULL;
+    } else {
+        result = __Pyx_NewRef(__pyx_mstate_global->__pyx_kp_u_);
+    }
+    goto done;
+}
+#endif
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyLong_From_long(long value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(long) < sizeof(long)) {
+            return PyLong_FromLong((long) value);
+        } else if (sizeof(long) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#if !CYTHON_COMPILING_IN_PYPY
+        } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(long) <= sizeof(long)) {
+            return PyLong_FromLong((long) value);
+        } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+        }
+    }
+    {
+        unsigned char *bytes = (unsigned char *)&value;
+#if !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x030d00A4
+        if (is_unsigned) {
+            return PyLong_FromUnsignedNativeBytes(bytes, sizeof(value), -1);
+        } else {
+            return PyLong_FromNativeBytes(bytes, sizeof(value), -1);
+        }
+#elif !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX < 0x030d0000
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        return _PyLong_FromByteArray(bytes, sizeof(long),
+                                     little, !is_unsigned);
+#else
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        PyObject *result = NULL, *kwds = NULL;
+        PyObject *py_bytes = NULL, *order_str = NULL, *from_bytes_str = NULL;;
+        py_bytes = PyBytes_FromStringAndSize((char*)bytes, sizeof(long));
+        if (!py_bytes) goto limited_bad;
+        from_bytes_str = PyUnicode_FromStringAndSize("from_bytes", 10);
+        if (!from_bytes_str) goto limited_bad;
+        order_str = PyUnicode_FromString(little ? "little" : "big");
+        if (!order_str) goto limited_bad;
+        {
+            PyObject *args[] = { (PyObject*)&PyLong_Type, py_bytes, order_str, Py_True };
+            if (!is_unsigned) {
+                PyObject *signed_str = PyUnicode_FromStringAndSize("signed", 6);
+                if (!signed_str) goto limited_bad;
+#if CYTHON_VECTORCALL
+                kwds = PyTuple_Pack(1, signed_str);
+#else
+                {
+                    PyObject *keys[] = {signed_str};
+                    PyObject *values[] = {Py_True};
+                    kwds = __Pyx_MakeKwargDict(keys, values, 1);
+                }
+#endif
+                Py_DECREF(signed_str);
+                if (unlikely(!kwds)) goto limited_bad;
+            }
+            result = __Pyx_Object_VectorcallMethodKwds(from_bytes_str, args, 3 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET, kwds);
+        }
+        limited_bad:
+        Py_XDECREF(kwds);
+        Py_XDECREF(order_str);
+        Py_XDECREF(py_bytes);
+        Py_XDECREF(from_bytes_str);
+        return result;
+#endif
+    }
+}
+
+/* CIntFromPy */
+static long __Pyx_LargePyLong___Pyx_PyLong_As_long(PyObject *x);
+static long __Pyx_raise_neg_overflow___Pyx_PyLong_As_long(void) {
+    const char* type_name = "long";
+    PyErr_Format(PyExc_OverflowError,
+        "can't convert negative value to %.200s", type_name);
+    return (long) -1;
+}
+static long __Pyx_raise_overflow___Pyx_PyLong_As_long(void) {
+    const char* type_name = "long";
+    PyErr_Format(PyExc_OverflowError,
+        "value too large to convert to %.200s", type_name);
+    return (long) -1;
+}
+static CYTHON_INLINE long __Pyx_PyULong___Pyx_PyLong_As_long(PyObject *x) {
+    const int is_unsigned = 1;
+#if CYTHON_USE_PYLONG_INTERNALS
+    {
+        const digit* digits = __Pyx_PyLong_Digits(x);
+        const Py_ssize_t size = __Pyx_PyLong_DigitCount(x);
+        if (size == 2 && (8 * sizeof(long) > 1 * PyLong_SHIFT)) {
+            if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(long) >= 2 * PyLong_SHIFT)) {
+                return (long) (((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+            }
+        } else
+        if (size == 3 && (8 * sizeof(long) > 2 * PyLong_SHIFT)) {
+            if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(long) >= 3 * PyLong_SHIFT)) {
+                return (long) (((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+            }
+        } else
+        if (size == 4 && (8 * sizeof(long) > 3 * PyLong_SHIFT)) {
+            if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(long) >= 4 * PyLong_SHIFT)) {
+                return (long) (((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+            }
+        } else
+        {}
+    }
+#elif CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+    if (unlikely(Py_SIZE(x) < 0)) {
+        goto raise_neg_overflow;
+    }
+#else
+    {
+        int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+        if (unlikely(result < 0))
+            return (long) -1;
+        if (unlikely(result == 1))
+            goto raise_neg_overflow;
+    }
+#endif
+    if ((sizeof(long) <= sizeof(unsigned long))) {
+        __PYX_VERIFY_RETURN_INT_EXC(long, unsigned long, PyLong_AsUnsignedLong(x))
+    } else if ((sizeof(long) <= sizeof(unsigned PY_LONG_LONG))) {
+        __PYX_VERIFY_RETURN_INT_EXC(long, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+    }
+    return __Pyx_LargePyLong___Pyx_PyLong_As_long(x);
+raise_neg_overflow:
+    return __Pyx_raise_neg_overflow___Pyx_PyLong_As_long();
+raise_overflow:
+    return __Pyx_raise_overflow___Pyx_PyLong_As_long();
+}
+static CYTHON_INLINE long __Pyx_PySLong___Pyx_PyLong_As_long(PyObject *x) {
+    const int is_unsigned = 0;
+#if CYTHON_USE_PYLONG_INTERNALS
+    if (__Pyx_PyLong_IsNeg(x)) {
+        const Py_ssize_t size = __Pyx_PyLong_DigitCount(x);
+        const digit* digits = __Pyx_PyLong_Digits(x);
+        if (size == 2 && (8 * sizeof(long) > 1 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 2 * PyLong_SHIFT)) {
+                long ival = - (long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                __PYX_VERIFY_RETURN_INT(long, long, ival)
+            } else if ((8 * sizeof(long) - 1 > 2 * PyLong_SHIFT)) {
+                return (long) (((long) -1) * (((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+            }
+        } else
+        if (size == 3 && (8 * sizeof(long) > 2 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 3 * PyLong_SHIFT)) {
+                long ival = - (long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                __PYX_VERIFY_RETURN_INT(long, long, ival)
+            } else if ((8 * sizeof(long) - 1 > 3 * PyLong_SHIFT)) {
+                return (long) (((long) -1) * (((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+            }
+        } else
+        if (size == 4 && (8 * sizeof(long) > 3 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 4 * PyLong_SHIFT)) {
+                long ival = - (long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0]));
+                __PYX_VERIFY_RETURN_INT(long, long, ival)
+            } else if ((8 * sizeof(long) - 1 > 4 * PyLong_SHIFT)) {
+                return (long) (((long) -1) * (((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+            }
+        } else
+        {}
+    } else {
+        const Py_ssize_t size = __Pyx_PyLong_DigitCount(x);
+        const digit* digits = __Pyx_PyLong_Digits(x);
+        if (size == 2 && (8 * sizeof(long) > 1 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 2 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(long) - 1 > 2 * PyLong_SHIFT)) {
+                return (long) (((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+            }
+        } else
+        if (size == 3 && (8 * sizeof(long) > 2 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 3 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(long) - 1 > 3 * PyLong_SHIFT)) {
+                return (long) (((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+            }
+        } else
+        if (size == 4 && (8 * sizeof(long) > 3 * PyLong_SHIFT)) {
+            if ((8 * sizeof(long) > 4 * PyLong_SHIFT)) {
+                __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+            } else if ((8 * sizeof(long) - 1 > 4 * PyLong_SHIFT)) {
+                return (long) (((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+            }
+        } else
+        {}
+    }
+#endif
+    #if __PYX_LIMITED_VERSION_HEX >= 0x030d0000
+    if ((sizeof(long) <= sizeof(int)) && (sizeof(int) < sizeof(long))) {
+        __PYX_VERIFY_RETURN_INT_EXC(long, int, PyLong_AsInt(x))
+    } else
+    #endif
+    if ((sizeof(long) <= sizeof(long))) {
+        __PYX_VERIFY_RETURN_INT_EXC(long, long, PyLong_AsLong(x))
+    } else if ((sizeof(long) <= sizeof(PY_LONG_LONG))) {
+        __PYX_VERIFY_RETURN_INT_EXC(long, PY_LONG_LONG, PyLong_AsLongLong(x))
+    }
+    return __Pyx_LargePyLong___Pyx_PyLong_As_long(x);
+raise_neg_overflow:
+    return __Pyx_raise_neg_overflow___Pyx_PyLong_As_long();
+raise_overflow:
+    return __Pyx_raise_overflow___Pyx_PyLong_As_long();
+}
+static long __Pyx_LargePyLong___Pyx_PyLong_As_long(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    long val;
+    int ret = -1;
+#if PY_VERSION_HEX >= 0x030d00A6 && !CYTHON_COMPILING_IN_LIMITED_API
+    Py_ssize_t bytes_copied = PyLong_AsNativeBytes(
+        x, &val, sizeof(val), Py_ASNATIVEBYTES_NATIVE_ENDIAN | (is_unsigned ? Py_ASNATIVEBYTES_UNSIGNED_BUFFER | Py_ASNATIVEBYTES_REJECT_NEGATIVE : 0));
+    if (unlikely(bytes_copied == -1)) {
+    } else if (unlikely(bytes_copied > (Py_ssize_t) sizeof(val))) {
+        goto raise_overflow;
+    } else {
+        ret = 0;
+    }
+#elif PY_VERSION_HEX < 0x030d0000 && !(CYTHON_COMPILING_IN_PYPY || CYTHON_COMPILING_IN_LIMITED_API) || defined(_PyLong_AsByteArray)
+    int one = 1; int is_little = (int)*(unsigned char *)&one;
+    unsigned char *bytes = (unsigned char *)&val;
+    ret = _PyLong_AsByteArray((PyLongObject *)x,
+                                bytes, sizeof(val),
+                                is_little, !is_unsigned);
+    if ((0)) goto raise_overflow;
+#else
+    PyObject *v;
+    PyObject *stepval = NULL, *mask = NULL, *shift = NULL;
+    int bits, remaining_bits, is_negative = 0;
+    int chunk_size = (sizeof(long) < 8) ? 30 : 62;
+    if (likely(PyLong_CheckExact(x))) {
+        v = __Pyx_NewRef(x);
+    } else {
+        v = PyNumber_Long(x);
+        if (unlikely(!v)) return (long) -1;
+        assert(PyLong_CheckExact(v));
+    }
+    {
+        int result = PyObject_RichCompareBool(v, Py_False, Py_LT);
+        if (unlikely(result < 0)) {
+            Py_DECREF(v);
+            return (long) -1;
+        }
+        is_negative = result == 1;
+    }
+    if (is_unsigned && unlikely(is_negative)) {
+        Py_DECREF(v);
+        PyErr_SetString(PyExc_OverflowError,
+            "can't convert negative value to long");
+        return (long) -1;
+    } else if (is_negative) {
+        stepval = PyNumber_Invert(v);
+        Py_DECREF(v);
+        if (unlikely(!stepval))
+            return (long) -1;
+    } else {
+        stepval = v;
+    }
+    v = NULL;
+    val = (long) 0;
+    mask = PyLong_FromLong((1L << chunk_size) - 1); if (unlikely(!mask)) goto done;
+    shift = PyLong_FromLong(chunk_size); if (unlikely(!shift)) goto done;
+    for (bits = 0; bits < (int) sizeof(long) * 8 - chunk_size; bits += chunk_size) {
+        PyObject *tmp, *digit;
+        long idigit;
+        digit = PyNumber_And(stepval, mask);
+        if (unlikely(!digit)) goto done;
+        idigit = PyLong_AsLong(digit);
+        Py_DECREF(digit);
+        if (unlikely(idigit < 0)) goto done;
+        val |= ((long) idigit) << bits;
+        tmp = PyNumber_Rshift(stepval, shift);
+        if (unlikely(!tmp)) goto done;
+        Py_DECREF(stepval); stepval = tmp;
+    }
+    Py_DECREF(shift); shift = NULL;
+    Py_DECREF(mask); mask = NULL;
+    {
+        long idigit = PyLong_AsLong(stepval);
+        if (unlikely(idigit < 0)) goto done;
+        remaining_bits = ((int) sizeof(long) * 8) - bits - (is_unsigned ? 0 : 1);
+        if (unlikely(idigit >= (1L << remaining_bits)))
+            goto raise_overflow;
+        val |= ((long) idigit) << bits;
+    }
+    if (!is_unsigned) {
+        if (unlikely(val & (((long) 1) << (sizeof(long) * 8 - 1))))
+            goto raise_overflow;
+        if (is_negative)
+            val = ~val;
+    }
+    ret = 0;
+done:
+    Py_XDECREF(shift);
+    Py_XDECREF(mask);
+    Py_XDECREF(stepval);
+#endif
+    if (unlikely(ret))
+        return (long) -1;
+    return val;
+raise_overflow:
+    return __Pyx_raise_overflow___Pyx_PyLong_As_long();
+}
+static CYTHON_INLINE long __Pyx_PyLong___Pyx_PyLong_As_long(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        #if CYTHON_USE_PYLONG_INTERNALS
+        if (unlikely(__Pyx_PyLong_IsNeg(x))) {
+            goto raise_neg_overflow;
+        } else if (__Pyx_PyLong_IsCompact(x)) {
+            __PYX_VERIFY_RETURN_INT(long, __Pyx_compact_upylong, __Pyx_PyLong_CompactValueUnsigned(x))
+        } else
+        #endif
+        {
+            return __Pyx_PyULong___Pyx_PyLong_As_long(x);
+        }
+    } else {
+        #if CYTHON_USE_PYLONG_INTERNALS
+        if (__Pyx_PyLong_IsCompact(x)) {
+            __PYX_VERIFY_RETURN_INT(long, __Pyx_compact_pylong, __Pyx_PyLong_CompactValue(x))
+        } else
+        #endif
+        {
+            return __Pyx_PySLong___Pyx_PyLong_As_long(x);
+        }
+    }
+#if CYTHON_USE_PYLONG_INTERNALS
+raise_neg_overflow:
+    return __Pyx_raise_neg_overflow___Pyx_PyLong_As_long();
+raise_overflow:
+    return __Pyx_raise_overflow___Pyx_PyLong_As_long();
+#endif
+}
+static long __Pyx_NonPyLong___Pyx_PyLong_As_long(PyObject *x) {
+    long val;
+    PyObject *tmp = __Pyx_PyNumber_Long(x);
+    if (!tmp) return (long) -1;
+    val = __Pyx_PyLong_As_long(tmp);
+    Py_DECREF(tmp);
+    return val;
+}
+static CYTHON_INLINE long __Pyx_PyLong_As_long(PyObject *x) {
+    if (likely(PyLong_Check(x))) {
+        return __Pyx_PyLong___Pyx_PyLong_As_long(x);
+    } else {
+        return __Pyx_NonPyLong___Pyx_PyLong_As_long(x);
+    }
+}
+
+/* GetRuntimeVersion */
+#if __PYX_LIMITED_VERSION_HEX < 0x030b0000
+void __Pyx_init_runtime_version(void) {
+    if (__Pyx_cached_runtime_version == 0) {
+        const char* rt_version = Py_GetVersion();
+        unsigned long version = 0;
+        unsigned long factor = 0x01000000UL;
+        unsigned int digit = 0;
+        int i = 0;
+        while (factor) {
+            while ('0' <= rt_version[i] && rt_version[i] <= '9') {
+                digit = digit * 10 + (unsigned int) (rt_version[i] - '0');
+                ++i;
+            }
+            version += factor * digit;
+            if (rt_version[i] != '.')
+                break;
+            digit = 0;
+            factor >>= 8;
+            ++i;
+        }
+        __Pyx_cached_runtime_version = version;
+    }
+}
+#endif
+static unsigned long __Pyx_get_runtime_version(void) {
+#if __PYX_LIMITED_VERSION_HEX >= 0x030b0000
+    return Py_Version & ~0xFFUL;
+#else
+    return __Pyx_cached_runtime_version;
+#endif
+}
+
+/* AddModuleRef */
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING && PY_VERSION_HEX < 0x030F00a3
+  static PyObject *__Pyx_PyImport_AddModuleObjectRef(PyObject *name) {
+      PyObject *module_dict = PyImport_GetModuleDict();
+      PyObject *m;
+      if (PyMapping_GetOptionalItem(module_dict, name, &m) < 0) {
+          return NULL;
+      }
+      if (m != NULL && PyModule_Check(m)) {
+          return m;
+      }
+      Py_XDECREF(m);
+      m = PyModule_NewObject(name);
+      if (m == NULL)
+          return NULL;
+      if (PyDict_CheckExact(module_dict)) {
+          PyObject *new_m;
+          (void)PyDict_SetDefaultRef(module_dict, name, m, &new_m);
+          Py_DECREF(m);
+          return new_m;
+      } else {
+           if (PyObject_SetItem(module_dict, name, m) != 0) {
+                Py_DECREF(m);
+                return NULL;
+            }
+            return m;
+      }
+  }
+  static PyObject *__Pyx_PyImport_AddModuleRef(const char *name) {
+      if ((PY_VERSION_HEX >= 0x030E0000) &&  Py_Version >= 0x030E0100) {
+          return PyImport_AddModuleRef(name);
+      }
+      PyObject *py_name = PyUnicode_FromString(name);
+      if (!py_name) return NULL;
+      PyObject *module = __Pyx_PyImport_AddModuleObjectRef(py_name);
+      Py_DECREF(py_name);
+      return module;
+  }
+#elif __PYX_LIMITED_VERSION_HEX < 0x030d0000
+  static PyObject *__Pyx_PyImport_AddModuleRef(const char *name) {
+      PyObject *module = PyImport_AddModule(name);
+      Py_XINCREF(module);
+      return module;
+  }
+#endif
+
+/* CheckBinaryVersion */
+static int __Pyx_check_binary_version(unsigned long ct_version, unsigned long rt_version, int allow_newer) {
+    const unsigned long MAJOR_MINOR = 0xFFFF0000UL;
+    if ((rt_version & MAJOR_MINOR) == (ct_version & MAJOR_MINOR))
+        return 0;
+    if (likely(allow_newer && (rt_version & MAJOR_MINOR) > (ct_version & MAJOR_MINOR)))
+        return 1;
+    {
+        char message[200];
+        PyOS_snprintf(message, sizeof(message),
+                      "compile time Python version %d.%d "
+                      "of module '%.100s' "
+                      "%s "
+                      "runtime version %d.%d",
+                       (int) (ct_version >> 24), (int) ((ct_version >> 16) & 0xFF),
+                       __Pyx_MODULE_NAME,
+                       (allow_newer) ? "was newer than" : "does not match",
+                       (int) (rt_version >> 24), (int) ((rt_version >> 16) & 0xFF)
+       );
+        return PyErr_WarnEx(NULL, message, 1);
+    }
+}
+
+#include <string.h>
+static CYTHON_INLINE Py_ssize_t __Pyx_ssize_strlen(const char *s) {
+    size_t len = strlen(s);
+    if (unlikely(len > (size_t) PY_SSIZE_T_MAX)) {
+        PyErr_SetString(PyExc_OverflowError, "byte string is too long");
+        return -1;
+    }
+    return (Py_ssize_t) len;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char* c_str) {
+    Py_ssize_t len = __Pyx_ssize_strlen(c_str);
+    if (unlikely(len < 0)) return NULL;
+    return __Pyx_PyUnicode_FromStringAndSize(c_str, len);
+}
+static CYTHON_INLINE PyObject* __Pyx_PyByteArray_FromString(const char* c_str) {
+    Py_ssize_t len = __Pyx_ssize_strlen(c_str);
+    if (unlikely(len < 0)) return NULL;
+    return PyByteArray_FromStringAndSize(c_str, len);
+}
+static CYTHON_INLINE const char* __Pyx_PyObject_AsString(PyObject* o) {
+    Py_ssize_t ignore;
+    return __Pyx_PyObject_AsStringAndSize(o, &ignore);
+}
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_UTF8
+static CYTHON_INLINE const char* __Pyx_PyUnicode_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+    if (unlikely(__Pyx_PyUnicode_READY(o) == -1)) return NULL;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    {
+        const char* result;
+        Py_ssize_t unicode_length;
+        CYTHON_MAYBE_UNUSED_VAR(unicode_length); // only for __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+        #if __PYX_LIMITED_VERSION_HEX < 0x030A0000
+        if (unlikely(PyArg_Parse(o, "s#", &result, length) < 0)) return NULL;
+        #else
+        result = PyUnicode_AsUTF8AndSize(o, length);
+        #endif
+        #if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+        unicode_length = PyUnicode_GetLength(o);
+        if (unlikely(unicode_length < 0)) return NULL;
+        if (unlikely(unicode_length != *length)) {
+            PyUnicode_AsASCIIString(o);
+            return NULL;
+        }
+        #endif
+        return result;
+    }
+#else
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+    if (likely(PyUnicode_IS_ASCII(o))) {
+        *length = PyUnicode_GET_LENGTH(o);
+        return PyUnicode_AsUTF8(o);
+    } else {
+        PyUnicode_AsASCIIString(o);
+        return NULL;
+    }
+#else
+    return PyUnicode_AsUTF8AndSize(o, length);
+#endif
+#endif
+}
+#endif
+static CYTHON_INLINE const char* __Pyx_PyObject_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_UTF8
+    if (PyUnicode_Check(o)) {
+        return __Pyx_PyUnicode_AsStringAndSize(o, length);
+    } else
+#endif
+    if (PyByteArray_Check(o)) {
+#if (CYTHON_ASSUME_SAFE_SIZE && CYTHON_ASSUME_SAFE_MACROS) || (CYTHON_COMPILING_IN_PYPY && (defined(PyByteArray_AS_STRING) && defined(PyByteArray_GET_SIZE)))
+        *length = PyByteArray_GET_SIZE(o);
+        return PyByteArray_AS_STRING(o);
+#else
+        *length = PyByteArray_Size(o);
+        if (*length == -1) return NULL;
+        return PyByteArray_AsString(o);
+#endif
+    } else
+    {
+        char* result;
+        int r = PyBytes_AsStringAndSize(o, &result, length);
+        if (unlikely(r < 0)) {
+            return NULL;
+        } else {
+            return result;
+        }
+    }
+}
+static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject* x) {
+   int is_true = x == Py_True;
+   if (is_true | (x == Py_False) | (x == Py_None)) return is_true;
+   else return PyObject_IsTrue(x);
+}
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject* x) {
+    int retval;
+    if (unlikely(!x)) return -1;
+    retval = __Pyx_PyObject_IsTrue(x);
+    Py_DECREF(x);
+    return retval;
+}
+static PyObject* __Pyx_PyNumber_LongWrongResultType(PyObject* result) {
+    __Pyx_TypeName result_type_name = __Pyx_PyType_GetFullyQualifiedName(Py_TYPE(result));
+    #if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030d0000
+    if (unlikely(!result_type_name)) goto bad;
+    #endif
+    if (PyLong_Check(result)) {
+        if (PyErr_WarnFormat(PyExc_DeprecationWarning, 1,
+                "__int__ returned non-int (type " __Pyx_FMT_TYPENAME ").  "
+                "The ability to return an instance of a strict subclass of int is deprecated, "
+                "and may be removed in a future version of Python.",
+                result_type_name)) {
+            __Pyx_DECREF_TypeName(result_type_name);
+            goto bad;
+        }
+        __Pyx_DECREF_TypeName(result_type_name);
+        return result;
+    }
+    PyErr_Format(PyExc_TypeError,
+                 "__int__ returned non-int (type " __Pyx_FMT_TYPENAME ")",
+                 result_type_name);
+    __Pyx_DECREF_TypeName(result_type_name);
+bad:
+    Py_DECREF(result);
+    return NULL;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_Long(PyObject* x) {
+#if CYTHON_USE_TYPE_SLOTS
+  PyNumberMethods *m;
+#endif
+  PyObject *res = NULL;
+  if (likely(PyLong_Check(x)))
+      return __Pyx_NewRef(x);
+#if CYTHON_USE_TYPE_SLOTS
+  m = Py_TYPE(x)->tp_as_number;
+  if (likely(m && m->nb_int)) {
+      res = m->nb_int(x);
+  }
+#else
+  if (!PyBytes_CheckExact(x) && !PyUnicode_CheckExact(x)) {
+      res = PyNumber_Long(x);
+  }
+#endif
+  if (likely(res)) {
+      if (unlikely(!PyLong_CheckExact(res))) {
+          return __Pyx_PyNumber_LongWrongResultType(res);
+      }
+  }
+  else if (!PyErr_Occurred()) {
+      PyErr_SetString(PyExc_TypeError,
+                      "an integer is required");
+  }
+  return res;
+}
+static CYTHON_INLINE Py_ssize_t __Pyx_PyLong_AsSsize_t(PyObject* b) {
+    #if CYTHON_USE_PYLONG_INTERNALS
+    Py_ssize_t ival;
+    const Py_ssize_t size = __Pyx_PyLong_DigitCount(b);
+    const int is_neg = __Pyx_PyLong_IsNeg(b);
+    const digit* digits = __Pyx_PyLong_Digits(b);
+    if (size == 0) return 0;
+    #if SIZEOF_SIZE_T * 8 > 1 * PyLong_SHIFT
+    if (size == 1) {
+        ival = (Py_ssize_t) (((size_t)digits[0]));
+    } else
+    #endif
+    #if SIZEOF_SIZE_T * 8 > 2 * PyLong_SHIFT
+    if (size == 2) {
+        ival = (Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+    } else
+    #endif
+    #if SIZEOF_SIZE_T * 8 > 3 * PyLong_SHIFT
+    if (size == 3) {
+        ival = (Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+    } else
+    #endif
+    #if SIZEOF_SIZE_T * 8 > 4 * PyLong_SHIFT
+    if (size == 4) {
+        ival = (Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+    } else
+    #endif
+        return PyLong_AsSsize_t(b);
+    return is_neg ? -ival : ival;
+    #else
+    return PyLong_AsSsize_t(b);
+    #endif
+}
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject* b) {
+    if (likely(PyLong_Check(b))) {
+        return __Pyx_PyLong_AsSsize_t(b);
+    } else {
+        Py_ssize_t ival;
+        PyObject *x = PyNumber_Index(b);
+        if (unlikely(!x)) return -1;
+        ival = __Pyx_PyLong_AsSsize_t(x);
+        Py_DECREF(x);
+        return ival;
+    }
+}
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject* o) {
+  if (sizeof(Py_hash_t) == sizeof(Py_ssize_t)) {
+    return (Py_hash_t) __Pyx_PyIndex_AsSsize_t(o);
+  } else {
+    Py_ssize_t ival;
+    PyObject *x;
+    x = PyNumber_Index(o);
+    if (!x) return -1;
+    ival = PyLong_AsLong(x);
+    Py_DECREF(x);
+    return ival;
+  }
+}
+static CYTHON_INLINE PyObject *__Pyx_Owned_Py_None(int b) {
+    CYTHON_UNUSED_VAR(b);
+    return __Pyx_NewRef(Py_None);
+}
+static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b) {
+  return __Pyx_NewRef(b ? Py_True: Py_False);
+}
+static CYTHON_INLINE PyObject * __Pyx_PyLong_FromSize_t(size_t ival) {
+    return PyLong_FromSize_t(ival);
+}
+
+
+/* MultiPhaseInitModuleState */
+#if CYTHON_PEP489_MULTI_PHASE_INIT && CYTHON_USE_MODULE_STATE
+#ifndef CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+#if (CYTHON_COMPILING_IN_LIMITED_API || PY_VERSION_HEX >= 0x030C0000)
+  #define CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE 1
+#else
+  #define CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE 0
+#endif
+#endif
+#if CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE && !CYTHON_ATOMICS
+#error "Module state with PEP489 requires atomics. Currently that's one of\
+ C11, C++11, gcc atomic intrinsics or MSVC atomic intrinsics"
+#endif
+#if !CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+#define __Pyx_ModuleStateLookup_Lock()
+#define __Pyx_ModuleStateLookup_Unlock()
+#elif !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x030d0000
+static PyMutex __Pyx_ModuleStateLookup_mutex = {0};
+#define __Pyx_ModuleStateLookup_Lock() PyMutex_Lock(&__Pyx_ModuleStateLookup_mutex)
+#define __Pyx_ModuleStateLookup_Unlock() PyMutex_Unlock(&__Pyx_ModuleStateLookup_mutex)
+#elif defined(__cplusplus) && __cplusplus >= 201103L
+#include <mutex>
+static std::mutex __Pyx_ModuleStateLookup_mutex;
+#define __Pyx_ModuleStateLookup_Lock() __Pyx_ModuleStateLookup_mutex.lock()
+#define __Pyx_ModuleStateLookup_Unlock() __Pyx_ModuleStateLookup_mutex.unlock()
+#elif defined(__STDC_VERSION__) && (__STDC_VERSION__ > 201112L) && !defined(__STDC_NO_THREADS__)
+#include <threads.h>
+static mtx_t __Pyx_ModuleStateLookup_mutex;
+static once_flag __Pyx_ModuleStateLookup_mutex_once_flag = ONCE_FLAG_INIT;
+static void __Pyx_ModuleStateLookup_initialize_mutex(void) {
+    mtx_init(&__Pyx_ModuleStateLookup_mutex, mtx_plain);
+}
+#define __Pyx_ModuleStateLookup_Lock()\
+  call_once(&__Pyx_ModuleStateLookup_mutex_once_flag, __Pyx_ModuleStateLookup_initialize_mutex);\
+  mtx_lock(&__Pyx_ModuleStateLookup_mutex)
+#define __Pyx_ModuleStateLookup_Unlock() mtx_unlock(&__Pyx_ModuleStateLookup_mutex)
+#elif defined(HAVE_PTHREAD_H)
+#include <pthread.h>
+static pthread_mutex_t __Pyx_ModuleStateLookup_mutex = PTHREAD_MUTEX_INITIALIZER;
+#define __Pyx_ModuleStateLookup_Lock() pthread_mutex_lock(&__Pyx_ModuleStateLookup_mutex)
+#define __Pyx_ModuleStateLookup_Unlock() pthread_mutex_unlock(&__Pyx_ModuleStateLookup_mutex)
+#elif defined(_WIN32)
+#include <Windows.h>  // synchapi.h on its own doesn't work
+static SRWLOCK __Pyx_ModuleStateLookup_mutex = SRWLOCK_INIT;
+#define __Pyx_ModuleStateLookup_Lock() AcquireSRWLockExclusive(&__Pyx_ModuleStateLookup_mutex)
+#define __Pyx_ModuleStateLookup_Unlock() ReleaseSRWLockExclusive(&__Pyx_ModuleStateLookup_mutex)
+#else
+#error "No suitable lock available for CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE.\
+ Requires C standard >= C11, or C++ standard >= C++11,\
+ or pthreads, or the Windows 32 API, or Python >= 3.13."
+#endif
+typedef struct {
+    int64_t id;
+    PyObject *module;
+} __Pyx_InterpreterIdAndModule;
+typedef struct {
+    char interpreter_id_as_index;
+    Py_ssize_t count;
+    Py_ssize_t allocated;
+    __Pyx_InterpreterIdAndModule table[1];
+} __Pyx_ModuleStateLookupData;
+#define __PYX_MODULE_STATE_LOOKUP_SMALL_SIZE 32
+#if CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+static __pyx_atomic_int_type __Pyx_ModuleStateLookup_read_counter = 0;
+#endif
+#if CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+static __pyx_atomic_ptr_type __Pyx_ModuleStateLookup_data = 0;
+#else
+static __Pyx_ModuleStateLookupData* __Pyx_ModuleStateLookup_data = NULL;
+#endif
+static __Pyx_InterpreterIdAndModule* __Pyx_State_FindModuleStateLookupTableLowerBound(
+        __Pyx_InterpreterIdAndModule* table,
+        Py_ssize_t count,
+        int64_t interpreterId) {
+    __Pyx_InterpreterIdAndModule* begin = table;
+    __Pyx_InterpreterIdAndModule* end = begin + count;
+    if (begin->id == interpreterId) {
+        return begin;
+    }
+    while ((end - begin) > __PYX_MODULE_STATE_LOOKUP_SMALL_SIZE) {
+        __Pyx_InterpreterIdAndModule* halfway = begin + (end - begin)/2;
+        if (halfway->id == interpreterId) {
+            return halfway;
+        }
+        if (halfway->id < interpreterId) {
+            begin = halfway;
+        } else {
+            end = halfway;
+        }
+    }
+    for (; begin < end; ++begin) {
+        if (begin->id >= interpreterId) return begin;
+    }
+    return begin;
+}
+static PyObject *__Pyx_State_FindModule(CYTHON_UNUSED void* dummy) {
+    int64_t interpreter_id = PyInterpreterState_GetID(PyInterpreterState_Get());
+    if (interpreter_id == -1) return NULL;
+#if CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+    __Pyx_ModuleStateLookupData* data = (__Pyx_ModuleStateLookupData*)__pyx_atomic_pointer_load_relaxed(&__Pyx_ModuleStateLookup_data);
+    {
+        __pyx_atomic_incr_acq_rel(&__Pyx_ModuleStateLookup_read_counter);
+        if (likely(data)) {
+            __Pyx_ModuleStateLookupData* new_data = (__Pyx_ModuleStateLookupData*)__pyx_atomic_pointer_load_acquire(&__Pyx_ModuleStateLookup_data);
+            if (likely(data == new_data)) {
+                goto read_finished;
+            }
+        }
+        __pyx_atomic_decr_acq_rel(&__Pyx_ModuleStateLookup_read_counter);
+        __Pyx_ModuleStateLookup_Lock();
+        __pyx_atomic_incr_relaxed(&__Pyx_ModuleStateLookup_read_counter);
+        data = (__Pyx_ModuleStateLookupData*)__pyx_atomic_pointer_load_relaxed(&__Pyx_ModuleStateLookup_data);
+        __Pyx_ModuleStateLookup_Unlock();
+    }
+  read_finished:;
+#else
+    __Pyx_ModuleStateLookupData* data = __Pyx_ModuleStateLookup_data;
+#endif
+    __Pyx_InterpreterIdAndModule* found = NULL;
+    if (unlikely(!data)) goto end;
+    if (data->interpreter_id_as_index) {
+        if (interpreter_id < data->count) {
+            found = data->table+interpreter_id;
+        }
+    } else {
+        found = __Pyx_State_FindModuleStateLookupTableLowerBound(
+            data->table, data->count, interpreter_id);
+    }
+  end:
+    {
+        PyObject *result=NULL;
+        if (found && found->id == interpreter_id) {
+            result = found->module;
+        }
+#if CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+        __pyx_atomic_decr_acq_rel(&__Pyx_ModuleStateLookup_read_counter);
+#endif
+        return result;
+    }
+}
+#if CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+static void __Pyx_ModuleStateLookup_wait_until_no_readers(void) {
+    while (__pyx_atomic_load(&__Pyx_ModuleStateLookup_read_counter) != 0);
+}
+#else
+#define __Pyx_ModuleStateLookup_wait_until_no_readers()
+#endif
+static int __Pyx_State_AddModuleInterpIdAsIndex(__Pyx_ModuleStateLookupData **old_data, PyObject* module, int64_t interpreter_id) {
+    Py_ssize_t to_allocate = (*old_data)->allocated;
+    while (to_allocate <= interpreter_id) {
+        if (to_allocate == 0) to_allocate = 1;
+        else to_allocate *= 2;
+    }
+    __Pyx_ModuleStateLookupData *new_data = *old_data;
+    if (to_allocate != (*old_data)->allocated) {
+         new_data = (__Pyx_ModuleStateLookupData *)realloc(
+            *old_data,
+            sizeof(__Pyx_ModuleStateLookupData)+(to_allocate-1)*sizeof(__Pyx_InterpreterIdAndModule));
+        if (!new_data) {
+            PyErr_NoMemory();
+            return -1;
+        }
+        for (Py_ssize_t i = new_data->allocated; i < to_allocate; ++i) {
+            new_data->table[i].id = i;
+            new_data->table[i].module = NULL;
+        }
+        new_data->allocated = to_allocate;
+    }
+    new_data->table[interpreter_id].module = module;
+    if (new_data->count < interpreter_id+1) {
+        new_data->count = interpreter_id+1;
+    }
+    *old_data = new_data;
+    return 0;
+}
+static void __Pyx_State_ConvertFromInterpIdAsIndex(__Pyx_ModuleStateLookupData *data) {
+    __Pyx_InterpreterIdAndModule *read = data->table;
+    __Pyx_InterpreterIdAndModule *write = data->table;
+    __Pyx_InterpreterIdAndModule *end = read + data->count;
+    for (; read<end; ++read) {
+        if (read->module) {
+            write->id = read->id;
+            write->module = read->module;
+            ++write;
+        }
+    }
+    data->count = write - data->table;
+    for (; write<end; ++write) {
+        write->id = 0;
+        write->module = NULL;
+    }
+    data->interpreter_id_as_index = 0;
+}
+static int __Pyx_State_AddModule(PyObject* module, CYTHON_UNUSED void* dummy) {
+    int64_t interpreter_id = PyInterpreterState_GetID(PyInterpreterState_Get());
+    if (interpreter_id == -1) return -1;
+    int result = 0;
+    __Pyx_ModuleStateLookup_Lock();
+#if CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+    __Pyx_ModuleStateLookupData *old_data = (__Pyx_ModuleStateLookupData *)
+            __pyx_atomic_pointer_exchange(&__Pyx_ModuleStateLookup_data, 0);
+#else
+    __Pyx_ModuleStateLookupData *old_data = __Pyx_ModuleStateLookup_data;
+#endif
+    __Pyx_ModuleStateLookupData *new_data = old_data;
+    if (!new_data) {
+        new_data = (__Pyx_ModuleStateLookupData *)calloc(1, sizeof(__Pyx_ModuleStateLookupData));
+        if (!new_data) {
+            result = -1;
+            PyErr_NoMemory();
+            goto end;
+        }
+        new_data->allocated = 1;
+        new_data->interpreter_id_as_index = 1;
+    }
+    __Pyx_ModuleStateLookup_wait_until_no_readers();
+    if (new_data->interpreter_id_as_index) {
+        if (interpreter_id < __PYX_MODULE_STATE_LOOKUP_SMALL_SIZE) {
+            result = __Pyx_State_AddModuleInterpIdAsIndex(&new_data, module, interpreter_id);
+            goto end;
+        }
+        __Pyx_State_ConvertFromInterpIdAsIndex(new_data);
+    }
+    {
+        Py_ssize_t insert_at = 0;
+        {
+            __Pyx_InterpreterIdAndModule* lower_bound = __Pyx_State_FindModuleStateLookupTableLowerBound(
+                new_data->table, new_data->count, interpreter_id);
+            assert(lower_bound);
+            insert_at = lower_bound - new_data->table;
+            if (unlikely(insert_at < new_data->count && lower_bound->id == interpreter_id)) {
+                lower_bound->module = module;
+                goto end;  // already in table, nothing more to do
+            }
+        }
+        if (new_data->count+1 >= new_data->allocated) {
+            Py_ssize_t to_allocate = (new_data->count+1)*2;
+            new_data =
+                (__Pyx_ModuleStateLookupData*)realloc(
+                    new_data,
+                    sizeof(__Pyx_ModuleStateLookupData) +
+                    (to_allocate-1)*sizeof(__Pyx_InterpreterIdAndModule));
+            if (!new_data) {
+                result = -1;
+                new_data = old_data;
+                PyErr_NoMemory();
+                goto end;
+            }
+            new_data->allocated = to_allocate;
+        }
+        ++new_data->count;
+        int64_t last_id = interpreter_id;
+        PyObject *last_module = module;
+        for (Py_ssize_t i=insert_at; i<new_data->count; ++i) {
+            int64_t current_id = new_data->table[i].id;
+            new_data->table[i].id = last_id;
+            last_id = current_id;
+            PyObject *current_module = new_data->table[i].module;
+            new_data->table[i].module = last_module;
+            last_module = current_module;
+        }
+    }
+  end:
+#if CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+    __pyx_atomic_pointer_exchange(&__Pyx_ModuleStateLookup_data, new_data);
+#else
+    __Pyx_ModuleStateLookup_data = new_data;
+#endif
+    __Pyx_ModuleStateLookup_Unlock();
+    return result;
+}
+static int __Pyx_State_RemoveModule(CYTHON_UNUSED void* dummy) {
+    int64_t interpreter_id = PyInterpreterState_GetID(PyInterpreterState_Get());
+    if (interpreter_id == -1) return -1;
+    __Pyx_ModuleStateLookup_Lock();
+#if CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+    __Pyx_ModuleStateLookupData *data = (__Pyx_ModuleStateLookupData *)
+            __pyx_atomic_pointer_exchange(&__Pyx_ModuleStateLookup_data, 0);
+#else
+    __Pyx_ModuleStateLookupData *data = __Pyx_ModuleStateLookup_data;
+#endif
+    if (data->interpreter_id_as_index) {
+        if (interpreter_id < data->count) {
+            data->table[interpreter_id].module = NULL;
+        }
+        goto done;
+    }
+    {
+        __Pyx_ModuleStateLookup_wait_until_no_readers();
+        __Pyx_InterpreterIdAndModule* lower_bound = __Pyx_State_FindModuleStateLookupTableLowerBound(
+            data->table, data->count, interpreter_id);
+        if (!lower_bound) goto done;
+        if (lower_bound->id != interpreter_id) goto done;
+        __Pyx_InterpreterIdAndModule *end = data->table+data->count;
+        for (;lower_bound<end-1; ++lower_bound) {
+            lower_bound->id = (lower_bound+1)->id;
+            lower_bound->module = (lower_bound+1)->module;
+        }
+    }
+    --data->count;
+    if (data->count == 0) {
+        free(data);
+        data = NULL;
+    }
+  done:
+#if CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+    __pyx_atomic_pointer_exchange(&__Pyx_ModuleStateLookup_data, data);
+#else
+    __Pyx_ModuleStateLookup_data = data;
+#endif
+    __Pyx_ModuleStateLookup_Unlock();
+    return 0;
+}
+#endif
+
+/* #### Code section: utility_code_pragmas_end ### */
+#ifdef _MSC_VER
+#pragma warning( pop )
+#endif
+
+
+
+/* #### Code section: end ### */
+#endif /* Py_PYTHON_H */
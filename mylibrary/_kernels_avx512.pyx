@@ -0,0 +1,10 @@
+# -*- coding: utf-8 -*-
+#
+# cython: wraparound  = False
+# cython: boundscheck = False
+# cython: cdivision   = True
+"""Kernels of mylibrary.compute, compiled for AVX-512 (F, DQ, VL). Selected automatically at import."""
+
+from __future__ import division, print_function, absolute_import
+
+include "_kernels.pxi"
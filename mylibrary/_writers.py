@@ -0,0 +1,305 @@
+# -*- coding: utf-8 -*-
+#
+"""Non-blocking output for mylibrary.dostuff: BackgroundWriter and AsyncWriter.
+
+This part of dostuff is plain Python (the work is done by a Writer, in a thread), so both backends
+share it; see mylibrary.backend(). mylibrary.dostuff subclasses these classes with its own Writer.
+Use them from there, not from here.
+"""
+
+from __future__ import division, print_function, absolute_import
+
+import atexit
+import queue
+import threading
+import time
+import weakref
+
+
+# Writers that may hold unflushed data, flushed at interpreter exit.
+#
+_open_writers = weakref.WeakSet()
+
+@atexit.register
+def _flush_open_writers():
+    # Background writers first, since they feed into a Writer.
+    for w in sorted( list(_open_writers), key=lambda w: not isinstance(w, BackgroundWriter) ):
+        try:
+            w.close()
+        except Exception:
+            pass
+
+
+#########################################################
+# Non-blocking output
+#########################################################
+
+_STOP = object()  # end-of-queue marker
+
+# Writer thread of BackgroundWriter: drain q into writer until _STOP. Notify space when it takes messages.
+#
+# This does not reference the BackgroundWriter itself, so that it can be garbage collected
+# (and hence closed at the latest at interpreter exit) while the thread is running.
+#
+def _drain( q, writer, max_delay, errors, space ):
+    timeout  = None  # no pending data
+    deadline = 0.0
+    stop     = False
+    while not stop:
+        try:
+            batch = [ q.get(timeout=timeout) ]
+        except queue.Empty:  # time policy
+            try:
+                writer.flush()
+            except Exception as err:
+                errors.append(err)
+            timeout = None
+            continue
+        try:
+            while True:
+                batch.append( q.get_nowait() )
+        except queue.Empty:
+            pass
+        with space:
+            space.notify_all()
+        if batch[len(batch) - 1] is _STOP:
+            batch.pop()
+            stop = True
+        try:
+            if not errors:  # after a write error, discard the rest
+                writer.write_many(batch)
+                if stop  or  max_delay == 0:
+                    writer.flush()
+        except Exception as err:
+            errors.append(err)
+        finally:
+            for _ in range( len(batch) + stop ):
+                q.task_done()
+        if max_delay is not None  and  max_delay > 0:
+            if timeout is None:
+                deadline = time.monotonic() + max_delay
+            timeout = max( 0.0, deadline - time.monotonic() )
+
+class BackgroundWriter:
+    """Non-blocking version of Writer: messages are handed to a dedicated writer thread.
+
+Messages go into a bounded queue, which a background thread drains into a Writer.
+Hence a slow stdout or pipe does not stall the calling threads, until the queue fills up;
+then ``policy`` decides what happens.
+
+Messages are as in Writer. Bytes-like messages other than ``bytes`` are copied into
+a ``bytes`` object when queued, since they are written out later.
+
+Pending messages are written out on flush() and close(), at the end of a ``with`` block,
+and at interpreter exit. If writing fails in the background thread, the exception is raised
+in the caller, from the next write(), flush() or close().
+
+Parameters:
+    file : file object or int, optional
+        Where to write. Default ``sys.stdout``.
+
+    maxsize : int
+        Maximum number of messages in the queue. Default 10000.
+
+    policy : str
+        What write() does when the queue is full:
+            "block": wait until there is space (backpressure). This is the default.
+            "drop":  discard the message, and count it in ``dropped``.
+
+    bufsize, max_delay :
+        As in Writer. The time policy is applied by the writer thread, so pending messages
+        are written out after ``max_delay`` seconds even if no more messages arrive.
+"""
+    _Writer = None  # the Writer class of the backend; set by the subclass in mylibrary.dostuff
+
+    def __init__( self, file=None, maxsize=10000, policy="block", bufsize=65536, max_delay=0.5 ):
+        if policy not in ("block", "drop"):
+            raise ValueError( "policy must be 'block' or 'drop', got '%s'" % (policy) )
+        if maxsize <= 0:
+            raise ValueError( "maxsize must be > 0, got %d" % (maxsize) )
+        self.policy  = policy
+        self.dropped = 0
+        self.closed  = False
+        self._errors = []
+        self._lock   = threading.Lock()  # for closed and dropped; held while queueing, so nothing is queued after _STOP
+        self._queue  = queue.Queue(maxsize)
+        self._space  = threading.Condition()  # notified when the writer thread takes messages from the queue
+        self._writer = self._Writer( file, bufsize, None )  # the time policy is applied by _drain
+        self._thread = threading.Thread( target=_drain, args=(self._queue, self._writer, max_delay, self._errors, self._space),
+                                         name="mylibrary.dostuff.BackgroundWriter", daemon=True )
+        self._thread.start()
+        _open_writers.add(self)
+
+    def _check_open( self ):
+        if self.closed:
+            raise ValueError( "write to closed BackgroundWriter" )
+
+    def _count_drop( self ):
+        with self._lock:
+            self.dropped += 1
+
+    def _raise_pending( self ):
+        if self._errors:
+            raise self._errors.pop(0)
+
+    # A message in the form it is queued.
+    #
+    @staticmethod
+    def _message( s ):
+        if isinstance(s, (str, bytes)):
+            return s
+        return bytes( memoryview(s).cast("B") )  # snapshot, in case the caller modifies the buffer
+
+    def write( self, s ):
+        """Queue one message. Return whether it was queued (False if dropped)."""
+        s = self._message(s)
+        with self._lock:  # with policy "block", other writers wait here rather than in the queue: the same backpressure
+            self._check_open()
+            self._raise_pending()
+            if self.policy == "block":
+                self._queue.put(s)
+                return True
+            try:
+                self._queue.put_nowait(s)
+            except queue.Full:
+                self.dropped += 1
+                return False
+            return True
+
+    def write_nowait( self, s ):
+        """Queue one message if there is space, regardless of policy. Return whether it was queued.
+
+A message that did not fit is not counted in ``dropped``.
+"""
+        s = self._message(s)
+        with self._lock:
+            self._check_open()
+            self._raise_pending()
+            try:
+                self._queue.put_nowait(s)
+            except queue.Full:
+                return False
+            return True
+
+    # As write() with policy "block", but give up once the threading.Event cancelled is set.
+    #
+    # Return whether s was queued. Used by AsyncWriter, whose awaiting task may be cancelled:
+    # cancelled is checked right before each attempt, so once it is set, s is not queued.
+    #
+    def _put_unless( self, s, cancelled ):
+        s = self._message(s)
+        with self._lock:
+            while True:
+                self._check_open()
+                self._raise_pending()
+                with self._space:  # the writer thread cannot make space unnoticed between put_nowait() and wait()
+                    if cancelled.is_set():
+                        return False
+                    try:
+                        self._queue.put_nowait(s)
+                        return True
+                    except queue.Full:
+                        self._space.wait(0.1)  # with a timeout, to see cancelled soon after it is set
+
+    def flush( self ):
+        """Wait until all queued messages have been written out."""
+        if not self.closed:
+            self._queue.join()
+            self._writer.flush()
+        self._raise_pending()
+
+    def close( self ):
+        """Write out all queued messages, and stop the writer thread.
+
+Closing an already closed writer does nothing. The underlying file is not closed.
+"""
+        with self._lock:
+            if self.closed:
+                return
+            self.closed = True
+            self._queue.put(_STOP)  # always accepted eventually, since the thread keeps draining
+        _open_writers.discard(self)
+        self._thread.join()
+        self._writer.close()
+        self._raise_pending()
+
+    def __enter__( self ):
+        return self
+
+    def __exit__( self, exc_type, exc_value, traceback ):
+        self.close()
+
+# Run fn(*args) in executor, from the running event loop.
+#
+# asyncio is imported here, not at the top: it takes longer to import than all of mylibrary,
+# and whoever awaits this has imported it already.
+#
+async def _in_executor( executor, fn, *args ):
+    import asyncio
+    return await asyncio.get_running_loop().run_in_executor( executor, fn, *args )
+
+class AsyncWriter:
+    """asyncio version of BackgroundWriter: awaitable writes that never block the event loop.
+
+When the queue is full, ``await write()`` either drops the message (policy "drop"),
+or waits without blocking the event loop until there is space (policy "block").
+
+The waiting is done by a thread of this writer, not by the default executor of the event loop,
+so that blocked writes cannot hold up other work there. Writes that wait are queued in the order
+they were awaited. If the awaiting task is cancelled, its message is dropped (and not counted
+in ``dropped``), unless it was queued already.
+
+Parameters are as in BackgroundWriter.
+
+Example::
+
+    async with AsyncWriter() as w:
+        async for s in messages:
+            await w.write(s)
+"""
+    _BackgroundWriter = None  # set by the subclass in mylibrary.dostuff
+
+    def __init__( self, file=None, maxsize=10000, policy="block", bufsize=65536, max_delay=0.5 ):
+        from concurrent.futures import ThreadPoolExecutor  # as asyncio, see _in_executor()
+        self._bw       = self._BackgroundWriter( file, maxsize, policy, bufsize, max_delay )
+        self._executor = ThreadPoolExecutor( 1, thread_name_prefix="mylibrary.dostuff.AsyncWriter" )  # started on first use
+
+    @property
+    def dropped( self ):
+        return self._bw.dropped
+
+    @property
+    def closed( self ):
+        return self._bw.closed
+
+    async def write( self, s ):
+        """Queue one message. Return whether it was queued (False if dropped)."""
+        if self._bw.write_nowait(s):
+            return True
+        if self._bw.policy == "drop":
+            self._bw._count_drop()
+            return False
+        s = self._bw._message(s)  # snapshot now; the thread queues it later
+        cancelled = threading.Event()
+        try:
+            return await _in_executor( self._executor, self._bw._put_unless, s, cancelled )
+        except BaseException:  # asyncio.CancelledError: stop waiting for space in the queue
+            cancelled.set()
+            raise
+
+    async def flush( self ):
+        """Wait until all queued messages have been written out."""
+        await _in_executor( self._executor, self._bw.flush )
+
+    async def aclose( self ):
+        """Write out all queued messages, and stop the writer thread."""
+        try:
+            await _in_executor( self._executor, self._bw.close )
+        finally:
+            self._executor.shutdown( wait=False )
+
+    async def __aenter__( self ):
+        return self
+
+    async def __aexit__( self, exc_type, exc_value, traceback ):
+        await self.aclose()
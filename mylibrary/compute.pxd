@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+#
+# Cython-level declarations for mylibrary.compute, available for cimport from other Cython modules.
+#
+# These are the C-level kernels behind the Python API: raw pointers in, no Python objects,
+# no GIL needed, and always serial, so they can be called from inside the caller's own
+# prange() loops. Strides are counted in elements (not bytes), and may be negative.
+#
+# Usage:
+#
+#     cimport mylibrary.compute as compute
+#
+#     for i in prange(m, nogil=True):
+#         s[i] = compute.sum_f_double(&x[i, 0], 1, n)
+
+from __future__ import absolute_import
+
+# Elementwise square root, out[j] = sqrt(x[j]) for j = 0, ..., n-1.
+#
+# out may be x itself, but must not otherwise overlap it.
+#
+cdef void f_double( const double* x, double* out, Py_ssize_t n ) noexcept nogil
+cdef void f_float( const float* x, float* out, Py_ssize_t n ) noexcept nogil
+
+cdef void f_strided_double( const double* x, Py_ssize_t xstride, double* out, Py_ssize_t ostride, Py_ssize_t n ) noexcept nogil
+cdef void f_strided_float( const float* x, Py_ssize_t xstride, float* out, Py_ssize_t ostride, Py_ssize_t n ) noexcept nogil
+
+# Fused reductions of sqrt(x[j]) over j = 0, ..., n-1. Sums use pairwise summation in double precision.
+#
+# sum and dot return 0 for n = 0; min and max return NaN for n = 0, and propagate NaNs.
+#
+cdef double sum_f_double( const double* x, Py_ssize_t xstride, Py_ssize_t n ) noexcept nogil
+cdef double sum_f_float( const float* x, Py_ssize_t xstride, Py_ssize_t n ) noexcept nogil
+
+cdef double dot_f_double( const double* x, Py_ssize_t xstride, const double* y, Py_ssize_t ystride, Py_ssize_t n ) noexcept nogil
+cdef double dot_f_float( const float* x, Py_ssize_t xstride, const float* y, Py_ssize_t ystride, Py_ssize_t n ) noexcept nogil
+
+cdef double min_f_double( const double* x, Py_ssize_t xstride, Py_ssize_t n ) noexcept nogil
+cdef double min_f_float( const float* x, Py_ssize_t xstride, Py_ssize_t n ) noexcept nogil
+
+cdef double max_f_double( const double* x, Py_ssize_t xstride, Py_ssize_t n ) noexcept nogil
+cdef double max_f_float( const float* x, Py_ssize_t xstride, Py_ssize_t n ) noexcept nogil
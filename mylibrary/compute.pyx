@@ -7,13 +7,496 @@
 
 from __future__ import division, print_function, absolute_import
 
+import importlib
+import mmap
+import os
 
 # import something from libm
-from libc.math cimport sqrt as c_sqrt
+from libc.math cimport NAN
+
+from cpython.pycapsule cimport PyCapsule_GetPointer
+
+# the kernels, compiled once per instruction set variant; see _kernels.pxd
+from mylibrary._kernels cimport *
+
+# hot-path counters (off by default); see mylibrary.counters
+from mylibrary.counters cimport Site, SITE_COMPUTE_F, SITE_COMPUTE_F_UFUNC, SITE_COMPUTE_REDUCE, SITE_COMPUTE_PIPELINE, \
+                                enabled_flag, clock_ns, record
 
 # we use NumPy for memory allocation
 import numpy as np
 
+# and NumPy's C API for creating ufuncs (setup.py adds NumPy's headers to the include path)
+cimport numpy as cnp
+cnp.import_array()
+cnp.import_ufunc()
+
+# argument checking and output allocation, plain Python shared with the NumPy backend; see mylibrary/_arguments.py
+from mylibrary._arguments import supported_dtypes, check_input as _check_input, prepare_elementwise as _prepare_elementwise
+
+
+# Arrays shorter than this are always processed serially, regardless of num_threads.
+#
+# Starting up an OpenMP thread team costs some microseconds, which for a short array
+# is more than the whole serial loop takes. Tune this for your machine if needed;
+# it is a plain module attribute, so  mylibrary.compute.parallel_threshold = ...  works.
+#
+parallel_threshold = 65536
+
+# Floating-point types the kernels are specialized for.
+#
+# Cython generates one copy of each function using "real" for each listed type;
+# Python-level calls dispatch on the dtype of the actual arguments.
+#
+#    http://cython.readthedocs.io/en/latest/src/userguide/fusedtypes.html
+#
+ctypedef fused real:
+    float
+    double
+
+cdef const bint* _stats_on = enabled_flag()
+
+
+#########################################################
+# C-level kernels
+#########################################################
+
+# The kernels live in _kernels.pxi, which setup.py compiles once per instruction set variant,
+# as the modules mylibrary._kernels_<variant>. A wheel built this way runs on any CPU of the
+# architecture, and still uses e.g. AVX2 and FMA where available, unlike a -march=native build.
+#
+# At import, we pick the best variant that the CPU supports (see _select_kernels() below),
+# and from then on call the kernels through its table of function pointers. That costs one
+# indirect call per kernel call, i.e. per array, not per element.
+#
+# These wrappers give the kernels the fused-type signatures that the rest of this module uses.
+
+cdef const KernelTable* _K = NULL
+
+cdef inline void _sqrt_contig( const real* x, real* out, Py_ssize_t n, int num_threads ) noexcept nogil:
+    if real is float:
+        _K.sqrt_contig_float(x, out, n, num_threads)
+    else:
+        _K.sqrt_contig_double(x, out, n, num_threads)
+
+cdef inline void _sqrt_strided( const real* x, Py_ssize_t xs0, Py_ssize_t xs1,
+                                real* out, Py_ssize_t os0, Py_ssize_t os1,
+                                Py_ssize_t m, Py_ssize_t n, int num_threads ) noexcept nogil:
+    if real is float:
+        _K.sqrt_strided_float(x, xs0, xs1, out, os0, os1, m, n, num_threads)
+    else:
+        _K.sqrt_strided_double(x, xs0, xs1, out, os0, os1, m, n, num_threads)
+
+cdef inline double _pairwise_sum( const real* x, Py_ssize_t xs0, Py_ssize_t xs1,
+                                  const real* y, Py_ssize_t ys0, Py_ssize_t ys1,
+                                  Py_ssize_t ncols, Py_ssize_t k0, Py_ssize_t count ) noexcept nogil:
+    if real is float:
+        return _K.pairwise_sum_float(x, xs0, xs1, y, ys0, ys1, ncols, k0, count)
+    else:
+        return _K.pairwise_sum_double(x, xs0, xs1, y, ys0, ys1, ncols, k0, count)
+
+cdef inline double _extremum( bint is_max, const real* x, Py_ssize_t xs0, Py_ssize_t xs1,
+                              Py_ssize_t ncols, Py_ssize_t k0, Py_ssize_t count ) noexcept nogil:
+    if real is float:
+        return _K.extremum_float(is_max, x, xs0, xs1, ncols, k0, count)
+    else:
+        return _K.extremum_double(is_max, x, xs0, xs1, ncols, k0, count)
+
+cdef inline double _reduce( _Reduction op, const real* x, Py_ssize_t xs0, Py_ssize_t xs1,
+                            const real* y, Py_ssize_t ys0, Py_ssize_t ys1,
+                            Py_ssize_t m, Py_ssize_t n, bint chunked, int num_threads ) noexcept nogil:
+    if real is float:
+        return _K.reduce_float(op, x, xs0, xs1, y, ys0, ys1, m, n, chunked, num_threads)
+    else:
+        return _K.reduce_double(op, x, xs0, xs1, y, ys0, ys1, m, n, chunked, num_threads)
+
+cdef inline double _combine( _Reduction op, const double* partials, Py_ssize_t n ) noexcept nogil:
+    return _K.combine(op, partials, n)
+
+cdef inline void _pipeline( const _Op* ops, int nops, const real* x, Py_ssize_t xs0, Py_ssize_t xs1,
+                            real* out, Py_ssize_t os0, Py_ssize_t os1,
+                            Py_ssize_t m, Py_ssize_t n, int num_threads ) noexcept nogil:
+    if real is float:
+        _K.pipeline_float(ops, nops, x, xs0, xs1, out, os0, os1, m, n, num_threads)
+    else:
+        _K.pipeline_double(ops, nops, x, xs0, xs1, out, os0, os1, m, n, num_threads)
+
+
+# CPU feature detection, via the compiler's builtins (which also check that the OS saves the wider registers).
+#
+cdef extern from *:
+    """
+    #if (defined(__GNUC__) || defined(__clang__)) && (defined(__x86_64__) || defined(__i386__))
+    static int mylibrary_cpu_has_avx2(void) {
+        __builtin_cpu_init();
+        return __builtin_cpu_supports("avx2") && __builtin_cpu_supports("fma");
+    }
+    static int mylibrary_cpu_has_avx512(void) {
+        __builtin_cpu_init();
+        return mylibrary_cpu_has_avx2() && __builtin_cpu_supports("avx512f")
+            && __builtin_cpu_supports("avx512dq") && __builtin_cpu_supports("avx512vl");
+    }
+    #else
+    static int mylibrary_cpu_has_avx2(void) { return 0; }
+    static int mylibrary_cpu_has_avx512(void) { return 0; }
+    #endif
+    """
+    bint _cpu_has_avx2 "mylibrary_cpu_has_avx2" () nogil
+    bint _cpu_has_avx512 "mylibrary_cpu_has_avx512" () nogil
+
+# Kernel variants, best first. Not all of them are built on every platform.
+#
+kernel_variants = ("avx512", "avx2", "baseline")
+
+_kernel_modules = {}  # variant name -> imported module, so that its table stays valid
+_kernel_variant = None
+
+def _cpu_supports( variant ):
+    if variant == "avx512":
+        return _cpu_has_avx512()
+    if variant == "avx2":
+        return _cpu_has_avx2()
+    return variant == "baseline"
+
+def _import_kernels( variant ):
+    if variant not in _kernel_modules:
+        _kernel_modules[variant] = importlib.import_module( "mylibrary._kernels_%s" % (variant) )
+    return _kernel_modules[variant]
+
+def available_kernel_variants():
+    """Return the kernel variants that are built and supported by this CPU, best first."""
+    result = []
+    for variant in kernel_variants:
+        if _cpu_supports(variant):
+            try:
+                _import_kernels(variant)
+            except ImportError:
+                continue
+            result.append(variant)
+    return tuple(result)
+
+def kernel_variant():
+    """Return the name of the active kernel variant: "avx512", "avx2" or "baseline".
+
+The best variant supported by the CPU is selected at import time. To override,
+set the environment variable ``MYLIBRARY_KERNELS`` to a variant name before importing,
+or call set_kernel_variant().
+"""
+    return _kernel_variant
+
+def set_kernel_variant( variant ):
+    """Switch to another kernel variant (see kernel_variant()). Mainly for testing and benchmarking.
+
+Raises:
+    ValueError
+        If the variant is unknown, not built, or not supported by this CPU.
+"""
+    global _K, _kernel_variant
+    if variant not in kernel_variants:
+        raise ValueError( "unknown kernel variant '%s'; valid: %s" % (variant, kernel_variants) )
+    if not _cpu_supports(variant):
+        raise ValueError( "kernel variant '%s' is not supported by this CPU" % (variant) )
+    try:
+        module = _import_kernels(variant)
+    except ImportError:
+        raise ValueError( "kernel variant '%s' is not available in this build" % (variant) )
+    _K = <const KernelTable*>PyCapsule_GetPointer(module.kernels, KERNELS_CAPSULE)
+    _kernel_variant = variant
+
+def _select_kernels():
+    requested = os.environ.get("MYLIBRARY_KERNELS")
+    if requested:
+        set_kernel_variant(requested)
+        return
+    variants = available_kernel_variants()
+    if not variants:
+        raise ImportError( "mylibrary.compute: no kernel module found; is mylibrary built correctly?" )
+    set_kernel_variant(variants[0])
+
+_select_kernels()
+
+
+# Whether the modules were compiled with profiling and line tracing (build type "profile" in setup.py).
+# See mylibrary.profiling.
+#
+cdef extern from *:
+    """
+    #ifdef MYLIBRARY_PROFILE_BUILD
+    #define MYLIBRARY_IS_PROFILE_BUILD 1
+    #else
+    #define MYLIBRARY_IS_PROFILE_BUILD 0
+    #endif
+    """
+    bint _IS_PROFILE_BUILD "MYLIBRARY_IS_PROFILE_BUILD"
+
+_profile_build = _IS_PROFILE_BUILD
+
+
+# NumPy ufunc inner loop: one (possibly strided) run of n elements.
+#
+# Steps are in bytes. NumPy only calls inner loops on aligned data, so for float and double
+# the steps are multiples of the item size.
+#
+cdef void _f_ufunc_loop( const real* x, real* out, cnp.npy_intp n, cnp.npy_intp xstep, cnp.npy_intp ostep ) noexcept nogil:
+    cdef cnp.npy_intp isz = <cnp.npy_intp>sizeof(real)  # signed, as the steps, which may be negative
+    cdef long long t0 = 0
+    if _stats_on[0]:
+        t0 = clock_ns()
+    if xstep == isz  and  ostep == isz:
+        _sqrt_contig(x, out, n, 1)
+    else:
+        _sqrt_strided(x, 0, xstep // isz, out, 0, ostep // isz, 1, n, 1)
+    if _stats_on[0]:
+        record(SITE_COMPUTE_F_UFUNC, n, 2*n*sizeof(real), t0, False)
+
+# The loops registered with NumPy; the signature is fixed by PyUFuncGenericFunction.
+#
+cdef void _f_ufunc_loop_float( char** args, cnp.npy_intp* dimensions, cnp.npy_intp* steps, void* data ) noexcept nogil:
+    _f_ufunc_loop(<const float*>args[0], <float*>args[1], dimensions[0], steps[0], steps[1])
+
+cdef void _f_ufunc_loop_double( char** args, cnp.npy_intp* dimensions, cnp.npy_intp* steps, void* data ) noexcept nogil:
+    _f_ufunc_loop(<const double*>args[0], <double*>args[1], dimensions[0], steps[0], steps[1])
+
+
+#########################################################
+# C-level API (declared in compute.pxd)
+#########################################################
+
+# Thin, serial wrappers around the kernels above, with concrete types, for cimport by other Cython modules.
+
+cdef void f_double( const double* x, double* out, Py_ssize_t n ) noexcept nogil:
+    _sqrt_contig(x, out, n, 1)
+
+cdef void f_float( const float* x, float* out, Py_ssize_t n ) noexcept nogil:
+    _sqrt_contig(x, out, n, 1)
+
+cdef void f_strided_double( const double* x, Py_ssize_t xstride, double* out, Py_ssize_t ostride, Py_ssize_t n ) noexcept nogil:
+    _sqrt_strided(x, 0, xstride, out, 0, ostride, 1, n, 1)
+
+cdef void f_strided_float( const float* x, Py_ssize_t xstride, float* out, Py_ssize_t ostride, Py_ssize_t n ) noexcept nogil:
+    _sqrt_strided(x, 0, xstride, out, 0, ostride, 1, n, 1)
+
+# For the reductions, a run of n elements is a rank-2 array with one row of n columns.
+
+cdef double sum_f_double( const double* x, Py_ssize_t xstride, Py_ssize_t n ) noexcept nogil:
+    return _pairwise_sum(x, 0, xstride, <const double*>NULL, 0, 0, n, 0, n) if n > 0 else 0.0
+
+cdef double sum_f_float( const float* x, Py_ssize_t xstride, Py_ssize_t n ) noexcept nogil:
+    return _pairwise_sum(x, 0, xstride, <const float*>NULL, 0, 0, n, 0, n) if n > 0 else 0.0
+
+cdef double dot_f_double( const double* x, Py_ssize_t xstride, const double* y, Py_ssize_t ystride, Py_ssize_t n ) noexcept nogil:
+    return _pairwise_sum(x, 0, xstride, y, 0, ystride, n, 0, n) if n > 0 else 0.0
+
+cdef double dot_f_float( const float* x, Py_ssize_t xstride, const float* y, Py_ssize_t ystride, Py_ssize_t n ) noexcept nogil:
+    return _pairwise_sum(x, 0, xstride, y, 0, ystride, n, 0, n) if n > 0 else 0.0
+
+cdef double min_f_double( const double* x, Py_ssize_t xstride, Py_ssize_t n ) noexcept nogil:
+    return _extremum(False, x, 0, xstride, n, 0, n) if n > 0 else NAN
+
+cdef double min_f_float( const float* x, Py_ssize_t xstride, Py_ssize_t n ) noexcept nogil:
+    return _extremum(False, x, 0, xstride, n, 0, n) if n > 0 else NAN
+
+cdef double max_f_double( const double* x, Py_ssize_t xstride, Py_ssize_t n ) noexcept nogil:
+    return _extremum(True, x, 0, xstride, n, 0, n) if n > 0 else NAN
+
+cdef double max_f_float( const float* x, Py_ssize_t xstride, Py_ssize_t n ) noexcept nogil:
+    return _extremum(True, x, 0, xstride, n, 0, n) if n > 0 else NAN
+
+
+#########################################################
+# Python-level glue
+#########################################################
+
+# Return a rank-2 view of a, without copying; or None, if a cannot be viewed as rank-2 without a copy.
+#
+# For contiguous data, this collapses all dimensions into one (long) contiguous run.
+#
+def _as_2d( a ):
+    if a.ndim == 0:
+        return a.reshape(1, 1)
+    if a.ndim == 1:
+        return a[:, None]  # one element per row, so that even 1-D strided input has rows to parallelize over
+    if a.ndim == 2:
+        return a
+    v = a.view()
+    try:
+        v.shape = (-1, a.shape[a.ndim - 1])  # unlike reshape(), this raises instead of copying
+    except AttributeError:
+        return None
+    return v
+
+# Convert a memoryview stride from bytes to elements.
+#
+cdef Py_ssize_t _elstride( Py_ssize_t stride_in_bytes, Py_ssize_t itemsize ) except? -1:
+    if stride_in_bytes % itemsize != 0:
+        raise ValueError( "array stride %d is not a multiple of the item size %d" % (stride_in_bytes, itemsize) )
+    return stride_in_bytes // itemsize
+
+# Apply the sqrt kernel to a rank-2 view. The fused type makes x and out agree on dtype.
+#
+def _f_2d( const real[:, :] x, real[:, :] out, int num_threads ):
+    cdef Py_ssize_t m = x.shape[0], n = x.shape[1]
+    if m == 0  or  n == 0:
+        return
+    if m * n < parallel_threshold:
+        num_threads = 1
+
+    cdef Py_ssize_t isz = sizeof(real)
+    cdef Py_ssize_t xs0 = _elstride(x.strides[0], isz), xs1 = _elstride(x.strides[1], isz)
+    cdef Py_ssize_t os0 = _elstride(out.strides[0], isz), os1 = _elstride(out.strides[1], isz)
+    cdef const real* px = &x[0, 0]
+    cdef real* po = &out[0, 0]
+
+    # Both covering one contiguous run of m*n elements? (Strides of length-1 axes do not matter.)
+    cdef bint contig = ( (m == 1 or (xs0 == n and os0 == n))  and  (n == 1 or (xs1 == 1 and os1 == 1)) )
+
+    cdef long long t0 = 0
+    with nogil:
+        if _stats_on[0]:
+            t0 = clock_ns()
+        if contig:
+            _sqrt_contig(px, po, m*n, num_threads)
+        else:
+            _sqrt_strided(px, xs0, xs1, po, os0, os1, m, n, num_threads)
+        if _stats_on[0]:
+            record(SITE_COMPUTE_F, m*n, 2*m*n*isz, t0, num_threads != 1)  # read x, write out
+
+# f() of a C-contiguous, aligned, native-endian float32 or float64 array, into a new array; None for any other x.
+#
+# The same kernel as through _map_2d() and _f_2d(), without their views and checks.
+#
+cdef object _f_contig( cnp.ndarray x, int num_threads ):
+    cdef int typenum = cnp.PyArray_TYPE(x)
+    if (typenum != cnp.NPY_DOUBLE  and  typenum != cnp.NPY_FLOAT)  or  not cnp.PyArray_ISCARRAY_RO(x):
+        return None
+    cdef cnp.ndarray out = cnp.PyArray_SimpleNew(x.ndim, cnp.PyArray_DIMS(x), typenum)
+    cdef Py_ssize_t n = cnp.PyArray_SIZE(x)
+    if n == 0:
+        return out
+    if n < parallel_threshold:
+        num_threads = 1
+
+    cdef Py_ssize_t isz = cnp.PyArray_ITEMSIZE(x)
+    cdef void* px = cnp.PyArray_DATA(x)
+    cdef void* po = cnp.PyArray_DATA(out)
+    cdef long long t0 = 0
+    with nogil:
+        if _stats_on[0]:
+            t0 = clock_ns()
+        if typenum == cnp.NPY_DOUBLE:
+            _sqrt_contig(<const double*>px, <double*>po, n, num_threads)
+        else:
+            _sqrt_contig(<const float*>px, <float*>po, n, num_threads)
+        if _stats_on[0]:
+            record(SITE_COMPUTE_F, n, 2*n*isz, t0, num_threads != 1)  # read x, write out
+    return out
+
+# Run a pipeline on a rank-2 view.
+#
+def _pipeline_2d( const real[:, :] x, real[:, :] out, Pipeline p, int num_threads ):
+    cdef Py_ssize_t m = x.shape[0], n = x.shape[1]
+    if m == 0  or  n == 0:
+        return
+    if m * n < parallel_threshold:
+        num_threads = 1
+
+    cdef Py_ssize_t isz = sizeof(real)
+    cdef Py_ssize_t xs0 = _elstride(x.strides[0], isz), xs1 = _elstride(x.strides[1], isz)
+    cdef Py_ssize_t os0 = _elstride(out.strides[0], isz), os1 = _elstride(out.strides[1], isz)
+    cdef const real* px = &x[0, 0]
+    cdef real* po = &out[0, 0]
+    cdef long long t0 = 0
+    with nogil:
+        if _stats_on[0]:
+            t0 = clock_ns()
+        _pipeline(p._ops, p._nops, px, xs0, xs1, po, os0, os1, m, n, num_threads)
+        if _stats_on[0]:
+            record(SITE_COMPUTE_PIPELINE, m*n, 2*m*n*isz, t0, num_threads != 1)
+
+# Apply an elementwise rank-2 kernel (such as _f_2d) to arrays x and out of the same shape.
+#
+# If rows is True, rank-1 input becomes a single row (for kernels that parallelize over runs of elements).
+#
+def _map_2d( kernel, x, out, *args, bint rows=False ):
+    # Both Fortran-ordered? Elementwise operations do not care about axis order,
+    # so run on the transposes, which are C-ordered.
+    if x.ndim > 1  and  x.flags.f_contiguous  and  out.flags.f_contiguous  and  not (x.flags.c_contiguous and out.flags.c_contiguous):
+        x, out = x.T, out.T
+
+    as_2d = _as_rows if rows else _as_2d
+    x2, out2 = as_2d(x), as_2d(out)
+    if x2 is not None  and  out2 is not None:
+        kernel(x2, out2, *args)
+    else:  # rank > 2, with a layout that cannot be collapsed; one call per rank-2 slab
+        for idx in np.ndindex(*x.shape[:x.ndim - 2]):
+            kernel(x[idx], out[idx], *args)
+
+# Reduce a rank-2 view of x (and y, for a dot product; else None) to a float.
+#
+def _reduce_2d( const real[:, :] x, const real[:, :] y, _Reduction op, int num_threads ):
+    cdef Py_ssize_t m = x.shape[0], n = x.shape[1]
+    cdef bint chunked = (m * n >= parallel_threshold)
+    if not chunked:
+        num_threads = 1
+
+    cdef Py_ssize_t isz = sizeof(real)
+    cdef Py_ssize_t xs0 = _elstride(x.strides[0], isz), xs1 = _elstride(x.strides[1], isz)
+    cdef Py_ssize_t ys0 = 0, ys1 = 0
+    cdef const real* px = &x[0, 0]
+    cdef const real* py = NULL
+    if y is not None:
+        ys0, ys1 = _elstride(y.strides[0], isz), _elstride(y.strides[1], isz)
+        py = &y[0, 0]
+
+    cdef double result
+    cdef long long t0 = 0
+    with nogil:
+        if _stats_on[0]:
+            t0 = clock_ns()
+        result = _reduce(op, px, xs0, xs1, py, ys0, ys1, m, n, chunked, num_threads)
+        if _stats_on[0]:
+            record(SITE_COMPUTE_REDUCE, m*n, (2 if py != NULL else 1)*m*n*isz, t0, num_threads != 1)
+    return result
+
+# Like _as_2d(), but rank-1 input becomes a single row: a reduction parallelizes over runs of elements, not rows.
+#
+def _as_rows( a ):
+    if a.ndim == 1:
+        return a[None, :]
+    return _as_2d(a)
+
+# Reduce nonempty x (and y) of any rank and layout, without copying.
+#
+def _reduction( _Reduction op, x, y, int num_threads ):
+    if num_threads < 0:
+        raise ValueError( "num_threads must be >= 0, got %d" % (num_threads) )
+
+    if y is not None:
+        if y.dtype != x.dtype:
+            raise ValueError( "y has dtype '%s', expected '%s'" % (y.dtype, x.dtype) )
+        if y.shape != x.shape:
+            raise ValueError( "y has shape %s, expected %s" % (y.shape, x.shape) )
+        if x.ndim > 1  and  x.flags.f_contiguous  and  y.flags.f_contiguous  and  not (x.flags.c_contiguous and y.flags.c_contiguous):
+            x, y = x.T, y.T
+    elif x.ndim > 1  and  x.flags.f_contiguous  and  not x.flags.c_contiguous:
+        x = x.T
+
+    x2 = _as_rows(x)
+    y2 = _as_rows(y) if y is not None else None
+    if x2 is not None  and  (y is None or y2 is not None):
+        return _reduce_2d(x2, y2, op, num_threads)
+
+    # rank > 2, with a layout that cannot be collapsed; one reduction per rank-2 slab
+    cdef Py_ssize_t k
+    cdef double[:] partials = np.empty( (int(np.prod(x.shape[:x.ndim - 2])),), dtype=np.float64 )
+    for k, idx in enumerate(np.ndindex(*x.shape[:x.ndim - 2])):
+        partials[k] = _reduce_2d(x[idx], y[idx] if y is not None else None, op, num_threads)
+    return _combine(op, &partials[0], partials.shape[0])
+
+
+#########################################################
+# Public API
+#########################################################
 
 # The docstring conforms to the NumPyDoc style:
 #
@@ -26,43 +509,520 @@ import numpy as np
 # We use the buffer protocol:
 #    http://cython.readthedocs.io/en/latest/src/userguide/memoryviews.html
 #
-def f( double[::1] x ):
+def f( x, out=None, bint inplace=False, int num_threads=1, dtype=None, result="array" ):
     """Example math function.
 
 Take the square root, elementwise.
 
 Parameters:
-    x : rank-1 np.array of double
+    x : np.array of float32 or float64, any rank and memory layout; or any buffer
         Numbers to be square-rooted.
 
+        Processed where it is: strided views (e.g. ``x[::2]``, ``x[:, 3:7]``),
+        Fortran-ordered and N-D arrays are not copied. float32 input is
+        computed in single precision, at half the memory traffic.
+
+        Anything that supports the buffer protocol is accepted without copying,
+        e.g. ``array.array("d")``, ``memoryview``, ``mmap.mmap`` or Arrow buffers.
+        Untyped byte buffers (``bytes``, ``bytearray``, ``mmap.mmap``, ...) are
+        reinterpreted as elements of type ``dtype``.
+
+        May be read-only (e.g. a memory-mapped file opened with ``mode="r"``).
+        Any length that fits in the address space is supported.
+
+    out : np.array or buffer, optional
+        Writable array with the same shape and dtype as ``x``,
+        into which to write the result. If not given, a new array is allocated.
+
+        Like ``x``, may be any buffer; an untyped byte buffer is reinterpreted
+        as the dtype of ``x``, with the shape of ``x`` if the size matches.
+
+        ``out`` must either be ``x`` itself, or not overlap ``x`` at all.
+
+    inplace : bool
+        If True, overwrite ``x`` with the result. ``x`` must then be writable.
+        Equivalent to ``f(x, out=x)``; cannot be combined with ``out``.
+
+    num_threads : int
+        Number of OpenMP threads to use.
+
+        1 (default) runs serially. 0 uses the OpenMP default team size
+        (i.e. ``OMP_NUM_THREADS``, or all cores if not set). Any larger value
+        requests exactly that many threads.
+
+        Inputs shorter than ``parallel_threshold`` are always processed serially.
+
+    dtype : np.float32 or np.float64, optional
+        Element type of ``x``, if ``x`` is an untyped byte buffer. Default float64.
+        If given for typed input, it must match the dtype of ``x``.
+
+    result : str
+        What to return:
+            "array":      an np.array (default).
+            "like":       a container of the same type as ``x``: np.array for np.array,
+                          ``array.array`` for ``array.array``, ``bytearray`` for untyped
+                          byte buffers, and ``memoryview`` for anything else.
+            "memoryview": a ``memoryview`` of the result, with the shape and format of ``x``.
+
+        If ``out`` was given, "array" and "like" return ``out`` itself.
+
 Return value:
-    rank-1 np.array of double
-        The square roots.
+    np.array (or another container; see ``result``) of the same shape and dtype as x
+        The square roots. If ``out`` was given (or ``inplace`` was set),
+        this is ``out`` (respectively ``x``) itself.
+
+Raises:
+    ValueError
+        If ``x`` has an unsupported dtype, or ``out`` (or ``x``, when ``inplace``)
+        has the wrong dtype or shape, is read-only, or partially overlaps ``x``.
+        Nothing is ever copied to make the arguments fit.
 """
-    cdef int n = x.shape[0]
+    if num_threads < 0:
+        raise ValueError( "num_threads must be >= 0, got %d" % (num_threads) )
+    if result not in ("array", "like", "memoryview"):
+        raise ValueError( "result must be 'array', 'like' or 'memoryview', got '%s'" % (result) )
 
-    # np.empty() is a pretty good mechanism for dynamic allocation of arrays,
-    # as long as memory allocation can be done in Python parts of the code (no "nogil").
+    # Fast path for the common case: a contiguous float32 or float64 np.ndarray, and the defaults
+    # for everything else. For small inputs, the general path below costs more than the square roots.
     #
-    # If you absolutely need to dynamically allocate memory in nogil code,
-    # then "from libc.stdlib cimport malloc, free", and be ready for pain.
-    #
-    cdef double[::1] out = np.empty( (n,), dtype=np.float64, order="C" )
+    if type(x) is np.ndarray  and  out is None  and  not inplace  and  dtype is None  and  result == "array":
+        y = _f_contig(x, num_threads)
+        if y is not None:
+            return y
+
+    x, out, out_orig = _prepare_elementwise(x, out, inplace, dtype, result == "like")
 
-    # Memoryview slices don't do  out[:] = ...  assignments, so we loop.
+    # All sizes and indices in the kernels are Py_ssize_t, the native index width
+    # (64 bits on 64-bit platforms). A plain C int would silently wrap around
+    # for arrays of 2**31 elements or more.
     #
-    # Everything is typed, though, so the loop will run at C speed.
+    # The kernels release the GIL, so any other Python threads can proceed
+    # while this one is computing.
     #
-    # As a bonus, we release the GIL, so any other Python threads
-    # can proceed while this one is computing.
+    # _map_2d() reduces x and out to rank-2 views (one call per slab, if the layout does not allow that),
+    # and _f_2d() picks the contiguous or the strided kernel of the selected variant, serial below
+    # parallel_threshold; the OpenMP parallelization is in the kernels, see _kernels.pxi.
     #
-    # We could also "cimport cython.parallel" and "for j in cython.parallel.prange(n):"
-    # if we wanted (and then link this module with OpenMP in setup.py).
+    _map_2d(_f_2d, x, out, num_threads)
+
+    if result == "memoryview":
+        return memoryview(out)
+    return out_orig
+
+async def f_async( x, out=None, bint inplace=False, dtype=None, chunksize=None, executor=None ):
+    """asyncio version of f(): ``await f_async(x)`` computes f(x) on an executor, without blocking the event loop.
+
+Large inputs are split into chunks, which run one after the other (see
+mylibrary.parallel.map_chunks_async()): between chunks, the event loop runs, and the chunks
+of other coroutines get their turn on the executor. Cancelling the coroutine takes effect
+between chunks.
+
+Parameters:
+    x, out, inplace, dtype : as in f()
+
+    chunksize : int, optional
+        Elements per chunk. Default: the number of elements in 1 MB of ``x``
+        (mylibrary.parallel.async_chunk_bytes); a fraction of a millisecond of work.
+
+    executor : concurrent.futures.Executor, optional
+        Where to run the chunks. Default: the event loop's default executor.
+
+Return value:
+    np.array, as f() with ``result="array"``.
+
+Raises:
+    ValueError
+        As f(), before anything is computed.
+
+    asyncio.CancelledError
+        If cancelled; the chunk being computed at that moment is finished first, the rest of
+        the result is left unwritten.
+"""
+    from mylibrary import parallel
+
+    x, out, out_orig = _prepare_elementwise(x, out, inplace, dtype)
+    await parallel.map_chunks_async( f, x, out, chunksize, executor )
+    return out_orig
+
+
+# Out-of-core processing.
+#
+# Memory-map a region of an open file, returning (mmap object, offset of the region within it).
+# mmap offsets must be multiples of the allocation granularity, so we map from an aligned position.
+#
+def _map_region( fileobj, Py_ssize_t offset, Py_ssize_t nbytes, bint writable ):
+    cdef Py_ssize_t start = offset - offset % mmap.ALLOCATIONGRANULARITY
+    mm = mmap.mmap( fileobj.fileno(), nbytes + (offset - start), offset=start,
+                    access=(mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ) )
+    return mm, offset - start
+
+# madvise() a byte range of mm, if the platform supports it. These are only hints.
+#
+def _advise( mm, option_name, Py_ssize_t start, Py_ssize_t length ):
+    option = getattr(mmap, option_name, None)
+    if option is None  or  not hasattr(mm, "madvise")  or  length <= 0:
+        return
+    cdef Py_ssize_t aligned = start - start % mmap.PAGESIZE  # madvise() wants a page-aligned start
+    try:
+        mm.madvise( option, aligned, min(length + (start - aligned), len(mm) - aligned) )
+    except OSError:
+        pass
+
+def f_file( src, dst, dtype=None, kernel=None, Py_ssize_t blocksize=4*1024*1024, bint advise=True, int num_threads=1 ):
+    """Out-of-core version of f(): stream f over a file, writing the result to another file.
+
+Both files are memory-mapped, and processed one block at a time, so inputs larger than RAM
+are fine, and the resident memory stays bounded (around two blocks).
+
+Parameters:
+    src : str
+        Path of the input file: either a ``.npy`` file (detected by its header; any shape and order),
+        or raw binary data (interpreted as a rank-1 array of ``dtype``).
+
+    dst : str
+        Path of the output file, created or overwritten. Same format as the input:
+        a ``.npy`` file with the same dtype, shape and order, or raw binary data.
+
+    dtype : np.dtype, optional
+        For raw input, the dtype of the data (float32 or float64). Default float64.
+        For ``.npy`` input, this must be omitted or match the header.
+
+    kernel : callable, optional
+        Elementwise operation to apply, called as ``kernel(x, out=out, num_threads=...)``
+        on each block. Default f. A Pipeline can be used here, too.
+
+    blocksize : int
+        Block size in bytes. The default (4 MB) fits in typical L2/L3 caches,
+        while keeping the per-block overhead small.
+
+    advise : bool
+        If True (default), give the OS memory-access hints (madvise, where supported):
+        sequential access, prefetching of the next input block, and dropping of
+        already processed pages from the process's resident set.
+
+    num_threads : int
+        As in f(); applied within each block.
+"""
+    if kernel is None:
+        kernel = f
+
+    with open(src, "rb") as fin:
+        # .npy or raw?
+        try:
+            version = np.lib.format.read_magic(fin)
+        except ValueError:
+            version = None
+        if version is not None:
+            if version == (1, 0):
+                shape, fortran_order, file_dtype = np.lib.format.read_array_header_1_0(fin)
+            else:
+                shape, fortran_order, file_dtype = np.lib.format.read_array_header_2_0(fin)
+            if dtype is not None  and  np.dtype(dtype) != file_dtype:
+                raise ValueError( "dtype %s given, but '%s' has dtype %s" % (np.dtype(dtype), src, file_dtype) )
+            dtype = file_dtype
+            in_offset = fin.tell()
+        else:
+            dtype = np.dtype(np.float64 if dtype is None else dtype)
+            in_offset = 0
+            fin.seek(0, os.SEEK_END)
+            nbytes = fin.tell()
+            if nbytes % dtype.itemsize != 0:
+                raise ValueError( "size of '%s' (%d bytes) is not a multiple of the item size of %s" % (src, nbytes, dtype) )
+            shape, fortran_order = (nbytes // dtype.itemsize,), False
+
+        if dtype not in supported_dtypes:
+            raise ValueError( "unsupported dtype '%s'; expected one of %s" % (dtype, [np.dtype(t).name for t in supported_dtypes]) )
+        n = int(np.prod(shape))
+
+        # Create the output file at its final size.
+        if version is not None:
+            out_memmap = np.lib.format.open_memmap( dst, mode="w+", dtype=dtype, shape=shape, fortran_order=fortran_order )
+            out_offset = out_memmap.offset
+            del out_memmap
+        else:
+            with open(dst, "wb") as fout:
+                fout.truncate(n * dtype.itemsize)
+            out_offset = 0
+        if n == 0:
+            return
+
+        # The elements are processed in memory order; f is elementwise, so the logical shape does not matter.
+        #
+        with open(dst, "r+b") as fout:
+            in_mm,  in_start  = _map_region( fin,  in_offset,  n * dtype.itemsize, False )
+            out_mm, out_start = _map_region( fout, out_offset, n * dtype.itemsize, True )
+            x = out = None
+            try:
+                x   = np.frombuffer( in_mm,  dtype=dtype, count=n, offset=in_start )
+                out = np.frombuffer( out_mm, dtype=dtype, count=n, offset=out_start )
+
+                block = max(1, blocksize // dtype.itemsize)
+                if advise:
+                    _advise( in_mm,  "MADV_SEQUENTIAL", 0, len(in_mm) )
+                    _advise( out_mm, "MADV_SEQUENTIAL", 0, len(out_mm) )
+                for start in range(0, n, block):
+                    stop = min(n, start + block)
+                    if advise:  # start reading the next block while we compute on this one
+                        _advise( in_mm, "MADV_WILLNEED", in_start + stop * dtype.itemsize, block * dtype.itemsize )
+
+                    kernel( x[start:stop], out=out[start:stop], num_threads=num_threads )
+
+                    if advise:  # done with these pages; the page cache still has them, but our resident set does not
+                        _advise( in_mm,  "MADV_DONTNEED", in_start  + start * dtype.itemsize, (stop - start) * dtype.itemsize )
+                        _advise( out_mm, "MADV_DONTNEED", out_start + start * dtype.itemsize, (stop - start) * dtype.itemsize )
+                out_mm.flush()
+            finally:
+                x = out = None  # release the buffer exports, so that the maps can be closed
+                out_mm.close()
+                in_mm.close()
+
+# Fused reductions.
+#
+# These compute e.g.  f(x).sum()  in one pass over x, without the full-size temporary array.
+#
+def sum_f( x, int num_threads=1 ):
+    """Sum of f(x), without materializing f(x).
+
+Like ``f(x).sum()``, but streams over ``x`` once, with O(1) temporary memory.
+Uses pairwise summation, accumulating in double precision also for float32 input.
+
+Parameters:
+    x : np.array of float32 or float64, any rank and memory layout
+        Numbers whose square roots to sum.
+
+    num_threads : int
+        As in f(). The result does not depend on the number of threads.
+
+Return value:
+    float
+        The sum. 0.0 if ``x`` is empty.
+"""
+    x = _check_input(x)
+    if x.size == 0:
+        return 0.0
+    return _reduction(_REDUCE_SUM, x, None, num_threads)
+
+def mean_f( x, int num_threads=1 ):
+    """Mean of f(x), without materializing f(x).
+
+Like ``f(x).mean()``; see sum_f().
+
+Return value:
+    float
+        The mean. NaN if ``x`` is empty.
+"""
+    x = _check_input(x)
+    if x.size == 0:
+        return float("nan")
+    return _reduction(_REDUCE_SUM, x, None, num_threads) / x.size
+
+def min_f( x, int num_threads=1 ):
+    """Minimum of f(x), without materializing f(x).
+
+Like ``f(x).min()``. If any element of ``x`` is negative or NaN, the result is NaN.
+
+Raises:
+    ValueError
+        If ``x`` is empty.
+"""
+    x = _check_input(x)
+    if x.size == 0:
+        raise ValueError( "min_f() of an empty array" )
+    return _reduction(_REDUCE_MIN, x, None, num_threads)
+
+def max_f( x, int num_threads=1 ):
+    """Maximum of f(x), without materializing f(x).
+
+Like ``f(x).max()``. If any element of ``x`` is negative or NaN, the result is NaN.
+
+Raises:
+    ValueError
+        If ``x`` is empty.
+"""
+    x = _check_input(x)
+    if x.size == 0:
+        raise ValueError( "max_f() of an empty array" )
+    return _reduction(_REDUCE_MAX, x, None, num_threads)
+
+def dot_f( x, y, int num_threads=1 ):
+    """Dot product of f(x) and y, without materializing f(x).
+
+Like ``np.vdot(f(x), y)``, i.e. the sum of the elementwise products over all elements
+(for rank-1 input, this is ``np.dot(f(x), y)``). Pairwise summation, as in sum_f().
+
+For the 2-norm of f(x), use  ``sqrt(dot_f(x, f(x)))``, or, if ``x`` is nonnegative,
+simply ``sqrt(x.sum())``.
+
+Parameters:
+    x : np.array of float32 or float64, any rank and memory layout
+        Numbers whose square roots to use.
+
+    y : np.array
+        Weights. Same shape and dtype as ``x``; any memory layout.
+
+    num_threads : int
+        As in f(). The result does not depend on the number of threads.
+
+Return value:
+    float
+        The dot product. 0.0 if ``x`` is empty.
+"""
+    x = _check_input(x)
+    y = _check_input(y, "y")
+    if x.size == 0  and  y.shape == x.shape:
+        return 0.0
+    return _reduction(_REDUCE_DOT, x, y, num_threads)
+
+cdef class Pipeline:
+    """Fused elementwise pipeline.
+
+Composes elementwise operations into one loop that takes a single pass over memory,
+with the GIL released. For example::
+
+    p = Pipeline().scale(2.0).offset(1.0).f().clip(0.0, 10.0)
+    y = p(x)  # same as  np.clip(np.sqrt(2.0*x + 1.0), 0.0, 10.0),  but without the three temporaries
+
+Each operation method returns a new pipeline (the original is not modified), so pipelines
+can be built once, shared and extended. Calling a pipeline takes the same arguments as f(),
+with the same handling of dtypes (float32, float64), memory layouts, ``out``, ``inplace``
+and ``num_threads``.
+
+Operations are applied blockwise, to a few kB of elements at a time, so that the intermediate
+results stay in L1 cache. The operations themselves are precompiled loops over a block;
+there is no per-element interpretation overhead.
+
+The operation parameters are stored as double, and converted to the dtype of the input
+when the pipeline runs.
+"""
+    cdef _Op _ops[_PIPELINE_MAXOPS]
+    cdef int _nops
+
+    def __cinit__( self ):
+        self._nops = 0
+
+    cdef Pipeline _then( self, _OpCode code, double a=0.0, double b=0.0 ):
+        if self._nops == _PIPELINE_MAXOPS:
+            raise ValueError( "a pipeline can have at most %d operations" % (_PIPELINE_MAXOPS) )
+        cdef Pipeline p = Pipeline.__new__(Pipeline)
+        cdef int k
+        for k in range(self._nops):
+            p._ops[k] = self._ops[k]
+        p._ops[self._nops].code = code
+        p._ops[self._nops].a    = a
+        p._ops[self._nops].b    = b
+        p._nops = self._nops + 1
+        return p
+
+    def scale( self, double a ):
+        """Multiply by a."""
+        return self._then(_OP_SCALE, a, 0.0)
+
+    def offset( self, double b ):
+        """Add b."""
+        return self._then(_OP_OFFSET, 0.0, b)
+
+    def f( self ):
+        """Take the square root (the elementwise operation of compute.f())."""
+        return self._then(_OP_SQRT)
+
+    def clip( self, double lo, double hi ):
+        """Clip to the interval [lo, hi]. NaNs pass through."""
+        if not lo <= hi:
+            raise ValueError( "need lo <= hi, got lo = %g, hi = %g" % (lo, hi) )
+        return self._then(_OP_CLIP, lo, hi)
+
+    def abs( self ):
+        """Take the absolute value."""
+        return self._then(_OP_ABS)
+
+    def square( self ):
+        """Square."""
+        return self._then(_OP_SQUARE)
+
+    def __len__( self ):
+        return self._nops
+
+    def __repr__( self ):
+        cdef int k
+        cdef _Op op
+        parts = ["Pipeline()"]
+        for k in range(self._nops):
+            op = self._ops[k]
+            if op.code == _OP_SCALE:
+                parts.append( ".scale(%r)" % (op.a) )
+            elif op.code == _OP_OFFSET:
+                parts.append( ".offset(%r)" % (op.b) )
+            elif op.code == _OP_SQRT:
+                parts.append( ".f()" )
+            elif op.code == _OP_CLIP:
+                parts.append( ".clip(%r, %r)" % (op.a, op.b) )
+            elif op.code == _OP_ABS:
+                parts.append( ".abs()" )
+            elif op.code == _OP_SQUARE:
+                parts.append( ".square()" )
+        return "".join(parts)
+
+    # Pickle as the list of operations; e.g. to send the pipeline to worker processes (see mylibrary.parallel.ProcessPool).
     #
-    cdef int j
-    with nogil:
-        for j in range(n):
-            out[j] = c_sqrt(x[j])
+    def __reduce__( self ):
+        cdef int k
+        ops = []
+        for k in range(self._nops):
+            ops.append( (<int>self._ops[k].code, self._ops[k].a, self._ops[k].b) )
+        return (_pipeline_from_ops, (tuple(ops),))
+
+    def __call__( self, x, out=None, bint inplace=False, int num_threads=1 ):
+        """Run the pipeline on x. Arguments and return value as in f()."""
+        if num_threads < 0:
+            raise ValueError( "num_threads must be >= 0, got %d" % (num_threads) )
+        x, out, out_orig = _prepare_elementwise(x, out, inplace)
+        _map_2d(_pipeline_2d, x, out, self, num_threads, rows=True)
+        return out_orig
+
+def _pipeline_from_ops( ops ):
+    cdef Pipeline p = Pipeline()
+    for code, a, b in ops:
+        p = p._then( <_OpCode><int>code, a, b )
+    return p
+
+
+# The ufunc machinery keeps pointers to these tables, so they must live as long as the module.
+#
+# One entry per inner loop; types lists the input and output type of each loop, in order.
+# NumPy picks the first loop to which the inputs can be safely cast (e.g. int64 -> double).
+#
+cdef cnp.PyUFuncGenericFunction _f_ufunc_loops[2]
+cdef void* _f_ufunc_data[2]
+cdef char _f_ufunc_types[4]
+
+_f_ufunc_loops[0] = <cnp.PyUFuncGenericFunction>_f_ufunc_loop_float
+_f_ufunc_loops[1] = <cnp.PyUFuncGenericFunction>_f_ufunc_loop_double
+_f_ufunc_data[0]  = NULL
+_f_ufunc_data[1]  = NULL
+_f_ufunc_types[0] = cnp.NPY_FLOAT
+_f_ufunc_types[1] = cnp.NPY_FLOAT
+_f_ufunc_types[2] = cnp.NPY_DOUBLE
+_f_ufunc_types[3] = cnp.NPY_DOUBLE
+
+f_ufunc = cnp.PyUFunc_FromFuncAndData( _f_ufunc_loops, _f_ufunc_data, _f_ufunc_types,
+                                       2,  # number of loops
+                                       1,  # inputs
+                                       1,  # outputs
+                                       cnp.PyUFunc_None,  # identity (only meaningful for binary ufuncs)
+                                       b"f_ufunc",
+                                       b"""f_ufunc(x, /, out=None, *, where=True, ...)
+
+Example math function as a NumPy ufunc: the square root, elementwise.
+
+Same kernels as f(), but driven by NumPy's ufunc machinery, so it supports
+broadcasting, out=, where=, dtype=, casting= and all other ufunc keyword arguments,
+and can be used inside NumPy expressions.
 
-    return np.asanyarray(out)  # return proper np.ndarray, not memoryview slice
+Inner loops are provided for float32 and float64. Other input types are cast
+by NumPy (e.g. integers to float64). Always serial; for the OpenMP-parallel path,
+use f().
 
+Being a unary ufunc, it has no reduce() or accumulate(); see NumPy's documentation
+on ufunc methods.
+""",
+                                       0 )  # unused
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+#
+# Cython-level API of mylibrary.counters, for cimport by the other modules of mylibrary.
+#
+# Usage in a hot path (all of this is nogil):
+#
+#     from mylibrary.counters cimport Site, SITE_COMPUTE_F, enabled_flag, clock_ns, record
+#     cdef const bint* _stats_on = enabled_flag()   # at module level
+#     ...
+#     cdef long long t0 = 0
+#     if _stats_on[0]:
+#         t0 = clock_ns()
+#     ... the work ...
+#     if _stats_on[0]:
+#         record(SITE_COMPUTE_F, n, nbytes, t0, parallel)
+#
+# When the counters are disabled (the default), the cost is one load and a branch per site.
+
+from __future__ import absolute_import
+
+# Instrumented sites. Keep in sync with _site_names in counters.pyx.
+#
+cdef enum Site:
+    SITE_COMPUTE_F
+    SITE_COMPUTE_F_UFUNC
+    SITE_COMPUTE_REDUCE
+    SITE_COMPUTE_PIPELINE
+    SITE_DOSTUFF_HELLO
+    SITE_DOSTUFF_WRITER
+    SITE_PREDICATES
+    NSITES
+
+# Address of the on/off switch; stable for the lifetime of the process.
+#
+cdef const bint* enabled_flag() noexcept nogil
+
+# Monotonic clock, in nanoseconds.
+#
+cdef long long clock_ns() noexcept nogil
+
+# Count one call at site, which processed the given numbers of elements and bytes,
+# started at time t0 (from clock_ns()), and took the parallel or the serial path.
+#
+# Safe to call from any thread, with or without the GIL.
+#
+cdef void record( Site site, Py_ssize_t elements, Py_ssize_t nbytes, long long t0, bint parallel ) noexcept nogil
@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+#
+# cython: wraparound  = False
+# cython: boundscheck = False
+"""Hot-path counters of mylibrary: call counts, element and byte totals, time, and parallel/serial path per site.
+
+The counters are off by default. Enable them by setting the environment variable
+``MYLIBRARY_STATS=1`` before importing mylibrary, or at run time by enable_stats().
+
+The counters are updated without the GIL, with relaxed atomic adds into per-thread slots
+(whole cache lines, so threads do not contend); stats() sums over the slots.
+
+A call is one run of a kernel: one per call of compute.f() or a reduction, except that N-D inputs
+whose layout cannot be collapsed to 2-D take one run per 2-D slab; one per inner loop that NumPy
+calls, for compute.f_ufunc; and one per call of dostuff.hello(), Writer.write() or
+Writer.write_many() (which the background and asyncio writers use).
+"""
+
+from __future__ import division, print_function, absolute_import
+
+import os
+
+from mylibrary.counters cimport Site, NSITES
+
+
+# The counters, in C.
+#
+# counters[slot][site][field]. Each thread picks a slot at its first update, round-robin;
+# with more threads than slots, some threads share a slot, which the atomic adds make safe.
+#
+cdef extern from *:
+    """
+    #include <time.h>
+
+    #define MYLIBRARY_STATS_SLOTS  64
+    #define MYLIBRARY_STATS_SITES  8   /* >= NSITES in counters.pxd */
+    #define MYLIBRARY_STATS_FIELDS 5   /* calls, elements, bytes, nanoseconds, parallel calls */
+
+    #if defined(__GNUC__) || defined(__clang__)
+    #define MYLIBRARY_THREAD_LOCAL        __thread
+    #define MYLIBRARY_CACHE_ALIGNED       __attribute__((aligned(64)))
+    #define MYLIBRARY_ATOMIC_ADD(p, v)    __atomic_fetch_add((p), (v), __ATOMIC_RELAXED)
+    #define MYLIBRARY_ATOMIC_LOAD(p)      __atomic_load_n((p), __ATOMIC_RELAXED)
+    #define MYLIBRARY_ATOMIC_STORE(p, v)  __atomic_store_n((p), (v), __ATOMIC_RELAXED)
+    #else  /* no atomics: all threads share one slot, and the counts are approximate under threads */
+    #define MYLIBRARY_THREAD_LOCAL
+    #define MYLIBRARY_CACHE_ALIGNED
+    #define MYLIBRARY_ATOMIC_ADD(p, v)    (*(p) += (v))
+    #define MYLIBRARY_ATOMIC_LOAD(p)      (*(p))
+    #define MYLIBRARY_ATOMIC_STORE(p, v)  (*(p) = (v))
+    #endif
+
+    /* The alignment rounds the size of a slot up to whole cache lines, so different slots never share one. */
+    typedef struct {
+        long long c[MYLIBRARY_STATS_SITES][MYLIBRARY_STATS_FIELDS];
+    } MYLIBRARY_CACHE_ALIGNED mylibrary_stats_slot;
+
+    static mylibrary_stats_slot mylibrary_stats[MYLIBRARY_STATS_SLOTS];
+    static int mylibrary_stats_enabled = 0;
+    static int mylibrary_stats_next_slot = 0;
+    static MYLIBRARY_THREAD_LOCAL int mylibrary_stats_my_slot = -1;
+
+    static long long mylibrary_stats_clock_ns(void) {
+        struct timespec t;
+        clock_gettime(CLOCK_MONOTONIC, &t);
+        return (long long)t.tv_sec * 1000000000LL + t.tv_nsec;
+    }
+
+    static void mylibrary_stats_add( int site, long long elements, long long nbytes, long long ns, int parallel ) {
+        int slot = mylibrary_stats_my_slot;
+        long long* c;
+        #if defined(__GNUC__) || defined(__clang__)
+        if (slot < 0) {
+            slot = MYLIBRARY_ATOMIC_ADD(&mylibrary_stats_next_slot, 1) % MYLIBRARY_STATS_SLOTS;
+            mylibrary_stats_my_slot = slot;
+        }
+        #else
+        slot = 0;
+        #endif
+        c = mylibrary_stats[slot].c[site];
+        MYLIBRARY_ATOMIC_ADD(&c[0], 1);
+        MYLIBRARY_ATOMIC_ADD(&c[1], elements);
+        MYLIBRARY_ATOMIC_ADD(&c[2], nbytes);
+        MYLIBRARY_ATOMIC_ADD(&c[3], ns);
+        if (parallel)
+            MYLIBRARY_ATOMIC_ADD(&c[4], 1);
+    }
+
+    static long long mylibrary_stats_load( int slot, int site, int field ) {
+        return MYLIBRARY_ATOMIC_LOAD(&mylibrary_stats[slot].c[site][field]);
+    }
+
+    static void mylibrary_stats_clear( int slot, int site, int field ) {
+        MYLIBRARY_ATOMIC_STORE(&mylibrary_stats[slot].c[site][field], 0);
+    }
+    """
+    enum:
+        _SLOTS  "MYLIBRARY_STATS_SLOTS"
+        _SITES  "MYLIBRARY_STATS_SITES"
+        _FIELDS "MYLIBRARY_STATS_FIELDS"
+    bint _enabled "mylibrary_stats_enabled"
+    long long _clock_ns "mylibrary_stats_clock_ns" () nogil
+    void _add "mylibrary_stats_add" ( int site, long long elements, long long nbytes, long long ns, int parallel ) nogil
+    long long _load "mylibrary_stats_load" ( int slot, int site, int field ) nogil
+    void _clear "mylibrary_stats_clear" ( int slot, int site, int field ) nogil
+
+
+#########################################################
+# Cython-level API (see counters.pxd)
+#########################################################
+
+cdef const bint* enabled_flag() noexcept nogil:
+    return &_enabled
+
+cdef long long clock_ns() noexcept nogil:
+    return _clock_ns()
+
+cdef void record( Site site, Py_ssize_t elements, Py_ssize_t nbytes, long long t0, bint parallel ) noexcept nogil:
+    _add( site, elements, nbytes, _clock_ns() - t0, parallel )
+
+
+#########################################################
+# Public API
+#########################################################
+
+# Names of the sites, in the order of the Site enum.
+#
+_site_names = ( "compute.f",
+                "compute.f_ufunc",
+                "compute.reduce",
+                "compute.Pipeline",
+                "dostuff.hello",
+                "dostuff.Writer",
+                "predicates" )
+
+assert len(_site_names) == NSITES  and  NSITES <= _SITES
+
+def stats_enabled():
+    """Return whether the counters are being updated."""
+    return bool(_enabled)
+
+def enable_stats( bint flag=True ):
+    """Switch the counters on (default) or off. The collected values are kept; see reset_stats()."""
+    global _enabled
+    _enabled = flag
+
+def stats():
+    """Return the counters, as a dict {site: {counter: value}}.
+
+Sites are the instrumented functions, e.g. "compute.f" or "dostuff.hello". All sites are always present.
+
+For each site, the counters are:
+    calls : int
+        Number of calls (kernel runs; see the module docstring).
+
+    elements : int
+        Elements processed: array elements for the numeric sites, messages for the output sites.
+
+    bytes : int
+        Bytes read plus bytes written (numeric sites), or bytes of message text (output sites).
+
+    seconds : float
+        Cumulative wall time spent in the calls, from a monotonic clock.
+
+    parallel, serial : int
+        How many of the calls took the multithreaded (OpenMP) path, and how many the serial one.
+
+The values are read while other threads may be updating them, so a counter may lag the others by a call.
+"""
+    cdef int slot, site, field
+    cdef long long totals[_FIELDS]
+    result = {}
+    for site in range(<int>NSITES):
+        for field in range(_FIELDS):
+            totals[field] = 0
+            for slot in range(_SLOTS):
+                totals[field] += _load(slot, site, field)
+        result[_site_names[site]] = { "calls":    totals[0],
+                                      "elements": totals[1],
+                                      "bytes":    totals[2],
+                                      "seconds":  totals[3] * 1e-9,
+                                      "parallel": totals[4],
+                                      "serial":   totals[0] - totals[4] }
+    return result
+
+def reset_stats():
+    """Set all counters to zero. Updates concurrent with the reset may be lost."""
+    cdef int slot, site, field
+    for slot in range(_SLOTS):
+        for site in range(_SITES):
+            for field in range(_FIELDS):
+                _clear(slot, site, field)
+
+
+if os.environ.get("MYLIBRARY_STATS", "0") not in ("", "0"):
+    enable_stats()
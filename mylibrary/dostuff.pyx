@@ -7,20 +7,241 @@
 
 from __future__ import division, print_function, absolute_import
 
+from cpython.buffer cimport PyObject_GetBuffer, PyBuffer_Release, PyBUF_SIMPLE
+from cpython.pythread cimport PyThread_type_lock, PyThread_allocate_lock, PyThread_free_lock, \
+                              PyThread_acquire_lock, PyThread_release_lock, WAIT_LOCK, NOWAIT_LOCK
+
+import sys
+
+from mylibrary import _writers
 
 # Use absolute module names, even from this library itself.
 #
 cimport mylibrary.subpackage.helloworld as helloworld
 
+# hot-path counters (off by default); see mylibrary.counters
+from mylibrary.counters cimport Site, SITE_DOSTUFF_HELLO, SITE_DOSTUFF_WRITER, enabled_flag, clock_ns, record
+
+cdef const bint* _stats_on = enabled_flag()
+
 
 def hello(s):
     """Python interface to mylibrary.subpackage.helloworld.
 
 This is mainly an example of absolute imports in Cython modules.
 
+Each call prints one message; for many messages, see hello_many() and Writer.
+
+Parameters:
+    s : str, or bytes-like
+        The string to echo. Bytes-like objects (``bytes``, ``bytearray``, ``memoryview``,
+        or anything else that supports the buffer protocol) are written to stdout as-is,
+        without decoding or copying.
+"""
+    cdef long long t0 = 0
+    if _stats_on[0]:
+        t0 = clock_ns()
+    if isinstance(s, str):
+        helloworld.hello(s)
+    else:
+        helloworld.hello_buffer(s)
+    if _stats_on[0]:
+        record(SITE_DOSTUFF_HELLO, 1, len((<str>s).encode("utf-8")) if isinstance(s, str) else memoryview(s).nbytes, t0, False)
+
+
+#########################################################
+# Batched output
+#########################################################
+
+# Acquire lock without deadlocking against a thread that holds it while waiting for the GIL.
+#
+cdef inline void _acquire( PyThread_type_lock lock ) noexcept:
+    if not PyThread_acquire_lock(lock, NOWAIT_LOCK):
+        with nogil:
+            PyThread_acquire_lock(lock, WAIT_LOCK)
+
+# Writers that may hold unflushed data, flushed at interpreter exit.
+#
+from mylibrary._writers import _open_writers
+
+cdef class Writer:
+    """Batched version of hello(): echo many messages with few system calls.
+
+Messages are collected into a C-level buffer, and written out in large chunks,
+with the GIL released during the write. Like print(), each message is followed by a newline.
+
+Messages are either str, which are encoded as UTF-8, or bytes-like objects (anything that
+supports the buffer protocol), which are written as-is. Bytes-like messages larger than
+the buffer are written straight from the caller's memory, without copying.
+
+The buffer is flushed when it is full, when the oldest pending message is older
+than ``max_delay`` seconds (checked when the next message is written), on flush() and close(),
+and at the end of a ``with`` block. Writers still open at interpreter exit are flushed then.
+
+Writer is safe to share between threads; each message is written out whole.
+
+Parameters:
+    file : file object or int, optional
+        Where to write. Default ``sys.stdout``. If the object has a file descriptor,
+        the writer writes to it directly; otherwise, it calls ``file.write()`` once per chunk.
+
+    bufsize : int
+        Buffer size in bytes. Default 64 KiB.
+
+    max_delay : float or None
+        Upper limit for how long a message may wait in the buffer, in seconds. Default 0.5.
+        ``0`` writes every message immediately; ``None`` waits until the buffer is full.
+
+Example::
+
+    with Writer() as w:
+        for s in messages:
+            w.write(s)
+"""
+    cdef helloworld.Buffer buf
+    cdef PyThread_type_lock lock
+    cdef readonly bint closed
+    cdef object __weakref__
+
+    def __cinit__( self, file=None, Py_ssize_t bufsize=65536, max_delay=0.5 ):
+        self.lock = PyThread_allocate_lock()
+        if self.lock == NULL:
+            raise MemoryError()
+        if file is None:
+            file = sys.stdout
+        if not isinstance(file, int):
+            # Anything already buffered in the Python-level stream must come out first.
+            if hasattr(file, "flush"):
+                file.flush()
+            try:
+                file = file.fileno()
+            except Exception:  # e.g. io.StringIO; write via the Python object
+                pass
+        helloworld.buffer_init( &self.buf, file, bufsize, -1.0 if max_delay is None else max_delay )
+        self.closed = False
+        _open_writers.add(self)
+
+    def __dealloc__( self ):
+        # Unflushed data is flushed by close(), __exit__ or at interpreter exit; errors cannot be reported here.
+        helloworld.buffer_free(&self.buf)
+        if self.lock != NULL:
+            PyThread_free_lock(self.lock)
+
+    cdef int _check_open( self ) except -1:
+        if self.closed:
+            raise ValueError( "write to closed Writer" )
+        return 0
+
+    # Write one message; the caller holds the lock. Return its size in bytes.
+    #
+    cdef Py_ssize_t _write( self, s ) except -1:
+        cdef bytes b
+        cdef Py_buffer view
+        if isinstance(s, str):
+            b = (<str>s).encode("utf-8")
+            helloworld.buffer_write_line( &self.buf, b, len(b) )
+            return len(b)
+        PyObject_GetBuffer(s, &view, PyBUF_SIMPLE)
+        try:
+            helloworld.buffer_write_line( &self.buf, <const char*>view.buf, view.len )
+            return view.len
+        finally:
+            PyBuffer_Release(&view)
+
+    def write( self, s ):
+        """Write one message (followed by a newline)."""
+        cdef Py_ssize_t nbytes
+        cdef long long t0 = 0
+        _acquire(self.lock)
+        try:
+            self._check_open()
+            if _stats_on[0]:
+                t0 = clock_ns()
+            nbytes = self._write(s)
+            if _stats_on[0]:
+                record(SITE_DOSTUFF_WRITER, 1, nbytes, t0, False)
+        finally:
+            PyThread_release_lock(self.lock)
+
+    def write_many( self, iterable ):
+        """Write each item of iterable as one message. Return the number of messages written."""
+        cdef Py_ssize_t count = 0, nbytes = 0
+        cdef long long t0 = 0
+        _acquire(self.lock)
+        try:
+            self._check_open()
+            if _stats_on[0]:
+                t0 = clock_ns()
+            for s in iterable:
+                nbytes += self._write(s)
+                count += 1
+            if _stats_on[0]:
+                record(SITE_DOSTUFF_WRITER, count, nbytes, t0, False)
+        finally:
+            PyThread_release_lock(self.lock)
+        return count
+
+    def flush( self ):
+        """Write out all pending messages now."""
+        _acquire(self.lock)
+        try:
+            if not self.closed:
+                helloworld.buffer_flush(&self.buf)
+        finally:
+            PyThread_release_lock(self.lock)
+
+    def close( self ):
+        """Flush, and release the buffer. Closing an already closed writer does nothing.
+
+The underlying file is not closed.
+"""
+        _acquire(self.lock)
+        try:
+            if not self.closed:
+                self.closed = True
+                _open_writers.discard(self)
+                try:
+                    helloworld.buffer_flush(&self.buf)
+                finally:
+                    helloworld.buffer_free(&self.buf)
+        finally:
+            PyThread_release_lock(self.lock)
+
+    def __enter__( self ):
+        return self
+
+    def __exit__( self, exc_type, exc_value, traceback ):
+        self.close()
+
+
+def hello_many( iterable, file=None ):
+    """Batched version of hello(): echo each item of iterable, with few system calls.
+
 Parameters:
-    s : str
-        The string to echo.
+    iterable : iterable of str or bytes-like
+        The messages to echo, one per line.
+
+    file : file object or int, optional
+        Where to write. Default ``sys.stdout``.
+
+Return value:
+    int
+        The number of messages written.
 """
-    helloworld.hello(s)
+    with Writer( file, max_delay=None ) as w:
+        return w.write_many(iterable)
+
+
+#########################################################
+# Non-blocking output
+#########################################################
+
+# The queueing is plain Python, shared with the NumPy backend; see mylibrary/_writers.py.
+
+class BackgroundWriter(_writers.BackgroundWriter):
+    __doc__ = _writers.BackgroundWriter.__doc__
+    _Writer = Writer
 
+class AsyncWriter(_writers.AsyncWriter):
+    __doc__ = _writers.AsyncWriter.__doc__
+    _BackgroundWriter = BackgroundWriter
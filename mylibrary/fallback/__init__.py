@@ -0,0 +1,12 @@
+# -*- coding: utf-8 -*-
+#
+"""NumPy backend of mylibrary: the modules compute, dostuff, predicates and counters in pure Python and NumPy.
+
+mylibrary uses these when its compiled extension modules are not available, e.g. on a host
+without a C compiler, or when pinned by the environment variable ``MYLIBRARY_BACKEND=numpy``;
+see mylibrary.backend(). Then ``import mylibrary.compute`` gives mylibrary.fallback.compute, and so on.
+
+The modules can also be imported directly, e.g. to benchmark the two backends side by side.
+"""
+
+from __future__ import absolute_import
@@ -0,0 +1,293 @@
+# -*- coding: utf-8 -*-
+#
+"""NumPy backend of mylibrary.compute: the same API, in vectorized NumPy.
+
+The arguments, return values and errors are those of the compiled module; see the docstrings
+in mylibrary/compute.pyx. The differences:
+
+  - f() computes exactly what the compiled kernels do (np.sqrt is correctly rounded, too).
+    The reductions agree up to rounding: both accumulate in double precision, in a different order.
+  - num_threads is validated, but NumPy computes serially.
+  - f_ufunc is np.sqrt itself, so it also accepts the dtypes that np.sqrt does.
+  - f_file() ignores the memory-access hints (``advise``).
+  - There is one kernel variant, "numpy".
+"""
+
+from __future__ import division, print_function, absolute_import
+
+import os
+
+import numpy as np
+
+from mylibrary._arguments import supported_dtypes, check_input as _check_input, prepare_elementwise as _prepare_elementwise
+from mylibrary.fallback import counters
+
+
+# As in mylibrary.compute.
+#
+parallel_threshold = 65536
+_profile_build     = False
+
+# The reductions work on blocks of this many elements at a time, so their temporary memory is bounded.
+#
+_BLOCK = 65536
+
+kernel_variants = ("numpy",)
+
+def available_kernel_variants():
+    """Return the kernel variants that are available: just "numpy" in the NumPy backend."""
+    return kernel_variants
+
+def kernel_variant():
+    """Return the name of the active kernel variant: "numpy" in the NumPy backend."""
+    return "numpy"
+
+def set_kernel_variant( variant ):
+    """Switch to another kernel variant. The NumPy backend only has "numpy"."""
+    if variant not in kernel_variants:
+        raise ValueError( "unknown kernel variant '%s'; valid: %s" % (variant, kernel_variants) )
+
+
+#########################################################
+# Helpers
+#########################################################
+
+def _check_threads( num_threads ):
+    if num_threads < 0:
+        raise ValueError( "num_threads must be >= 0, got %d" % (num_threads) )
+
+# Split nonempty x (and y, of the same shape) into blocks of about _BLOCK elements, along the first axis.
+#
+def _blocks( x, y=None ):
+    if x.ndim == 0:
+        x = x.reshape(1)
+        y = y.reshape(1) if y is not None else None
+    rows = max( 1, _BLOCK // max(1, x.size // x.shape[0]) )
+    for start in range(0, x.shape[0], rows):
+        yield x[start:start + rows], (y[start:start + rows] if y is not None else None)
+
+
+#########################################################
+# Public API
+#########################################################
+
+def f( x, out=None, inplace=False, num_threads=1, dtype=None, result="array" ):
+    """Example math function: the square root, elementwise. As mylibrary.compute.f()."""
+    _check_threads(num_threads)
+    if result not in ("array", "like", "memoryview"):
+        raise ValueError( "result must be 'array', 'like' or 'memoryview', got '%s'" % (result) )
+
+    x, out, out_orig = _prepare_elementwise(x, out, inplace, dtype, result == "like")
+    t0 = counters.clock_ns() if counters._enabled else 0
+    with np.errstate(invalid="ignore"):  # NaN for negative inputs, without a warning, as in the compiled kernels
+        np.sqrt(x, out=out)
+    if counters._enabled:
+        counters.record( "compute.f", x.size, 2 * x.nbytes, t0 )
+
+    if result == "memoryview":
+        return memoryview(out)
+    return out_orig
+
+async def f_async( x, out=None, inplace=False, dtype=None, chunksize=None, executor=None ):
+    """asyncio version of f(), run chunk by chunk on an executor. As mylibrary.compute.f_async()."""
+    from mylibrary import parallel
+
+    x, out, out_orig = _prepare_elementwise(x, out, inplace, dtype)
+    await parallel.map_chunks_async( f, x, out, chunksize, executor )
+    return out_orig
+
+f_ufunc = np.sqrt
+
+def _reduce( op, x, y=None ):
+    t0 = counters.clock_ns() if counters._enabled else 0
+    result = 0.0 if op in ("sum", "dot") else None
+    for bx, by in _blocks(x, y):
+        with np.errstate(invalid="ignore"):
+            r = np.sqrt(bx)
+        if op == "sum":
+            result += r.sum(dtype=np.float64)
+        elif op == "dot":
+            result += np.multiply(r, by, dtype=np.float64).sum()
+        else:
+            part = r.min() if op == "min" else r.max()
+            result = part if result is None else (np.minimum(result, part) if op == "min" else np.maximum(result, part))  # NaN propagates
+    if counters._enabled:
+        counters.record( "compute.reduce", x.size, x.nbytes * (2 if y is not None else 1), t0 )
+    return float(result)
+
+def sum_f( x, num_threads=1 ):
+    """Sum of f(x), without materializing f(x). As mylibrary.compute.sum_f()."""
+    _check_threads(num_threads)
+    x = _check_input(x)
+    if x.size == 0:
+        return 0.0
+    return _reduce("sum", x)
+
+def mean_f( x, num_threads=1 ):
+    """Mean of f(x), without materializing f(x). As mylibrary.compute.mean_f()."""
+    _check_threads(num_threads)
+    x = _check_input(x)
+    if x.size == 0:
+        return float("nan")
+    return _reduce("sum", x) / x.size
+
+def min_f( x, num_threads=1 ):
+    """Minimum of f(x), without materializing f(x). As mylibrary.compute.min_f()."""
+    _check_threads(num_threads)
+    x = _check_input(x)
+    if x.size == 0:
+        raise ValueError( "min_f() of an empty array" )
+    return _reduce("min", x)
+
+def max_f( x, num_threads=1 ):
+    """Maximum of f(x), without materializing f(x). As mylibrary.compute.max_f()."""
+    _check_threads(num_threads)
+    x = _check_input(x)
+    if x.size == 0:
+        raise ValueError( "max_f() of an empty array" )
+    return _reduce("max", x)
+
+def dot_f( x, y, num_threads=1 ):
+    """Dot product of f(x) and y, without materializing f(x). As mylibrary.compute.dot_f()."""
+    _check_threads(num_threads)
+    x = _check_input(x)
+    y = _check_input(y, "y")
+    if x.size == 0  and  y.shape == x.shape:
+        return 0.0
+    if y.dtype != x.dtype:
+        raise ValueError( "y has dtype '%s', expected '%s'" % (y.dtype, x.dtype) )
+    if y.shape != x.shape:
+        raise ValueError( "y has shape %s, expected %s" % (y.shape, x.shape) )
+    return _reduce("dot", x, y)
+
+
+_PIPELINE_MAXOPS = 32
+
+class Pipeline:
+    """Elementwise pipeline. As mylibrary.compute.Pipeline, with the same operations and call arguments.
+
+In the NumPy backend, each operation is one ufunc call over the whole array, in place on the output.
+"""
+    def __init__( self ):
+        self._ops = ()  # (name, a, b)
+
+    def _then( self, name, a=0.0, b=0.0 ):
+        if len(self._ops) == _PIPELINE_MAXOPS:
+            raise ValueError( "a pipeline can have at most %d operations" % (_PIPELINE_MAXOPS) )
+        p = Pipeline()
+        p._ops = self._ops + ((name, float(a), float(b)),)
+        return p
+
+    def scale( self, a ):
+        """Multiply by a."""
+        return self._then("scale", a, 0.0)
+
+    def offset( self, b ):
+        """Add b."""
+        return self._then("offset", 0.0, b)
+
+    def f( self ):
+        """Take the square root (the elementwise operation of compute.f())."""
+        return self._then("f")
+
+    def clip( self, lo, hi ):
+        """Clip to the interval [lo, hi]. NaNs pass through."""
+        if not lo <= hi:
+            raise ValueError( "need lo <= hi, got lo = %g, hi = %g" % (lo, hi) )
+        return self._then("clip", lo, hi)
+
+    def abs( self ):
+        """Take the absolute value."""
+        return self._then("abs")
+
+    def square( self ):
+        """Square."""
+        return self._then("square")
+
+    def __len__( self ):
+        return len(self._ops)
+
+    def __repr__( self ):
+        parts = ["Pipeline()"]
+        for name, a, b in self._ops:
+            if name == "scale":
+                parts.append( ".scale(%r)" % (a) )
+            elif name == "offset":
+                parts.append( ".offset(%r)" % (b) )
+            elif name == "clip":
+                parts.append( ".clip(%r, %r)" % (a, b) )
+            else:
+                parts.append( ".%s()" % (name) )
+        return "".join(parts)
+
+    def __call__( self, x, out=None, inplace=False, num_threads=1 ):
+        """Run the pipeline on x. Arguments and return value as in f()."""
+        _check_threads(num_threads)
+        x, out, out_orig = _prepare_elementwise(x, out, inplace)
+        t0 = counters.clock_ns() if counters._enabled else 0
+        src = x
+        if not self._ops:
+            np.copyto(out, x)
+        for name, a, b in self._ops:
+            a, b = x.dtype.type(a), x.dtype.type(b)  # the compiled kernels convert the parameters to the dtype of x, too
+            if name == "scale":
+                np.multiply(src, a, out=out)
+            elif name == "offset":
+                np.add(src, b, out=out)
+            elif name == "f":
+                with np.errstate(invalid="ignore"):  # as in f()
+                    np.sqrt(src, out=out)
+            elif name == "clip":
+                np.clip(src, a, b, out=out)
+            elif name == "abs":
+                np.abs(src, out=out)
+            elif name == "square":
+                np.square(src, out=out)
+            src = out
+        if counters._enabled:
+            counters.record( "compute.Pipeline", x.size, 2 * x.nbytes, t0 )
+        return out_orig
+
+
+def f_file( src, dst, dtype=None, kernel=None, blocksize=4*1024*1024, advise=True, num_threads=1 ):
+    """Out-of-core version of f(). As mylibrary.compute.f_file(), except that ``advise`` is ignored."""
+    if kernel is None:
+        kernel = f
+
+    with open(src, "rb") as fin:
+        try:
+            version = np.lib.format.read_magic(fin)
+        except ValueError:
+            version = None
+    if version is not None:
+        x = np.load(src, mmap_mode="r")
+        if dtype is not None  and  np.dtype(dtype) != x.dtype:
+            raise ValueError( "dtype %s given, but '%s' has dtype %s" % (np.dtype(dtype), src, x.dtype) )
+        dtype = x.dtype
+    else:
+        dtype  = np.dtype(np.float64 if dtype is None else dtype)
+        nbytes = os.path.getsize(src)
+        if nbytes % dtype.itemsize != 0:
+            raise ValueError( "size of '%s' (%d bytes) is not a multiple of the item size of %s" % (src, nbytes, dtype) )
+        x = np.memmap(src, dtype=dtype, mode="r") if nbytes else np.empty((0,), dtype=dtype)
+
+    if dtype not in supported_dtypes:
+        raise ValueError( "unsupported dtype '%s'; expected one of %s" % (dtype, [np.dtype(t).name for t in supported_dtypes]) )
+
+    fortran_order = x.ndim > 1  and  x.flags.f_contiguous  and  not x.flags.c_contiguous
+    if version is not None:
+        out = np.lib.format.open_memmap( dst, mode="w+", dtype=dtype, shape=x.shape, fortran_order=fortran_order )
+    elif x.size:
+        out = np.memmap( dst, dtype=dtype, mode="w+", shape=x.shape )
+    else:
+        open(dst, "wb").close()
+        return
+    if x.size == 0:
+        return
+
+    # The elements are processed in memory order; f is elementwise, so the logical shape does not matter.
+    xf, outf = x.ravel(order="K"), out.ravel(order="K")  # views, since both are contiguous
+    block = max(1, blocksize // dtype.itemsize)
+    for start in range(0, xf.size, block):
+        kernel( xf[start:start + block], out=outf[start:start + block], num_threads=num_threads )
+    out.flush()
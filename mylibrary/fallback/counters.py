@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+#
+"""NumPy backend of mylibrary.counters: the same API, with the counters in a dict under a lock.
+
+See mylibrary.counters for what is counted. The NumPy backend never takes the parallel path,
+and counts compute.f_ufunc (which is np.sqrt here) not at all.
+"""
+
+from __future__ import division, print_function, absolute_import
+
+import os
+import threading
+import time
+
+
+_site_names = ( "compute.f",
+                "compute.f_ufunc",
+                "compute.reduce",
+                "compute.Pipeline",
+                "dostuff.hello",
+                "dostuff.Writer",
+                "predicates" )
+
+_lock     = threading.Lock()
+_counters = { site: [0, 0, 0, 0, 0] for site in _site_names }  # calls, elements, bytes, nanoseconds, parallel calls
+_enabled  = False
+
+clock_ns = time.monotonic_ns
+
+# Count one call at site; see counters.pxd. The caller checks _enabled first, to keep the disabled path cheap.
+#
+def record( site, elements, nbytes, t0, parallel=False ):
+    ns = clock_ns() - t0
+    with _lock:
+        c = _counters[site]
+        c[0] += 1
+        c[1] += elements
+        c[2] += nbytes
+        c[3] += ns
+        c[4] += bool(parallel)
+
+def stats_enabled():
+    """Return whether the counters are being updated."""
+    return _enabled
+
+def enable_stats( flag=True ):
+    """Switch the counters on (default) or off. The collected values are kept; see reset_stats()."""
+    global _enabled
+    _enabled = bool(flag)
+
+def stats():
+    """Return the counters, as a dict {site: {counter: value}}; see mylibrary.counters.stats()."""
+    with _lock:
+        return { site: { "calls":    c[0],
+                         "elements": c[1],
+                         "bytes":    c[2],
+                         "seconds":  c[3] * 1e-9,
+                         "parallel": c[4],
+                         "serial":   c[0] - c[4] }
+                 for site, c in _counters.items() }
+
+def reset_stats():
+    """Set all counters to zero."""
+    with _lock:
+        for c in _counters.values():
+            c[:] = [0, 0, 0, 0, 0]
+
+
+if os.environ.get("MYLIBRARY_STATS", "0") not in ("", "0"):
+    enable_stats()
@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+#
+"""Pure-Python backend of mylibrary.dostuff: the same API, with the output buffer in a bytearray.
+
+See mylibrary/dostuff.pyx for the documentation. The buffering, the flush policies and the handling
+of str and bytes-like messages are the same; BackgroundWriter and AsyncWriter are shared with the
+compiled backend (see mylibrary/_writers.py).
+"""
+
+from __future__ import division, print_function, absolute_import
+
+import io
+import os
+import sys
+import threading
+import time
+
+from mylibrary import _writers
+from mylibrary._writers import _open_writers
+from mylibrary.fallback import counters
+
+
+# Write all of the chunks to fd, in order, in as few system calls as possible.
+#
+def _write_all( fd, *chunks ):
+    views = [ memoryview(c).cast("B") for c in chunks if len(c) ]
+    while views:
+        k = os.writev(fd, views) if hasattr(os, "writev") else os.write(fd, views[0])
+        while views  and  k >= len(views[0]):
+            k -= len(views[0])
+            views.pop(0)
+        if views:
+            views[0] = views[0][k:]
+
+# Send bytes to a Python file object without a file descriptor.
+#
+def _send_file( file, data ):
+    if isinstance(file, io.TextIOBase):
+        file.write( bytes(data).decode("utf-8", "surrogateescape") )
+    else:
+        file.write( bytes(data) )
+
+# Bytes of a message: UTF-8 for str; the contents of anything else that supports the buffer protocol.
+#
+def _as_bytes( s ):
+    if isinstance(s, str):
+        return s.encode("utf-8")
+    return memoryview(s).cast("B")
+
+
+def hello( s ):
+    """Python interface to mylibrary.subpackage.helloworld. As mylibrary.dostuff.hello()."""
+    t0 = counters.clock_ns() if counters._enabled else 0
+    if isinstance(s, str):
+        print(s)
+    else:
+        data = _as_bytes(s)
+        stdout = sys.stdout
+        stdout.flush()  # keep the order of output written via print()
+        try:
+            fd = stdout.fileno()
+        except Exception:  # e.g. io.StringIO
+            _send_file( stdout, data )
+            _send_file( stdout, b"\n" )
+        else:
+            _write_all( fd, data, b"\n" )
+    if counters._enabled:
+        counters.record( "dostuff.hello", 1, len(_as_bytes(s)), t0 )
+
+
+class Writer:
+    """Batched version of hello(): echo many messages with few system calls. As mylibrary.dostuff.Writer."""
+    def __init__( self, file=None, bufsize=65536, max_delay=0.5 ):
+        if bufsize <= 0:
+            raise ValueError( "capacity must be > 0, got %d" % (bufsize) )
+        if file is None:
+            file = sys.stdout
+        if not isinstance(file, int):
+            if hasattr(file, "flush"):
+                file.flush()
+            try:
+                file = file.fileno()
+            except Exception:  # e.g. io.StringIO; write via the Python object
+                pass
+        self._fd        = file if isinstance(file, int) else -1
+        self._file      = None if isinstance(file, int) else file
+        self._buf       = bytearray()
+        self._capacity  = bufsize
+        self._max_delay = -1.0 if max_delay is None else max_delay
+        self._deadline  = 0.0
+        self._lock      = threading.Lock()
+        self.closed     = False
+        _open_writers.add(self)
+
+    def _send( self, *chunks ):
+        if self._fd >= 0:
+            _write_all( self._fd, *chunks )
+        else:
+            for c in chunks:
+                if len(c):
+                    _send_file( self._file, c )
+
+    def _flush( self ):
+        data, self._buf = self._buf, bytearray()  # drop the data even if the write fails, as the compiled Writer does
+        self._send(data)
+
+    # Write one message; the caller holds the lock. Return its size in bytes.
+    #
+    def _write( self, s ):
+        data  = _as_bytes(s)
+        total = len(data) + 1
+        if len(self._buf) + total > self._capacity:  # size policy
+            if total > self._capacity:  # would not fit even into an empty buffer; pending data and message in one go
+                pending, self._buf = self._buf, bytearray()
+                self._send( pending, data, b"\n" )
+                return len(data)
+            self._flush()
+        t = 0.0
+        if self._max_delay >= 0.0:
+            t = time.monotonic()
+            if not self._buf:
+                self._deadline = t + self._max_delay
+        self._buf += data
+        self._buf += b"\n"
+        if self._max_delay >= 0.0  and  t >= self._deadline:  # time policy
+            self._flush()
+        return len(data)
+
+    def _check_open( self ):
+        if self.closed:
+            raise ValueError( "write to closed Writer" )
+
+    def write( self, s ):
+        """Write one message (followed by a newline)."""
+        with self._lock:
+            self._check_open()
+            t0 = counters.clock_ns() if counters._enabled else 0
+            nbytes = self._write(s)
+            if counters._enabled:
+                counters.record( "dostuff.Writer", 1, nbytes, t0 )
+
+    def write_many( self, iterable ):
+        """Write each item of iterable as one message. Return the number of messages written."""
+        count = nbytes = 0
+        with self._lock:
+            self._check_open()
+            t0 = counters.clock_ns() if counters._enabled else 0
+            for s in iterable:
+                nbytes += self._write(s)
+                count += 1
+            if counters._enabled:
+                counters.record( "dostuff.Writer", count, nbytes, t0 )
+        return count
+
+    def flush( self ):
+        """Write out all pending messages now."""
+        with self._lock:
+            if not self.closed:
+                self._flush()
+
+    def close( self ):
+        """Flush, and release the buffer. Closing an already closed writer does nothing.
+
+The underlying file is not closed.
+"""
+        with self._lock:
+            if not self.closed:
+                self.closed = True
+                _open_writers.discard(self)
+                self._flush()
+
+    def __enter__( self ):
+        return self
+
+    def __exit__( self, exc_type, exc_value, traceback ):
+        self.close()
+
+def hello_many( iterable, file=None ):
+    """Batched version of hello(): echo each item of iterable. As mylibrary.dostuff.hello_many()."""
+    with Writer( file, max_delay=None ) as w:
+        return w.write_many(iterable)
+
+
+class BackgroundWriter(_writers.BackgroundWriter):
+    __doc__ = _writers.BackgroundWriter.__doc__
+    _Writer = Writer
+
+class AsyncWriter(_writers.AsyncWriter):
+    __doc__ = _writers.AsyncWriter.__doc__
+    _BackgroundWriter = BackgroundWriter
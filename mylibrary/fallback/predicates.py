@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+#
+"""NumPy backend of mylibrary.predicates: the same API, in vectorized NumPy.
+
+See mylibrary/predicates.pyx for the documentation. Here, the array versions build the boolean
+mask ``x == value`` (one byte per element), where the compiled kernels need no temporary at all.
+"""
+
+from __future__ import division, print_function, absolute_import
+
+import operator
+
+import numpy as np
+
+from mylibrary.fallback import counters
+
+
+def _flat( x, value ):
+    x = np.asarray(x)
+    if x.dtype.kind not in "iu"  or  not x.dtype.isnative:
+        raise ValueError( "expected an array of native-endian integers, got dtype '%s'" % (x.dtype) )
+    info = np.iinfo(x.dtype)
+    return (x.reshape(-1) if x.ndim != 1 else x), (info.min <= value <= info.max)
+
+def _check_out( out, shape ):
+    out = np.asarray(out)
+    if out.dtype != np.bool_  and  out.dtype != np.uint8:
+        raise ValueError( "out has dtype '%s', expected 'bool' or 'uint8'" % (out.dtype) )
+    if out.shape != shape:
+        raise ValueError( "out has shape %s, expected %s" % (out.shape, shape) )
+    if not out.flags.writeable:
+        raise ValueError( "out is read-only" )
+    if not out.flags.c_contiguous:
+        raise ValueError( "out must be C-contiguous" )
+    return out
+
+# x == value, elementwise, into out (a flat bool array) if given. value must be representable in the dtype of x.
+#
+def _equal( xf, value, out=None ):
+    t0 = counters.clock_ns() if counters._enabled else 0
+    mask = np.equal( xf, xf.dtype.type(value), out=out )
+    if counters._enabled:
+        counters.record( "predicates", xf.size, xf.nbytes, t0 )
+    return mask
+
+
+def g( x, value=42 ):
+    """Scalar predicate: return whether x == value (by default, 42). As mylibrary.predicates.g()."""
+    return operator.index(x) == operator.index(value)
+
+def g_mask( x, value=42, out=None ):
+    """Array version of g(): boolean mask of where x == value. As mylibrary.predicates.g_mask()."""
+    value = operator.index(value)
+    shape = np.shape(x)
+    xf, possible = _flat(x, value)
+    if out is None:
+        out_orig = out = np.empty( shape, dtype=np.bool_ )
+    else:
+        out_orig, out = out, _check_out( out, shape )
+    if possible:
+        _equal( xf, value, out.reshape(-1) )
+    else:
+        out[...] = False
+    return out_orig
+
+def g_count( x, value=42 ):
+    """Array version of g(): number of elements of x equal to value. As mylibrary.predicates.g_count()."""
+    value = operator.index(value)
+    xf, possible = _flat(x, value)
+    return int( np.count_nonzero(_equal(xf, value)) ) if possible else 0
+
+def g_any( x, value=42 ):
+    """Array version of g(): whether any element of x equals value. As mylibrary.predicates.g_any()."""
+    value = operator.index(value)
+    xf, possible = _flat(x, value)
+    return possible  and  bool( _equal(xf, value).any() )
+
+def g_nonzero( x, value=42 ):
+    """Array version of g(): indices of the elements of x equal to value. As mylibrary.predicates.g_nonzero()."""
+    value = operator.index(value)
+    shape = np.shape(x)
+    if len(shape) == 0:
+        raise ValueError( "g_nonzero() of a 0-d array is not defined, as for np.nonzero(); use np.atleast_1d(x)" )
+    xf, possible = _flat(x, value)
+    idx = np.flatnonzero( _equal(xf, value) ) if possible else np.empty( (0,), dtype=np.intp )
+    if len(shape) == 1:
+        return (idx,)
+    return np.unravel_index(idx, shape)
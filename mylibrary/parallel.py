@@ -0,0 +1,562 @@
+# -*- coding: utf-8 -*-
+#
+"""Chunked parallel execution of elementwise kernels on a persistent thread pool.
+
+The kernels of mylibrary (compute.f, compute.f_ufunc, compute.Pipeline, ...) release the GIL while
+they compute, so Python threads running them on disjoint parts of an array run in parallel.
+map_chunks() does this: it splits the array into chunks, and has a few threads take chunks
+until none are left, each writing its results into the same preallocated output.
+
+Compared with the ``num_threads`` argument of the kernels (OpenMP):
+
+  - It works in builds without OpenMP, and with the NumPy backend (NumPy's ufuncs release the GIL, too).
+  - The threads are those of a concurrent.futures pool: the shared pool of this module, or the
+    application's own (``executor``). Calls from several threads of an application then share
+    one bounded set of threads, instead of each starting an OpenMP team (oversubscription).
+  - It is safe to call from within a task of the pool it uses: the calling thread works on the
+    chunks, too, and never waits for a task that has not started.
+
+map_chunks_async() is the asyncio counterpart: a coroutine that runs the chunks on an executor,
+one after the other, so that the event loop stays responsive, other coroutines' chunks interleave
+with its own, and cancellation takes effect between chunks. compute.f_async() is built on it.
+
+ProcessPool is for when one process does not scale, because the Python code around the kernels
+holds the GIL: a pool of persistent worker processes, which run the chunks of map_chunks() on
+arrays in shared memory. Only the names of the shared memory blocks, the array layouts and the
+chunk ranges are sent to the workers; the array data is never pickled.
+"""
+
+from __future__ import division, print_function, absolute_import
+
+import collections
+import functools
+import itertools
+import os
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+
+# Chunks are about this many bytes of input: large enough that the per-chunk overhead (a Python-level
+# call, around a microsecond) is negligible, small enough that there are chunks for all threads,
+# and that a chunk of input and output stays in the L2 cache.
+#
+chunk_bytes = 256 * 1024
+
+# Chunk boundaries fall on this many bytes in the output, so that no two threads write into
+# the same cache line (false sharing).
+#
+_CACHE_LINE = 64
+
+# Chunks of map_chunks_async() are about this many bytes of input. Each is one round trip through the
+# event loop (tens of microseconds), and the delay of a cancellation; this is a fraction of a millisecond of work.
+#
+async_chunk_bytes = 1024 * 1024
+
+_pool      = None  # the shared pool, created on first use
+_pool_size = 0
+_pool_lock = threading.Lock()
+
+
+def default_workers():
+    """Return the default number of workers: the number of CPUs this process may run on."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # not available on all platforms
+        return os.cpu_count() or 1
+
+# Return (the shared pool, its number of threads), starting it if needed.
+#
+# Its size is fixed when it starts: default_workers() - 1 threads (but at least one), since the calling
+# thread works, too. Growing it would mean replacing it, under calls that are about to submit to it.
+#
+def _shared_pool():
+    global _pool, _pool_size
+    with _pool_lock:
+        if _pool is None:
+            _pool_size = max( 1, default_workers() - 1 )
+            _pool      = ThreadPoolExecutor( max_workers=_pool_size, thread_name_prefix="mylibrary.parallel" )
+        return _pool, _pool_size
+
+def shutdown( wait=True ):
+    """Stop the threads of the shared pool. The next call of map_chunks() starts a new pool.
+
+The pool is also shut down at interpreter exit; this is for releasing the threads earlier.
+Calls of map_chunks() running meanwhile finish their remaining chunks in the calling thread.
+"""
+    global _pool, _pool_size
+    with _pool_lock:
+        pool, _pool, _pool_size = _pool, None, 0
+    if pool is not None:
+        pool.shutdown(wait=wait)
+
+
+# Check the arguments common to map_chunks() and map_chunks_async(). Return (x, out, chunksize) to use.
+#
+# If out is None, it is allocated by empty_like(x), once the other arguments have been checked.
+#
+def _check_args( x, out, chunksize, default_bytes, empty_like=np.empty_like ):
+    if chunksize is not None  and  chunksize < 1:
+        raise ValueError( "chunksize must be >= 1, got %d" % (chunksize) )
+    x = np.asarray(x)
+    if out is None:
+        out = empty_like(x)
+    else:
+        out_array = np.asarray(out)
+        if out_array.shape != x.shape:
+            raise ValueError( "out has shape %s, expected %s" % (out_array.shape, x.shape) )
+        if not out_array.flags.writeable:
+            raise ValueError( "out is read-only" )
+    if chunksize is None:
+        chunksize = max( 1, default_bytes // max(1, x.itemsize) )
+    return x, out, chunksize
+
+# Return (x, out, bounds): views of x and out to be split along their first axis, and the chunk boundaries on it.
+#
+# Where x and out have the same contiguous layout, they are flattened in memory order (f is elementwise,
+# so the logical shape does not matter), and the boundaries fall on cache lines of out. Otherwise they
+# are split into blocks of rows along the first axis.
+#
+def _chunks( x, out, chunksize ):
+    for order in ("C", "F"):
+        if x.flags[order + "_CONTIGUOUS"]  and  out.flags[order + "_CONTIGUOUS"]:
+            x, out = x.reshape(-1, order=order), out.reshape(-1, order=order)  # views
+            line  = max( 1, _CACHE_LINE // out.itemsize )
+            step  = max( line, chunksize // line * line )
+            head  = (-out.__array_interface__["data"][0] % _CACHE_LINE) // out.itemsize  # elements up to the first cache line boundary
+            start = head if 0 < head < x.shape[0] else 0
+            return x, out, [0] + list( range(start or step, x.shape[0], step) ) + [x.shape[0]]
+    rows = max( 1, chunksize // max(1, x.size // x.shape[0]) )
+    return x, out, list( range(0, x.shape[0], rows) ) + [x.shape[0]]
+
+# Worker: run kernel on chunks, taking the next free one until none are left, or a chunk failed.
+#
+def _work( kernel, x, out, bounds, next_chunk, errors ):
+    n = len(bounds) - 1
+    try:
+        for i in next_chunk:  # itertools.count: atomic, so each chunk goes to one worker
+            if i >= n  or  errors:
+                break
+            kernel( x[bounds[i]:bounds[i + 1]], out=out[bounds[i]:bounds[i + 1]] )
+    except BaseException as e:
+        errors.append(e)
+
+
+def map_chunks( kernel, x, out=None, workers=None, chunksize=None, executor=None ):
+    """Apply an elementwise kernel to x in parallel, chunk by chunk, on a thread pool.
+
+Parameters:
+    kernel : callable
+        Elementwise operation, called as ``kernel(x_chunk, out=out_chunk)`` on each chunk;
+        e.g. compute.f, compute.f_ufunc, a compute.Pipeline, or a NumPy ufunc. It should release
+        the GIL, or the chunks run one at a time.
+
+        compute.f and Pipeline run serially within each chunk (``num_threads`` defaults to 1),
+        so no OpenMP threads are started on top of the pool's.
+
+    x : np.array, or anything np.asarray() accepts
+        Input, of any shape and memory layout.
+
+    out : np.array, optional
+        Writable array of the same shape as x, into which to write the result. Its dtype is whatever
+        kernel accepts. If not given, an array of the same shape, layout and dtype as x is allocated.
+
+    workers : int, optional
+        Number of threads working on the chunks, counting the calling thread. Default default_workers().
+        1 calls kernel on the whole of x in the calling thread. On the shared pool, at most
+        its threads plus the calling thread work; larger values are reduced to that.
+
+    chunksize : int, optional
+        Elements per chunk (about; chunk boundaries are moved to cache lines of out).
+        Default: the number of elements in chunk_bytes of x.
+
+    executor : concurrent.futures.ThreadPoolExecutor, optional
+        Pool to run the workers on. Default: the shared pool of this module, started on first use
+        with default_workers() - 1 threads (at least one), and kept for later calls.
+
+Return value:
+    out (allocated, if not given)
+
+Raises:
+    ValueError
+        If workers or chunksize is less than 1, or out has the wrong shape or is read-only.
+
+    Any exception raised by kernel, for the first chunk that failed. The remaining chunks are
+    then skipped, so parts of out are not written.
+"""
+    if workers is None:
+        workers = default_workers()
+    if workers < 1:
+        raise ValueError( "workers must be >= 1, got %d" % (workers) )
+
+    x, out, chunksize = _check_args( x, out, chunksize, chunk_bytes )
+
+    if workers == 1  or  x.ndim == 0  or  x.size <= chunksize:
+        kernel( x, out=out )
+        return out
+
+    xc, outc, bounds = _chunks( x, np.asarray(out), chunksize )
+    if executor is None:
+        pool, size = _shared_pool()
+        workers = min( workers, size + 1 )
+    else:
+        pool = executor
+    workers = min( workers, len(bounds) - 1 )
+
+    next_chunk = itertools.count()
+    errors     = []
+    futures    = []
+    for _ in range(workers - 1):
+        try:
+            futures.append( pool.submit(_work, kernel, xc, outc, bounds, next_chunk, errors) )
+        except RuntimeError:  # the shared pool was shut down meanwhile (see shutdown()); the calling thread does the rest
+            if executor is not None:
+                raise
+            break
+    _work( kernel, xc, outc, bounds, next_chunk, errors )
+
+    # All chunks are taken. A task that has not started would find nothing to do; cancel it rather
+    # than wait for it, which could deadlock when called from a task of the same pool.
+    for future in futures:
+        if not future.cancel():
+            future.result()
+    if errors:
+        raise errors[0]
+    return out
+
+
+async def map_chunks_async( kernel, x, out=None, chunksize=None, executor=None ):
+    """Apply an elementwise kernel to x on an executor, chunk by chunk, without blocking the event loop.
+
+The chunks run one at a time, each as one task on the executor; between chunks, control returns
+to the event loop. Several of these coroutines running at once (e.g. from concurrent request
+handlers) thus overlap, sharing the executor's threads chunk by chunk, and none of them holds
+a thread for long.
+
+Parameters:
+    kernel, x, out : as in map_chunks()
+
+    chunksize : int, optional
+        Elements per chunk. Default: the number of elements in async_chunk_bytes of x.
+
+    executor : concurrent.futures.Executor, optional
+        Where to run the chunks. Default: the event loop's default executor.
+
+Return value:
+    out (allocated, if not given)
+
+Raises:
+    As map_chunks().
+
+    asyncio.CancelledError
+        If the coroutine is cancelled. The chunk being computed at that moment is finished first
+        (the kernels cannot be interrupted), so that nothing writes into out any more once the
+        cancellation has taken effect; the later chunks are not computed.
+"""
+    import asyncio  # not at the top; see mylibrary._writers
+
+    x, out, chunksize = _check_args( x, out, chunksize, async_chunk_bytes )
+
+    if x.ndim == 0:
+        xc, outc, bounds = x.reshape(1), np.asarray(out).reshape(1), [0, 1]
+    else:
+        xc, outc, bounds = _chunks( x, np.asarray(out), chunksize )
+    loop = asyncio.get_running_loop()
+    for start, stop in zip(bounds[:-1], bounds[1:]):
+        future = loop.run_in_executor( executor, functools.partial(kernel, xc[start:stop], out=outc[start:stop]) )
+        try:
+            await asyncio.shield(future)  # so that cancelling us does not lose track of the running chunk
+        except asyncio.CancelledError:
+            await asyncio.wait( [future] )
+            raise
+    return out
+
+
+#########################################################
+# Process pool over shared memory
+#########################################################
+
+# In the workers: shared memory blocks attached so far, name -> SharedMemory, least recently used first.
+# Beyond _MAX_ATTACHED, the least recently used are closed, since the parent frees its blocks along with
+# their arrays; never those of the current task, whose views would be left on unmapped memory.
+#
+_attached = collections.OrderedDict()
+_MAX_ATTACHED = 16
+
+def _init_worker( modules, ready ):
+    # Warm up: import the extension modules once per worker, not in the first task.
+    for name in modules:
+        __import__(name)
+    ready.wait()  # until all workers are up; see ProcessPool.__init__()
+
+# Return the SharedMemory blocks of names, attaching those not attached yet.
+#
+def _attach( names ):
+    from multiprocessing import shared_memory
+    for name in names:
+        if name in _attached:
+            _attached.move_to_end(name)
+            continue
+        try:
+            _attached[name] = shared_memory.SharedMemory( name=name, track=False )  # Python >= 3.13: the parent owns it, and unlinks it
+        except TypeError:
+            _attached[name] = shared_memory.SharedMemory( name=name )  # registers it again, with the parent's resource tracker: no effect
+    while len(_attached) > max( _MAX_ATTACHED, len(names) ):  # names are the most recently used, so they stay
+        _attached.popitem(last=False)[1].close()  # no views left: they live only for one task
+    return [ _attached[name] for name in names ]
+
+# Rebuild an array in the shared memory block shm from its description (see ProcessPool._describe).
+#
+def _view( shm, desc ):
+    name, offset, shape, strides, dtype = desc
+    return np.ndarray( shape, dtype=np.dtype(dtype), buffer=shm.buf, offset=offset, strides=strides )
+
+def _run_chunk( kernel, xdesc, outdesc, start, stop ):
+    xshm, outshm = _attach( (xdesc[0], outdesc[0]) )
+    kernel( _view(xshm, xdesc)[start:stop], out=_view(outshm, outdesc)[start:stop] )
+
+# The base of the arrays from ProcessPool.array(): it keeps the shared memory block mapped as long as
+# one of them is alive. (NumPy keeps a reference to the buffer object, but no buffer export on it,
+# so that SharedMemory.close() would unmap the memory under a live array.)
+#
+# It also frees the block as soon as it can: release() (a weakref.finalize, called when the last
+# array goes, or at interpreter exit) unlinks it and drops it from the pool's blocks.
+#
+class _SharedBuffer:
+    def __init__( self, shm, shape, dtype, order, blocks ):
+        self.shm = shm
+        self.__array_interface__ = np.ndarray( shape, dtype=dtype, buffer=shm.buf, order=order ).__array_interface__
+        self.release = weakref.finalize( self, _release_block, shm, blocks )
+
+# Unlink a shared memory block, and drop it from blocks; it is unmapped when the last reference to it goes.
+#
+# This runs from the garbage collector, too, so it takes no locks: list.remove() is atomic.
+#
+def _release_block( shm, blocks ):
+    try:
+        blocks.remove(shm)
+    except ValueError:  # already dropped by _shutdown_pool()
+        pass
+    try:
+        shm.unlink()
+    except FileNotFoundError:
+        pass
+
+# Stop the workers, and unlink the shared memory blocks: each is unmapped when its last array goes.
+#
+def _shutdown_pool( pool, blocks, scratch ):
+    pool.shutdown( wait=True )
+    for shm in list(blocks):
+        _release_block( shm, blocks )
+    scratch.clear()
+
+# Bytes spanned by array a, as (lowest address, highest address + 1).
+#
+def _byte_bounds( a ):
+    low = high = a.__array_interface__["data"][0]
+    for n, stride in zip(a.shape, a.strides):
+        if n == 0:
+            return low, low
+        if stride < 0:
+            low  += (n - 1) * stride
+        else:
+            high += (n - 1) * stride
+    return low, high + a.itemsize
+
+
+class ProcessPool:
+    """Pool of worker processes that run elementwise kernels on arrays in shared memory.
+
+Use it where threads do not help, e.g. when GIL-bound Python code runs around the kernels in
+each worker. The workers are started at once, import the kernels' modules, and stay up for
+later calls.
+
+Arrays allocated with array() live in shared memory, and the workers use them in place.
+Other arrays are copied into a shared scratch block (and results out of one) for each call:
+one memory copy, but still no pickling of data.
+
+Example::
+
+    with ProcessPool(4) as pool:
+        x = pool.array(10**8)
+        x[:] = ...
+        y = pool.map_chunks( compute.f, x )  # y is in shared memory, too
+
+Parameters:
+    processes : int, optional
+        Number of worker processes. Default default_workers().
+
+    start_method : str, optional
+        multiprocessing start method: "forkserver" (default, where available), "spawn" or "fork".
+        "fork" starts fastest, but copies the state of the parent, including its threads' locks.
+
+    modules : sequence of str
+        Modules the workers import at start-up. Default: the backend modules of mylibrary.
+
+The pool shuts down (waiting for running tasks, and freeing the shared memory) on close(),
+at the end of a with block, when garbage collected, or at interpreter exit.
+
+The workers are those of a concurrent.futures.ProcessPoolExecutor: if one dies (e.g. crashes
+in a kernel), the call fails with BrokenProcessPool rather than waiting for it forever.
+The pool is then unusable; close it, and start a new one.
+"""
+    def __init__( self, processes=None, start_method=None, modules=("mylibrary.compute", "mylibrary.predicates") ):
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+        if processes is None:
+            processes = default_workers()
+        if processes < 1:
+            raise ValueError( "processes must be >= 1, got %d" % (processes) )
+        if start_method is None:
+            start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        from multiprocessing import resource_tracker
+        resource_tracker.ensure_running()  # before the workers start, so that they share it; see _attach()
+
+        # Return only once every worker has imported the modules. The workers start as tasks are submitted,
+        # one per task while none is idle; none is, before all of them have passed the barrier.
+        context = multiprocessing.get_context(start_method)
+        ready   = context.Barrier(processes)
+        pool    = ProcessPoolExecutor( processes, mp_context=context, initializer=_init_worker, initargs=(tuple(modules), ready) )
+        try:
+            for future in [ pool.submit(int) for _ in range(processes) ]:
+                future.result()
+        except BaseException:
+            pool.shutdown( wait=False, cancel_futures=True )
+            raise
+
+        self.processes = processes
+        self._pool     = pool
+        self._blocks   = []  # SharedMemory blocks of the live arrays from array(); see _SharedBuffer
+        self._scratch  = {}  # "in"/"out" -> array in a reusable scratch block
+        self._call     = threading.Lock()  # calls share the scratch blocks, so they take turns
+        self._finalize = weakref.finalize( self, _shutdown_pool, self._pool, self._blocks, self._scratch )
+
+    @property
+    def closed( self ):
+        return not self._finalize.alive
+
+    def close( self ):
+        """Wait for running tasks, stop the workers and free the shared memory. Closing twice does nothing.
+
+Arrays from array() stay valid in this process as long as they are referenced.
+"""
+        self._finalize()
+
+    def __enter__( self ):
+        return self
+
+    def __exit__( self, exc_type, exc_value, traceback ):
+        self.close()
+
+    def _check_open( self ):
+        if self.closed:
+            raise ValueError( "ProcessPool is closed" )
+
+    def array( self, shape, dtype=np.float64, order="C" ):
+        """Return a new, uninitialized array in shared memory, which the workers use without copying.
+
+The shared memory is freed as soon as the array (and every view of it) is no longer referenced.
+Closing the pool frees it, too; the array then stays valid in this process, but only here.
+"""
+        from multiprocessing import shared_memory
+        self._check_open()
+        dtype  = np.dtype(dtype)
+        nbytes = int( np.prod(shape, dtype=np.int64) ) * dtype.itemsize
+        shm = shared_memory.SharedMemory( create=True, size=max(1, nbytes) )
+        self._blocks.append(shm)
+        return np.asarray( _SharedBuffer(shm, shape, dtype, order, self._blocks) )
+
+    # Describe a (view of an) array in one of our shared memory blocks, for _view(); None if it is not in one.
+    #
+    def _describe( self, a ):
+        low, high = _byte_bounds(a)
+        for shm in list(self._blocks):
+            base = np.frombuffer( shm.buf, dtype=np.uint8 ).__array_interface__["data"][0]
+            if base <= low  and  high <= base + shm.size:
+                return ( shm.name, a.__array_interface__["data"][0] - base, a.shape, a.strides, a.dtype.str )
+        return None
+
+    # Return a scratch array of the given shape and dtype in shared memory, reusing the block of the last call.
+    #
+    def _scratch_array( self, key, shape, dtype ):
+        a = self._scratch.get(key)
+        if a is None  or  a.size < int( np.prod(shape) )  or  a.dtype != dtype:
+            if a is not None:
+                a.base.release()  # unlinked now; unmapped right after, as no views of it outlive a call
+            a = self._scratch[key] = self.array( max(1, int(np.prod(shape))), dtype )
+        return a[:int(np.prod(shape))].reshape(shape)
+
+    def map_chunks( self, kernel, x, out=None, chunksize=None ):
+        """Apply an elementwise kernel to x, chunk by chunk, in the worker processes.
+
+Parameters:
+    kernel : callable
+        As in map_chunks(). It is sent to the workers by pickling, so it must be picklable:
+        e.g. compute.f, compute.f_ufunc, a compute.Pipeline, a NumPy ufunc, or a module-level function.
+
+    x, out : np.array
+        As in map_chunks(). Arrays from array() (or views of them) are used in place;
+        others are copied through shared scratch memory.
+
+    chunksize : int, optional
+        Elements per chunk. Default: x split into four chunks per process.
+
+Return value:
+    out; if not given, a new array from array().
+
+Raises:
+    ValueError
+        As map_chunks(); or if the pool is closed.
+
+    concurrent.futures.process.BrokenProcessPool
+        If a worker process died.
+
+    Any exception raised by kernel in a worker. The chunks not started yet are then skipped.
+
+Calls from several threads take turns; each uses all of the processes anyway.
+"""
+        with self._call:
+            return self._map_chunks( kernel, x, out, chunksize )
+
+    # A new output array like x, from array().
+    #
+    def _empty_like( self, x ):
+        return self.array( x.shape, x.dtype, order="F" if x.flags.f_contiguous and not x.flags.c_contiguous else "C" )
+
+    def _map_chunks( self, kernel, x, out, chunksize ):
+        from concurrent.futures import wait, FIRST_EXCEPTION
+        self._check_open()
+        x = np.asarray(x)
+        if chunksize is None:
+            chunksize = max( 1, -(-x.size // (4 * self.processes)) )
+        x, out, chunksize = _check_args( x, out, chunksize, 0, self._empty_like )
+        out_array = np.asarray(out)
+
+        xdesc = self._describe(x)
+        if xdesc is None:
+            xs = self._scratch_array( "in", x.shape, x.dtype )
+            np.copyto(xs, x)
+        else:
+            xs = x
+        odesc = self._describe(out_array)
+        os_   = out_array if odesc is not None else self._scratch_array( "out", out_array.shape, out_array.dtype )
+
+        if x.ndim == 0:
+            xc, outc, bounds = xs.reshape(1), os_.reshape(1), [0, 1]
+        else:
+            xc, outc, bounds = _chunks( xs, os_, chunksize )
+        xdesc, odesc = self._describe(xc), self._describe(outc)
+        futures = [ self._pool.submit( _run_chunk, kernel, xdesc, odesc, start, stop ) for start, stop in zip(bounds[:-1], bounds[1:]) ]
+        wait( futures, return_when=FIRST_EXCEPTION )
+        for future in futures:  # after an error, skip the chunks not started yet
+            future.cancel()
+        wait(futures)  # none still running, before the scratch blocks are reused
+        for future in futures:
+            if not future.cancelled():
+                future.result()  # raises the exception of the chunk, if any
+
+        if os_ is not out_array:
+            np.copyto(out_array, os_)
+        return out
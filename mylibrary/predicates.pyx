@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+#
+# cython: wraparound  = False
+# cython: boundscheck = False
+# cython: cdivision   = True
+"""Example Cython module for predicates over integer arrays.
+
+The array versions take the whole buffer in one call and loop in C with the GIL released,
+instead of one Python-to-C call and one bool object per element.
+"""
+
+from __future__ import division, print_function, absolute_import
+
+import operator
+
+from libc.stdint cimport int8_t, int16_t, int32_t, int64_t, uint8_t, uint16_t, uint32_t, uint64_t
+
+# hot-path counters (off by default); see mylibrary.counters
+from mylibrary.counters cimport Site, SITE_PREDICATES, enabled_flag, clock_ns, record
+
+import numpy as np
+
+
+# Integer types the kernels are specialized for.
+#
+ctypedef fused integer:
+    int8_t
+    int16_t
+    int32_t
+    int64_t
+    uint8_t
+    uint16_t
+    uint32_t
+    uint64_t
+
+
+#########################################################
+# Kernels
+#########################################################
+
+# The callers check that value is representable in the dtype of x, so the comparisons are exact.
+# A uint64 value of 2**63 or more comes as its bit pattern, a negative long long (see _c_value()):
+# <integer>value converts it back, since conversion to an unsigned type is modulo 2**64 in C.
+#
+# Each kernel counts one call of the "predicates" site (see mylibrary.counters), with the elements it read.
+
+cdef const bint* _stats_on = enabled_flag()
+
+def _mask( const integer[:] x, long long value, unsigned char[:] out ):
+    cdef integer v = <integer>value
+    cdef Py_ssize_t j, n = x.shape[0]
+    cdef long long t0 = 0
+    with nogil:
+        if _stats_on[0]:
+            t0 = clock_ns()
+        for j in range(n):
+            out[j] = (x[j] == v)
+        if _stats_on[0]:
+            record(SITE_PREDICATES, n, n*(sizeof(integer) + 1), t0, False)
+
+def _count( const integer[:] x, long long value ):
+    cdef integer v = <integer>value
+    cdef Py_ssize_t j, n = x.shape[0]
+    cdef Py_ssize_t count = 0
+    cdef long long t0 = 0
+    with nogil:
+        if _stats_on[0]:
+            t0 = clock_ns()
+        for j in range(n):
+            count += (x[j] == v)
+        if _stats_on[0]:
+            record(SITE_PREDICATES, n, n*sizeof(integer), t0, False)
+    return count
+
+def _find_first( const integer[:] x, long long value ):
+    cdef integer v = <integer>value
+    cdef Py_ssize_t j, n = x.shape[0]
+    cdef Py_ssize_t found = -1
+    cdef long long t0 = 0
+    with nogil:
+        if _stats_on[0]:
+            t0 = clock_ns()
+        for j in range(n):
+            if x[j] == v:
+                found = j
+                break
+        if _stats_on[0]:
+            j = n if found < 0 else found + 1  # elements actually read
+            record(SITE_PREDICATES, j, j*sizeof(integer), t0, False)
+    return found
+
+def _indices( const integer[:] x, long long value, Py_ssize_t[:] out ):
+    cdef integer v = <integer>value
+    cdef Py_ssize_t j, k = 0, n = x.shape[0]
+    cdef long long t0 = 0
+    with nogil:
+        if _stats_on[0]:
+            t0 = clock_ns()
+        for j in range(n):
+            if x[j] == v:
+                out[k] = j
+                k += 1
+        if _stats_on[0]:
+            record(SITE_PREDICATES, n, n*sizeof(integer) + k*sizeof(Py_ssize_t), t0, False)
+
+# View x as a rank-1 np.ndarray of a supported integer dtype (a copy only if x is non-contiguous N-D).
+#
+# Return (flat x, whether value can occur in x at all). value is a Python int, of any size.
+#
+def _flat( x, value ):
+    x = np.asarray(x)
+    if x.dtype.kind not in "iu"  or  not x.dtype.isnative:
+        raise ValueError( "expected an array of native-endian integers, got dtype '%s'" % (x.dtype) )
+    info = np.iinfo(x.dtype)
+    return (x.reshape(-1) if x.ndim != 1 else x), (info.min <= value <= info.max)
+
+# Check the out argument of g_mask(), before the nogil loop writes to it: any object with the buffer
+# protocol, of bool (or uint8, for 0/1) with the given shape, writable and C-contiguous.
+#
+# Return it as an np.ndarray.
+#
+def _check_out( out, shape ):
+    out = np.asarray(out)
+    if out.dtype != np.bool_  and  out.dtype != np.uint8:
+        raise ValueError( "out has dtype '%s', expected 'bool' or 'uint8'" % (out.dtype) )
+    if out.shape != shape:
+        raise ValueError( "out has shape %s, expected %s" % (out.shape, shape) )
+    if not out.flags.writeable:
+        raise ValueError( "out is read-only" )
+    if not out.flags.c_contiguous:
+        raise ValueError( "out must be C-contiguous" )
+    return out
+
+# value, known to fit in the dtype of the array, as the long long the kernels take.
+#
+cdef long long _c_value( value ):
+    return value - 2**64 if value >= 2**63 else value  # only for uint64
+
+
+#########################################################
+# Public API
+#########################################################
+
+# Silly example: check if input is 42, return True or False.
+#
+def g( x, value=42 ):
+    """Scalar predicate: return whether x == value (by default, 42). Both must be integers.
+
+For many values, use the array versions: g_mask(), g_count(), g_any(), g_nonzero().
+"""
+    return operator.index(x) == operator.index(value)
+
+def g_mask( x, value=42, out=None ):
+    """Array version of g(): boolean mask of where x == value.
+
+Parameters:
+    x : np.array of integers (any signed or unsigned width), any rank
+        Values to test.
+
+    value : int
+        The value to look for. Default 42. A value outside the range of the dtype of ``x``
+        (e.g. 300 for uint8, or -1 for any unsigned type) matches nothing.
+
+    out : np.array of bool, optional
+        Writable, C-contiguous array of the same shape as ``x``, into which to write the result.
+        Any object with the buffer protocol will do; uint8 (0 and 1) is accepted, too.
+
+Return value:
+    np.array of bool, same shape as x
+        True where ``x == value``. If ``out`` was given, this is ``out`` itself.
+"""
+    value = operator.index(value)
+    shape = np.shape(x)
+    xf, possible = _flat(x, value)
+    if out is None:
+        out_orig = out = np.empty( shape, dtype=np.bool_ )
+    else:
+        out_orig, out = out, _check_out( out, shape )
+    if possible:
+        _mask(xf, _c_value(value), out.reshape(-1).view(np.uint8))
+    else:
+        out[...] = False
+    return out_orig
+
+def g_count( x, value=42 ):
+    """Array version of g(): number of elements of x equal to value.
+
+Like ``np.count_nonzero(g_mask(x, value))``, but without the mask.
+"""
+    value = operator.index(value)
+    xf, possible = _flat(x, value)
+    return _count(xf, _c_value(value)) if possible else 0
+
+def g_any( x, value=42 ):
+    """Array version of g(): whether any element of x equals value.
+
+Stops at the first match.
+"""
+    value = operator.index(value)
+    xf, possible = _flat(x, value)
+    return possible  and  _find_first(xf, _c_value(value)) >= 0
+
+def g_nonzero( x, value=42 ):
+    """Array version of g(): indices of the elements of x equal to value.
+
+Like ``np.nonzero(x == value)``: returns a tuple of index arrays, one per dimension of ``x``.
+As with np.nonzero(), a 0-d x is a ValueError.
+"""
+    value = operator.index(value)
+    shape = np.shape(x)
+    if len(shape) == 0:
+        raise ValueError( "g_nonzero() of a 0-d array is not defined, as for np.nonzero(); use np.atleast_1d(x)" )
+    xf, possible = _flat(x, value)
+    idx = np.empty( (_count(xf, _c_value(value)) if possible else 0,), dtype=np.intp )
+    if idx.shape[0] > 0:
+        _indices(xf, _c_value(value), idx)
+    if len(shape) == 1:
+        return (idx,)
+    return np.unravel_index(idx, shape)
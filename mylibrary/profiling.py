@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+#
+"""Run code under a profiler, with the Cython functions of mylibrary included.
+
+Cython functions are visible to profilers only in the profiling build of mylibrary::
+
+    python setup.py build_ext --inplace --force --build-type=profile
+
+In the other builds (the default "optimized" build included), they contain no tracing code
+at all; calls into mylibrary then show up as part of their Python caller.
+
+The profiling build slows the kernels down considerably (line tracing takes the GIL for each
+traced line, also in nogil code), so use it to find *where* the time goes, not to measure *how much*.
+"""
+
+from __future__ import division, print_function, absolute_import
+
+import cProfile
+import pstats
+import warnings
+
+
+def is_profile_build():
+    """Return whether mylibrary was compiled as the profiling build (see the module docstring)."""
+    import mylibrary.compute as compute
+    return bool(compute._profile_build)
+
+def _check_build():
+    if not is_profile_build():
+        warnings.warn( "mylibrary is not a profiling build; its Cython functions will not appear in the profile. "
+                       "Rebuild with: python setup.py build_ext --inplace --force --build-type=profile",
+                       RuntimeWarning, stacklevel=3 )
+
+
+def profile( func, *args, **kwargs ):
+    """Call func(*args, **kwargs) under cProfile.
+
+Parameters:
+    func : callable
+        The code to profile. Any further arguments are passed to it.
+
+Return value:
+    tuple (result, stats)
+        ``result`` is the return value of ``func``, and ``stats`` a ``pstats.Stats`` of the run,
+        e.g. ``stats.sort_stats("cumulative").print_stats(20)``.
+
+Warns with RuntimeWarning if mylibrary is not a profiling build.
+"""
+    _check_build()
+    profiler = cProfile.Profile()
+    result   = profiler.runcall( func, *args, **kwargs )
+    return result, pstats.Stats(profiler)
+
+def line_profile( func, *args, **kwargs ):
+    """Call func(*args, **kwargs) under line_profiler, timing each line of the given functions.
+
+Parameters:
+    func : callable
+        The code to profile. Any further arguments are passed to it, except for:
+
+    functions : sequence of functions, keyword-only, optional
+        The functions whose lines to time. Both Python functions and the ``def`` functions of
+        mylibrary's Cython modules (e.g. ``mylibrary.compute.f``) are accepted. Default ``[func]``.
+
+Return value:
+    tuple (result, profiler)
+        ``result`` is the return value of ``func``, and ``profiler`` the ``line_profiler.LineProfiler``;
+        ``profiler.print_stats()`` prints the line-by-line report.
+
+Raises:
+    ImportError
+        If the line_profiler package is not installed (it is an optional dependency).
+
+Warns with RuntimeWarning if mylibrary is not a profiling build.
+"""
+    functions = kwargs.pop( "functions", None ) or [func]
+    try:
+        from line_profiler import LineProfiler
+    except ImportError:
+        raise ImportError( "line_profile() needs the line_profiler package (pip install line_profiler); "
+                           "profile() only needs the standard library" )
+    _check_build()
+    profiler = LineProfiler( *functions )
+    result   = profiler.runcall( func, *args, **kwargs )
+    return result, profiler
@@ -4,5 +4,37 @@
 
 from __future__ import absolute_import
 
+from cpython.ref cimport PyObject
+
 cdef void hello(str s)
+cdef int hello_buffer(object data) except -1  # any buffer-protocol object, written as-is
+
+# Batched output: messages are collected into a C-level buffer, and written out in large chunks.
+#
+# The buffer is flushed when the next message no longer fits (size policy), and when the oldest
+# pending message has waited for max_delay seconds (time policy; checked at each write).
+#
+# Output goes to the file descriptor fd; if fd < 0, to the write() method of the Python object file,
+# for streams that have no file descriptor (such as io.StringIO).
+#
+# None of these functions are thread-safe; the caller must serialize access to each Buffer.
+#
+cdef struct Buffer:
+    char*       data
+    Py_ssize_t  size       # bytes pending
+    Py_ssize_t  capacity
+    int         fd
+    PyObject*   file       # owned reference, or NULL
+    double      max_delay  # seconds; negative = no time policy
+    double      deadline   # flush when the clock reaches this; only meaningful when size > 0
 
+cdef int buffer_init( Buffer* buf, object file, Py_ssize_t capacity, double max_delay ) except -1
+cdef void buffer_free( Buffer* buf ) noexcept
+cdef int buffer_write( Buffer* buf, const char* data, Py_ssize_t n ) except -1
+cdef int buffer_write_line( Buffer* buf, const char* data, Py_ssize_t n ) except -1  # data, then a newline
+cdef int buffer_flush( Buffer* buf ) except -1
+
+# Write all of data to fd, with the GIL released around the system calls.
+#
+cdef int write_fd( int fd, const char* data, Py_ssize_t n ) except -1
+cdef int write2_fd( int fd, const char* a, Py_ssize_t na, const char* b, Py_ssize_t nb ) except -1  # a, then b
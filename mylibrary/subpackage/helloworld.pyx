@@ -11,8 +11,193 @@
 
 from __future__ import division, print_function, absolute_import
 
+from libc.errno cimport errno, EINTR
+from libc.stdlib cimport malloc, free
+from libc.string cimport memcpy
+from posix.time cimport clock_gettime, timespec, CLOCK_MONOTONIC
+from posix.uio cimport iovec, writev
+
+from cpython.buffer cimport PyObject_GetBuffer, PyBuffer_Release, PyBUF_SIMPLE
+from cpython.exc cimport PyErr_CheckSignals
+from cpython.ref cimport PyObject, Py_XINCREF, Py_XDECREF
+from cpython.bytes cimport PyBytes_FromStringAndSize
+
+import io
+import os
+import sys
+
 # Echo the string s.
 #
 cdef void hello(str s):
     print(s)  # this is really, really silly (providing a Cython-level cdef function that just calls Python print())
 
+# Echo the contents of data, which is any object supporting the buffer protocol (bytes, bytearray, memoryview, ...).
+#
+# The bytes are written as-is (followed by a newline) to the file descriptor of sys.stdout,
+# without decoding, encoding or copying them.
+#
+cdef int hello_buffer(object data) except -1:
+    cdef Py_buffer view
+    cdef const char* newline = b"\n"
+    PyObject_GetBuffer(data, &view, PyBUF_SIMPLE)
+    try:
+        stdout = sys.stdout
+        stdout.flush()  # keep the order of output written via print()
+        try:
+            fd = stdout.fileno()
+        except Exception:  # e.g. io.StringIO; nothing to write straight through to
+            _send_file( stdout, <const char*>view.buf, view.len )
+            _send_file( stdout, newline, 1 )
+        else:
+            write2_fd( fd, <const char*>view.buf, view.len, newline, 1 )
+    finally:
+        PyBuffer_Release(&view)
+    return 0
+
+
+#########################################################
+# Batched output
+#########################################################
+
+cdef inline double _now() noexcept nogil:
+    cdef timespec t
+    clock_gettime(CLOCK_MONOTONIC, &t)
+    return t.tv_sec + 1e-9 * t.tv_nsec
+
+# Write all of the segments iov[0], ..., iov[count-1] to fd, in order.
+#
+# Partial writes advance iov in place.
+#
+cdef int _writev_all( int fd, iovec* iov, int count ) except -1:
+    cdef Py_ssize_t k
+    cdef int err = 0
+    while count > 0:
+        if iov[0].iov_len == 0:
+            iov += 1
+            count -= 1
+            continue
+        with nogil:
+            k = writev(fd, iov, count)
+            if k < 0:
+                err = errno
+        if k < 0:
+            if err == EINTR:  # PEP 475: run signal handlers, then retry
+                PyErr_CheckSignals()
+                continue
+            raise OSError( err, os.strerror(err) )
+        while count > 0  and  <size_t>k >= iov[0].iov_len:
+            k -= iov[0].iov_len
+            iov += 1
+            count -= 1
+        if count > 0:
+            iov[0].iov_base = <char*>iov[0].iov_base + k
+            iov[0].iov_len -= k
+    return 0
+
+cdef int write_fd( int fd, const char* data, Py_ssize_t n ) except -1:
+    cdef iovec iov
+    iov.iov_base = <void*>data
+    iov.iov_len  = <size_t>n
+    return _writev_all(fd, &iov, 1)
+
+cdef int write2_fd( int fd, const char* a, Py_ssize_t na, const char* b, Py_ssize_t nb ) except -1:
+    cdef iovec[2] iov
+    iov[0].iov_base = <void*>a
+    iov[0].iov_len  = <size_t>na
+    iov[1].iov_base = <void*>b
+    iov[1].iov_len  = <size_t>nb
+    return _writev_all(fd, iov, 2)
+
+# Send n bytes to a Python file object.
+#
+cdef int _send_file( object file, const char* data, Py_ssize_t n ) except -1:
+    chunk = PyBytes_FromStringAndSize(data, n)
+    if isinstance(file, io.TextIOBase):
+        file.write( chunk.decode("utf-8", "surrogateescape") )
+    else:
+        file.write(chunk)
+    return 0
+
+# Send n bytes to wherever buf writes to, bypassing the buffer.
+#
+cdef int _send( Buffer* buf, const char* data, Py_ssize_t n ) except -1:
+    if n == 0:
+        return 0
+    if buf.fd >= 0:
+        return write_fd(buf.fd, data, n)
+    return _send_file(<object>buf.file, data, n)
+
+# file is either an int (file descriptor) or an object with a write() method.
+#
+cdef int buffer_init( Buffer* buf, object file, Py_ssize_t capacity, double max_delay ) except -1:
+    if capacity <= 0:
+        raise ValueError( "capacity must be > 0, got %d" % (capacity) )
+    buf.data = <char*>malloc(<size_t>capacity)
+    if buf.data == NULL:
+        raise MemoryError()
+    buf.size      = 0
+    buf.capacity  = capacity
+    buf.max_delay = max_delay
+    buf.deadline  = 0.0
+    if isinstance(file, int):
+        buf.fd   = file
+        buf.file = NULL
+    else:
+        buf.fd   = -1
+        buf.file = <PyObject*>file
+        Py_XINCREF(buf.file)
+    return 0
+
+# Release the memory; pending data is discarded (flush first if it matters).
+#
+cdef void buffer_free( Buffer* buf ) noexcept:
+    free(buf.data)
+    buf.data     = NULL
+    buf.size     = 0
+    buf.capacity = 0
+    Py_XDECREF(buf.file)
+    buf.file     = NULL
+
+cdef int buffer_flush( Buffer* buf ) except -1:
+    cdef Py_ssize_t n = buf.size
+    buf.size = 0  # drop the data even if the write fails, so that a broken pipe does not fail every later write too
+    return _send(buf, buf.data, n)
+
+cdef int buffer_write( Buffer* buf, const char* data, Py_ssize_t n ) except -1:
+    return _buffer_write(buf, data, n, False)
+
+cdef int buffer_write_line( Buffer* buf, const char* data, Py_ssize_t n ) except -1:
+    return _buffer_write(buf, data, n, True)
+
+cdef int _buffer_write( Buffer* buf, const char* data, Py_ssize_t n, bint newline ) except -1:
+    cdef Py_ssize_t total = n + newline
+    cdef iovec[3] iov
+    if buf.size + total > buf.capacity:  # size policy
+        if total > buf.capacity:  # would not fit even into an empty buffer, so don't copy it at all
+            if buf.fd >= 0:  # pending data, then the message, in one system call
+                iov[0].iov_base = buf.data
+                iov[0].iov_len  = <size_t>buf.size
+                iov[1].iov_base = <void*>data
+                iov[1].iov_len  = <size_t>n
+                iov[2].iov_base = <void*><const char*>b"\n"
+                iov[2].iov_len  = <size_t>newline
+                buf.size = 0
+                return _writev_all(buf.fd, iov, 3)
+            buffer_flush(buf)
+            _send(buf, data, n)
+            return _send(buf, b"\n", newline)
+        buffer_flush(buf)
+
+    cdef double t = 0.0
+    if buf.max_delay >= 0.0:
+        t = _now()
+        if buf.size == 0:
+            buf.deadline = t + buf.max_delay
+    memcpy(buf.data + buf.size, data, <size_t>n)
+    buf.size += n
+    if newline:
+        buf.data[buf.size] = b'\n'
+        buf.size += 1
+    if buf.max_delay >= 0.0  and  t >= buf.deadline:  # time policy
+        buffer_flush(buf)
+    return 0
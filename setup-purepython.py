@@ -186,7 +186,7 @@ setup(
     #
     # This **does not** automatically recurse into subpackages, so they must also be declared.
     #
-    packages = ["mylibrary"],
+    packages = ["mylibrary", "mylibrary.fallback"],
 
     zip_safe = True,  # no Cython extensions
 
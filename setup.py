@@ -43,8 +43,20 @@ libname="mylibrary"
 
 # Choose build type.
 #
+# This can also be chosen at build time, by the environment variable MYLIBRARY_BUILD_TYPE,
+# or by the option --build-type=... on the command line, e.g.
+#     python setup.py build_ext --inplace --build-type=pgo
+#
+# "pgo" is "optimized" with profile-guided and link-time optimization; see class build_ext_pgo below.
+#
+# "profile" is "optimized" with Cython's profiling and line tracing enabled, so that the Cython
+# functions show up in cProfile and line_profiler; see mylibrary.profiling. This slows the code down,
+# so it is for diagnosis only; the other build types contain no profiling code.
+#
 build_type="optimized"
 #build_type="debug"
+#build_type="pgo"
+#build_type="profile"
 
 # Short description for package list on PyPI
 #
@@ -68,7 +80,7 @@ Supports Python 2.7 and 3.4.
 datadirs  = ("test",)
 
 # File extensions to be considered as data files. (Literal, no wildcards.)
-dataexts  = (".py",  ".pyx", ".pxd",  ".c", ".cpp", ".h",  ".sh",  ".lyx", ".tex", ".txt", ".pdf")
+dataexts  = (".py",  ".pyx", ".pxd", ".pxi", ".c", ".cpp", ".h",  ".sh",  ".lyx", ".tex", ".txt", ".pdf")
 
 # Standard documentation to detect (and package if it exists).
 #
@@ -86,16 +98,24 @@ import sys
 if sys.version_info < (2,7):
     sys.exit('Sorry, Python < 2.7 is not supported')
 
+import math
 import os
+import platform
 
 from setuptools import setup
 from setuptools.extension import Extension
+from setuptools.command.build_ext import build_ext
 
 try:
     from Cython.Build import cythonize
 except ImportError:
     sys.exit("Cython not found. Cython is needed to build the extension modules.")
 
+try:
+    import numpy as np
+except ImportError:
+    sys.exit("NumPy not found. NumPy's C headers are needed to build the extension modules.")
+
 
 #########################################################
 # Definitions
@@ -112,8 +132,15 @@ except ImportError:
 
 # Modules involving numerical computations
 #
-extra_compile_args_math_optimized    = ['-march=native', '-O2', '-msse', '-msse2', '-mfma', '-mfpmath=sse']
-extra_compile_args_math_debug        = ['-march=native', '-O0', '-g']
+# These flags must not assume anything beyond the baseline of the target architecture
+# (e.g. no -march=native), so that the result runs on any CPU it may be installed on.
+# Instruction set extensions are used via the kernel variants below.
+#
+# -fno-math-errno lets the compiler use the hardware square root instruction (and vectorize it);
+# the C library's sqrt() would otherwise be called for each negative input, just to set errno.
+#
+extra_compile_args_math_optimized    = ['-O2', '-fno-math-errno']
+extra_compile_args_math_debug        = ['-O0', '-g']
 extra_link_args_math_optimized       = []
 extra_link_args_math_debug           = []
 
@@ -124,11 +151,52 @@ extra_compile_args_nonmath_debug     = ['-O0', '-g']
 extra_link_args_nonmath_optimized    = []
 extra_link_args_nonmath_debug        = []
 
+# Instruction set variants of the kernels of mylibrary.compute (mylibrary/_kernels.pxi), with their additional flags.
+#
+# Each variant becomes its own extension module, mylibrary._kernels_<variant>; at import time,
+# mylibrary.compute uses the best one that the CPU supports. Only the baseline is built on
+# architectures other than x86.
+#
+# -ftree-vectorize is needed at -O2 (it is on by default only at -O3).
+#
+is_x86 = platform.machine().lower() in ('x86_64', 'amd64', 'i386', 'i686', 'x86')
+if is_x86:
+    isa_variants = { 'baseline': ['-ftree-vectorize', '-msse2', '-mfpmath=sse'],
+                     'avx2':     ['-ftree-vectorize', '-mavx2', '-mfma'],
+                     'avx512':   ['-ftree-vectorize', '-mavx512f', '-mavx512dq', '-mavx512vl', '-mavx2', '-mfma', '-mprefer-vector-width=512'] }
+else:
+    isa_variants = { 'baseline': ['-ftree-vectorize'] }
+
 # Additional flags to compile/link with OpenMP
 #
 openmp_compile_args = ['-fopenmp']
 openmp_link_args    = ['-fopenmp']
 
+# Additional flags for the build type "pgo" (GCC)
+#
+# "{}" is replaced by the directory for the profile data. The instrumented build updates its counters
+# atomically, since the kernels run in OpenMP threads.
+#
+# With LTO, code generation happens at link time, so each module is also linked with all of its compile flags
+# (otherwise e.g. the instruction set flags of the kernel variants would be lost).
+#
+pgo_generate_compile_args = ['-fprofile-generate={}', '-fprofile-update=atomic']
+pgo_generate_link_args    = ['-fprofile-generate={}']
+pgo_use_compile_args      = ['-fprofile-use={}', '-fprofile-correction', '-Wno-missing-profile', '-flto=auto']
+pgo_use_link_args         = ['-fprofile-use={}', '-fprofile-correction', '-Wno-missing-profile', '-flto=auto']
+
+# Training workload for the build type "pgo": a script run with the instrumented build to collect the profile,
+# and then to time the plain optimized and the PGO build. It must accept the options --repeat N and --json.
+#
+pgo_workload = os.path.join("test", "pgo_workload.py")
+
+# Additional include paths and macros for modules that "cimport numpy"
+#
+# The macro disables NumPy's deprecated pre-1.7 C API (and the warning about it).
+#
+numpy_include_dirs  = [np.get_include()]
+numpy_define_macros = [('NPY_NO_DEPRECATED_API', 'NPY_1_7_API_VERSION')]
+
 
 #########################################################
 # Helpers
@@ -143,15 +211,24 @@ openmp_link_args    = ['-fopenmp']
 my_include_dirs = ["."]
 
 
+# Build type override from the environment or the command line (see build_type above).
+#
+build_type = os.environ.get("MYLIBRARY_BUILD_TYPE", build_type)
+for arg in list(sys.argv):
+    if arg.startswith("--build-type="):
+        build_type = arg.split("=", 1)[1]
+        sys.argv.remove(arg)  # not an option setuptools knows about
+
+
 # Choose the base set of compiler and linker flags.
 #
-if build_type == 'optimized':
+if build_type in ('optimized', 'pgo', 'profile'):
     my_extra_compile_args_math    = extra_compile_args_math_optimized
     my_extra_compile_args_nonmath = extra_compile_args_nonmath_optimized
     my_extra_link_args_math       = extra_link_args_math_optimized
     my_extra_link_args_nonmath    = extra_link_args_nonmath_optimized
     my_debug = False
-    print( "build configuration selected: optimized" )
+    print( "build configuration selected: %s" % (build_type) )
 elif build_type == 'debug':
     my_extra_compile_args_math    = extra_compile_args_math_debug
     my_extra_compile_args_nonmath = extra_compile_args_nonmath_debug
@@ -160,10 +237,24 @@ elif build_type == 'debug':
     my_debug = True
     print( "build configuration selected: debug" )
 else:
-    raise ValueError("Unknown build configuration '%s'; valid: 'optimized', 'debug'" % (build_type))
+    raise ValueError("Unknown build configuration '%s'; valid: 'optimized', 'debug', 'pgo', 'profile'" % (build_type))
 
+# Cython directives and C macros for the profiling build.
+#
+# The directives make Cython generate the tracing calls; the macros compile them in.
+# CYTHON_TRACE_NOGIL also traces the nogil sections (the kernels), taking the GIL for each trace event.
+#
+# MYLIBRARY_PROFILE_BUILD is our own; it lets the modules report how they were built (see mylibrary.profiling).
+#
+if build_type == 'profile':
+    my_compiler_directives = { 'profile': True, 'linetrace': True, 'binding': True }
+    my_define_macros       = [ ('CYTHON_TRACE', '1'), ('CYTHON_TRACE_NOGIL', '1'), ('MYLIBRARY_PROFILE_BUILD', '1') ]
+else:
+    my_compiler_directives = {}
+    my_define_macros       = []
 
-def declare_cython_extension(extName, use_math=False, use_openmp=False, include_dirs=None):
+
+def declare_cython_extension(extName, use_math=False, use_openmp=False, use_numpy=False, include_dirs=None, isa=None):
     """Declare a Cython extension module for setuptools.
 
 Parameters:
@@ -177,6 +268,16 @@ Parameters:
     use_openmp : bool
         If True, compile and link with OpenMP.
 
+    use_numpy : bool
+        If True, add NumPy's C headers to the include path (for ``cimport numpy``).
+
+    include_dirs : list of str, optional
+        Include paths for the C compiler.
+
+    isa : str, optional
+        Name of an instruction set variant in ``isa_variants``, whose flags to add.
+        Only meaningful for the optimized builds.
+
 Return value:
     Extension object
         that can be passed to ``setuptools.setup``.
@@ -192,10 +293,20 @@ Return value:
         link_args    = list(my_extra_link_args_nonmath)
         libraries    = None  # value if no libraries, see setuptools.extension._Extension
 
+    # Instruction set variant
+    if isa is not None  and  build_type in ('optimized', 'pgo', 'profile'):
+        compile_args = compile_args + isa_variants[isa]
+
     # OpenMP
     if use_openmp:
-        compile_args.insert( 0, openmp_compile_args )
-        link_args.insert( 0, openmp_link_args )
+        compile_args = openmp_compile_args + compile_args  # splice in the flags, not the list itself
+        link_args    = openmp_link_args    + link_args
+
+    # NumPy C API
+    define_macros = list(my_define_macros) or None
+    if use_numpy:
+        include_dirs  = list(include_dirs or []) + numpy_include_dirs
+        define_macros = list(define_macros or []) + numpy_define_macros
 
     # See
     #    http://docs.cython.org/src/tutorial/external.html
@@ -207,10 +318,111 @@ Return value:
                       extra_compile_args=compile_args,
                       extra_link_args=link_args,
                       include_dirs=include_dirs,
+                      define_macros=define_macros,
                       libraries=libraries
                     )
 
 
+class build_ext_pgo(build_ext):
+    """build_ext that, for the build type "pgo", adds profile-guided and link-time optimization.
+
+For other build types, this is the plain build_ext.
+
+The build runs in three phases, each a complete build of all extension modules:
+
+    1. The plain optimized build. Run the workload, for timing.
+    2. An instrumented build. Run the workload, which writes the profile.
+    3. The optimized build using the profile, with LTO. Run the workload, for timing.
+
+Finally, print a report comparing the timings of phases 1 and 3, and save it as JSON
+in the build directory.
+
+All phases use the same build_temp, since GCC finds the profile of each object file by its path.
+To run the workload, each phase also installs the modules into the source tree (as --inplace does);
+without --inplace, those copies are removed at the end. The result of the last phase is what gets installed.
+
+The sources do not change between build types, so to go back to another build type, build with --force.
+
+After a successful build of any type, this records the Cython directives the C files were
+generated with (see cython_stamp below).
+"""
+    def run(self):
+        if build_type == 'pgo':
+            self.run_pgo()
+        else:
+            build_ext.run(self)
+        write_cython_stamp()
+
+    def run_pgo(self):
+        import json
+        import shutil
+        import subprocess
+
+        if self.compiler not in (None, 'unix'):
+            raise ValueError( "build type 'pgo' requires GCC; got compiler '%s'" % (self.compiler) )
+
+        source_root = os.path.dirname(os.path.abspath(__file__))
+        profile_dir = os.path.abspath( os.path.join(self.build_temp, "pgo-profile") )
+        inplace     = self.inplace
+        compiler    = self.compiler  # build_ext.run() replaces this with the compiler object
+        base_args   = [ (list(ext.extra_compile_args), list(ext.extra_link_args)) for ext in self.extensions ]
+        inplace_files = [ os.path.join(source_root, self.get_ext_filename(ext.name)) for ext in self.extensions ]
+        preexisting   = [ f for f in inplace_files if os.path.exists(f) ]
+
+        def build_phase(compile_args, link_args, lto=False):
+            for ext, (c, l) in zip(self.extensions, base_args):
+                ext.extra_compile_args = c + [ a.format(profile_dir) for a in compile_args ]
+                ext.extra_link_args    = ( l + [ a.format(profile_dir) for a in link_args ]
+                                           + (ext.extra_compile_args if lto else []) )
+            self.force    = True   # the sources have not changed, but the flags have
+            self.inplace  = True
+            self.compiler = compiler
+            build_ext.run(self)
+
+        def run_workload(repeat):
+            env = dict(os.environ)
+            env["PYTHONPATH"] = os.pathsep.join( [source_root] + ([env["PYTHONPATH"]] if env.get("PYTHONPATH") else []) )
+            output = subprocess.check_output( [sys.executable, os.path.join(source_root, pgo_workload), "--repeat", str(repeat), "--json"],
+                                              env=env, cwd=os.path.dirname(os.path.join(source_root, pgo_workload)) )
+            return json.loads( output.decode("utf-8").strip().splitlines()[-1] )
+
+        try:
+            print( "pgo: phase 1/3: plain optimized build" )
+            build_phase([], [])
+            baseline = run_workload(repeat=5)
+
+            print( "pgo: phase 2/3: instrumented build, training run" )
+            if os.path.isdir(profile_dir):
+                shutil.rmtree(profile_dir)  # stale profiles would not match the object files
+            build_phase(pgo_generate_compile_args, pgo_generate_link_args)
+            run_workload(repeat=1)
+
+            print( "pgo: phase 3/3: build with profile and LTO" )
+            build_phase(pgo_use_compile_args, pgo_use_link_args, lto=True)
+            optimized = run_workload(repeat=5)
+        finally:
+            self.inplace = inplace
+            if not inplace:
+                for f in inplace_files:
+                    if f not in preexisting  and  os.path.exists(f):
+                        os.remove(f)
+
+        # Report
+        print( "pgo: workload timings (best of 5), plain optimized build vs. PGO+LTO build:" )
+        print( "    %-24s %12s %12s %8s" % ("item", "optimized", "pgo+lto", "speedup") )
+        log_speedup = 0.0
+        for name in baseline:
+            speedup = baseline[name] / optimized[name]
+            log_speedup += math.log(speedup)
+            print( "    %-24s %9.3f ms %9.3f ms %7.2fx" % (name, 1e3 * baseline[name], 1e3 * optimized[name], speedup) )
+        geomean = math.exp( log_speedup / len(baseline) )
+        print( "    %-24s %12s %12s %7.2fx" % ("geometric mean", "", "", geomean) )
+        report_path = os.path.join(self.build_temp, "pgo-report.json")
+        with open(report_path, "w") as f:
+            json.dump( {"optimized": baseline, "pgo+lto": optimized, "geometric_mean_speedup": geomean}, f, indent=2 )
+        print( "pgo: report saved as '%s'" % (report_path) )
+
+
 # Gather user-defined data files
 #
 # http://stackoverflow.com/questions/13628979/setuptools-how-to-make-package-contain-extra-data-folder-and-all-folders-inside
@@ -259,15 +471,23 @@ except MyFileNotFoundError:
 
 # declare Cython extension modules here
 #
-ext_module_dostuff    = declare_cython_extension( "mylibrary.dostuff",               use_math=False, use_openmp=False , include_dirs=my_include_dirs )
-ext_module_compute    = declare_cython_extension( "mylibrary.compute",               use_math=True,  use_openmp=False , include_dirs=my_include_dirs )
-ext_module_helloworld = declare_cython_extension( "mylibrary.subpackage.helloworld", use_math=False, use_openmp=False , include_dirs=my_include_dirs )
+ext_module_dostuff    = declare_cython_extension( "mylibrary.dostuff",               use_math=False, use_openmp=False, use_numpy=False, include_dirs=my_include_dirs )
+ext_module_compute    = declare_cython_extension( "mylibrary.compute",               use_math=True,  use_openmp=False, use_numpy=True,  include_dirs=my_include_dirs )
+ext_module_predicates = declare_cython_extension( "mylibrary.predicates",            use_math=False, use_openmp=False, use_numpy=False, include_dirs=my_include_dirs )
+ext_module_helloworld = declare_cython_extension( "mylibrary.subpackage.helloworld", use_math=False, use_openmp=False, use_numpy=False, include_dirs=my_include_dirs )
+ext_module_counters   = declare_cython_extension( "mylibrary.counters",              use_math=False, use_openmp=False, use_numpy=False, include_dirs=my_include_dirs )
 
 # this is mainly to allow a manual logical ordering of the declared modules
 #
+# the kernels of mylibrary.compute, one module per instruction set variant
+ext_modules_kernels   = [ declare_cython_extension( "mylibrary._kernels_%s" % (isa), use_math=True, use_openmp=True, use_numpy=False, include_dirs=my_include_dirs, isa=isa )
+                          for isa in sorted(isa_variants) ]
+
 cython_ext_modules = [ext_module_dostuff,
                       ext_module_compute,
-                      ext_module_helloworld]
+                      ext_module_predicates,
+                      ext_module_helloworld,
+                      ext_module_counters] + ext_modules_kernels
 
 # Call cythonize() explicitly, as recommended in the Cython documentation. See
 #     http://cython.readthedocs.io/en/latest/src/reference/compilation.html#compiling-with-distutils
@@ -277,7 +497,28 @@ cython_ext_modules = [ext_module_dostuff,
 # Note that my_ext_modules is just a list of Extension objects. We could add any C sources (not coming from Cython modules) here if needed.
 # cythonize() just performs the Cython-level processing, and returns a list of Extension objects.
 #
-my_ext_modules = cythonize( cython_ext_modules, include_path=my_include_dirs, gdb_debug=my_debug )
+# The generated C code depends on the compiler directives, but cythonize() only compares timestamps.
+# Hence we remember which directives the C files were generated with, and regenerate them all when it
+# changes, so that e.g. an optimized build after a profiling build does not keep the tracing code.
+#
+# The stamp is written by build_ext_pgo.run(), only after a successful build; any other command
+# (--help, sdist, clean, ...) leaves it alone, so the next build still sees the change.
+#
+cython_stamp      = os.path.join( os.path.dirname(os.path.abspath(__file__)), "build", "cython-directives" )
+cython_directives = repr(sorted(my_compiler_directives.items()))
+cython_directives_changed = True
+if os.path.exists(cython_stamp):
+    with open(cython_stamp) as f:
+        cython_directives_changed = ( f.read().strip() != cython_directives )
+
+def write_cython_stamp():
+    if not os.path.isdir( os.path.dirname(cython_stamp) ):
+        os.makedirs( os.path.dirname(cython_stamp) )
+    with open(cython_stamp, "w") as f:
+        f.write(cython_directives)
+
+my_ext_modules = cythonize( cython_ext_modules, include_path=my_include_dirs, gdb_debug=my_debug,
+                            compiler_directives=my_compiler_directives, force=cython_directives_changed )
 
 
 #########################################################
@@ -342,18 +583,22 @@ setup(
     #
     ext_modules = my_ext_modules,
 
+    # build_ext that knows the build type "pgo"
+    #
+    cmdclass = {'build_ext': build_ext_pgo},
+
     # Declare packages so that  python -m setup build  will copy .py files (especially __init__.py).
     #
     # This **does not** automatically recurse into subpackages, so they must also be declared.
     #
-    packages = ["mylibrary", "mylibrary.subpackage"],
+    packages = ["mylibrary", "mylibrary.subpackage", "mylibrary.fallback"],
 
     # Install also Cython headers so that other Cython modules can cimport ours
     #
     # Fileglobs relative to each package, **does not** automatically recurse into subpackages.
     #    
     # FIXME: force sdist, but sdist only, to keep the .pyx files (this puts them also in the bdist)
-    package_data={'mylibrary': ['*.pxd', '*.pyx'],
+    package_data={'mylibrary': ['*.pxd', '*.pxi', '*.pyx'],
                   'mylibrary.subpackage': ['*.pxd', '*.pyx']},
 
     # Disable zip_safe, because:
@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+"""Benchmark compute.f against np.sqrt: throughput in GB/s across sizes, dtypes, layouts and thread counts.
+
+The sizes run from L1-resident (4 kB of input) to RAM-bound (by default 256 MB of input).
+Throughput counts the bytes read plus the bytes written, so it is directly comparable
+to the memory bandwidth of the machine.
+
+Usage:
+    python benchmark.py [--max-bytes N] [--threads 1,0] [--kernels all] [--json FILE] [--compare FILE]
+
+Both mylibrary and NumPy write into a preallocated output array, so the timings do not include
+memory allocation. Each case reports the best of several runs.
+
+With --json, the results (and a description of the machine and the build) are also written
+to FILE as JSON ("-" for stdout). With --compare, the results are compared case by case
+to an earlier JSON file; the exit status is 1 if any case got slower by more than --tolerance.
+
+To benchmark the NumPy backend (mylibrary.fallback) instead of the compiled one, run with
+MYLIBRARY_BACKEND=numpy; its results appear under the kernel variant "numpy".
+"""
+
+from __future__ import division, print_function, absolute_import
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+import numpy as np
+
+try:
+    import mylibrary
+    import mylibrary.compute as compute
+except ImportError:
+    print( "ERROR: mylibrary not found; is it built (in this Python)?", file=sys.stderr )
+    raise
+
+
+dtypes  = (np.float32, np.float64)
+layouts = ("contiguous", "strided")  # strided: every other element of an array twice the size
+
+# Time fn() and return the best time per call, in seconds.
+#
+# The number of calls per timing is chosen so that each timing takes at least min_time.
+#
+def best_time( fn, repeat=5, min_time=0.02 ):
+    fn()  # warm up: page faults, thread team start-up
+    number = 1
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(number):
+            fn()
+        t = time.perf_counter() - t0
+        if t >= min_time  or  number >= 1 << 20:
+            break
+        number *= 2 if t <= 0 else max(2, int(1.5 * min_time / t))
+    best = t / number
+    for _ in range(repeat - 1):
+        t0 = time.perf_counter()
+        for _ in range(number):
+            fn()
+        best = min( best, (time.perf_counter() - t0) / number )
+    return best
+
+# Input sizes in bytes: powers of 8 from 4 kB up to max_bytes, and max_bytes itself.
+#
+def sizes_up_to( max_bytes ):
+    result = []
+    nbytes = 4096
+    while nbytes < max_bytes:
+        result.append(nbytes)
+        nbytes *= 8
+    result.append(max_bytes)
+    return result
+
+# Make the input and output arrays of one case: n elements of dtype, in the given layout.
+#
+def make_arrays( n, dtype, layout, rng ):
+    if layout == "contiguous":
+        x   = rng.rand(n).astype(dtype)
+        out = np.empty_like(x)
+    else:
+        x   = rng.rand(2 * n).astype(dtype)[::2]
+        out = np.empty( (2 * n,), dtype=dtype )[::2]
+    return x, out
+
+# Run the benchmark. Return a list of result records (dicts).
+#
+def run( max_bytes=256 * 2**20, threads=(1, 0), kernels=None, repeat=5, verbose=True ):
+    rng = np.random.RandomState(42)
+    if kernels is None:
+        kernels = [ compute.kernel_variant() ]
+    active = compute.kernel_variant()
+
+    results = []
+    try:
+        for nbytes in sizes_up_to(max_bytes):
+            for dtype in dtypes:
+                itemsize = np.dtype(dtype).itemsize
+                n = max(1, nbytes // itemsize)
+                for layout in layouts:
+                    x, out = make_arrays(n, dtype, layout, rng)
+                    moved  = 2 * n * itemsize  # read x, write out
+
+                    t_np = best_time( lambda: np.sqrt(x, out=out), repeat )
+                    for kernel in kernels:
+                        compute.set_kernel_variant(kernel)
+                        for num_threads in threads:
+                            t = best_time( lambda: compute.f(x, out=out, num_threads=num_threads), repeat )
+                            record = { "bytes": n * itemsize,
+                                       "elements": n,
+                                       "dtype": np.dtype(dtype).name,
+                                       "layout": layout,
+                                       "kernel": kernel,
+                                       "num_threads": num_threads,
+                                       "seconds": t,
+                                       "gbps": moved / t * 1e-9,
+                                       "numpy_seconds": t_np,
+                                       "numpy_gbps": moved / t_np * 1e-9,
+                                       "speedup": t_np / t }
+                            results.append(record)
+                            if verbose:
+                                print( format_record(record) )
+                                sys.stdout.flush()
+                    del x, out
+    finally:
+        compute.set_kernel_variant(active)
+    return results
+
+def case_key( record ):
+    return (record["bytes"], record["dtype"], record["layout"], record["kernel"], record["num_threads"])
+
+def format_size( nbytes ):
+    for unit in ("B", "kB", "MB", "GB"):
+        if nbytes < 1024  or  unit == "GB":
+            return "%d %s" % (nbytes, unit) if nbytes == int(nbytes) else "%.1f %s" % (nbytes, unit)
+        nbytes /= 1024
+
+def format_record( r ):
+    return "%8s  %-7s  %-10s  %-8s  threads=%-2d  %7.2f GB/s   numpy %7.2f GB/s   x%.2f" % (
+           format_size(r["bytes"]), r["dtype"], r["layout"], r["kernel"], r["num_threads"], r["gbps"], r["numpy_gbps"], r["speedup"] )
+
+# Describe the machine and the build, for the JSON output.
+#
+def environment():
+    return { "mylibrary": mylibrary.__version__,
+             "numpy": np.__version__,
+             "python": platform.python_version(),
+             "platform": platform.platform(),
+             "machine": platform.machine(),
+             "cpu_count": os.cpu_count(),
+             "backend": mylibrary.backend(),
+             "kernel_variants": list(compute.available_kernel_variants()),
+             "omp_num_threads": os.environ.get("OMP_NUM_THREADS"),
+             "time": time.strftime("%Y-%m-%dT%H:%M:%S%z") }
+
+# Compare results against an earlier run. Print the cases present in both; return the number of regressions.
+#
+def compare( results, baseline, tolerance ):
+    old = { case_key(r): r for r in baseline["results"] }
+    regressions = 0
+    for r in results:
+        b = old.get(case_key(r))
+        if b is None:
+            continue
+        ratio = r["gbps"] / b["gbps"]
+        slower = ratio < 1.0 - tolerance
+        regressions += slower
+        print( "%8s  %-7s  %-10s  %-8s  threads=%-2d  %7.2f -> %7.2f GB/s  x%.2f%s" % (
+               format_size(r["bytes"]), r["dtype"], r["layout"], r["kernel"], r["num_threads"],
+               b["gbps"], r["gbps"], ratio, "  REGRESSION" if slower else "" ) )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser( description=__doc__.splitlines()[0] )
+    parser.add_argument( "--max-bytes", type=int, default=256 * 2**20, help="largest input size in bytes (default 256 MB)" )
+    parser.add_argument( "--threads", default="1,0", help="comma-separated num_threads values for compute.f (default 1,0; 0 = OpenMP default)" )
+    parser.add_argument( "--kernels", default=None, help="comma-separated kernel variants, or 'all' (default: the active one)" )
+    parser.add_argument( "--repeat", type=int, default=5, help="timings per case; the best is reported (default 5)" )
+    parser.add_argument( "--json", metavar="FILE", help="write the results as JSON to FILE ('-' for stdout)" )
+    parser.add_argument( "--compare", metavar="FILE", help="compare against the results of an earlier --json run" )
+    parser.add_argument( "--tolerance", type=float, default=0.10, help="relative slowdown that counts as a regression (default 0.10)" )
+    args = parser.parse_args()
+
+    if args.kernels == "all":
+        kernels = list(compute.available_kernel_variants())
+    elif args.kernels:
+        kernels = args.kernels.split(",")
+    else:
+        kernels = None
+    threads = [ int(t) for t in args.threads.split(",") ]
+
+    results = run( args.max_bytes, threads, kernels, args.repeat, verbose=(args.json != "-") )
+
+    if args.json:
+        data = { "environment": environment(), "results": results }
+        if args.json == "-":
+            print( json.dumps(data, indent=1) )
+        else:
+            with open(args.json, "w") as f:
+                json.dump(data, f, indent=1)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        print()
+        if compare(results, baseline, args.tolerance):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
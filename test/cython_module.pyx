@@ -7,8 +7,27 @@
 
 from __future__ import division, print_function, absolute_import
 
+# C-level API of mylibrary.compute; see mylibrary/compute.pxd
+cimport mylibrary.compute as compute
+
+from cython.parallel cimport prange
+
+import numpy as np
+
 # Silly example: check if input is 42, return True or False.
 #
+# For arrays, see the nogil batch versions in mylibrary.predicates.
+#
 def g(int x):
     return (x == 42)
 
+
+# Example of using the C-level API of an installed library from another Cython module:
+# sums of square roots along the rows of x, one row per thread, with no Python calls in the loop.
+#
+def rowsums_f(const double[:, ::1] x):
+    cdef Py_ssize_t i, m = x.shape[0], n = x.shape[1]
+    cdef double[::1] out = np.empty( (m,), dtype=np.float64 )
+    for i in prange(m, nogil=True):
+        out[i] = compute.sum_f_double(&x[i, 0], 1, n)
+    return np.asarray(out)
@@ -3,15 +3,33 @@
 
 from __future__ import division, print_function, absolute_import
 
+import array
+import asyncio
+import importlib.machinery
+import io
+import mmap
+import os
+import shutil
+import subprocess
 import sys
+import tempfile
+import threading
+import time
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 
 import numpy as np
 
 # This requires mylibrary to be compiled and installed first (using the top-level setup.py).
 #
 try:
+    import mylibrary
     import mylibrary.dostuff as dostuff
     import mylibrary.compute as compute
+    import mylibrary.predicates as predicates
+    import mylibrary.parallel as parallel
+    import mylibrary.profiling as profiling
 except ImportError:
     print( "ERROR: mylibrary not found; is it installed (in this Python)?", file=sys.stderr )
     raise
@@ -20,37 +38,694 @@ except ImportError:
 #
 # This module belongs to the tests, and is not part of mylibrary.
 #
-try:
-    import cython_module
-except ImportError:
-    print( "ERROR: cython_module.pyx must be compiled first; run  'python -m setup build_ext --inplace'  to do this", file=sys.stderr )
-    raise
+# It cimports the compiled mylibrary.compute, so it cannot be used with the NumPy backend.
+#
+compiled = mylibrary.backend() == "compiled"
+if compiled:
+    try:
+        import cython_module
+    except ImportError:
+        print( "ERROR: cython_module.pyx must be compiled first; run  'python -m setup build_ext --inplace'  to do this", file=sys.stderr )
+        raise
+else:
+    cython_module = None
+
+
+# Failed checks. Each is also printed, so that running this file as a script shows them in context.
+#
+failures = []
+
+def fail( msg ):
+    print( msg )
+    failures.append( msg )
 
 
 def test():
+    del failures[:]
+
     # Test the dostuff module in the installed mylibrary
     #
     # This should just print "Hello world" after jumping through all the API hoops
     dostuff.hello("Hello world")
 
+    # Batched output
+    msgs = [ "message %d" % i for i in range(100000) ]
+    with tempfile.TemporaryFile("w+") as file:
+        ok = dostuff.hello_many(msgs, file) == len(msgs)
+        file.seek(0)
+        ok = ok and file.read() == "".join( m + "\n" for m in msgs )
+    stream = io.BytesIO()
+    with dostuff.Writer(stream, bufsize=16, max_delay=None) as w:
+        w.write("hello")
+        ok = ok and stream.getvalue() == b""            # still buffered
+        w.write("a long message that does not fit")     # flushes, then bypasses the buffer
+        ok = ok and stream.getvalue() == b"hello\na long message that does not fit\n"
+        w.write("x")
+    ok = ok and w.closed and stream.getvalue().endswith(b"fit\nx\n")
+    stream = io.StringIO()
+    w = dostuff.Writer(stream, max_delay=0)
+    w.write("now")
+    ok = ok and stream.getvalue() == "now\n"
+    w.close()
+    # Bytes-like messages are written as-is
+    payloads = [ b"caf\xc3\xa9", bytearray(b"\xff\xfe"), memoryview(b"0123456789")[2:8], np.arange(65, 70, dtype=np.uint8) ]
+    with tempfile.TemporaryFile() as file:
+        with dostuff.Writer(file.fileno(), bufsize=5) as w:  # some fit in the buffer, some bypass it
+            w.write_many(payloads)
+            w.write("text")
+        file.seek(0)
+        ok = ok and file.read() == b"caf\xc3\xa9\n\xff\xfe\n234567\nABCDE\ntext\n"
+    stdout, sys.stdout = sys.stdout, io.StringIO()
+    try:
+        dostuff.hello(b"from bytes")
+        ok = ok and sys.stdout.getvalue() == "from bytes\n"
+    finally:
+        sys.stdout = stdout
+    if ok:
+        print("**PASS** dostuff.hello_many(), dostuff.Writer")
+    else:
+        fail("**FAIL** dostuff.hello_many(), dostuff.Writer")
+
+    # Non-blocking output, through a writer thread
+    stream = io.BytesIO()
+    with dostuff.BackgroundWriter(stream, maxsize=5) as w:  # policy "block": nothing is lost
+        for m in msgs[:10000]:
+            w.write(m)
+    ok = stream.getvalue().decode("utf-8").splitlines() == msgs[:10000]
+    stream = io.BytesIO()
+    w = dostuff.BackgroundWriter(stream, max_delay=0.01)
+    w.write("soon")
+    for _ in range(500):  # written out by the time policy, without further calls
+        if stream.getvalue():
+            break
+        time.sleep(0.01)
+    ok = ok and stream.getvalue() == b"soon\n"
+    w.close()
+    class SlowStream(io.RawIOBase):
+        def writable(self):
+            return True
+        def write(self, b):
+            time.sleep(0.01)
+            return len(b)
+    w = dostuff.BackgroundWriter(SlowStream(), maxsize=10, policy="drop", bufsize=64)
+    nqueued = sum( w.write(m) for m in msgs[:1000] )
+    w.close()
+    ok = ok and w.dropped > 0 and nqueued + w.dropped == 1000
+    w = dostuff.BackgroundWriter(SlowStream(), maxsize=10, policy="drop", bufsize=64)  # from several threads
+    with ThreadPoolExecutor(8) as executor:
+        nqueued = sum( executor.map(lambda m: w.write(m), msgs[:4000]) )
+    w.close()
+    ok = ok and nqueued + w.dropped == 4000
+    stream = io.BytesIO()
+    w = dostuff.BackgroundWriter(stream)
+    def write_until_closed():
+        count = 0
+        try:
+            while True:
+                w.write("x")
+                count += 1
+        except ValueError:  # closed: every message queued before is written out, none after
+            return count
+    with ThreadPoolExecutor(4) as executor:
+        counts = [ executor.submit(write_until_closed) for _ in range(4) ]
+        time.sleep(0.05)
+        w.close()
+        ok = ok and stream.getvalue().count(b"x\n") == sum( c.result() for c in counts )
+    async def async_writer():
+        stream = io.BytesIO()
+        async with dostuff.AsyncWriter(stream, maxsize=3) as w:
+            for m in msgs[:1000]:
+                await w.write(m)
+        return stream.getvalue().decode("utf-8").splitlines() == msgs[:1000]
+    ok = ok and asyncio.run(async_writer())
+    async def async_writer_cancel():
+        loop = asyncio.get_running_loop()
+        loop.set_default_executor( ThreadPoolExecutor(1) )
+        gate, waiting, data = threading.Event(), threading.Event(), []
+        class GatedStream(io.RawIOBase):
+            def writable(self):
+                return True
+            def write(self, b):
+                waiting.set()
+                gate.wait()
+                data.append( bytes(b) )
+                return len(b)
+        w = dostuff.AsyncWriter(GatedStream(), maxsize=1, max_delay=0)
+        try:
+            await w.write("a")
+            while not waiting.is_set():  # the writer thread has taken "a", and waits for the gate
+                await asyncio.sleep(0.01)
+            await w.write("b")  # fills the queue
+            blocked = asyncio.ensure_future( w.write("c") )
+            await asyncio.sleep(0.05)
+            ok = await asyncio.wait_for( loop.run_in_executor(None, lambda: True), 5 )  # the default executor is not taken up
+            blocked.cancel()
+            await asyncio.gather(blocked, return_exceptions=True)
+        finally:
+            gate.set()
+        await w.write("d")
+        await w.aclose()
+        return ok and b"".join(data) == b"a\nb\nd\n" and w.dropped == 0
+    ok = ok and asyncio.run(async_writer_cancel())
+    if ok:
+        print("**PASS** dostuff.BackgroundWriter, dostuff.AsyncWriter")
+    else:
+        fail("**FAIL** dostuff.BackgroundWriter, dostuff.AsyncWriter")
+
     # Test the compute module in the installed mylibrary
     x  = np.arange(1000, dtype=np.float64)
     y1 = np.sqrt(x)
     y2 = compute.f(x)
-    if np.allclose( y1, y2 ):
+    ok = np.allclose( y1, y2 )
+    for xc in [ np.array(4.0), np.empty(0), np.float32(9.0) * np.ones((3, 4), dtype=np.float32), x.reshape(10, 100)[:5] ]:  # contiguous: the fast path
+        yc = compute.f(xc)
+        ok = ok and type(yc) is np.ndarray and yc.dtype == xc.dtype and yc.shape == xc.shape and np.array_equal( yc, np.sqrt(xc) )
+    x.flags.writeable = False
+    ok = ok and np.array_equal( compute.f(x), y1 )
+    x.flags.writeable = True
+    if ok:
         print("**PASS** compute.f()")
     else:
-        print("**FAIL** compute.f()")
+        fail("**FAIL** compute.f()")
+
+    # Large enough to take the OpenMP path
+    x  = np.arange(4 * compute.parallel_threshold, dtype=np.float64)
+    y1 = np.sqrt(x)
+    y2 = compute.f(x, num_threads=0)
+    y3 = compute.f(x, num_threads=4)
+    if np.array_equal( y1, y2 ) and np.array_equal( y1, y3 ):
+        print("**PASS** compute.f(..., num_threads=...)")
+    else:
+        fail("**FAIL** compute.f(..., num_threads=...)")
+
+    # float32, strided, Fortran-ordered and N-D inputs, processed without copying
+    a = np.arange(2*3*40*50, dtype=np.float64).reshape((2, 3, 40, 50))
+    cases = [ a.astype(np.float32),
+              a[:, :, ::3, 1::2],
+              a[..., ::-1],
+              np.asfortranarray(a),
+              a[0, 0, 7],
+              a[0, 0, :, 7],
+              np.float64(49.0),
+            ]
+    ok = True
+    for c in cases:
+        y = compute.f(c)
+        ok = ok and y.dtype == c.dtype and y.shape == np.shape(c) and np.allclose( y, np.sqrt(c) )
+        out = np.zeros_like(c)
+        ok = ok and compute.f(c, out=out) is out and np.allclose( out, np.sqrt(c) )
+    big = np.arange(4 * compute.parallel_threshold, dtype=np.float32).reshape((-1, 64))[:, ::2]
+    ok = ok and np.allclose( compute.f(big, num_threads=0), np.sqrt(big) )
+    if ok:
+        print("**PASS** compute.f(float32, strided, N-D)")
+    else:
+        fail("**FAIL** compute.f(float32, strided, N-D)")
+
+    # Output into a caller-supplied buffer, and in-place
+    x   = np.arange(1000, dtype=np.float64)
+    out = np.empty_like(x)
+    y1  = compute.f(x, out=out)
+    x2  = x.copy()
+    y2  = compute.f(x2, inplace=True)
+    if y1 is out and y2 is x2 and np.array_equal( out, np.sqrt(x) ) and np.array_equal( x2, np.sqrt(x) ):
+        print("**PASS** compute.f(..., out=...), compute.f(..., inplace=True)")
+    else:
+        fail("**FAIL** compute.f(..., out=...), compute.f(..., inplace=True)")
+
+    # Bad output buffers must be rejected, not silently copied
+    bad = [ np.empty(999, dtype=np.float64),         # wrong length
+            np.empty(1000, dtype=np.float32),        # wrong dtype (x is float64)
+            np.empty((2, 500), dtype=np.float64),    # wrong shape
+            np.frombuffer(bytes(8000)),              # read-only
+            x[1:],                                   # wrong length, and overlaps x
+          ]
+    nrejected = 0
+    for b in bad:
+        try:
+            compute.f(x, out=b)
+        except ValueError:
+            nrejected += 1
+    if nrejected == len(bad):
+        print("**PASS** compute.f() output validation")
+    else:
+        fail("**FAIL** compute.f() output validation")
+
+    # Any buffer as input or output, and results of the same container type
+    a  = array.array("d", [1.0, 4.0, 9.0])
+    ok = np.array_equal( compute.f(a), [1.0, 2.0, 3.0] )
+    y  = compute.f(a, result="like")
+    ok = ok and isinstance(y, array.array) and y.typecode == "d" and list(y) == [1.0, 2.0, 3.0]
+    y  = compute.f(memoryview(np.arange(6.0).reshape((2, 3))), result="like")
+    ok = ok and isinstance(y, memoryview) and y.shape == (2, 3) and np.allclose( y, np.sqrt(np.arange(6.0)).reshape((2, 3)) )
+    y  = compute.f(a, result="memoryview")
+    ok = ok and isinstance(y, memoryview) and y.format == "d" and y.tolist() == [1.0, 2.0, 3.0]
+    raw = np.array([4.0, 16.0], dtype=np.float32).tobytes()
+    y   = compute.f(raw, dtype=np.float32, result="like")
+    ok  = ok and isinstance(y, bytearray) and np.array_equal( np.frombuffer(y, dtype=np.float32), [2.0, 4.0] )
+    mm  = mmap.mmap(-1, 4 * 8)
+    np.frombuffer(mm)[:] = [1.0, 4.0, 9.0, 16.0]
+    compute.f(mm, inplace=True)
+    ok  = ok and np.array_equal( np.frombuffer(mm), [1.0, 2.0, 3.0, 4.0] )
+    out = bytearray(4 * 8)
+    ok  = ok and compute.f(np.arange(4.0).reshape((2, 2)), out=out) is out and np.allclose( np.frombuffer(out), np.sqrt(np.arange(4.0)) )
+    mm.close()
+    if ok:
+        print("**PASS** compute.f(buffer), compute.f(..., result=...)")
+    else:
+        fail("**FAIL** compute.f(buffer), compute.f(..., result=...)")
+
+    # The ufunc version: broadcasting, out=, where=, casting
+    x   = np.arange(12, dtype=np.float64).reshape((3, 4))
+    out = np.full((2, 3, 4), -1.0)
+    compute.f_ufunc(x, out=out, where=(x > 5))
+    ok  = isinstance(compute.f_ufunc, np.ufunc)
+    ok  = ok and np.array_equal( out, np.where(x > 5, np.sqrt(x), -1.0) + np.zeros((2, 1, 1)) )
+    ok  = ok and compute.f_ufunc(np.arange(4)).dtype == np.float64
+    ok  = ok and compute.f_ufunc(np.arange(4, dtype=np.float32)).dtype == np.float32
+    ok  = ok and np.allclose( compute.f_ufunc(x.T[::-1]), np.sqrt(x.T[::-1]) )
+    if ok:
+        print("**PASS** compute.f_ufunc()")
+    else:
+        fail("**FAIL** compute.f_ufunc()")
+
+    # Fused reductions
+    rng = np.random.RandomState(42)
+    ok  = True
+    for x in [ rng.rand(1000),
+               rng.rand(4 * compute.parallel_threshold),
+               rng.rand(30, 40, 50)[:, ::3, ::-2],
+               np.asfortranarray(rng.rand(300, 50)) ]:
+        r = np.sqrt(x)
+        y = rng.rand(*x.shape)
+        ok = ok and np.isclose( compute.sum_f(x), r.sum() ) and np.isclose( compute.mean_f(x), r.mean() )
+        ok = ok and compute.min_f(x) == r.min() and compute.max_f(x) == r.max()
+        ok = ok and np.isclose( compute.dot_f(x, y), np.vdot(r, y) )
+        ok = ok and compute.sum_f(x, num_threads=0) == compute.sum_f(x, num_threads=3)  # deterministic
+    x  = rng.rand(4 * compute.parallel_threshold)
+    x[12345] = -1.0
+    ok = ok and np.isnan( compute.max_f(x) ) and np.isnan( compute.min_f(x, num_threads=0) )
+    ok = ok and compute.sum_f(np.zeros(0)) == 0.0
+    if ok:
+        print("**PASS** compute.sum_f(), mean_f(), min_f(), max_f(), dot_f()")
+    else:
+        fail("**FAIL** compute.sum_f(), mean_f(), min_f(), max_f(), dot_f()")
+
+    # Fused elementwise pipeline
+    p  = compute.Pipeline().scale(2.0).offset(1.0).f().clip(0.0, 10.0)
+    ok = repr(p) == "Pipeline().scale(2.0).offset(1.0).f().clip(0.0, 10.0)" and len(p) == 4
+    for x in [ 100 * rng.rand(1000),
+               100 * rng.rand(4 * compute.parallel_threshold).astype(np.float32),
+               100 * rng.rand(30, 40, 50)[:, ::3, ::-2],
+               100 * rng.rand(3000)[::3] ]:
+        r  = np.clip( np.sqrt(2.0*x + 1.0), 0.0, 10.0 )
+        ok = ok and p(x).dtype == x.dtype and np.allclose( p(x), r ) and np.allclose( p(x, num_threads=0), r )
+    x  = rng.rand(1000) - 0.5
+    ok = ok and np.array_equal( compute.Pipeline().abs().square()(x), x*x )
+    ok = ok and np.array_equal( compute.Pipeline()(x), x )
+    if ok:
+        print("**PASS** compute.Pipeline")
+    else:
+        fail("**FAIL** compute.Pipeline")
+
+    # Instruction set variants of the kernels: all give the same results
+    active   = compute.kernel_variant()
+    variants = compute.available_kernel_variants()
+    ok = active == variants[0] and ("baseline" in variants if compiled else variants == ("numpy",))
+    x  = rng.rand(3 * compute.parallel_threshold)
+    results = []
+    try:
+        for v in variants:
+            compute.set_kernel_variant(v)
+            results.append( (compute.f(x, num_threads=0), compute.f(x[::3].astype(np.float32)), compute.sum_f(x), compute.max_f(x), p(x)) )
+    finally:
+        compute.set_kernel_variant(active)
+    for r in results:
+        ok = ok and all( np.array_equal(a, b) for a, b in zip(r, results[0]) )
+    try:
+        compute.set_kernel_variant("no such variant")
+        ok = False
+    except ValueError:
+        pass
+    if ok:
+        print("**PASS** compute.kernel_variant(), set_kernel_variant() (active: %s)" % (active))
+    else:
+        fail("**FAIL** compute.kernel_variant(), set_kernel_variant() (active: %s)" % (active))
+
+    # Read-only memory-mapped input
+    with tempfile.TemporaryFile() as file:
+        x  = np.memmap( file, dtype=np.float64, mode="w+", shape=(1000,) )
+        x[:] = np.arange(1000)
+        x.flush()
+        xr = np.memmap( file, dtype=np.float64, mode="r", shape=(1000,) )
+        if np.array_equal( compute.f(xr), np.sqrt(np.arange(1000)) ):
+            print("**PASS** compute.f(read-only memmap)")
+        else:
+            fail("**FAIL** compute.f(read-only memmap)")
+        del x, xr
+
+    # Out-of-core: .npy and raw files
+    tmpdir = tempfile.mkdtemp()
+    try:
+        src, dst = os.path.join(tmpdir, "x.npy"), os.path.join(tmpdir, "y.npy")
+        x = np.asfortranarray( rng.rand(300, 70).astype(np.float32) )
+        np.save(src, x)
+        compute.f_file(src, dst, blocksize=1000)  # many blocks, not page-aligned
+        y = np.load(dst)
+        ok = y.dtype == x.dtype and y.shape == x.shape and y.flags.f_contiguous and np.array_equal( y, compute.f(x) )
+
+        src, dst = os.path.join(tmpdir, "x.bin"), os.path.join(tmpdir, "y.bin")
+        x = rng.rand(12345)
+        x.tofile(src)
+        compute.f_file(src, dst, kernel=compute.Pipeline().scale(4.0).f())
+        ok = ok and np.allclose( np.fromfile(dst), np.sqrt(4.0*x) )
+    finally:
+        for name in os.listdir(tmpdir):
+            os.remove( os.path.join(tmpdir, name) )
+        os.rmdir(tmpdir)
+    if ok:
+        print("**PASS** compute.f_file()")
+    else:
+        fail("**FAIL** compute.f_file()")
+
+    # Chunked parallel execution on a thread pool
+    ok = True
+    for x in [ rng.rand(300001), rng.rand(700, 900).T, rng.rand(2000, 300)[::2, ::3], rng.rand(100001).astype(np.float32)[1:] ]:
+        for kernel in [ compute.f, compute.f_ufunc, compute.Pipeline().f() ]:
+            y  = parallel.map_chunks( kernel, x, workers=4, chunksize=9999 )
+            ok = ok and np.array_equal( y, np.sqrt(x) ) and y.strides == np.empty_like(x).strides
+    x   = rng.rand(200000)
+    out = np.empty_like(x)
+    ok  = ok and parallel.map_chunks( compute.f, x, out, workers=3 ) is out and np.array_equal( out, np.sqrt(x) )
+    ok  = ok and np.array_equal( parallel.map_chunks(compute.f, x, workers=1), out ) and np.array_equal( parallel.map_chunks(compute.f, x[:10]), out[:10] )
+    with ThreadPoolExecutor(2) as executor:  # the application's own pool, also from within one of its tasks
+        y  = executor.submit( lambda: parallel.map_chunks(compute.f, x, workers=4, chunksize=1000, executor=executor) ).result()
+        ok = ok and np.array_equal( y, np.sqrt(x) )
+    with ThreadPoolExecutor(8) as executor:  # concurrent calls on the shared pool, with mixed workers, and a shutdown() in between
+        results = [ executor.submit(parallel.map_chunks, compute.f, x, workers=w, chunksize=1000) for w in list(range(2, 10)) * 4 ]
+        parallel.shutdown(wait=False)
+        ok = ok and all( np.array_equal(r.result(), np.sqrt(x)) for r in results )
+    def failing( x, out ):
+        raise ZeroDivisionError()
+    for bad, exc in [ (lambda: parallel.map_chunks(failing, x, workers=3, chunksize=1000), ZeroDivisionError),
+                      (lambda: parallel.map_chunks(compute.f, x, workers=0), ValueError),
+                      (lambda: parallel.map_chunks(compute.f, x, out=np.empty(3)), ValueError) ]:
+        try:
+            bad()
+            ok = False
+        except exc:
+            pass
+    if ok:
+        print("**PASS** parallel.map_chunks()")
+    else:
+        fail("**FAIL** parallel.map_chunks()")
+
+    # asyncio: chunks on an executor, interleaved with other coroutines, cancellable between chunks
+    async def async_compute():
+        x  = rng.rand(2**20)
+        ok = np.array_equal( await compute.f_async(x), np.sqrt(x) )
+        ok = ok and np.array_equal( await compute.f_async(x.reshape(1024, 1024).T[::3], chunksize=5000), np.sqrt(x.reshape(1024, 1024).T[::3]) )
+        out = np.empty_like(x)
+        ok = ok and await compute.f_async(x, out=out, chunksize=10000) is out and np.array_equal( out, np.sqrt(x) )
+
+        ticks = []  # the event loop keeps running while f_async computes
+        async def ticker():
+            while True:
+                ticks.append(None)
+                await asyncio.sleep(0)
+        t = asyncio.ensure_future( ticker() )
+        await compute.f_async(x, chunksize=10000)
+        t.cancel()
+        ok = ok and len(ticks) >= 10
+
+        order = []  # two coroutines on one thread take turns, chunk by chunk
+        def kernel( tag ):
+            return lambda x, out: order.append(tag)
+        with ThreadPoolExecutor(1) as executor:
+            await asyncio.gather( parallel.map_chunks_async(kernel("a"), x, chunksize=2**16, executor=executor),
+                                  parallel.map_chunks_async(kernel("b"), x, chunksize=2**16, executor=executor) )
+        ok = ok and min( order.count("a"), order.count("b") ) >= 16 and order[:6] == ["a", "b"] * 3
+
+        out  = np.zeros_like(x)
+        task = asyncio.ensure_future( compute.f_async(np.ones_like(x), out=out, chunksize=1000) )
+        while not out.any():
+            await asyncio.sleep(0)
+        task.cancel()
+        try:
+            await task
+            ok = False
+        except asyncio.CancelledError:
+            pass
+        written = out.copy()
+        await asyncio.sleep(0.01)
+        ok = ok and 0 < np.count_nonzero(written) < x.size and np.array_equal( out, written )
+
+        try:
+            await compute.f_async(x.astype(np.int32))
+            ok = False
+        except ValueError:
+            pass
+        return ok
+    if asyncio.run(async_compute()):
+        print("**PASS** compute.f_async(), parallel.map_chunks_async()")
+    else:
+        fail("**FAIL** compute.f_async(), parallel.map_chunks_async()")
+
+    # Worker processes over shared memory
+    ok = True
+    with parallel.ProcessPool(2) as pool:
+        x = pool.array( (600, 500) )
+        x[:] = rng.rand(600, 500)
+        y = pool.map_chunks( compute.f, x )  # in place, both ways
+        ok = ok and np.array_equal( y, np.sqrt(x) ) and pool._describe(y) is not None
+        ok = ok and np.array_equal( pool.map_chunks(compute.f, x.T[::2, 1:], chunksize=7777), np.sqrt(x.T[::2, 1:]) )
+        ok = ok and np.array_equal( pool.map_chunks(compute.Pipeline().scale(4.0).f(), x), 2.0 * np.sqrt(x) )
+        for _ in range(2 * parallel._MAX_ATTACHED + 3):  # the same input, with a new out each time: x stays attached in the workers
+            ok = ok and np.array_equal( pool.map_chunks(compute.f, x), y )
+        for xp in [ rng.rand(100001), rng.rand(300, 200).T, rng.rand(50001).astype(np.float32)[::-2] ]:  # through scratch memory
+            out = np.empty_like(xp)
+            ok  = ok and pool.map_chunks( compute.f, xp, out ) is out and np.array_equal( out, np.sqrt(xp) )
+        nblocks, nshm = len(pool._blocks), len(os.listdir("/dev/shm"))
+        for k in range(1, 20):  # growing scratch blocks, and a new out each time: no block stays behind
+            ok = ok and np.array_equal( pool.map_chunks(compute.f, rng.rand(1000 * k)).shape, (1000 * k,) )
+        ok = ok and len(pool._blocks) == nblocks and len(os.listdir("/dev/shm")) == nshm
+        names = [ shm.name for shm in pool._blocks ]
+        for bad, exc in [ (lambda: pool.map_chunks(compute.f, x.astype(np.int32)), ValueError),
+                          (lambda: pool.map_chunks(np.sqrt, x, out=np.empty(3)), ValueError),
+                          (lambda: pool.map_chunks(np.sqrt, x, chunksize=0), ValueError),
+                          (lambda: pool.map_chunks(np.divide, x), TypeError) ]:  # raised in a worker
+            try:
+                bad()
+                ok = False
+            except exc:
+                pass
+    ok = ok and pool.closed and not any( os.path.exists("/dev/shm/" + name.lstrip("/")) for name in names )
+    try:
+        pool.map_chunks( compute.f, x )
+        ok = False
+    except ValueError:
+        pass
+    ok = ok and np.array_equal( y, np.sqrt(x) )  # still mapped in this process
+    class Crash:  # unpickling it kills the worker
+        def __reduce__(self):
+            return (os._exit, (1,))
+    with parallel.ProcessPool(1) as pool:
+        try:
+            pool.map_chunks( Crash(), pool.array(10) )
+            ok = False
+        except BrokenProcessPool:  # rather than waiting for the dead worker
+            pass
+    if ok:
+        print("**PASS** parallel.ProcessPool")
+    else:
+        fail("**FAIL** parallel.ProcessPool")
+
+    # Hot-path counters
+    was_enabled = mylibrary.stats_enabled()
+    mylibrary.enable_stats()
+    mylibrary.reset_stats()
+    try:
+        x = rng.rand(2 * compute.parallel_threshold)
+        compute.f(x)
+        compute.f(x.astype(np.float32), num_threads=2)
+        compute.sum_f(x)
+        predicates.g_count(np.arange(100))
+        with dostuff.Writer(io.StringIO()) as w:
+            w.write_many(["one", b"two"])
+        s = mylibrary.stats()
+    finally:
+        mylibrary.enable_stats(was_enabled)
+        mylibrary.reset_stats()
+    sf = s["compute.f"]
+    ok = ( sf["calls"] == 2  and  sf["elements"] == 2 * x.size  and  sf["bytes"] == 2 * 8 * x.size + 2 * 4 * x.size  and
+           sf["parallel"] == int(compiled)  and  sf["serial"] == 2 - int(compiled)  and  sf["seconds"] > 0  and
+           s["compute.reduce"]["calls"] == 1  and  s["predicates"]["elements"] == 100  and
+           s["dostuff.Writer"]["elements"] == 2  and  s["dostuff.Writer"]["bytes"] == 6  and
+           s["compute.Pipeline"]["calls"] == 0  and  all( v == 0 for v in mylibrary.stats()["compute.f"].values() ) )
+    if ok:
+        print("**PASS** mylibrary.stats(), reset_stats()")
+    else:
+        fail("**FAIL** mylibrary.stats(), reset_stats()")
+
+    # Profiling helper; the Cython functions appear in the profile only in the profiling build
+    x = rng.rand(1000)
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        y, stats = profiling.profile( compute.f, x, num_threads=1 )
+    names = [ name for (filename, line, name) in stats.stats ]
+    ok = np.array_equal( y, np.sqrt(x) )
+    if profiling.is_profile_build():
+        ok = ok and "f" in names and not caught
+    else:
+        ok = ok and len(caught) == 1 and issubclass(caught[0].category, RuntimeWarning)
+    if ok:
+        print("**PASS** profiling.profile() (profiling build: %s)" % (profiling.is_profile_build()))
+    else:
+        fail("**FAIL** profiling.profile() (profiling build: %s)" % (profiling.is_profile_build()))
 
     # Test the local Cython module
-    b1 = cython_module.g(42)
-    b2 = cython_module.g(23)
-    if b1 and not b2:
+    if cython_module is None:
+        print("**SKIP** cython_module.g() (backend: %s)" % (mylibrary.backend()))
+    elif cython_module.g(42) and not cython_module.g(23):
         print("**PASS** cython_module.g()")
     else:
-        print("**FAIL** cython_module.g()")
+        fail("**FAIL** cython_module.g()")
+
+    # The array versions of g(), in mylibrary.predicates
+    ok = predicates.g(42) and not predicates.g(23)
+    for x in [ rng.randint(0, 100, size=100000),
+               rng.randint(0, 100, size=(30, 40, 50)).astype(np.uint8)[:, ::3, ::-2],
+               rng.randint(-100, 100, size=1000).astype(np.int16),
+               np.arange(1000, dtype=np.uint64) ]:
+        for value in [42, -1, 300]:
+            mask = (x == value)
+            ok = ok and np.array_equal( predicates.g_mask(x, value), mask )
+            ok = ok and predicates.g_count(x, value) == np.count_nonzero(mask)
+            ok = ok and predicates.g_any(x, value) == np.any(mask)
+            ok = ok and all( np.array_equal(a, b) for a, b in zip(predicates.g_nonzero(x, value), np.nonzero(mask)) )
+    big = np.array([0, 2**63 - 1, 2**63, 2**64 - 1, 2**63], dtype=np.uint64)  # values beyond the range of long long
+    for value, expected in [ (2**63, [2, 4]), (2**64 - 1, [3]), (np.uint64(2**63 - 1), [1]), (2**64, []), (-1, []) ]:
+        ok = ok and predicates.g_nonzero(big, value)[0].tolist() == expected and predicates.g_count(big, value) == len(expected)
+        ok = ok and predicates.g_any(big, value) == bool(expected) and predicates.g_mask(big, value).nonzero()[0].tolist() == expected
+    ok  = ok and predicates.g(2**70, 2**70) and predicates.g_count(np.arange(10, dtype=np.int8), -2**70) == 0
+    out = np.empty((1000,), dtype=bool)
+    ok  = ok and predicates.g_mask(np.arange(1000), out=out) is out and np.count_nonzero(out) == 1
+    buf = bytearray(100)  # any buffer-protocol object; uint8 gets 0 and 1
+    ok  = ok and predicates.g_mask(np.arange(100), out=memoryview(buf)) is not None and buf.count(1) == 1 and buf[42] == 1
+    for bad in [ lambda: predicates.g_mask(np.arange(10.0)),
+                 lambda: predicates.g_mask(np.arange(10), out=np.empty(10, dtype=np.int32)),
+                 lambda: predicates.g_mask(np.arange(10), out=np.empty(11, dtype=bool)),
+                 lambda: predicates.g_mask(np.arange(10), out=bytes(10)),
+                 lambda: predicates.g_mask(np.arange(20).reshape(4, 5), out=np.empty((5, 4), dtype=bool).T),
+                 lambda: predicates.g_nonzero(np.array(42)) ]:
+        try:
+            bad()
+            ok = False
+        except ValueError:
+            pass
+    if ok:
+        print("**PASS** predicates.g(), g_mask(), g_count(), g_any(), g_nonzero()")
+    else:
+        fail("**FAIL** predicates.g(), g_mask(), g_count(), g_any(), g_nonzero()")
+
+    # The NumPy backend gives the same results as the compiled one
+    import mylibrary.fallback.compute as np_compute
+    import mylibrary.fallback.predicates as np_predicates
+    x  = rng.rand(3 * compute.parallel_threshold + 7) - 0.1  # some negative: NaN
+    x32 = x[::3].astype(np.float32)
+    xs = x[:5000]
+    p  = compute.Pipeline().scale(3.0).abs().f().clip(0.1, 1.5).square()
+    pn = np_compute.Pipeline().scale(3.0).abs().f().clip(0.1, 1.5).square()
+    ok = ( np.array_equal( np_compute.f(x), compute.f(x), equal_nan=True )  and
+           np.array_equal( np_compute.f(x32), compute.f(x32), equal_nan=True )  and
+           np.array_equal( np_compute.f(x.reshape(-1, 1)[::2].T), compute.f(x.reshape(-1, 1)[::2].T), equal_nan=True )  and
+           np.isnan( np_compute.sum_f(x) )  and  np.isnan( np_compute.max_f(x) )  and
+           np.isclose( np_compute.sum_f(np.abs(x)), compute.sum_f(np.abs(x)) )  and
+           np.isclose( np_compute.mean_f(x32[x32 > 0]), compute.mean_f(x32[x32 > 0]) )  and
+           np_compute.min_f(np.abs(xs)) == compute.min_f(np.abs(xs))  and
+           np.isclose( np_compute.dot_f(np.abs(xs), xs), compute.dot_f(np.abs(xs), xs) )  and
+           np.allclose( pn(x), p(x) )  and  repr(pn) == repr(p)  and
+           np_predicates.g_count(np.arange(1000) % 100) == predicates.g_count(np.arange(1000) % 100) )
+    for bad in [ lambda: np_compute.f(x, num_threads=-1), lambda: np_compute.f(x.astype(np.int32)),
+                 lambda: np_compute.f(x, out=np.empty(3)), lambda: np_predicates.g_mask(x) ]:
+        try:
+            bad()
+            ok = False
+        except ValueError:
+            pass
+
+    # ...and is used throughout when pinned by MYLIBRARY_BACKEND
+    env = dict( os.environ, MYLIBRARY_BACKEND="numpy",
+                PYTHONPATH=os.pathsep.join( [os.path.dirname(os.path.dirname(mylibrary.__file__))] + sys.path ) )
+    code = "import mylibrary, mylibrary.compute; from mylibrary import dostuff; print(mylibrary.backend(), mylibrary.compute.__name__, dostuff.__name__)"
+    r = subprocess.run( [sys.executable, "-c", code], env=env, capture_output=True, text=True )
+    ok = ok and r.stdout.split() == ["numpy", "mylibrary.fallback.compute", "mylibrary.fallback.dostuff"]
+    r = subprocess.run( [sys.executable, "-c", "import mylibrary"], env=dict(env, MYLIBRARY_BACKEND="fortran"), capture_output=True, text=True )
+    ok = ok and r.returncode != 0 and "MYLIBRARY_BACKEND" in r.stderr
+    # A compiled module that fails to load: the backend is settled once, and never split
+    if compiled:
+        with tempfile.TemporaryDirectory() as tmp:
+            pkgdir = os.path.dirname(mylibrary.__file__)
+            shutil.copytree( pkgdir, os.path.join(tmp, "mylibrary"), ignore=shutil.ignore_patterns("*.c", "__pycache__") )
+            origin = importlib.machinery.PathFinder.find_spec("mylibrary.dostuff", [pkgdir]).origin
+            with open( os.path.join(tmp, "mylibrary", os.path.basename(origin)), "wb" ) as file:
+                file.write(b"not a shared library")
+            env = dict( os.environ, MYLIBRARY_BACKEND="", PYTHONPATH=os.pathsep.join([tmp] + sys.path) )
+            code = ( "import mylibrary; d = mylibrary.dostuff; "  # first use fails: the NumPy backend, for all modules
+                     "print(mylibrary.backend(), d.__name__, mylibrary.counters.__name__, mylibrary.compute.__name__)" )
+            r = subprocess.run( [sys.executable, "-c", code], env=env, cwd=tmp, capture_output=True, text=True )  # not the cwd, which may hold mylibrary
+            ok = ok and r.stdout.split() == ["numpy", "mylibrary.fallback.dostuff", "mylibrary.fallback.counters", "mylibrary.fallback.compute"]
+            code = ( "import mylibrary; c = mylibrary.counters\n"  # the compiled backend is settled, and stays
+                     "try:\n    mylibrary.dostuff\nexcept ImportError:\n    print('ImportError')\n"
+                     "print(mylibrary.backend(), mylibrary.counters is c, c.__name__)" )
+            r = subprocess.run( [sys.executable, "-c", code], env=env, cwd=tmp, capture_output=True, text=True )
+            ok = ok and r.stdout.split() == ["ImportError", "compiled", "True", "mylibrary.counters"]
+    if ok:
+        print("**PASS** mylibrary.fallback, MYLIBRARY_BACKEND (backend: %s)" % (mylibrary.backend()))
+    else:
+        fail("**FAIL** mylibrary.fallback, MYLIBRARY_BACKEND (backend: %s)" % (mylibrary.backend()))
+
+    # The local Cython module calling mylibrary.compute's C-level API
+    x = rng.rand(50, 300)
+    if cython_module is None:
+        print("**SKIP** cython_module.rowsums_f() (backend: %s)" % (mylibrary.backend()))
+    elif np.allclose( cython_module.rowsums_f(x), np.sqrt(x).sum(axis=1) ):
+        print("**PASS** cython_module.rowsums_f() (cimport mylibrary.compute)")
+    else:
+        fail("**FAIL** cython_module.rowsums_f() (cimport mylibrary.compute)")
+
+    assert not failures, "%d check(s) failed: %s" % (len(failures), "; ".join(failures))
+
+
+def test_large():
+    del failures[:]
+
+    # Input with more elements than fit in a 32-bit int.
+    #
+    # The input is a sparse memory-mapped file, so it takes almost no disk space,
+    # but the output is a regular array of 16 GiB; hence this is opt-in.
+    #
+    if not os.environ.get("MYLIBRARY_TEST_LARGE"):
+        print("**SKIP** compute.f(>2**31 elements); set MYLIBRARY_TEST_LARGE=1 to run")
+        return
+
+    n = 2**31 + 1000
+    with tempfile.TemporaryFile() as file:
+        x = np.memmap( file, dtype=np.float64, mode="w+", shape=(n,) )
+        tail = np.arange(1000, dtype=np.float64)**2
+        x[-1000:] = tail  # touches only the last few pages
+        x.flush()
+        xr = np.memmap( file, dtype=np.float64, mode="r", shape=(n,) )
+        y = compute.f(xr, num_threads=0)
+        if y.shape == (n,) and np.array_equal( y[-1000:], np.sqrt(tail) ) and y[0] == 0.0:
+            print("**PASS** compute.f(>2**31 elements)")
+        else:
+            fail("**FAIL** compute.f(>2**31 elements)")
+        del x, xr, y
+
+    assert not failures, "%d check(s) failed: %s" % (len(failures), "; ".join(failures))
 
 
 if __name__ == '__main__':
     test()
+    test_large()
 
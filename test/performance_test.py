@@ -0,0 +1,279 @@
+# -*- coding: utf-8 -*-
+"""Performance tests of mylibrary: allocation budgets, throughput against a stored baseline, and GIL release.
+
+These check properties of the hot paths, so that a regression fails the test run:
+
+  - with ``out=`` (and in the other no-copy modes), the kernels allocate nothing proportional to the data;
+  - the throughput of compute.f, relative to np.sqrt on the same machine, stays within a tolerance
+    of the ratios stored in perf_baseline.json;
+  - the kernels release the GIL, so that other Python threads run while they compute;
+  - ``import mylibrary`` stays within a time budget (``python -X importtime``), and imports NumPy
+    and the extension modules only when they are first used.
+
+Throughput is compared as a ratio to NumPy, not in absolute GB/s, so that the baseline carries over
+between machines. The tolerance is relative, default 0.35; set ``MYLIBRARY_PERF_TOLERANCE`` to change it.
+After an intentional change in performance, set ``MYLIBRARY_PERF_UPDATE_BASELINE=1`` to rewrite the baseline.
+The import budget is 50 ms by default; set ``MYLIBRARY_IMPORT_BUDGET_MS`` to change it.
+
+Run with pytest, or as a script.
+"""
+
+from __future__ import division, print_function, absolute_import
+
+import array
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+
+import numpy as np
+import pytest
+
+try:
+    import mylibrary
+    import mylibrary.compute as compute
+    import mylibrary.predicates as predicates
+    import mylibrary.profiling as profiling
+except ImportError:
+    print( "ERROR: mylibrary not found; is it installed (in this Python)?", file=sys.stderr )
+    raise
+
+import benchmark  # in this directory
+
+
+baseline_path = os.path.join( os.path.dirname(os.path.abspath(__file__)), "perf_baseline.json" )
+tolerance     = float( os.environ.get("MYLIBRARY_PERF_TOLERANCE", "0.35") )
+import_budget = float( os.environ.get("MYLIBRARY_IMPORT_BUDGET_MS", "50") ) * 1e-3
+
+# The tracing code of the profiling build (see mylibrary.profiling) would make the timings meaningless.
+# The baseline and the budgets are those of the compiled backend; the NumPy backend allocates temporaries.
+#
+pytestmark = [ pytest.mark.skipif( profiling.is_profile_build(), reason="profiling build" ),
+               pytest.mark.skipif( mylibrary.backend() != "compiled", reason="NumPy backend (mylibrary.fallback)" ) ]
+
+
+#########################################################
+# Allocations
+#########################################################
+
+# Return the peak of traced memory allocated by fn(), in bytes, beyond what was allocated before the call.
+#
+def peak_allocation( fn, repeat=5 ):
+    fn()  # warm up: first-call caches, lazily created objects
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        for _ in range(repeat):
+            fn()
+        return tracemalloc.get_traced_memory()[1] - before
+    finally:
+        tracemalloc.stop()
+
+def no_copy_cases():
+    rng = np.random.RandomState(42)
+    x   = rng.rand(2**17)                        # 1 MiB
+    out = np.empty_like(x)
+    x32 = x.astype(np.float32)
+    x2  = np.asfortranarray( rng.rand(256, 512) )
+    out2 = np.empty_like(x2)
+    xs  = rng.rand(2**18)[::2]
+    p   = compute.Pipeline().scale(2.0).f().clip(0.0, 1.0)
+    ints = rng.randint(0, 100, size=2**17).astype(np.int32)
+    mask = np.empty( ints.shape, dtype=bool )
+    buf  = array.array( "d", bytes(x.nbytes) )
+    return { "f(out=)":              lambda: compute.f(x, out=out),
+             "f(float32, inplace)":  lambda: compute.f(x32, inplace=True),
+             "f(Fortran, out=)":     lambda: compute.f(x2, out=out2),
+             "f(strided, out=)":     lambda: compute.f(xs, out=out[:xs.shape[0]]),
+             "f(threads, out=)":     lambda: compute.f(x, out=out, num_threads=0),
+             "f(array.array out=)":  lambda: compute.f(x, out=buf),
+             "f_ufunc(out=)":        lambda: compute.f_ufunc(x, out=out),
+             "Pipeline(out=)":       lambda: p(x, out=out),
+             "sum_f":                lambda: compute.sum_f(x),
+             "dot_f":                lambda: compute.dot_f(x, x),
+             "g_mask(out=)":         lambda: predicates.g_mask(ints, out=mask),
+             "g_count":              lambda: predicates.g_count(ints),
+           }
+
+# Per call, the Python-level glue allocates some small objects (memoryview slices, tuples);
+# a copy of the data would be 1 MiB.
+#
+_allocation_budget = 16 * 1024
+
+@pytest.mark.parametrize( "name", sorted(no_copy_cases()) )
+def test_no_allocations( name ):
+    fn = no_copy_cases()[name]
+    peak = peak_allocation(fn)
+    assert peak < _allocation_budget, "%s allocated %d bytes (budget %d)" % (name, peak, _allocation_budget)
+
+def test_allocation_check_works():
+    # The check must see NumPy's data allocations, or the tests above would pass vacuously.
+    x = np.random.rand(2**17)
+    assert peak_allocation( lambda: compute.f(x) ) >= x.nbytes
+
+
+#########################################################
+# Throughput
+#########################################################
+
+# Cases: name -> (dtype, layout, number of elements, whether to pass out=). The arrays are about 1 MiB,
+# cache-friendly enough for stable timings; test/benchmark.py covers the full range of sizes.
+#
+# The small case measures the per-call overhead of the most common call, f(x) (against np.sqrt(x)),
+# which takes the fast path of compute.f: there, any extra layer of argument handling shows.
+#
+throughput_cases = { "float32/contiguous": (np.float32, "contiguous", 2**18, True),
+                     "float32/strided":    (np.float32, "strided",    2**18, True),
+                     "float64/contiguous": (np.float64, "contiguous", 2**17, True),
+                     "float64/strided":    (np.float64, "strided",    2**17, True),
+                     "float64/small":      (np.float64, "contiguous", 100,   False),  # per-call overhead
+                   }
+
+# Speed of compute.f relative to np.sqrt (> 1 is faster) for one case.
+#
+def speed_ratio( name ):
+    dtype, layout, n, with_out = throughput_cases[name]
+    x, out = benchmark.make_arrays( n, dtype, layout, np.random.RandomState(42) )
+    if not with_out:
+        out = None
+    t_np = t = float("inf")
+    for _ in range(3):  # alternating, so that a burst of noise on the machine does not hit only one of the two
+        t_np = min( t_np, benchmark.best_time(lambda: np.sqrt(x, out=out), repeat=3) )
+        t    = min( t,    benchmark.best_time(lambda: compute.f(x, out=out), repeat=3) )
+    return t_np / t
+
+def load_baseline():
+    with open(baseline_path) as f:
+        return json.load(f)["ratios"]
+
+@pytest.mark.parametrize( "name", sorted(throughput_cases) )
+def test_throughput( name ):
+    ratio = speed_ratio(name)
+    if os.environ.get("MYLIBRARY_PERF_UPDATE_BASELINE"):
+        update_baseline(name, ratio)
+        return
+    expected = load_baseline()[name]
+    assert ratio >= expected * (1.0 - tolerance), \
+           "compute.f %s: %.3f x the speed of np.sqrt, baseline %.3f (tolerance %.0f%%)" % (name, ratio, expected, 100 * tolerance)
+
+def update_baseline( name, ratio ):
+    try:
+        with open(baseline_path) as f:
+            data = json.load(f)
+    except IOError:
+        data = { "description": "Speed of compute.f relative to np.sqrt, per case of performance_test.py", "ratios": {} }
+    data["ratios"][name] = round(ratio, 3)
+    with open(baseline_path, "w") as f:
+        json.dump(data, f, indent=1, sort_keys=True)
+        f.write("\n")
+
+
+#########################################################
+# GIL release
+#########################################################
+
+# Run fn() in the calling thread, while another thread spins in Python, recording timestamps.
+#
+# Return the number of timestamps that fall strictly inside the calls of fn. The spinning thread
+# needs the GIL to take a timestamp, so this is nonzero only if fn released the GIL.
+#
+# The switch interval is raised for the duration, so that the interpreter does not force the calling
+# thread to hand over the GIL; the spinning thread yields it at each iteration. Then the only way
+# for the spinning thread to run during fn is for fn to release the GIL itself.
+#
+def ticks_during( fn, calls=10 ):
+    ticks = []
+    stop  = threading.Event()
+    def spin():
+        while not stop.is_set():
+            ticks.append( time.perf_counter() )
+            time.sleep(0)  # releases the GIL
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(100.0)
+    thread = threading.Thread( target=spin )
+    thread.start()
+    windows = []
+    try:
+        time.sleep(0.01)  # let the thread start spinning
+        for _ in range(calls):
+            t0 = time.perf_counter()
+            fn()
+            windows.append( (t0, time.perf_counter()) )
+    finally:
+        stop.set()
+        thread.join()
+        sys.setswitchinterval(interval)
+    return sum( 1 for t in ticks for (t0, t1) in windows if t0 < t < t1 )
+
+def gil_cases():
+    rng = np.random.RandomState(42)
+    x   = rng.rand(2**22)  # 32 MiB; several milliseconds per call
+    out = np.empty_like(x)
+    p   = compute.Pipeline().scale(2.0).f().clip(0.0, 1.0)
+    ints = rng.randint(0, 100, size=2**23).astype(np.int32)
+    return { "f":        lambda: compute.f(x, out=out),
+             "f_ufunc":  lambda: compute.f_ufunc(x, out=out),
+             "Pipeline": lambda: p(x, out=out),
+             "sum_f":    lambda: compute.sum_f(x),
+             "g_count":  lambda: predicates.g_count(ints),
+           }
+
+@pytest.mark.parametrize( "name", sorted(gil_cases()) )
+def test_releases_gil( name ):
+    assert ticks_during( gil_cases()[name] ) > 0, "no other thread ran during %s; is the GIL released?" % (name)
+
+def test_gil_check_works():
+    # A computation that holds the GIL throughout must give no ticks, or the tests above would pass vacuously.
+    values = np.random.rand(2**18).tolist()
+    assert ticks_during( lambda: sorted(values), calls=3 ) == 0
+
+
+#########################################################
+# Import time
+#########################################################
+
+# Run code in a fresh interpreter, with mylibrary importable as in this one.
+#
+def run_python( code, *options ):
+    root = os.path.dirname( os.path.dirname(os.path.abspath(mylibrary.__file__)) )
+    env  = dict( os.environ, PYTHONPATH=os.pathsep.join([root] + sys.path) )
+    return subprocess.run( [sys.executable] + list(options) + ["-c", code], env=env, capture_output=True, text=True, check=True )
+
+# Return the cumulative time of "import mylibrary", in seconds, as reported by "python -X importtime".
+#
+def import_time():
+    for line in run_python( "import mylibrary", "-X", "importtime" ).stderr.splitlines():
+        fields = line.split("|")
+        if len(fields) == 3  and  fields[2].strip() == "mylibrary":
+            return int(fields[1]) * 1e-6
+    raise RuntimeError( "no import time reported for mylibrary" )
+
+# Return the names of the modules loaded after running code. (Unlike -X importtime, this also sees extension modules.)
+#
+def loaded_modules( code ):
+    return set( run_python( code + "\nimport sys; print(' '.join(sys.modules))" ).stdout.split() )
+
+def test_import_time_budget():
+    best = min( import_time() for _ in range(3) )  # to leave out a cold disk cache
+    assert best <= import_budget, "import mylibrary took %.1f ms, budget %.1f ms" % (1e3 * best, 1e3 * import_budget)
+
+@pytest.mark.parametrize( "code", ["import mylibrary",
+                                   "import mylibrary; mylibrary.__version__, mylibrary.backends",
+                                   "from mylibrary import dostuff; dostuff.hello_many([])"] )
+def test_import_is_lazy( code ):
+    loaded = loaded_modules(code)
+    assert "mylibrary" in loaded
+    for heavy in ["numpy", "asyncio", "mylibrary.compute", "mylibrary.predicates"]:
+        assert heavy not in loaded, "%s loads %s" % (code, heavy)
+
+def test_import_check_works():
+    # Using compute must load it and NumPy, or the test above would pass vacuously.
+    loaded = loaded_modules("import mylibrary; mylibrary.compute.f")
+    assert "numpy" in loaded  and  "mylibrary.compute" in loaded
+
+if __name__ == '__main__':
+    sys.exit( pytest.main([__file__, "-v"]) )
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""Representative workload for mylibrary: training run for profile-guided optimization, and its timing.
+
+The top-level setup.py runs this with the instrumented build (build type "pgo") to collect
+the profile, and then with the plain optimized and the PGO build to compare them.
+
+Usage:
+    python pgo_workload.py [--repeat N] [--json]
+
+Prints the best time of N runs (default 3) of each item, in seconds; with --json, as a JSON object.
+"""
+
+from __future__ import division, print_function, absolute_import
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+try:
+    import mylibrary.compute as compute
+    import mylibrary.dostuff as dostuff
+    import mylibrary.predicates as predicates
+except ImportError:
+    print( "ERROR: mylibrary not found; is it built (in this Python)?", file=sys.stderr )
+    raise
+
+
+# Items of the workload: name -> function of no arguments.
+#
+# Cover the hot paths: the kernels (contiguous, strided, float32 and float64, serial and threaded),
+# the Python-level glue (many calls on small arrays), and the non-numeric modules.
+#
+def workloads():
+    rng = np.random.RandomState(42)
+    x   = rng.rand(1000000)
+    x32 = x.astype(np.float32)
+    x2  = rng.rand(1000, 2000)[:, ::2]
+    out = np.empty_like(x)
+    small = rng.rand(100)
+    p   = compute.Pipeline().scale(2.0).offset(1.0).f().clip(0.0, 1.5)
+    ints  = rng.randint(0, 100, size=1000000).astype(np.int32)
+    msgs  = [ "message %d" % i for i in range(100000) ]
+
+    def small_calls():
+        for _ in range(10000):
+            compute.f(small)
+
+    def hello_many():
+        with open(os.devnull, "w") as file:
+            dostuff.hello_many(msgs, file)
+
+    return { "f(float64)":          lambda: compute.f(x, out=out),
+             "f(float32)":          lambda: compute.f(x32),
+             "f(strided)":          lambda: compute.f(x2),
+             "f(threads)":          lambda: compute.f(x, out=out, num_threads=0),
+             "f(small) x 10000":    small_calls,
+             "f_ufunc":             lambda: compute.f_ufunc(x, out=out),
+             "sum_f":               lambda: compute.sum_f(x),
+             "max_f":               lambda: compute.max_f(x2),
+             "dot_f":               lambda: compute.dot_f(x, x),
+             "Pipeline":            lambda: p(x, out=out),
+             "predicates.g_count":  lambda: predicates.g_count(ints),
+             "predicates.g_mask":   lambda: predicates.g_mask(ints),
+             "dostuff.hello_many":  hello_many,
+           }
+
+# Run each item repeat times. Return {name: best time in seconds}.
+#
+def run( repeat=3 ):
+    timings = {}
+    for name, work in workloads().items():
+        best = float("inf")
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            work()
+            best = min( best, time.perf_counter() - t0 )
+        timings[name] = best
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser( description=__doc__.splitlines()[0] )
+    parser.add_argument( "--repeat", type=int, default=3, help="runs of each item; the best time is reported" )
+    parser.add_argument( "--json", action="store_true", help="print the timings as a JSON object" )
+    args = parser.parse_args()
+
+    timings = run(args.repeat)
+    if args.json:
+        print( json.dumps(timings) )
+    else:
+        for name, t in timings.items():
+            print( "%-24s %10.3f ms" % (name, 1e3 * t) )
+
+
+if __name__ == '__main__':
+    main()
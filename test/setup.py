@@ -148,8 +148,8 @@ Return value:
 
     # OpenMP
     if use_openmp:
-        compile_args.insert( 0, openmp_compile_args )
-        link_args.insert( 0, openmp_link_args )
+        compile_args = openmp_compile_args + compile_args  # splice in the flags, not the list itself
+        link_args    = openmp_link_args    + link_args
 
     # See
     #    http://docs.cython.org/src/tutorial/external.html
@@ -170,7 +170,7 @@ Return value:
 
 # declare Cython extension modules here
 #
-ext_module_cythonmodule = declare_cython_extension( "cython_module", use_math=False, use_openmp=False )
+ext_module_cythonmodule = declare_cython_extension( "cython_module", use_math=False, use_openmp=True )
 
 # this is mainly to allow a manual logical ordering of the declared modules
 #